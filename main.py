@@ -55,6 +55,16 @@ import time
 import random
 import threading
 
+try:  # JSON (역)직렬화 고속 경로 — 없으면 stdlib json으로 동작
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None  # type: ignore[assignment]
+
+try:  # 한국 공휴일 달력 — 없으면 주말만 비영업일로 취급(fail-open)
+    import holidays as _holidays_mod
+except Exception:  # pragma: no cover
+    _holidays_mod = None  # type: ignore[assignment]
+
 from collector import (
     NaverClientConfig,
     naver_news_search as _collector_naver_news_search,
@@ -479,6 +489,9 @@ REPORT_HOUR_KST = int(os.getenv("REPORT_HOUR_KST", os.getenv("RUN_HOUR_KST", "6"
 WINDOW_MIN_HOURS = int(os.getenv("WINDOW_MIN_HOURS", "0"))  # 최소 후보 수집 윈도우(시간, 기본 0=윈도우 확장 없음)
 CROSSDAY_DEDUPE_DAYS = int(os.getenv("CROSSDAY_DEDUPE_DAYS", "7"))  # 최근 N일 URL/사건키 중복 방지
 CROSSDAY_DEDUPE_ENABLED_ENV = (os.getenv("CROSSDAY_DEDUPE_ENABLED", "true").strip().lower() == "true")
+# 제목 근사중복(SimHash) 차단: 매체만 다른 재전송 기사(조사/한두 단어 차이)를 수집 단계에서 컷
+DEDUPE_SIMHASH_ENABLED = os.getenv("DEDUPE_SIMHASH_ENABLED", "1").strip().lower() in ("1", "true", "yes", "y")
+DEDUPE_SIMHASH_MAX_HAMMING = max(0, min(8, int(os.getenv("DEDUPE_SIMHASH_MAX_HAMMING", "3"))))
 
 # 최근 히스토리(크로스데이 중복 방지) - main()에서 state를 읽어 채움
 CROSSDAY_DEDUPE_ENABLED = False
@@ -1067,6 +1080,9 @@ OPENAI_REASONING_EFFORT = os.getenv("OPENAI_REASONING_EFFORT", "").strip()
 OPENAI_TEXT_VERBOSITY = os.getenv("OPENAI_TEXT_VERBOSITY", "").strip()
 OPENAI_BATCH_SIZE = int((os.getenv("OPENAI_BATCH_SIZE", "25") or "25").strip() or 25)
 OPENAI_BATCH_SIZE = max(5, min(OPENAI_BATCH_SIZE, 80))
+# 배치가 여러 청크로 나뉠 때 동시 전송 수(I/O 병렬화). 1이면 기존 순차 동작.
+OPENAI_SUMMARY_MAX_WORKERS = int((os.getenv("OPENAI_SUMMARY_MAX_WORKERS", "2") or "2").strip() or 2)
+OPENAI_SUMMARY_MAX_WORKERS = max(1, min(OPENAI_SUMMARY_MAX_WORKERS, 4))
 OPENAI_SUMMARY_CACHE_PATH = os.getenv("OPENAI_SUMMARY_CACHE_PATH", ".agri_summary_cache.json").strip() or ".agri_summary_cache.json"
 OPENAI_SUMMARY_CACHE_MAX = int((os.getenv("OPENAI_SUMMARY_CACHE_MAX", "2000") or "2000").strip() or 2000)
 OPENAI_SUMMARY_CACHE_MAX = max(200, min(OPENAI_SUMMARY_CACHE_MAX, 20000))
@@ -1076,6 +1092,9 @@ OPENAI_SUMMARY_TIMEOUT_SECONDS = float((os.getenv("OPENAI_SUMMARY_TIMEOUT_SECOND
 OPENAI_SUMMARY_TIMEOUT_SECONDS = max(10.0, min(OPENAI_SUMMARY_TIMEOUT_SECONDS, 90.0))
 OPENAI_SUMMARY_MISSING_RETRY_MAX = int((os.getenv("OPENAI_SUMMARY_MISSING_RETRY_MAX", "5") or "5").strip() or 5)
 OPENAI_SUMMARY_MISSING_RETRY_MAX = max(0, min(OPENAI_SUMMARY_MISSING_RETRY_MAX, 10))
+# 배치 내 근사중복(통신사 전재 등) 병합 임계값(토큰 자카드 유사도, 0=비활성)
+OPENAI_SUMMARY_DUP_JACCARD = float((os.getenv("OPENAI_SUMMARY_DUP_JACCARD", "0.88") or "0.88").strip() or 0.88)
+OPENAI_SUMMARY_DUP_JACCARD = max(0.0, min(OPENAI_SUMMARY_DUP_JACCARD, 1.0))
 _OPENAI_QUOTA_EXHAUSTED = False
 OPENAI_SUMMARY_FEEDBACK_PATH = os.getenv("OPENAI_SUMMARY_FEEDBACK_PATH", "docs/evals/latest-feedback.txt").strip()
 OPENAI_SUMMARY_FEEDBACK_MAX_CHARS = int((os.getenv("OPENAI_SUMMARY_FEEDBACK_MAX_CHARS", "600") or "600").strip() or 600)
@@ -1376,6 +1395,9 @@ ALLOWED_GO_KR = {
     "kma.go.kr",
 }
 
+# 정부/연구기관 도메인 접미사(endswith tuple — 한 번의 C 호출로 판정)
+_GOV_SUFFIXES = (".go.kr", ".re.kr")
+
 AGRI_POLICY_KEYWORDS = [
     "농축수산물", "농축산물", "성수품", "할인지원", "할당관세", "검역",
     "수급", "가격", "과일", "비축미", "원산지", "정책", "대책", "브리핑", "보도자료"
@@ -2709,6 +2731,13 @@ SECTIONS: list[SectionConfig] = [
     },
 ]
 
+# 핫패스에서 key→섹션 설정을 매번 선형 탐색하지 않도록 모듈 로드 시 1회 인덱싱
+SECTION_CONF_BY_KEY: dict[str, SectionConfig] = {
+    str(sec.get("key") or "").strip(): sec
+    for sec in SECTIONS
+    if str(sec.get("key") or "").strip()
+}
+
 
 # -----------------------------
 # Topic diversity
@@ -2969,6 +2998,12 @@ def dt_kst(d: date, hour: int) -> datetime:
     return datetime(d.year, d.month, d.day, hour, 0, 0, tzinfo=KST)
 
 def parse_pubdate_to_kst(pubdate_str: str) -> datetime:
+    # 네이버 pubDate는 고정 RFC1123 형식("Mon, 06 Jan 2025 07:00:00 +0900")
+    # → strptime 고속 경로를 먼저 시도하고, 변형된 입력만 범용 파서로 처리
+    try:
+        return datetime.strptime(pubdate_str, "%a, %d %b %Y %H:%M:%S %z").astimezone(KST)
+    except Exception:
+        pass
     try:
         dt = parsedate_to_datetime(pubdate_str)
         if dt.tzinfo is None:
@@ -3304,14 +3339,26 @@ def _date_hint_from_url(url: str) -> date | None:
     return None
 
 
+@lru_cache(maxsize=8192)
+def _lowered_title_desc(title: str, desc: str) -> str:
+    """(title + " " + desc).lower()를 기사별 1회만 계산(필터/랭킹이 공유)."""
+    return (title + " " + desc).lower()
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
 def clean_text(s: str) -> str:
     if not s:
         return ""
-    s = html.unescape(s)
-    s = re.sub(r"<[^>]+>", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # 엔티티/태그가 없는 평문(대부분)은 unescape/태그 제거를 건너뛴다
+    if "&" in s:
+        s = html.unescape(s)
+    if "<" in s:
+        s = _TAG_RE.sub(" ", s)
+    return _WS_RE.sub(" ", s).strip()
 
+@lru_cache(maxsize=8192)
 def domain_of(url: str) -> str:
     """URL의 도메인(호스트명).
     - m., www. 같은 일반 서브도메인은 제거해 매체 매핑/중복키/필터가 일관되게 동작하도록 한다.
@@ -3327,7 +3374,17 @@ def domain_of(url: str) -> str:
     except Exception:
         return ""
 
+_TRACKING_HINTS = ("utm_", "gclid", "fbclid", "igshid", "ref=", "outurl", "nclick")
+
+@lru_cache(maxsize=8192)
 def strip_tracking_params(url: str) -> str:
+    # fast path: 쿼리가 없거나 추적 파라미터 흔적이 전혀 없으면(대부분의 URL)
+    # urlparse→parse_qsl→urlencode→urlunparse 왕복을 건너뛴다.
+    if "?" not in url:
+        return url
+    low = url.lower()
+    if not any(h in low for h in _TRACKING_HINTS):
+        return url
     try:
         u = urlparse(url)
         q = [(k, v) for (k, v) in parse_qsl(u.query, keep_blank_values=True)
@@ -3337,6 +3394,7 @@ def strip_tracking_params(url: str) -> str:
     except Exception:
         return url
 
+@lru_cache(maxsize=8192)
 def canonicalize_url(url: str) -> str:
     url = strip_tracking_params(url or "").strip()
     if not url:
@@ -3355,11 +3413,16 @@ def canonicalize_url(url: str) -> str:
     except Exception:
         return url
 
+_TITLE_BRACKET_RE = re.compile(r"\[[^\]]+\]")
+_TITLE_PAREN_RE = re.compile(r"\([^)]*\)")
+_TITLE_NONWORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+
+@lru_cache(maxsize=16384)
 def norm_title_key(title: str) -> str:
     t = (title or "").lower()
-    t = re.sub(r"\[[^\]]+\]", " ", t)
-    t = re.sub(r"\([^)]*\)", " ", t)
-    t = re.sub(r"[^0-9a-z가-힣]+", "", t)
+    t = _TITLE_BRACKET_RE.sub(" ", t)
+    t = _TITLE_PAREN_RE.sub(" ", t)
+    t = _TITLE_NONWORD_RE.sub("", t)
     return t[:90]
 
 # -----------------------------
@@ -3609,7 +3672,7 @@ def _dist_story_signature(title: str, desc: str) -> str | None:
         return f"EV:DIST:SUPPLY_CENTER:{loc or 'center'}"
 
     sales_channel_signature_like = is_dist_sales_channel_ops_context(title, desc) or (
-        ("연합판매사업" in text) and count_any(text, [w.lower() for w in ("직거래", "평가회", "워크숍")]) >= 2
+        ("연합판매사업" in text) and count_any(text, _lowered_terms(("직거래", "평가회", "워크숍"))) >= 2
     )
     if sales_channel_signature_like:
         sales_group = _dist_sales_channel_group_key(title, desc)
@@ -3723,7 +3786,7 @@ def _supply_story_signature(title: str, desc: str) -> str | None:
     if quality_compare_like and quality_labels >= 2 and (("수입산" in labels) or ("비교" in labels) or ("블라인드" in labels)):
         return f"EV:SUPPLY:{topic_bucket}:QUALITY_COMPARE"
     org_match = _AGRI_ORG_EVENT_RX.search((title or "") + " " + (desc or ""))
-    promo_hits = count_any(text, [w.lower() for w in _SUPPLY_ORG_PROMO_TERMS])
+    promo_hits = count_any(text, _lowered_terms(_SUPPLY_ORG_PROMO_TERMS))
     if org_match and promo_hits >= 2:
         org_key = re.sub(r"\s+", "", org_match.group(1).lower())
         return f"EV:SUPPLY:{topic_bucket}:{org_key}:PROMO_EVENT"
@@ -3769,7 +3832,7 @@ def _dedupe_prefer_bonus(a: "Article", section_key: str) -> float:
         d = normalize_host(getattr(a, "domain", "") or "")
         title = (getattr(a, "title", "") or "")
         desc = (getattr(a, "description", "") or "")
-        txt = (title + " " + desc).lower()
+        txt = _lowered_title_desc(title, desc)
 
         b = 0.0
 
@@ -3961,10 +4024,10 @@ def is_dist_market_education_tail_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if not text:
         return False
-    education_hits = count_any(text, [w.lower() for w in _EDITORIAL_SAFE_DIST_EDUCATION_TERMS])
+    education_hits = count_any(text, _lowered_terms(_EDITORIAL_SAFE_DIST_EDUCATION_TERMS))
     market_hits = count_any(
         text,
-        [w.lower() for w in ("동화청과", "도매시장", "대형 유통업체", "구매·판매", "구매 판매", "출하 전략", "판로", "산지-유통")],
+        _lowered_terms(("동화청과", "도매시장", "대형 유통업체", "구매·판매", "구매 판매", "출하 전략", "판로", "산지-유통")),
     )
     return education_hits >= 2 and market_hits >= 2
 
@@ -3975,11 +4038,11 @@ def is_dist_hard_logistics_metric_context(title: str, desc: str) -> bool:
         return False
     support_grant_hits = count_any(
         text,
-        [w.lower() for w in ("물류기자재", "기자재 지원", "지원금 전달", "후원금 전달", "생산 안정", "생산안정")],
+        _lowered_terms(("물류기자재", "기자재 지원", "지원금 전달", "후원금 전달", "생산 안정", "생산안정")),
     )
     physical_ops_hits = count_any(
         text,
-        [w.lower() for w in ("물류비", "운송비", "하역", "반입량", "처리물량", "정산", "순회수집", "파렛트", "팰릿")],
+        _lowered_terms(("물류비", "운송비", "하역", "반입량", "처리물량", "정산", "순회수집", "파렛트", "팰릿")),
     )
     if support_grant_hits >= 1 and physical_ops_hits <= 0:
         return False
@@ -3990,10 +4053,10 @@ def is_dist_hard_logistics_metric_context(title: str, desc: str) -> bool:
         return False
     hard_ops_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "출하량", "출하율", "거래액", "물류비", "운송비", "물동량", "반입량", "처리물량",
             "지원금", "하역", "정산", "감축", "절감", "순회수집",
-        )],
+        )),
     )
     has_metric_ops = bool(re.search(
         r"(?:출하량|출하율|거래액|물류비|운송비|지원금|물동량|반입량|처리물량|경매가|경락가).{0,24}\d"
@@ -4012,21 +4075,21 @@ def is_dist_national_export_logistics_context(title: str, desc: str, dom: str =
     title_l = _nfkc_lower(title or "")
     if not text:
         return False
-    export_hits = count_any(text, [w.lower() for w in ("수출", "해외", "gcc", "중동", "중국", "미국")])
-    food_hits = count_any(text, [w.lower() for w in ("k-푸드", "k푸드", "농식품", "한국 식품", "식품기업", "한국농수산식품유통공사")])
+    export_hits = count_any(text, _lowered_terms(("수출", "해외", "gcc", "중동", "중국", "미국")))
+    food_hits = count_any(text, _lowered_terms(("k-푸드", "k푸드", "농식품", "한국 식품", "식품기업", "한국농수산식품유통공사")))
     if re.search(r"(?<![A-Za-z0-9])aT(?![A-Za-z0-9])", raw_text):
         food_hits += 1
     logistics_hits = count_any(
         text,
-        [w.lower() for w in ("물류난", "물류 차질", "해상 물류", "운임", "우회 운송", "물류비", "수출바우처", "물류 부담")],
+        _lowered_terms(("물류난", "물류 차질", "해상 물류", "운임", "우회 운송", "물류비", "수출바우처", "물류 부담")),
     )
-    shock_hits = count_any(text, [w.lower() for w in ("중동전쟁", "중동 전쟁", "전쟁", "홍해", "호르무즈", "위기")])
+    shock_hits = count_any(text, _lowered_terms(("중동전쟁", "중동 전쟁", "전쟁", "홍해", "호르무즈", "위기")))
     has_metric = bool(re.search(r"\d[\d,]*(?:\.\d+)?\s*(?:%|달러|억원|만\s*달러|억\s*달러)", text))
     title_signal = count_any(
         title_l,
-        [w.lower() for w in ("중동", "물류", "수출", "k-푸드", "k푸드", "gcc")],
+        _lowered_terms(("중동", "물류", "수출", "k-푸드", "k푸드", "gcc")),
     )
-    response_hits = count_any(text, [w.lower() for w in ("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처")])
+    response_hits = count_any(text, _lowered_terms(("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처")))
     if food_hits < 1 or logistics_hits < 1:
         return False
     if export_hits < 1 and response_hits < 2:
@@ -4043,12 +4106,12 @@ def is_dist_export_logistics_response_context(title: str, desc: str, dom: str =
         return False
     text = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     title_l = _nfkc_lower(title or "")
-    response_hits = count_any(text, [w.lower() for w in ("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처", "물류비 지원")])
+    response_hits = count_any(text, _lowered_terms(("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처", "물류비 지원")))
     title_response_hits = count_any(
         title_l,
-        [w.lower() for w in ("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처", "중동발 충격", "충격 확산")],
+        _lowered_terms(("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처", "중동발 충격", "충격 확산")),
     )
-    risk_hits = count_any(text, [w.lower() for w in ("중동발 충격", "충격 확산", "물류 차질", "물류 부담")])
+    risk_hits = count_any(text, _lowered_terms(("중동발 충격", "충격 확산", "물류 차질", "물류 부담")))
     return response_hits >= 2 and risk_hits >= 1 and title_response_hits >= 1
 
 
@@ -4058,7 +4121,7 @@ def is_dist_specific_kfood_export_logistics_context(title: str, desc: str, dom:
     text = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if is_dist_export_logistics_response_context(title, desc, dom, press):
         return False
-    specific_hits = count_any(text, [w.lower() for w in ("gcc", "중동 수출", "물류난", "해상 물류", "우회 운송", "운임", "딸기", "수출 37")])
+    specific_hits = count_any(text, _lowered_terms(("gcc", "중동 수출", "물류난", "해상 물류", "우회 운송", "운임", "딸기", "수출 37")))
     return specific_hits >= 2
 
 
@@ -4246,11 +4309,11 @@ def _editorial_safe_core_demote_reason(article: "Article", section_key: str) ->
         if _editorial_safe_has_any(text, dist_event_core_terms):
             concrete_ops_hits = count_any(
                 text,
-                [w.lower() for w in (
+                _lowered_terms((
                     "출하량", "거래액", "물류비", "물동량", "반입", "경매", "정산", "계약재배",
                     "수출 물량", "수출물량", "처리물량", "공선출하", "공동선별", "도매시장 반입",
                     "온라인도매시장", "가동", "준공",
-                )],
+                )),
             )
             has_metric_ops = bool(re.search(
                 r"(?:출하량|거래액|물류비|물동량|반입량|처리물량|수출\s*물량|정산액|경매가).{0,16}\d"
@@ -4296,24 +4359,24 @@ def _editorial_safe_core_demote_reason(article: "Article", section_key: str) ->
             return "opinion_column_core"
         title_field_price = count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "값 폭락", "가격 폭락", "값 하락", "가격 하락", "캘수록 손해",
                 "갈아엎", "밭 갈아", "농민들", "농가",
-            )],
+            )),
         )
         title_policy_actor = count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "정부", "농식품부", "농림축산식품부", "기재부", "농진청", "농촌진흥청",
                 "지자체", "전북자치도", "충남도", "무주군",
-            )],
+            )),
         )
         policy_action_hits = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "대책", "발표", "추진", "시행", "확대", "지원", "수매", "비축",
                 "산지폐기", "할당관세", "점검", "공급", "수급", "안정",
-            )],
+            )),
         )
         if title_field_price >= 2 and title_policy_actor == 0:
             return "policy_field_price_collapse_without_policy_lead"
@@ -5783,9 +5846,9 @@ def _managed_article_significance_metrics(
     market_anchor_hits = int((focus_metrics or {}).get("market_anchor_hits") or 0)
     issue_anchor_hits = int((focus_metrics or {}).get("issue_anchor_hits") or 0)
     focus_score = float((focus_metrics or {}).get("focus_score") or 0.0)
-    issue_title_hits = count_any(title_l, [w.lower() for w in _MANAGED_COMMODITY_BOARD_STRONG_ISSUE_TITLE_TERMS])
-    training_title_hits = count_any(title_l, [w.lower() for w in _MANAGED_COMMODITY_BOARD_TRAINING_TITLE_TERMS])
-    profile_title_hits = count_any(title_l, [w.lower() for w in _MANAGED_COMMODITY_BOARD_PROFILE_TITLE_TERMS])
+    issue_title_hits = count_any(title_l, _lowered_terms(_MANAGED_COMMODITY_BOARD_STRONG_ISSUE_TITLE_TERMS))
+    training_title_hits = count_any(title_l, _lowered_terms(_MANAGED_COMMODITY_BOARD_TRAINING_TITLE_TERMS))
+    profile_title_hits = count_any(title_l, _lowered_terms(_MANAGED_COMMODITY_BOARD_PROFILE_TITLE_TERMS))
     consumer_noise_hits = count_any(
         text_l,
         [
@@ -6004,7 +6067,7 @@ def _managed_commodity_item_for_seed(seed: str) -> dict[str, Any] | None:
 
 @lru_cache(maxsize=8192)
 def _topic_scores(title: str, desc: str) -> dict[str, float]:
-    t = (title + " " + desc).lower()
+    t = _lowered_title_desc(title, desc)
     tl = (title or "").lower()
     scores: dict[str, float] = {}
     managed_focus_item_cache: dict[str, dict[str, Any] | None] = {}
@@ -6083,7 +6146,7 @@ def _topic_scores(title: str, desc: str) -> dict[str, float]:
         "관세", "할당관세", "무관세", "fta", "통관", "수입신고", "보세", "보세구역", "반출", "반입",
         "관세청", "기재부", "농식품부", "정부", "대책", "지원", "단속", "고시", "개정", "시행",
     )
-    if any(x in t for x in POLICY_STRONG_TERMS):
+    if has_any(t, POLICY_STRONG_TERMS):
         scores["정책"] = scores.get("정책", 0.0) + 4.5
 
 
@@ -6134,21 +6197,58 @@ def extract_topic(title: str, desc: str) -> str:
                 return managed_topic
     return topic
 
+@lru_cache(maxsize=16384)
+def _canon_url_digest(canon_url: str) -> str:
+    """canon URL의 사건키용 digest. make_norm_key와 DedupeIndex가 공유(중복 sha256 제거)."""
+    return hashlib.sha256(canon_url.encode("utf-8")).hexdigest()[:32]
+
+
 def make_norm_key(canon_url: str, press: str, title_key: str) -> str:
     if canon_url:
-        h = hashlib.sha256(canon_url.encode("utf-8")).hexdigest()[:32]
-        return f"url:{h}"
+        return f"url:{_canon_url_digest(canon_url)}"
     base = f"{(press or '').strip()}|{title_key}"
     h = hashlib.sha256(base.encode("utf-8")).hexdigest()[:32]
     return f"pt:{h}"
 
+@lru_cache(maxsize=4096)
+def _any_words_pattern(words: tuple[str, ...]) -> "re.Pattern[str] | None":
+    """키워드 묶음을 단일 alternation 정규식으로 컴파일(묶음별 1회).
+
+    수십 개의 `w in text` 선형 스캔을 C 레벨 단일 패스로 대체한다.
+    pyahocorasick 없이도 동작하는 폴백 경로이며, 빈 묶음은 None을 돌려준다.
+    """
+    if not words:
+        return None
+    return re.compile("|".join(map(re.escape, words)))
+
 def has_any(text: str, words: list[str] | tuple[str, ...] | set[str]) -> bool:
-    return any(w in text for w in words)
+    pat = _any_words_pattern(tuple(words))
+    return pat is not None and pat.search(text) is not None
 
 def count_any(text: str, words: list[str] | tuple[str, ...] | set[str]) -> int:
+    # 정규식 프리필터로 "아무 키워드도 없는" 흔한 경우를 단일 패스로 걸러내고,
+    # 히트가 있을 때만 기존과 동일한 '포함 단어 수' 의미론으로 집계한다.
+    pat = _any_words_pattern(tuple(words))
+    if pat is None or pat.search(text) is None:
+        return 0
     return sum(1 for w in words if w in text)
 
 
+@lru_cache(maxsize=4096)
+def _lowered_terms_cached(words: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(w.lower() for w in words)
+
+
+def _lowered_terms(words: "list[str] | tuple[str, ...]") -> tuple[str, ...]:
+    """키워드 묶음을 소문자 tuple로 변환(묶음별 1회 캐시).
+
+    count_any/has_any 앞에서 매 호출마다 돌던 `_lowered_terms(...)`
+    리스트 컴프리헨션을 대체한다. tuple 리터럴 인자는 CPython이 상수로
+    접어주므로 호출 비용이 캐시 조회 1회로 줄어든다.
+    """
+    return _lowered_terms_cached(words if isinstance(words, tuple) else tuple(words))
+
+
 def has_apc_agri_context(text: str) -> bool:
     """APC 오탐(UPS/전원장비 등)을 막기 위해, '농업/산지유통' 문맥일 때만 APC로 인정."""
     t = (text or "").lower()
@@ -6170,8 +6270,8 @@ def has_apc_agri_context(text: str) -> bool:
         "산지", "생산자", "농가", "작목반", "조합원",
     )
 
-    strong_hit = count_any(t, [h.lower() for h in strong_hints])
-    weak_hit = count_any(t, [h.lower() for h in weak_hints])
+    strong_hit = count_any(t, _lowered_terms(strong_hints))
+    weak_hit = count_any(t, _lowered_terms(weak_hints))
 
     if strong_hit >= 1:
         return True
@@ -6196,6 +6296,7 @@ _MELON_EDIBLE_MARKERS = [
 _MELON_VARIETY_MARKERS = [
     "머스크멜론", "네트멜론", "얼스멜론", "하미과", "칸탈루프", "허니듀",
 ]
+_MELON_PRICE_RX = re.compile(r"멜론\s*(값|가격|시세|도매가격|출하가|경락가)")
 
 def is_edible_melon_context(text: str) -> bool:
     """Return True only when '멜론' clearly means the edible fruit (not the music service).
@@ -6221,7 +6322,7 @@ def is_edible_melon_context(text: str) -> bool:
     edible_hit = any(w.lower() in t for w in _MELON_EDIBLE_MARKERS)
 
     # 가격 패턴(멜론 값/가격/시세/도매가격 등)이 있으면, 음악마커가 없을 때만 과일로 인정
-    price_pat = bool(re.search(r"멜론\s*(값|가격|시세|도매가격|출하가|경락가)", t))
+    price_pat = bool(_MELON_PRICE_RX.search(t))
     if price_pat and not music_hit:
         edible_hit = True
 
@@ -6246,6 +6347,7 @@ _PIMANG_EDIBLE_MARKERS = [
     "산지", "산지유통", "산지유통센터", "apc", "선별", "저온", "저장", "ca저장",
     "수급", "시세", "가격", "수출", "검역", "통관",
 ]
+_PIMANG_PRICE_RX = re.compile(r"피망\s*(값|가격|시세|도매가격|출하가|경락가)")
 
 def is_edible_pimang_context(text: str) -> bool:
     """Return True only when '피망' clearly refers to the edible vegetable (bell pepper).
@@ -6261,7 +6363,7 @@ def is_edible_pimang_context(text: str) -> bool:
     edible_hit = any(w.lower() in t for w in _PIMANG_EDIBLE_MARKERS)
     game_hit = any(w.lower() in t for w in _PIMANG_GAME_MARKERS)
 
-    price_pat = bool(re.search(r"피망\s*(값|가격|시세|도매가격|출하가|경락가)", t))
+    price_pat = bool(_PIMANG_PRICE_RX.search(t))
     if price_pat and not game_hit:
         edible_hit = True
 
@@ -6281,6 +6383,7 @@ _POTATO_FRESH_MARKERS = [
     "저장", "물량", "씨감자", "봄감자", "수미감자", "감자 수급", "감자 가격",
     "감자 작황", "감자 재배", "감자 출하", "감자 도매가격", "검역", "통관", "수출",
 ]
+_POTATO_PRICE_RX = re.compile(r"감자\s*(값|가격|시세|도매가격|출하가|경락가|수급|작황|재배)")
 
 
 def is_fresh_potato_context(text: str) -> bool:
@@ -6291,7 +6394,7 @@ def is_fresh_potato_context(text: str) -> bool:
 
     fresh_hit = any(w.lower() in t for w in _POTATO_FRESH_MARKERS)
     processed_hit = any(w.lower() in t for w in _POTATO_PROCESSED_MARKERS)
-    price_pat = bool(re.search(r"감자\s*(값|가격|시세|도매가격|출하가|경락가|수급|작황|재배)", t))
+    price_pat = bool(_POTATO_PRICE_RX.search(t))
     if price_pat:
         fresh_hit = True
 
@@ -6345,6 +6448,9 @@ _TOMATO_EDIBLE_MARKERS = (
 )
 
 
+_TOMATO_PRICE_RX = re.compile(r"토마토\s*(가격|시세|수급|출하(?:량)?|작황|생육|재배|농가|도매|경매|병해충)")
+
+
 def is_edible_tomato_context(text: str) -> bool:
     """Return True only when '토마토' clearly refers to the crop or pest context."""
     t = _nfkc_lower(text or "")
@@ -6352,7 +6458,7 @@ def is_edible_tomato_context(text: str) -> bool:
         return False
     edible_hit = any(w.lower() in t for w in _TOMATO_EDIBLE_MARKERS)
     brand_noise_hit = any(w.lower() in t for w in _TOMATO_BRAND_NOISE_MARKERS)
-    price_pat = bool(re.search(r"토마토\s*(가격|시세|수급|출하(?:량)?|작황|생육|재배|농가|도매|경매|병해충)", t))
+    price_pat = bool(_TOMATO_PRICE_RX.search(t))
     if price_pat or "토마토뿔나방" in t:
         edible_hit = True
     if brand_noise_hit and not edible_hit:
@@ -6385,6 +6491,9 @@ _EGGPLANT_NON_EDIBLE_RX = re.compile(
     r"(?:사과|배|과수|나무).{0,12}(?:잎|줄기|가지|꽃|열매)|"
     r"가지각색|가지런"
 )
+_EGGPLANT_PRICE_RX = re.compile(r"가지\s*(가격|시세|수급|출하(?:량)?|작황|생육|재배|농가|도매|경매|유통|병해충|품목)")
+_EGGPLANT_CROP_RX = re.compile(r"(?:시설|노지)?가지\s*(재배|농가|출하(?:량)?|생산|작황|생육|수급|가격|시세|도매|경매|유통|병해충|품목)")
+_EGGPLANT_EXPLICIT_RX = re.compile(r"(?:^|[^\w])가지(?:\s*(?:가격|수급|출하|작황|재배|시세|도매|농가|경매|유통|생육|병해충|품목|산지|생산))")
 
 
 def is_edible_eggplant_context(text: str) -> bool:
@@ -6394,13 +6503,8 @@ def is_edible_eggplant_context(text: str) -> bool:
         return False
     edible_hit = any(w.lower() in t for w in _EGGPLANT_EDIBLE_MARKERS)
     non_edible_hit = any(w.lower() in t for w in _EGGPLANT_NON_EDIBLE_MARKERS) or (_EGGPLANT_NON_EDIBLE_RX.search(t) is not None)
-    price_pat = bool(re.search(r"가지\s*(가격|시세|수급|출하(?:량)?|작황|생육|재배|농가|도매|경매|유통|병해충|품목)", t))
-    explicit_crop_pat = bool(
-        re.search(
-            r"(?:시설|노지)?가지\s*(재배|농가|출하(?:량)?|생산|작황|생육|수급|가격|시세|도매|경매|유통|병해충|품목)",
-            t,
-        )
-    )
+    price_pat = bool(_EGGPLANT_PRICE_RX.search(t))
+    explicit_crop_pat = bool(_EGGPLANT_CROP_RX.search(t))
     strong_edible_hit = price_pat or explicit_crop_pat or any(marker in t for marker in ("시설가지", "노지가지", "가지 품목", "가지 산지", "가지 생산"))
     if strong_edible_hit:
         edible_hit = True
@@ -6413,7 +6517,7 @@ def is_edible_eggplant_context(text: str) -> bool:
     # "가지"가 명시적 품목 문맥(가지 가격/수급/출하 등)이 아니면 오탐 가능성 높음
     if not strong_edible_hit:
         # "가지" 앞뒤에 품목명으로 쓰인 명시적 패턴이 없으면 reject
-        has_explicit_eggplant_ref = bool(re.search(r"(?:^|[^\w])가지(?:\s*(?:가격|수급|출하|작황|재배|시세|도매|농가|경매|유통|생육|병해충|품목|산지|생산))", t))
+        has_explicit_eggplant_ref = bool(_EGGPLANT_EXPLICIT_RX.search(t))
         if not has_explicit_eggplant_ref:
             return False
     return True
@@ -6640,11 +6744,11 @@ def is_flower_novelty_noise_context(title: str, desc: str) -> bool:
     text = f"{title_l} {desc_l}".strip()
     if not text:
         return False
-    novelty_hits = count_any(text, [w.lower() for w in _FLOWER_TREND_NOISE_MARKERS])
-    bouquet_hits = count_any(text, [w.lower() for w in ("꽃다발", "부케", "플라워", "꽃 선물", "꽃다발 선물")])
-    event_hits = count_any(text, [w.lower() for w in _FLOWER_NOVELTY_EVENT_MARKERS])
-    market_signal_hits = count_any(text, [w.lower() for w in _FLOWER_NOVELTY_MARKET_SIGNAL_MARKERS])
-    association_hits = count_any(text, [w.lower() for w in _FLOWER_NOVELTY_ASSOCIATION_MARKERS])
+    novelty_hits = count_any(text, _lowered_terms(_FLOWER_TREND_NOISE_MARKERS))
+    bouquet_hits = count_any(text, _lowered_terms(("꽃다발", "부케", "플라워", "꽃 선물", "꽃다발 선물")))
+    event_hits = count_any(text, _lowered_terms(_FLOWER_NOVELTY_EVENT_MARKERS))
+    market_signal_hits = count_any(text, _lowered_terms(_FLOWER_NOVELTY_MARKET_SIGNAL_MARKERS))
+    association_hits = count_any(text, _lowered_terms(_FLOWER_NOVELTY_ASSOCIATION_MARKERS))
     if any(phrase in text for phrase in ("장난감 꽃", "생화 너무 비싸", "레고 꽃", "조화 시장")) and market_signal_hits <= 1:
         return True
     if novelty_hits == 0 and event_hits == 0:
@@ -6713,10 +6817,10 @@ def is_macro_trade_noise_context(text: str) -> bool:
     weak_horti = ("농산물", "농식품", "식품", "먹거리")
     strong_horti = _STRONG_HORTI_MARKERS + ("원예", "과수", "채소", "화훼", "절화", "청과")
 
-    geo_hit = count_any(t, [w.lower() for w in geo_trade])
-    ind_hit = count_any(t, [w.lower() for w in industry])
-    weak_hit = count_any(t, [w.lower() for w in weak_horti])
-    strong_hit = count_any(t, [w.lower() for w in strong_horti])
+    geo_hit = count_any(t, _lowered_terms(geo_trade))
+    ind_hit = count_any(t, _lowered_terms(industry))
+    weak_hit = count_any(t, _lowered_terms(weak_horti))
+    strong_hit = count_any(t, _lowered_terms(strong_horti))
 
     if geo_hit >= 2 and ind_hit >= 1 and weak_hit >= 1 and strong_hit == 0:
         return True
@@ -6730,9 +6834,9 @@ def is_general_consumer_price_noise(text: str) -> bool:
     if not t:
         return False
     basket_terms = ("전기요금", "가스요금", "통신비", "휘발유", "교통비", "월세", "외식비", "가공식품", "공공요금")
-    weak_hit = count_any(t, [w.lower() for w in _WEAK_HORTI_MARKERS])
-    strong_hit = count_any(t, [w.lower() for w in _STRONG_HORTI_MARKERS])
-    basket_hit = count_any(t, [w.lower() for w in basket_terms])
+    weak_hit = count_any(t, _lowered_terms(_WEAK_HORTI_MARKERS))
+    strong_hit = count_any(t, _lowered_terms(_STRONG_HORTI_MARKERS))
+    basket_hit = count_any(t, _lowered_terms(basket_terms))
 
     if basket_hit >= 2 and weak_hit >= 1 and strong_hit == 0:
         return True
@@ -6749,19 +6853,19 @@ def is_processed_food_lifestyle_context(title: str, desc: str) -> bool:
         return False
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "출하", "수급", "도매가격", "시세")],
+        _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "출하", "수급", "도매가격", "시세")),
     )
     if market_hits >= 1:
         return False
     processed_hits = count_any(
         txt,
-        [w.lower() for w in ("와인", "wine", "맥주", "주류", "디저트", "메뉴", "풍미", "페어링", "레스토랑", "바비큐", "bbq", "산지오베제", "빈티지", "소믈리에", "한 잔", "어때요")],
+        _lowered_terms(("와인", "wine", "맥주", "주류", "디저트", "메뉴", "풍미", "페어링", "레스토랑", "바비큐", "bbq", "산지오베제", "빈티지", "소믈리에", "한 잔", "어때요")),
     )
     lifestyle_hits = count_any(
         txt,
-        [w.lower() for w in ("레스토랑", "바비큐", "bbq", "한 잔", "어때요", "페어링", "풍미", "희소성", "국제 품종", "100%")],
+        _lowered_terms(("레스토랑", "바비큐", "bbq", "한 잔", "어때요", "페어링", "풍미", "희소성", "국제 품종", "100%")),
     )
-    title_hits = count_any(ttl, [w.lower() for w in ("와인", "wine", "바비큐", "bbq", "한 잔", "어때요", "페어링")])
+    title_hits = count_any(ttl, _lowered_terms(("와인", "wine", "바비큐", "bbq", "한 잔", "어때요", "페어링")))
     return (processed_hits >= 3 and lifestyle_hits >= 2) or (processed_hits >= 2 and title_hits >= 2)
 
 def is_policy_announcement_issue(text: str, dom: str = "", press: str = "") -> bool:
@@ -6786,10 +6890,10 @@ def is_policy_announcement_issue(text: str, dom: str = "", press: str = "") -> b
     )
     market_terms = ("가락시장", "도매시장", "공판장", "경락", "반입", "출하", "재고", "저장", "작황", "산지", "시세")
     commodity_terms = ("사과", "배", "감귤", "만감", "딸기", "포도", "참외", "오이", "토마토", "파프리카", "자두", "매실", "밤")
-    agency_hit = count_any(t, [w.lower() for w in agency_terms])
-    action_hit = count_any(t, [w.lower() for w in policy_action_terms])
-    market_hit = count_any(t, [w.lower() for w in market_terms])
-    commodity_hit = count_any(t, [w.lower() for w in commodity_terms])
+    agency_hit = count_any(t, _lowered_terms(agency_terms))
+    action_hit = count_any(t, _lowered_terms(policy_action_terms))
+    market_hit = count_any(t, _lowered_terms(market_terms))
+    commodity_hit = count_any(t, _lowered_terms(commodity_terms))
     price_move = (("가격" in t) or ("시세" in t)) and any(k in t for k in ("상승", "하락", "급등", "급락", "약세", "강세"))
 
     # 일반언론의 품목/시장 가격기사(예: 사과·배 가격 흐름)는 supply에 남긴다.
@@ -6799,7 +6903,7 @@ def is_policy_announcement_issue(text: str, dom: str = "", press: str = "") -> b
         "할당관세", "관세청", "보세", "보세구역", "수입신고", "통관", "추천서", "추천", "추천 취소",
         "집중관리", "지정", "의무", "신속 유통", "추징", "가산세", "단속", "관리 강화"
     )
-    strong_admin_hit = count_any(t, [w.lower() for w in strong_admin_terms])
+    strong_admin_hit = count_any(t, _lowered_terms(strong_admin_terms))
 
     if strong_admin_hit == 0:
         # '품목+시장/가격'이 핵심인 일반 기사만 supply에 남김
@@ -6834,7 +6938,7 @@ def is_generic_import_item_context(text: str) -> bool:
         "담합", "과징금", "공정거래위원회", "공정위"
     )
     admin_terms = ("할당관세", "보세", "보세구역", "통관", "수입신고", "추천서", "추징", "가산세", "관세청")
-    return (count_any(t, [w.lower() for w in generic_items]) >= 1) and (count_any(t, [w.lower() for w in admin_terms]) >= 1)
+    return (count_any(t, _lowered_terms(generic_items)) >= 1) and (count_any(t, _lowered_terms(admin_terms)) >= 1)
 
 
 
@@ -6868,10 +6972,10 @@ def is_supply_stabilization_policy_context(text: str, dom: str = "", press: str
         "대형마트", "편의점", "온라인", "한판",
     )
 
-    livestock_hit = count_any(t, [w.lower() for w in livestock_terms])
-    agency_hit = count_any(t, [w.lower() for w in agency_terms])
-    stabilization_hit = count_any(t, [w.lower() for w in stabilization_terms])
-    retail_hit = count_any(t, [w.lower() for w in retail_terms])
+    livestock_hit = count_any(t, _lowered_terms(livestock_terms))
+    agency_hit = count_any(t, _lowered_terms(agency_terms))
+    stabilization_hit = count_any(t, _lowered_terms(stabilization_terms))
+    retail_hit = count_any(t, _lowered_terms(retail_terms))
     official = policy_domain_override(d, t) or (d in POLICY_DOMAINS) or (p in ("정책브리핑", "농식품부"))
 
     if livestock_hit >= 1 and stabilization_hit >= 2 and (agency_hit >= 1 or retail_hit >= 1 or official):
@@ -6916,14 +7020,14 @@ def is_policy_market_brief_context(text: str, dom: str = "", press: str = "") ->
     driver_terms = ("중동", "전쟁", "유가", "환율", "변수", "영향", "수급", "공급", "분산 출하", "정부 가용물량")
     wholesale_terms = ("가락시장", "도매시장", "공판장", "경락", "경매", "반입")
 
-    agency_hit = count_any(t, [w.lower() for w in agency_terms])
-    item_hit = count_any(t, [w.lower() for w in broad_item_terms])
-    aggregate_hit = count_any(t, [w.lower() for w in aggregate_terms])
-    price_hit = count_any(t, [w.lower() for w in price_terms])
-    brief_hit = count_any(t, [w.lower() for w in brief_terms])
-    comparison_hit = count_any(t, [w.lower() for w in comparison_terms])
-    driver_hit = count_any(t, [w.lower() for w in driver_terms])
-    wholesale_hit = count_any(t, [w.lower() for w in wholesale_terms])
+    agency_hit = count_any(t, _lowered_terms(agency_terms))
+    item_hit = count_any(t, _lowered_terms(broad_item_terms))
+    aggregate_hit = count_any(t, _lowered_terms(aggregate_terms))
+    price_hit = count_any(t, _lowered_terms(price_terms))
+    brief_hit = count_any(t, _lowered_terms(brief_terms))
+    comparison_hit = count_any(t, _lowered_terms(comparison_terms))
+    driver_hit = count_any(t, _lowered_terms(driver_terms))
+    wholesale_hit = count_any(t, _lowered_terms(wholesale_terms))
 
     if wholesale_hit >= 1 and brief_hit == 0 and agency_hit == 0 and not officialish and aggregate_hit == 0:
         return False
@@ -6959,8 +7063,8 @@ def is_trade_policy_issue(text: str) -> bool:
         "취소", "의무화", "협의", "건의", "국회", "정부", "관계부처"
     )
 
-    trade_hit = count_any(t, [w.lower() for w in trade_terms])
-    action_hit = count_any(t, [w.lower() for w in action_terms])
+    trade_hit = count_any(t, _lowered_terms(trade_terms))
+    action_hit = count_any(t, _lowered_terms(action_terms))
 
     # 최소 2개 이상(관세+수출, 관세+fta, 통상+검역 등)의 조합이면서,
     # 제도/대응 맥락(action)이 1개 이상이면 policy 성격으로 본다.
@@ -6982,12 +7086,12 @@ def is_pest_control_policy_context(text: str) -> bool:
     if not t:
         return False
 
-    strict_hits = count_any(t, [w.lower() for w in PEST_STRICT_TERMS])
-    weather_hits = count_any(t, [w.lower() for w in PEST_WEATHER_TERMS])
-    horti_hits = count_any(t, [w.lower() for w in PEST_HORTI_TERMS])
-    action_hits = count_any(t, [w.lower() for w in ("전수조사", "정밀예찰", "예찰", "방제", "살포", "약제", "무상공급", "집중방제", "긴급방제", "확산 차단")])
-    policy_hits = count_any(t, [w.lower() for w in ("정책", "대책", "조례", "예산", "브리핑", "보도자료", "법", "개정", "관세", "통관")])
-    local_gov_hits = count_any(t, [w.lower() for w in ("시", "도", "시청", "도청", "군", "군청", "구", "구청", "지자체")])
+    strict_hits = count_any(t, _lowered_terms(PEST_STRICT_TERMS))
+    weather_hits = count_any(t, _lowered_terms(PEST_WEATHER_TERMS))
+    horti_hits = count_any(t, _lowered_terms(PEST_HORTI_TERMS))
+    action_hits = count_any(t, _lowered_terms(("전수조사", "정밀예찰", "예찰", "방제", "살포", "약제", "무상공급", "집중방제", "긴급방제", "확산 차단")))
+    policy_hits = count_any(t, _lowered_terms(("정책", "대책", "조례", "예산", "브리핑", "보도자료", "법", "개정", "관세", "통관")))
+    local_gov_hits = count_any(t, _lowered_terms(("시", "도", "시청", "도청", "군", "군청", "구", "구청", "지자체")))
 
     # 명시 해충명(예: 토마토뿔나방) 패턴 보강
     named_pest = re.search(r"[가-힣]{1,8}(나방|진딧물|가루이|응애|노린재|총채벌레|깍지벌레|선충)", t) is not None
@@ -7021,8 +7125,8 @@ def _has_named_pest_signal(text: str) -> bool:
 
 def _pest_title_signal_count(title: str) -> int:
     t = (title or "").lower()
-    hits = count_any(t, [w.lower() for w in PEST_TITLE_CORE_TERMS])
-    hits += count_any(t, [w.lower() for w in PEST_WEATHER_TERMS])
+    hits = count_any(t, _lowered_terms(PEST_TITLE_CORE_TERMS))
+    hits += count_any(t, _lowered_terms(PEST_WEATHER_TERMS))
     if _has_named_pest_signal(t):
         hits += 1
     return hits
@@ -7056,7 +7160,7 @@ def is_roundup_digest_title(title: str) -> bool:
     if not t:
         return False
     bracketed = _PEST_ROUNDUP_TITLE_PREFIX_RX.search(raw) is not None
-    roundup_hits = count_any(t, [w.lower() for w in _PEST_ROUNDUP_TITLE_TERMS])
+    roundup_hits = count_any(t, _lowered_terms(_PEST_ROUNDUP_TITLE_TERMS))
     tail_digest = t.endswith(" 외") or t.endswith("외") or t.endswith(" 등") or t.endswith("등")
     return (bracketed and roundup_hits >= 1) or (roundup_hits >= 2 and tail_digest)
 
@@ -7085,11 +7189,11 @@ def is_news_roundup_brief_context(title: str, desc: str) -> bool:
 
 def is_pest_story_focus_strong(title: str, desc: str) -> bool:
     t = f"{title or ''} {desc or ''}".lower()
-    strict_hits = count_any(t, [w.lower() for w in PEST_STRICT_TERMS])
-    weather_hits = count_any(t, [w.lower() for w in PEST_WEATHER_TERMS])
+    strict_hits = count_any(t, _lowered_terms(PEST_STRICT_TERMS))
+    weather_hits = count_any(t, _lowered_terms(PEST_WEATHER_TERMS))
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
-    horti_hits = count_any(t, [w.lower() for w in PEST_HORTI_TERMS]) + managed_count
-    action_hits = count_any(t, [w.lower() for w in _PEST_ACTION_TERMS])
+    horti_hits = count_any(t, _lowered_terms(PEST_HORTI_TERMS)) + managed_count
+    action_hits = count_any(t, _lowered_terms(_PEST_ACTION_TERMS))
     total_signal = strict_hits + weather_hits
     if horti_hits == 0 or total_signal == 0:
         return False
@@ -7111,9 +7215,9 @@ def is_local_agri_policy_program_context(text: str) -> bool:
     local_gov_named = re.search(r"(?:^|[\s·,，])(?:[가-힣]{2,12}(?:특별자치시|특별자치도|광역시|특별시|시|군|구|도))(?=$|[\s·,，])", text or "") is not None
 
     return (
-        (count_any(t, [w.lower() for w in local_gov_terms]) >= 1 or local_gov_named)
-        and count_any(t, [w.lower() for w in policy_program_terms]) >= 2
-        and count_any(t, [w.lower() for w in agri_market_terms]) >= 1
+        (count_any(t, _lowered_terms(local_gov_terms)) >= 1 or local_gov_named)
+        and count_any(t, _lowered_terms(policy_program_terms)) >= 2
+        and count_any(t, _lowered_terms(agri_market_terms)) >= 1
     )
 
 
@@ -7136,15 +7240,15 @@ def is_policy_local_price_support_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    actor_hits = count_any(txt, [w.lower() for w in _POLICY_LOCAL_PRICE_SUPPORT_ACTOR_TERMS])
+    actor_hits = count_any(txt, _lowered_terms(_POLICY_LOCAL_PRICE_SUPPORT_ACTOR_TERMS))
     if re.search(r"(?:^|[\s·,，])(?:[가-힣]{2,12}(?:특별자치시|특별자치도|광역시|특별시|시|군|구|도))(?=$|[\s·,，])", ttl):
         actor_hits += 1
     elif re.search(r"(?:^|[\s·,，])(?:[가-힣]{2,12}(?:특별자치시|특별자치도|광역시|특별시|시|군|구|도))(?=$|[\s·,，])", desc or ""):
         actor_hits += 1
-    support_hits = count_any(txt, [w.lower() for w in _POLICY_LOCAL_PRICE_SUPPORT_TERMS])
+    support_hits = count_any(txt, _lowered_terms(_POLICY_LOCAL_PRICE_SUPPORT_TERMS))
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    agri_hits = count_any(txt, [w.lower() for w in _POLICY_LOCAL_PRICE_SUPPORT_AGRI_TERMS]) + managed_count
-    title_support_hits = count_any((ttl or "").lower(), [w.lower() for w in ("가격안정", "최저가격", "최저 가격", "보전", "지원")])
+    agri_hits = count_any(txt, _lowered_terms(_POLICY_LOCAL_PRICE_SUPPORT_AGRI_TERMS)) + managed_count
+    title_support_hits = count_any((ttl or "").lower(), _lowered_terms(("가격안정", "최저가격", "최저 가격", "보전", "지원")))
     return (
         actor_hits >= 1
         and agri_hits >= 1
@@ -7177,12 +7281,12 @@ def is_policy_price_stabilization_system_context(title: str, desc: str, dom: str
         return False
     if is_policy_event_tail_context(ttl, desc or "", normalize_host(dom or ""), press or ""):
         return False
-    system_hits = count_any(txt, [w.lower() for w in _POLICY_PRICE_STABILIZATION_SYSTEM_TERMS])
-    action_hits = count_any(txt, [w.lower() for w in _POLICY_PRICE_STABILIZATION_SYSTEM_ACTION_TERMS])
-    actor_hits = count_any(txt, [w.lower() for w in _POLICY_PRICE_STABILIZATION_SYSTEM_ACTOR_TERMS])
+    system_hits = count_any(txt, _lowered_terms(_POLICY_PRICE_STABILIZATION_SYSTEM_TERMS))
+    action_hits = count_any(txt, _lowered_terms(_POLICY_PRICE_STABILIZATION_SYSTEM_ACTION_TERMS))
+    actor_hits = count_any(txt, _lowered_terms(_POLICY_PRICE_STABILIZATION_SYSTEM_ACTOR_TERMS))
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    agri_hits = count_any(txt, [w.lower() for w in _POLICY_MAJOR_ISSUE_AGRI_TERMS]) + managed_count
-    title_system_hits = count_any((ttl or "").lower(), [w.lower() for w in ("농산물가격안정제도", "가격안정제도", "평균가격", "경영비", "차액 지원")])
+    agri_hits = count_any(txt, _lowered_terms(_POLICY_MAJOR_ISSUE_AGRI_TERMS)) + managed_count
+    title_system_hits = count_any((ttl or "").lower(), _lowered_terms(("농산물가격안정제도", "가격안정제도", "평균가격", "경영비", "차액 지원")))
     return (
         agri_hits >= 1
         and actor_hits >= 1
@@ -7347,9 +7451,9 @@ def is_consumer_campaign_promo_context(title: str, desc: str, dom: str = "") ->
     if "챌린지" not in lead and "캠페인 동참" not in lead:
         return False
     # 정부·지자체·생산자단체의 공식 수급/소비 정책 행사는 제외하지 않는다(정책성 유지).
-    if count_any(lead, [w.lower() for w in ("농식품부", "농림축산식품부", "정부", "지자체", "도청", "시청", "군청")]) >= 1:
+    if count_any(lead, _lowered_terms(("농식품부", "농림축산식품부", "정부", "지자체", "도청", "시청", "군청"))) >= 1:
         return False
-    celeb_hits = count_any(lead, [w.lower() for w in _CONSUMER_CAMPAIGN_CELEB_TERMS])
+    celeb_hits = count_any(lead, _lowered_terms(_CONSUMER_CAMPAIGN_CELEB_TERMS))
     star_domain = "star." in (dom or "") or "entertain" in (dom or "")
     return celeb_hits >= 1 or star_domain
 
@@ -7376,10 +7480,10 @@ def is_supply_welfare_field_support_context(title: str, desc: str) -> bool:
     lead = _nfkc_lower(f"{ttl} {(desc or '')[:220]}")
     if not lead:
         return False
-    if count_any(lead, [w.lower() for w in _SUPPLY_WELFARE_TERMS]) < 1:
+    if count_any(lead, _lowered_terms(_SUPPLY_WELFARE_TERMS)) < 1:
         return False
     # 가격·시세·출하 등 실제 시장/수급 맥락이 있으면 수급 기사로 유지(판촉이라도 시장성 보존)
-    if count_any(lead, [w.lower() for w in _SUPPLY_MARKET_ANCHOR_TERMS]) >= 1:
+    if count_any(lead, _lowered_terms(_SUPPLY_MARKET_ANCHOR_TERMS)) >= 1:
         return False
     return True
 
@@ -7393,7 +7497,7 @@ def is_supply_org_promo_feature_context(title: str, desc: str) -> bool:
         return False
 
     org_hit = (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl) is not None) or (
-        count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_TERMS]) >= 1
+        count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_TERMS)) >= 1
     )
     if not org_hit:
         return False
@@ -7408,10 +7512,10 @@ def is_supply_org_promo_feature_context(title: str, desc: str) -> bool:
     if not horti_hit:
         return False
 
-    promo_hits = count_any(txt, [w.lower() for w in _SUPPLY_ORG_PROMO_TERMS])
-    season_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROMO_FEATURE_SEASON_TERMS])
-    official_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_WEAK_TAIL_OFFICIAL_TERMS])
-    visit_hits = count_any(txt, [w.lower() for w in _SUPPLY_WEAK_TAIL_VISIT_TERMS])
+    promo_hits = count_any(txt, _lowered_terms(_SUPPLY_ORG_PROMO_TERMS))
+    season_hits = count_any(txt, _lowered_terms(_SUPPLY_PROMO_FEATURE_SEASON_TERMS))
+    official_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_WEAK_TAIL_OFFICIAL_TERMS))
+    visit_hits = count_any(txt, _lowered_terms(_SUPPLY_WEAK_TAIL_VISIT_TERMS))
     if official_hits >= 1 and visit_hits >= 2:
         return False
 
@@ -7430,12 +7534,12 @@ def is_supply_tourism_event_context(title: str, desc: str) -> bool:
     if is_supply_stabilization_policy_context(txt) or is_policy_market_brief_context(txt):
         return False
 
-    tourism_hits = count_any(txt, [w.lower() for w in _SUPPLY_TOURISM_EVENT_TERMS])
-    title_tourism_hits = count_any((ttl or "").lower(), [w.lower() for w in _SUPPLY_TOURISM_EVENT_TERMS])
+    tourism_hits = count_any(txt, _lowered_terms(_SUPPLY_TOURISM_EVENT_TERMS))
+    title_tourism_hits = count_any((ttl or "").lower(), _lowered_terms(_SUPPLY_TOURISM_EVENT_TERMS))
     if tourism_hits == 0 and title_tourism_hits == 0:
         return False
 
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_TOURISM_KEEP_TERMS])
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_TOURISM_KEEP_TERMS))
     horti_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     if horti_hits == 0 and managed_count == 0 and best_horti_score(title, desc) < 1.8:
@@ -7460,10 +7564,10 @@ def is_commodity_sales_promo_context(title: str, desc: str) -> bool:
     topic_hit = topic in _HORTI_TOPICS_SET and topic_sc >= 1.0
     if managed_count == 0 and item_hits == 0 and (not topic_hit) and best_horti_score(ttl, desc or "") < 1.6:
         return False
-    promo_hits = count_any(txt, [w.lower() for w in _COMMODITY_PROMO_TAIL_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _COMMODITY_PROMO_KEEP_TERMS])
-    retail_actor_hits = count_any(txt, [w.lower() for w in _COMMODITY_PROMO_RETAIL_ACTOR_TERMS])
-    retail_action_hits = count_any(txt, [w.lower() for w in _COMMODITY_PROMO_RETAIL_ACTION_TERMS])
+    promo_hits = count_any(txt, _lowered_terms(_COMMODITY_PROMO_TAIL_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_COMMODITY_PROMO_KEEP_TERMS))
+    retail_actor_hits = count_any(txt, _lowered_terms(_COMMODITY_PROMO_RETAIL_ACTOR_TERMS))
+    retail_action_hits = count_any(txt, _lowered_terms(_COMMODITY_PROMO_RETAIL_ACTION_TERMS))
     retail_like = is_retail_promo_context(txt) or (retail_actor_hits >= 1 and retail_action_hits >= 1)
     if promo_hits == 0 and not retail_like:
         return False
@@ -7491,10 +7595,10 @@ def is_commodity_political_statement_context(title: str, desc: str) -> bool:
     topic_hit = topic in _HORTI_TOPICS_SET and topic_sc >= 1.0
     if managed_count == 0 and item_hits == 0 and (not topic_hit) and best_horti_score(ttl, desc or "") < 1.6:
         return False
-    actor_hits = count_any(ttl_l, [w.lower() for w in _COMMODITY_POLITICAL_ACTOR_TERMS]) + count_any(txt, [w.lower() for w in _COMMODITY_POLITICAL_ACTOR_TERMS])
-    action_hits = count_any(txt, [w.lower() for w in _COMMODITY_POLITICAL_ACTION_TERMS])
-    quoted_statement = actor_hits >= 1 and any(mark in ttl for mark in ('"', "“", "”", "‘", "’")) and count_any(txt, [w.lower() for w in ("가격", "값", "생산비", "격리", "대책")]) >= 1
-    keep_hits = count_any(txt, [w.lower() for w in _COMMODITY_POLITICAL_KEEP_TERMS])
+    actor_hits = count_any(ttl_l, _lowered_terms(_COMMODITY_POLITICAL_ACTOR_TERMS)) + count_any(txt, _lowered_terms(_COMMODITY_POLITICAL_ACTOR_TERMS))
+    action_hits = count_any(txt, _lowered_terms(_COMMODITY_POLITICAL_ACTION_TERMS))
+    quoted_statement = actor_hits >= 1 and any(mark in ttl for mark in ('"', "“", "”", "‘", "’")) and count_any(txt, _lowered_terms(("가격", "값", "생산비", "격리", "대책"))) >= 1
+    keep_hits = count_any(txt, _lowered_terms(_COMMODITY_POLITICAL_KEEP_TERMS))
     if actor_hits == 0 or (action_hits == 0 and not quoted_statement):
         return False
     if keep_hits >= 1 and (is_dist_market_ops_context(ttl, desc) or is_horti_market_action_context(ttl, desc) or is_dist_field_market_response_context(ttl, desc)):
@@ -7519,10 +7623,10 @@ def is_commodity_support_advice_context(title: str, desc: str) -> bool:
     topic_hit = topic in _HORTI_TOPICS_SET and topic_sc >= 1.0
     if managed_count == 0 and item_hits == 0 and (not topic_hit) and best_horti_score(ttl, desc or "") < 1.6:
         return False
-    title_hits = count_any(ttl_l, [w.lower() for w in _COMMODITY_SUPPORT_TITLE_TERMS])
-    text_hits = count_any(txt, [w.lower() for w in _COMMODITY_SUPPORT_TITLE_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _COMMODITY_SUPPORT_KEEP_TERMS])
-    market_hits = count_any(txt, [w.lower() for w in _MANAGED_COMMODITY_FOCUS_MARKET_TERMS])
+    title_hits = count_any(ttl_l, _lowered_terms(_COMMODITY_SUPPORT_TITLE_TERMS))
+    text_hits = count_any(txt, _lowered_terms(_COMMODITY_SUPPORT_TITLE_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_COMMODITY_SUPPORT_KEEP_TERMS))
+    market_hits = count_any(txt, _lowered_terms(_MANAGED_COMMODITY_FOCUS_MARKET_TERMS))
     if title_hits == 0 and text_hits < 2:
         return False
     if keep_hits >= 2 or (keep_hits >= 1 and title_hits == 0) or market_hits >= 2:
@@ -7546,8 +7650,8 @@ def is_commodity_consumer_guide_context(title: str, desc: str) -> bool:
     topic_hit = topic in _HORTI_TOPICS_SET and topic_sc >= 1.0
     if managed_count == 0 and item_hits == 0 and (not topic_hit) and best_horti_score(ttl, desc or "") < 1.6:
         return False
-    guide_hits = count_any(txt, [w.lower() for w in _COMMODITY_CONSUMER_GUIDE_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _COMMODITY_CONSUMER_GUIDE_KEEP_TERMS])
+    guide_hits = count_any(txt, _lowered_terms(_COMMODITY_CONSUMER_GUIDE_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_COMMODITY_CONSUMER_GUIDE_KEEP_TERMS))
     if guide_hits == 0:
         return False
     return keep_hits == 0
@@ -7565,19 +7669,19 @@ def is_commodity_consumer_storage_tip_context(title: str, desc: str) -> bool:
         return False
     guide_hits = count_any(
         txt,
-        [w.lower() for w in ("보관", "저장 기간", "저장기간", "실온 보관", "냉장 보관", "함께 두", "같이 두", "싹이", "솔라닌", "에틸렌", "햇빛", "수분 노출")],
+        _lowered_terms(("보관", "저장 기간", "저장기간", "실온 보관", "냉장 보관", "함께 두", "같이 두", "싹이", "솔라닌", "에틸렌", "햇빛", "수분 노출")),
     )
     title_guide_hits = count_any(
         ttl_l,
-        [w.lower() for w in ("보관", "저장 기간", "저장기간", "함께 두", "같이 두", "먹으면", "손해")],
+        _lowered_terms(("보관", "저장 기간", "저장기간", "함께 두", "같이 두", "먹으면", "손해")),
     )
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("산지유통", "저장고", "저장 물량", "저장물량", "재고", "도매시장", "공판장", "출하", "반입", "경락", "수급", "가격")],
+        _lowered_terms(("산지유통", "저장고", "저장 물량", "저장물량", "재고", "도매시장", "공판장", "출하", "반입", "경락", "수급", "가격")),
     )
     supply_chain_hits = count_any(
         txt,
-        [w.lower() for w in ("비축", "계약재배", "공급망", "조달", "식품업계", "식자재", "포장김치", "도매시장", "공급 확대", "공급을 확대")],
+        _lowered_terms(("비축", "계약재배", "공급망", "조달", "식품업계", "식자재", "포장김치", "도매시장", "공급 확대", "공급을 확대")),
     )
     if supply_chain_hits >= 2:
         return False
@@ -7595,12 +7699,12 @@ def is_supply_crime_incident_context(title: str, desc: str) -> bool:
         return False
     incident_hits = count_any(
         txt,
-        [w.lower() for w in ("도난", "절도", "훔쳐", "훔친", "사라진", "경찰", "수사", "피해액", "범행", "체포", "입건")],
+        _lowered_terms(("도난", "절도", "훔쳐", "훔친", "사라진", "경찰", "수사", "피해액", "범행", "체포", "입건")),
     )
-    damage_hits = count_any(txt, [w.lower() for w in ("망쳐", "고사", "피해", "피해가", "수천만원", "수천만 원")])
+    damage_hits = count_any(txt, _lowered_terms(("망쳐", "고사", "피해", "피해가", "수천만원", "수천만 원")))
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("가격", "시세", "수급", "출하", "반입", "경락", "경매", "도매", "작황", "생산량", "재배면적")],
+        _lowered_terms(("가격", "시세", "수급", "출하", "반입", "경락", "경매", "도매", "작황", "생산량", "재배면적")),
     )
     return incident_hits >= 2 and damage_hits >= 1 and market_hits <= 1
 
@@ -7610,8 +7714,8 @@ def is_pest_no_damage_crop_price_context(title: str, desc: str) -> bool:
     if not txt:
         return False
     no_damage = any(term in txt for term in ("냉해 없어", "냉해 피해 없어", "피해 없어", "피해가 없어", "피해는 없어", "냉해가 없어"))
-    crop_price = count_any(txt, [w.lower() for w in ("풍작", "작황", "수확", "생산량", "가격", "하락", "걱정", "우려")]) >= 2
-    pest_action = count_any(txt, [w.lower() for w in ("방제", "예찰", "약제", "살포", "확산", "발생", "차단", "병해충", "과수화상병", "탄저병")])
+    crop_price = count_any(txt, _lowered_terms(("풍작", "작황", "수확", "생산량", "가격", "하락", "걱정", "우려"))) >= 2
+    pest_action = count_any(txt, _lowered_terms(("방제", "예찰", "약제", "살포", "확산", "발생", "차단", "병해충", "과수화상병", "탄저병")))
     return bool(no_damage and crop_price and pest_action == 0)
 
 
@@ -7620,9 +7724,9 @@ def is_non_agri_industrial_material_market_context(title: str, desc: str) -> boo
     txt = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if not txt:
         return False
-    industrial_terms = [w.lower() for w in ("배터리", "k배터리", "분리막", "동박", "전해액", "양극재", "음극재", "이차전지", "반도체", "철강")]
-    market_terms = [w.lower() for w in ("가격반등", "가격 반등", "가격", "소재", "온기 확산", "업황", "실적", "주가")]
-    agri_anchor_terms = [w.lower() for w in ("농가", "농산물", "수급", "출하", "도매시장", "공판장")]
+    industrial_terms = _lowered_terms(("배터리", "k배터리", "분리막", "동박", "전해액", "양극재", "음극재", "이차전지", "반도체", "철강"))
+    market_terms = _lowered_terms(("가격반등", "가격 반등", "가격", "소재", "온기 확산", "업황", "실적", "주가"))
+    agri_anchor_terms = _lowered_terms(("농가", "농산물", "수급", "출하", "도매시장", "공판장"))
     title_industrial_hits = count_any(ttl, industrial_terms)
     title_market_hits = count_any(ttl, market_terms)
     title_agri_hits = count_any(ttl, HORTI_ITEM_TERMS_L) + count_any(ttl, agri_anchor_terms)
@@ -7643,26 +7747,26 @@ def is_non_agri_auto_market_context(title: str, desc: str) -> bool:
     txt = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if not txt:
         return False
-    agri_anchor_terms = [w.lower() for w in (
+    agri_anchor_terms = _lowered_terms((
         "농산물", "농식품", "농업", "농가", "원예", "과수", "채소", "과일",
         "수급", "출하", "도매시장", "공판장", "산지유통",
-    )]
+    ))
     if count_any(ttl, HORTI_ITEM_TERMS_L) + count_any(ttl, agri_anchor_terms) > 0:
         return False
     auto_title_hits = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "친환경차", "전기차", "phev", "hev", "하이브리드", "현대차", "기아",
             "byd", "씨라이언", "볼보", "suv", "세단", "모빌리티",
-        )],
+        )),
     )
     auto_text_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "친환경차", "전기차", "phev", "hev", "하이브리드", "현대차", "기아",
             "byd", "씨라이언", "볼보", "suv", "세단", "자동차", "차량", "라인업",
             "출시", "시장", "포위전략",
-        )],
+        )),
     )
     agri_text_hits = count_any(txt, agri_anchor_terms)
     # 자동차 기사 본문에 "시장 수급"처럼 범용 단어가 섞이는 경우가 있어
@@ -7680,27 +7784,27 @@ def is_non_agri_ai_robot_industry_context(title: str, desc: str) -> bool:
         return False
     title_agri_hits = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농업", "농가", "원예", "과수", "채소", "과일",
             "수급", "출하", "도매시장", "공판장", "산지유통", "스마트팜",
-        )],
+        )),
     ) + count_any(ttl, HORTI_ITEM_TERMS_L)
     if title_agri_hits > 0:
         return False
-    robot_title_hits = count_any(ttl, [w.lower() for w in ("ai", "로봇", "휴머노이드", "홈봇")])
+    robot_title_hits = count_any(ttl, _lowered_terms(("ai", "로봇", "휴머노이드", "홈봇")))
     robot_text_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "ai", "로봇", "휴머노이드", "입는 로봇", "자동차 정비사", "타이어",
             "산업 현장", "청소로봇", "홈봇", "스팀", "로니", "빌트인",
-        )],
+        )),
     )
     agri_text_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농업", "농가", "원예", "과수", "채소", "과일",
             "도매시장", "공판장", "산지유통", "apc", "스마트팜",
-        )],
+        )),
     )
     return robot_title_hits >= 1 and robot_text_hits >= 2 and agri_text_hits == 0
 
@@ -7727,7 +7831,7 @@ def _is_supply_authoritative_multi_price_context(title: str, desc: str) -> bool:
     )
     supply_evidence = count_any(
         txt,
-        [w.lower() for w in ("출하", "반입량", "생산량", "재배 면적", "재배면적", "전주 대비")],
+        _lowered_terms(("출하", "반입량", "생산량", "재배 면적", "재배면적", "전주 대비")),
     )
     return bool(
         official_source
@@ -7749,9 +7853,9 @@ def is_supply_unmanaged_broad_price_roundup_context(title: str, desc: str) -> bo
     if _is_supply_authoritative_multi_price_context(title, desc):
         return False
     broad_price = "농산물값" in ttl or "농산물 값" in ttl or "농산물 가격" in ttl
-    unmanaged_hits = count_any(ttl, [w.lower() for w in ("체리", "망고", "두리안", "바나나")])
+    unmanaged_hits = count_any(ttl, _lowered_terms(("체리", "망고", "두리안", "바나나")))
     managed_title_hits = int(_managed_commodity_match_summary(title or "", "").get("count") or 0)
-    radio_tail = count_any(txt, [w.lower() for w in ("ytn 라디오", "방송", "전화", "아래 텍스트는 실제 방송")]) >= 1
+    radio_tail = count_any(txt, _lowered_terms(("ytn 라디오", "방송", "전화", "아래 텍스트는 실제 방송"))) >= 1
     return broad_price and unmanaged_hits >= 1 and (radio_tail or managed_title_hits <= 1)
 
 def _has_title_agri_policy_anchor(title: str) -> bool:
@@ -7760,12 +7864,12 @@ def _has_title_agri_policy_anchor(title: str) -> bool:
         return False
     return count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농업", "농가", "원예", "과수", "채소", "과일",
             "수급", "가격안정", "가격 안정", "농특세", "농협", "농식품부",
             "농림축산식품부", "계약재배", "시장격리", "할인지원", "할당관세",
             "검역", "통관", "방제", "병해충", "과수화상병",
-        )],
+        )),
     ) >= 1
 
 
@@ -7777,18 +7881,18 @@ def is_non_agri_transport_policy_context(title: str, desc: str) -> bool:
         return False
     transport_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "여객선", "조타실", "선박", "해양사고", "선원", "해운", "항해", "cctv",
             "고속도로", "도로", "나들목", "ic", "교통 정체", "차로", "민간투자사업",
             "우선협상대상자", "성남~서초", "양재나들목",
-        )],
+        )),
     )
     policy_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "의무화", "안전", "대전환", "도입", "규제", "법안", "추진", "사업",
             "민간투자", "우선협상", "정체 줄인다", "선정",
-        )],
+        )),
     )
     return transport_hits >= 1 and policy_hits >= 1
 
@@ -7807,24 +7911,24 @@ def is_non_agri_trade_policy_context(title: str, desc: str) -> bool:
         return False
     trade_hits = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "관세 없앴", "관세 철폐", "무관세", "관세 인하", "상품시장 개방",
             "cepa", "fta", "무역협정", "수입 관세", "수출 관세",
-        )],
+        )),
     )
     non_agri_title_goods = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "캐시미어", "희토류", "광물", "화장품", "의약품", "자동차",
             "반도체", "철강", "섬유", "배터리", "원유", "천연가스",
-        )],
+        )),
     )
     non_agri_goods = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "캐시미어", "희토류", "광물", "화장품", "의약품", "자동차",
             "반도체", "철강", "섬유", "배터리", "원유", "천연가스",
-        )],
+        )),
     )
     # A long agreement explainer may mention one agricultural tariff line deep
     # in the body.  The briefing decision follows the title's traded basket:
@@ -7841,10 +7945,10 @@ def is_non_agri_consumer_export_promo_context(title: str, desc: str) -> bool:
         return False
     promo_hits = count_any(
         txt,
-        [w.lower() for w in ("소비재전", "소비재 전", "소비재", "수출길 청신호", "판로 확대", "해외 진출", "바이어")],
+        _lowered_terms(("소비재전", "소비재 전", "소비재", "수출길 청신호", "판로 확대", "해외 진출", "바이어")),
     )
-    export_hits = count_any(txt, [w.lower() for w in ("수출", "동남아", "베트남", "해외", "박람회")])
-    title_promo_hits = count_any(ttl, [w.lower() for w in ("소비재", "수출길 청신호", "동남아", "베트남")])
+    export_hits = count_any(txt, _lowered_terms(("수출", "동남아", "베트남", "해외", "박람회")))
+    title_promo_hits = count_any(ttl, _lowered_terms(("소비재", "수출길 청신호", "동남아", "베트남")))
     return promo_hits >= 1 and export_hits >= 1 and title_promo_hits >= 1
 
 
@@ -7855,8 +7959,8 @@ def is_non_agri_education_opinion_policy_context(title: str, desc: str) -> bool:
         return False
     if _has_title_agri_policy_anchor(title):
         return False
-    education_hits = count_any(ttl, [w.lower() for w in ("대학", "캠퍼스", "교육", "부산의 앵커", "앵커")])
-    opinion_hits = count_any(txt, [w.lower() for w in ("기고", "칼럼", "오피니언", "지역발전", "도시", "혁신")])
+    education_hits = count_any(ttl, _lowered_terms(("대학", "캠퍼스", "교육", "부산의 앵커", "앵커")))
+    opinion_hits = count_any(txt, _lowered_terms(("기고", "칼럼", "오피니언", "지역발전", "도시", "혁신")))
     return education_hits >= 1 and opinion_hits >= 1
 
 
@@ -7864,10 +7968,10 @@ def is_pest_diplomacy_not_pest_context(title: str, desc: str) -> bool:
     txt = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if not txt:
         return False
-    diplomacy_hits = count_any(txt, [w.lower() for w in ("북", "북한", "외교", "비타민c", "묘목")])
+    diplomacy_hits = count_any(txt, _lowered_terms(("북", "북한", "외교", "비타민c", "묘목")))
     pest_action_hits = count_any(
         txt,
-        [w.lower() for w in ("방제", "예찰", "약제", "살포", "확산", "발생", "차단", "병해충", "과수화상병", "탄저병")],
+        _lowered_terms(("방제", "예찰", "약제", "살포", "확산", "발생", "차단", "병해충", "과수화상병", "탄저병")),
     )
     return diplomacy_hits >= 2 and pest_action_hits == 0
 
@@ -7881,8 +7985,8 @@ def is_commodity_origin_history_tail_context(title: str, desc: str) -> bool:
     item_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     if managed_count == 0 and item_hits == 0:
         return False
-    origin_hits = count_any(txt, [w.lower() for w in ("들여온", "유래", "사연", "역사", "원산지", "코리안 멜론", "품종 이야기")])
-    market_hits = count_any(txt, [w.lower() for w in ("수급", "가격", "출하", "반입", "경락", "도매시장", "공판장", "농가 피해", "생산량", "재배면적")])
+    origin_hits = count_any(txt, _lowered_terms(("들여온", "유래", "사연", "역사", "원산지", "코리안 멜론", "품종 이야기")))
+    market_hits = count_any(txt, _lowered_terms(("수급", "가격", "출하", "반입", "경락", "도매시장", "공판장", "농가 피해", "생산량", "재배면적")))
     title_story = any(term in ttl for term in ("된 사연", "유래", "역사", "들여온"))
     return origin_hits >= 2 and title_story and market_hits == 0
 
@@ -7898,7 +8002,7 @@ def is_origin_fraud_enforcement_context(title: str, desc: str) -> bool:
         return False
     strong_fraud = any(w in txt for w in ("둔갑", "박스갈이"))
     origin_violation = ("원산지" in txt) and (
-        count_any(txt, [w.lower() for w in ("위반", "거짓", "속여", "속이", "허위", "부정유통", "적발", "둔갑")]) >= 1
+        count_any(txt, _lowered_terms(("위반", "거짓", "속여", "속이", "허위", "부정유통", "적발", "둔갑"))) >= 1
     )
     return strong_fraud or origin_violation
 
@@ -7915,11 +8019,11 @@ def is_personnel_award_noise_context(title: str, desc: str) -> bool:
         return False
     award_hits = count_any(
         ttl,
-        [w.lower() for w in ("포상", "표창", "시상", "수상자", "공로상", "모범공무원", "인사발령", "승진", "임명", "유공", "공무 성과")],
+        _lowered_terms(("포상", "표창", "시상", "수상자", "공로상", "모범공무원", "인사발령", "승진", "임명", "유공", "공무 성과")),
     )
     actor_hits = count_any(
         txt,
-        [w.lower() for w in ("공무원", "공무 성과", "주무관", "사무관", "서기관", "공직", "임직원", "직원")],
+        _lowered_terms(("공무원", "공무 성과", "주무관", "사무관", "서기관", "공직", "임직원", "직원")),
     )
     return award_hits >= 1 and actor_hits >= 1
 
@@ -7938,14 +8042,14 @@ def is_food_cooking_lifestyle_context(title: str, desc: str) -> bool:
         return False
     cooking_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "레시피", "셰프", "조리법", "요리법", "맛의 비결", "맛집", "집에서 만들", "집밥",
             "요리 대가", "중식의 대가", "손쉽게 만들", "비법", "황금레시피", "쿠킹",
-        )],
+        )),
     )
     food_hits = count_any(
         txt,
-        [w.lower() for w in ("음식", "메뉴", "외식", "배달", "먹방", "맛있", "즐길", "한 그릇", "별미")],
+        _lowered_terms(("음식", "메뉴", "외식", "배달", "먹방", "맛있", "즐길", "한 그릇", "별미")),
     )
     # 요리 큐가 2개 이상으로 분명할 때만 음식 라이프스타일로 판정(수급 기사의 부수적 '레시피' 1회 언급은 보존).
     return cooking_hits >= 2 and food_hits >= 1
@@ -7974,9 +8078,9 @@ def is_commodity_regional_branding_context(title: str, desc: str) -> bool:
     )
     if not geo_hit:
         return False
-    brand_hits = count_any(txt, [w.lower() for w in _COMMODITY_REGIONAL_BRANDING_TERMS])
-    title_brand_hits = count_any(ttl_l, [w.lower() for w in _COMMODITY_REGIONAL_BRANDING_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _COMMODITY_CONSUMER_GUIDE_KEEP_TERMS]) + count_any(txt, [w.lower() for w in _MANAGED_COMMODITY_FOCUS_MARKET_TERMS])
+    brand_hits = count_any(txt, _lowered_terms(_COMMODITY_REGIONAL_BRANDING_TERMS))
+    title_brand_hits = count_any(ttl_l, _lowered_terms(_COMMODITY_REGIONAL_BRANDING_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_COMMODITY_CONSUMER_GUIDE_KEEP_TERMS)) + count_any(txt, _lowered_terms(_MANAGED_COMMODITY_FOCUS_MARKET_TERMS))
     if title_brand_hits >= 1:
         return keep_hits <= 3
     return brand_hits >= 1 and keep_hits == 0
@@ -7989,11 +8093,11 @@ def is_commodity_broad_price_roundup_context(title: str, desc: str) -> bool:
         return False
     if is_supply_stabilization_policy_context(txt) or is_policy_market_brief_context(txt):
         return False
-    macro_hits = count_any(txt, [w.lower() for w in _COMMODITY_MACRO_ROUNDUP_TERMS])
-    goods_hits = count_any(txt, [w.lower() for w in _COMMODITY_MACRO_ROUNDUP_GOODS_TERMS])
+    macro_hits = count_any(txt, _lowered_terms(_COMMODITY_MACRO_ROUNDUP_TERMS))
+    goods_hits = count_any(txt, _lowered_terms(_COMMODITY_MACRO_ROUNDUP_GOODS_TERMS))
     keep_hits = (
-        count_any(txt, [w.lower() for w in _MANAGED_COMMODITY_FOCUS_MARKET_TERMS])
-        + count_any(txt, [w.lower() for w in _COMMODITY_SUPPORT_KEEP_TERMS])
+        count_any(txt, _lowered_terms(_MANAGED_COMMODITY_FOCUS_MARKET_TERMS))
+        + count_any(txt, _lowered_terms(_COMMODITY_SUPPORT_KEEP_TERMS))
     )
     multi_item_like = bool(re.search(r"\d+\s*개\s*품목", txt)) or txt.count("·") >= 2
     return macro_hits >= 1 and (goods_hits >= 2 or multi_item_like) and keep_hits <= 1
@@ -8007,11 +8111,11 @@ def is_supply_generic_category_watch_context(title: str, desc: str) -> bool:
         return False
     if is_supply_stabilization_policy_context(txt) or is_policy_market_brief_context(txt):
         return False
-    category_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_GENERIC_CATEGORY_WATCH_TERMS])
-    issue_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_GENERIC_CATEGORY_WATCH_ISSUE_TERMS])
+    category_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_GENERIC_CATEGORY_WATCH_TERMS))
+    issue_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_GENERIC_CATEGORY_WATCH_ISSUE_TERMS))
     broad_anchor_hits = count_any(
         txt,
-        [w.lower() for w in ("채소", "과일", "농산물", "원예", "과채", "엽근채", "수급", "가격", "공급", "소비", "정책")],
+        _lowered_terms(("채소", "과일", "농산물", "원예", "과채", "엽근채", "수급", "가격", "공급", "소비", "정책")),
     )
     multi_item_like = bool(re.search(r"\d+\s*개\s*품목", txt)) or txt.count("·") >= 2
     return category_hits >= 1 and issue_hits >= 1 and (broad_anchor_hits >= 4 or multi_item_like)
@@ -8030,16 +8134,16 @@ def is_supply_local_sales_event_context(title: str, desc: str) -> bool:
     local_actor = (_LOCAL_REGION_IN_TITLE_RX.search(ttl) is not None) or (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl) is not None)
     if not local_actor:
         return False
-    title_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_LOCAL_SALES_EVENT_TITLE_TERMS])
-    promo_hits = count_any(txt, [w.lower() for w in _SUPPLY_LOCAL_SALES_EVENT_PROMO_TERMS])
-    metric_hits = count_any(txt, [w.lower() for w in _SUPPLY_LOCAL_SALES_EVENT_METRIC_TERMS])
+    title_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_LOCAL_SALES_EVENT_TITLE_TERMS))
+    promo_hits = count_any(txt, _lowered_terms(_SUPPLY_LOCAL_SALES_EVENT_PROMO_TERMS))
+    metric_hits = count_any(txt, _lowered_terms(_SUPPLY_LOCAL_SALES_EVENT_METRIC_TERMS))
     if re.search(r"\d[\d,]*\s*(?:만\s*원|억\s*원|억원)", txt):
         metric_hits += 1
     hard_keep_hits = count_any(
         txt,
-        [w.lower() for w in ("수급", "출하", "경락", "경매", "도매시장", "공판장", "가락시장", "산지유통", "산지유통센터", "반입", "재고", "작황", "생산량", "난방비")],
+        _lowered_terms(("수급", "출하", "경락", "경매", "도매시장", "공판장", "가락시장", "산지유통", "산지유통센터", "반입", "재고", "작황", "생산량", "난방비")),
     )
-    soft_keep_hits = count_any(txt, [w.lower() for w in ("가격", "값", "저장")])
+    soft_keep_hits = count_any(txt, _lowered_terms(("가격", "값", "저장")))
     return title_hits >= 1 and promo_hits >= 1 and metric_hits >= 1 and hard_keep_hits == 0 and soft_keep_hits <= 2
 
 
@@ -8070,16 +8174,16 @@ def is_commodity_unanchored_general_context(
         return False
 
     keep_hits = (
-        count_any(txt, [w.lower() for w in _MANAGED_COMMODITY_FOCUS_MARKET_TERMS])
-        + count_any(txt, [w.lower() for w in _COMMODITY_SUPPORT_KEEP_TERMS])
-        + count_any(txt, [w.lower() for w in _COMMODITY_CONSUMER_GUIDE_KEEP_TERMS])
+        count_any(txt, _lowered_terms(_MANAGED_COMMODITY_FOCUS_MARKET_TERMS))
+        + count_any(txt, _lowered_terms(_COMMODITY_SUPPORT_KEEP_TERMS))
+        + count_any(txt, _lowered_terms(_COMMODITY_CONSUMER_GUIDE_KEEP_TERMS))
     )
     if keep_hits >= 2:
         return False
 
-    macro_hits = count_any(txt, [w.lower() for w in _COMMODITY_MACRO_ROUNDUP_TERMS])
-    goods_hits = count_any(txt, [w.lower() for w in _COMMODITY_MACRO_ROUNDUP_GOODS_TERMS])
-    generic_hits = count_any(txt, [w.lower() for w in _COMMODITY_UNANCHORED_GENERIC_TERMS])
+    macro_hits = count_any(txt, _lowered_terms(_COMMODITY_MACRO_ROUNDUP_TERMS))
+    goods_hits = count_any(txt, _lowered_terms(_COMMODITY_MACRO_ROUNDUP_GOODS_TERMS))
+    generic_hits = count_any(txt, _lowered_terms(_COMMODITY_UNANCHORED_GENERIC_TERMS))
     multi_item_like = bool(re.search(r"\d+\s*개\s*품목", txt)) or txt.count("·") >= 2
 
     if macro_hits >= 1 and (goods_hits >= 2 or multi_item_like):
@@ -8102,17 +8206,17 @@ def is_local_agri_org_feature_context(title: str, desc: str) -> bool:
         return False
 
     org_hit = (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl) is not None) or (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl_compact) is not None) or (
-        count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_TERMS]) >= 1
+        count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_TERMS)) >= 1
     )
-    promo_hit = count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_PROMO_TERMS])
-    field_hit = count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_FIELD_TERMS])
+    promo_hit = count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_PROMO_TERMS))
+    field_hit = count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_FIELD_TERMS))
     try:
         topic, topic_sc = best_topic_and_score(ttl, desc or "")
     except Exception:
         topic, topic_sc = ("", 0.0)
     horti_hit = (best_horti_score(ttl, desc or "") >= 1.1) or (topic in _HORTI_TOPICS_SET and topic_sc >= 1.0)
     agri_terms = ("농산물", "원예", "과수", "과일", "채소", "화훼", "농가", "샤인머스캣", "포도", "사과", "배", "GAP")
-    agri_hit = count_any(txt, [w.lower() for w in agri_terms]) >= 1
+    agri_hit = count_any(txt, _lowered_terms(agri_terms)) >= 1
     return org_hit and promo_hit >= 2 and field_hit >= 1 and (horti_hit or agri_hit)
 
 
@@ -8136,11 +8240,11 @@ def is_low_value_coop_pr_feature_context(title: str, desc: str) -> bool:
     txt = _nfkc_lower(f"{title or ''} {desc or ''}")
     concrete_ops_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "검역", "통관", "선적", "바이어", "공동선별", "공선출하", "산지유통센터",
             "apc", "물류", "도매시장", "공판장", "경락", "경매", "온라인 도매시장",
             "저온저장", "저장고", "선별",
-        )],
+        )),
     )
     return concrete_ops_hits == 0
 
@@ -8226,33 +8330,33 @@ def is_dist_local_field_profile_context(title: str, desc: str) -> bool:
         return False
 
     org_hit = (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(title or "") is not None) or (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl_compact) is not None) or (
-        count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_TERMS]) >= 1
+        count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_TERMS)) >= 1
     )
     if not org_hit:
         return False
 
-    org_title_hits = count_any(ttl, [w.lower() for w in ("\ud488\ubaa9\ub18d\ud611", "\uc6d0\uc608\ub18d\ud611")]) + count_any(ttl_compact, [w.lower() for w in ("\ud488\ubaa9\ub18d\ud611", "\uc6d0\uc608\ub18d\ud611")])
-    field_title_hits = count_any(ttl, [w.lower() for w in _DIST_LOCAL_FIELD_PROFILE_TITLE_TERMS]) + count_any(ttl_compact, [w.lower() for w in _DIST_LOCAL_FIELD_PROFILE_TITLE_TERMS])
-    field_body_hits = count_any(txt, [w.lower() for w in _DIST_LOCAL_FIELD_PROFILE_BODY_TERMS])
+    org_title_hits = count_any(ttl, _lowered_terms(("\ud488\ubaa9\ub18d\ud611", "\uc6d0\uc608\ub18d\ud611"))) + count_any(ttl_compact, _lowered_terms(("\ud488\ubaa9\ub18d\ud611", "\uc6d0\uc608\ub18d\ud611")))
+    field_title_hits = count_any(ttl, _lowered_terms(_DIST_LOCAL_FIELD_PROFILE_TITLE_TERMS)) + count_any(ttl_compact, _lowered_terms(_DIST_LOCAL_FIELD_PROFILE_TITLE_TERMS))
+    field_body_hits = count_any(txt, _lowered_terms(_DIST_LOCAL_FIELD_PROFILE_BODY_TERMS))
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uacf5\uc601\ub3c4\ub9e4\uc2dc\uc7a5", "\uacbd\ub77d", "\uacbd\ub9e4", "\ubc18\uc785", "\uc628\ub77c\uc778 \ub3c4\ub9e4\uc2dc\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\uc0b0\uc9c0\uc720\ud1b5\uc13c\ud130")],
+        _lowered_terms(("\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uacf5\uc601\ub3c4\ub9e4\uc2dc\uc7a5", "\uacbd\ub77d", "\uacbd\ub9e4", "\ubc18\uc785", "\uc628\ub77c\uc778 \ub3c4\ub9e4\uc2dc\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\uc0b0\uc9c0\uc720\ud1b5\uc13c\ud130")),
     )
     if has_apc_agri_context(txt):
         market_hits += 1
 
     horti_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     horti_sc = best_horti_score(title or "", desc or "")
-    profile_hits = count_any(txt, [w.lower() for w in ("\uc9c0\uc5ed\uacbd\uc81c", "\uc120\ub3c4", "\ube0c\ub79c\ub4dc", "\uacbd\uc81c\uc0ac\uc5c5", "\ub18d\uac00\uc2e4\uc775", "\ud310\ub85c", "\uc720\ud1b5", "\ucd9c\ud558")])
-    title_profile_hits = count_any(ttl, [w.lower() for w in ("\uc9c0\uc5ed\uacbd\uc81c \uc120\ub3c4", "\uc9c0\uc5ed\uacbd\uc81c \uc120\ub3c4\ud558\ub294")]) + count_any(
+    profile_hits = count_any(txt, _lowered_terms(("\uc9c0\uc5ed\uacbd\uc81c", "\uc120\ub3c4", "\ube0c\ub79c\ub4dc", "\uacbd\uc81c\uc0ac\uc5c5", "\ub18d\uac00\uc2e4\uc775", "\ud310\ub85c", "\uc720\ud1b5", "\ucd9c\ud558")))
+    title_profile_hits = count_any(ttl, _lowered_terms(("\uc9c0\uc5ed\uacbd\uc81c \uc120\ub3c4", "\uc9c0\uc5ed\uacbd\uc81c \uc120\ub3c4\ud558\ub294"))) + count_any(
         ttl_compact,
-        [w.lower() for w in ("\uc9c0\uc5ed\uacbd\uc81c\uc120\ub3c4", "\uc9c0\uc5ed\uacbd\uc81c\uc120\ub3c4\ud558\ub294")],
+        _lowered_terms(("\uc9c0\uc5ed\uacbd\uc81c\uc120\ub3c4", "\uc9c0\uc5ed\uacbd\uc81c\uc120\ub3c4\ud558\ub294")),
     )
     coop_field_hits = count_any(
         txt,
-        [w.lower() for w in ("\uad6c\ub9e4", "\uac00\uacf5", "\uc9c0\ub3c4\uc0ac\uc5c5", "\uc870\ud569\uc6d0 \uc2e4\uc775", "\uc2e4\uc775", "\uc9c0\uc5ed \uacbd\uc81c", "\uacfc\uc218 \uc804\ubb38")],
+        _lowered_terms(("\uad6c\ub9e4", "\uac00\uacf5", "\uc9c0\ub3c4\uc0ac\uc5c5", "\uc870\ud569\uc6d0 \uc2e4\uc775", "\uc2e4\uc775", "\uc9c0\uc5ed \uacbd\uc81c", "\uacfc\uc218 \uc804\ubb38")),
     )
-    horti_org_hits = count_any(txt, [w.lower() for w in ("\uacfc\uc218", "\uc0ac\uacfc", "\ubc30", "\ud3ec\ub3c4", "\uac10\uade4", "\uc6d0\uc608", "\ub18d\uc0b0\ubb3c", "\ub18d\uac00")])
+    horti_org_hits = count_any(txt, _lowered_terms(("\uacfc\uc218", "\uc0ac\uacfc", "\ubc30", "\ud3ec\ub3c4", "\uac10\uade4", "\uc6d0\uc608", "\ub18d\uc0b0\ubb3c", "\ub18d\uac00")))
 
     if org_title_hits >= 1 and (horti_hits >= 1 or horti_sc >= 1.4 or horti_org_hits >= 1):
         if field_title_hits >= 1 and (market_hits >= 1 or profile_hits >= 2):
@@ -8275,17 +8379,17 @@ def is_dist_market_ops_context(title: str, desc: str, dom: str = "", press: str
     if is_remote_foreign_trade_brief_context(ttl, desc or "", dom):
         return False
 
-    market_hits = count_any(txt, [w.lower() for w in _DIST_MARKET_OPS_MARKET_TERMS])
-    ops_hits = count_any(txt, [w.lower() for w in _DIST_MARKET_OPS_TERMS])
+    market_hits = count_any(txt, _lowered_terms(_DIST_MARKET_OPS_MARKET_TERMS))
+    ops_hits = count_any(txt, _lowered_terms(_DIST_MARKET_OPS_TERMS))
     actor_hits = count_any(
         txt,
-        [w.lower() for w in _DIST_MARKET_OPS_ACTOR_TERMS],
+        _lowered_terms(_DIST_MARKET_OPS_ACTOR_TERMS),
     )
     agri_hits = count_any(
         txt,
-        [w.lower() for w in ("\ub18d\uc0b0\ubb3c", "\ub18d\uc218\uc0b0\ubb3c", "\uc6d0\uc608", "\uacfc\uc218", "\uacfc\uc77c", "\ucc44\uc18c", "\uc0b0\uc9c0\uc720\ud1b5", "\ub3c4\ub9e4\uc2dc\uc7a5", "aT")],
+        _lowered_terms(("\ub18d\uc0b0\ubb3c", "\ub18d\uc218\uc0b0\ubb3c", "\uc6d0\uc608", "\uacfc\uc218", "\uacfc\uc77c", "\ucc44\uc18c", "\uc0b0\uc9c0\uc720\ud1b5", "\ub3c4\ub9e4\uc2dc\uc7a5", "aT")),
     )
-    event_hits = count_any(txt, [w.lower() for w in ("\uc138\ubbf8\ub098", "\ud3ec\ub7fc", "\uc124\uba85\ud68c", "\uac04\ub2f4\ud68c", "\ud589\uc0ac", "\uac1c\ucd5c")])
+    event_hits = count_any(txt, _lowered_terms(("\uc138\ubbf8\ub098", "\ud3ec\ub7fc", "\uc124\uba85\ud68c", "\uac04\ub2f4\ud68c", "\ud589\uc0ac", "\uac1c\ucd5c")))
 
     if market_hits == 0 or ops_hits < 2:
         return False
@@ -8301,11 +8405,11 @@ def is_dist_supply_management_center_context(title: str, desc: str) -> bool:
     if not txt:
         return False
 
-    center_hits = count_any(txt, [w.lower() for w in _DIST_SUPPLY_MANAGEMENT_CENTER_TERMS])
-    ops_hits = count_any(txt, [w.lower() for w in _DIST_SUPPLY_MANAGEMENT_OPS_TERMS])
+    center_hits = count_any(txt, _lowered_terms(_DIST_SUPPLY_MANAGEMENT_CENTER_TERMS))
+    ops_hits = count_any(txt, _lowered_terms(_DIST_SUPPLY_MANAGEMENT_OPS_TERMS))
     agri_hits = count_any(
         txt,
-        [w.lower() for w in ("\ub18d\uc0b0\ubb3c", "\ucc44\uc18c", "\ubc30\ucd94", "\ubb34", "\uc0b0\uc9c0", "\uc720\ud1b5", "\uc218\uae09")],
+        _lowered_terms(("\ub18d\uc0b0\ubb3c", "\ucc44\uc18c", "\ubc30\ucd94", "\ubb34", "\uc0b0\uc9c0", "\uc720\ud1b5", "\uc218\uae09")),
     )
     return center_hits >= 2 and agri_hits >= 1 and ops_hits >= 1
 
@@ -8317,26 +8421,26 @@ def is_dist_sales_channel_ops_context(title: str, desc: str) -> bool:
     if not txt:
         return False
 
-    channel_hits = count_any(txt, [w.lower() for w in _DIST_SALES_CHANNEL_OPS_TERMS])
-    actor_hits = count_any(txt, [w.lower() for w in _DIST_SALES_CHANNEL_ACTOR_TERMS])
-    agri_hits = count_any(txt, [w.lower() for w in ("\ub18d\uc5c5", "\ub18d\uc0b0\ubb3c", "\ub18d\uac00", "\uc720\ud1b5", "\ud310\ub85c", "\uc0b0\uc9c0\uc720\ud1b5", "\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5")])
-    market_hits = count_any(txt, [w.lower() for w in ("\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\ucd9c\ud558", "\ubb3c\ub958", "\uc720\ud1b5\ucc44\ub110")])
-    event_hits = count_any(txt, [w.lower() for w in ("\ud3c9\uac00\ud68c", "\uc6cc\ud06c\uc20d", "\ud68c\uc758", "\uac04\ub2f4\ud68c")])
+    channel_hits = count_any(txt, _lowered_terms(_DIST_SALES_CHANNEL_OPS_TERMS))
+    actor_hits = count_any(txt, _lowered_terms(_DIST_SALES_CHANNEL_ACTOR_TERMS))
+    agri_hits = count_any(txt, _lowered_terms(("\ub18d\uc5c5", "\ub18d\uc0b0\ubb3c", "\ub18d\uac00", "\uc720\ud1b5", "\ud310\ub85c", "\uc0b0\uc9c0\uc720\ud1b5", "\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5")))
+    market_hits = count_any(txt, _lowered_terms(("\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\ucd9c\ud558", "\ubb3c\ub958", "\uc720\ud1b5\ucc44\ub110")))
+    event_hits = count_any(txt, _lowered_terms(("\ud3c9\uac00\ud68c", "\uc6cc\ud06c\uc20d", "\ud68c\uc758", "\uac04\ub2f4\ud68c")))
     hard_anchor_hits = count_any(
         txt,
-        [w.lower() for w in ("\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\uc0b0\uc9c0\uc720\ud1b5\uc13c\ud130", "\ud1b5\ud569\uc720\ud1b5", "\ud1b5\ud569 \uc720\ud1b5", "\uc628\ub77c\uc778 \ud310\ub9e4", "\uc628\ub77c\uc778 \ud310\ub85c", "\uc720\ud1b5\ucc44\ub110", "\ubb3c\ub958", "\ucd9c\ud558")],
+        _lowered_terms(("\uac00\ub77d\uc2dc\uc7a5", "\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\uc0b0\uc9c0\uc720\ud1b5\uc13c\ud130", "\ud1b5\ud569\uc720\ud1b5", "\ud1b5\ud569 \uc720\ud1b5", "\uc628\ub77c\uc778 \ud310\ub9e4", "\uc628\ub77c\uc778 \ud310\ub85c", "\uc720\ud1b5\ucc44\ub110", "\ubb3c\ub958", "\ucd9c\ud558")),
     )
     title_hits = count_any(
         ttl.lower(),
-        [w.lower() for w in ("\uc5f0\ud569\ud310\ub9e4\uc0ac\uc5c5", "\uc9c1\uac70\ub798", "\ud310\ub9e4\uc0ac\uc5c5", "\ud1b5\ud569\uc720\ud1b5", "\ubb3c\ub7c9 \ud1b5\ud569\uad00\ub9ac", "\uc18c\ube44 \ucd09\uc9c4", "\uc628\ub77c\uc778 \ud310\ub9e4", "\uac70\ub798\ucc98 \ub2e4\ubcc0\ud654")]
+        _lowered_terms(("\uc5f0\ud569\ud310\ub9e4\uc0ac\uc5c5", "\uc9c1\uac70\ub798", "\ud310\ub9e4\uc0ac\uc5c5", "\ud1b5\ud569\uc720\ud1b5", "\ubb3c\ub7c9 \ud1b5\ud569\uad00\ub9ac", "\uc18c\ube44 \ucd09\uc9c4", "\uc628\ub77c\uc778 \ud310\ub9e4", "\uac70\ub798\ucc98 \ub2e4\ubcc0\ud654"))
     )
     promo_title_hits = count_any(
         ttl.lower(),
-        [w.lower() for w in ("\uc18c\ube44 \ucd09\uc9c4", "\uc18c\ube44\ucd09\uc9c4", "\uc9c1\uac70\ub798 \uc7a5\ud130", "\uc9c1\uac70\ub798\uc7a5\ud130", "\ub3d9\ud589\ub9c8\ucf00\ud305", "\uacf5\ub3d9\uad6c\ub9e4", "\ucd9c\ud558\ube44\uc6a9 \ubcf4\uc804", "\ucd9c\ud558 \ube44\uc6a9 \ubcf4\uc804", "\ud310\ub85c \ud655\ub300")],
+        _lowered_terms(("\uc18c\ube44 \ucd09\uc9c4", "\uc18c\ube44\ucd09\uc9c4", "\uc9c1\uac70\ub798 \uc7a5\ud130", "\uc9c1\uac70\ub798\uc7a5\ud130", "\ub3d9\ud589\ub9c8\ucf00\ud305", "\uacf5\ub3d9\uad6c\ub9e4", "\ucd9c\ud558\ube44\uc6a9 \ubcf4\uc804", "\ucd9c\ud558 \ube44\uc6a9 \ubcf4\uc804", "\ud310\ub85c \ud655\ub300")),
     )
     signature_title_hits = count_any(
         ttl.lower(),
-        [w.lower() for w in ("연합판매사업", "직거래", "직거래 장터", "직거래장터", "푸드통합지원센터", "온라인 도매시장", "온라인도매시장", "거래처 다변화")],
+        _lowered_terms(("연합판매사업", "직거래", "직거래 장터", "직거래장터", "푸드통합지원센터", "온라인 도매시장", "온라인도매시장", "거래처 다변화")),
     )
     sales_channel_signature = actor_hits >= 1 and channel_hits >= 2 and (
         title_hits >= 1 or signature_title_hits >= 2 or (signature_title_hits >= 1 and event_hits >= 1)
@@ -8397,7 +8501,7 @@ def is_dist_governance_policy_noise_context(title: str, desc: str, dom: str = ""
 
     policy_hits = count_any(
         txt,
-        [w.lower() for w in ("발표", "과제", "의무화", "개정", "정관", "위원회", "선거", "회의")],
+        _lowered_terms(("발표", "과제", "의무화", "개정", "정관", "위원회", "선거", "회의")),
     )
     hard_anchor_hits = count_any(
         txt,
@@ -8445,13 +8549,13 @@ def is_horti_market_action_context(title: str, desc: str) -> bool:
     txt = f"{title or ''} {desc or ''}".lower()
     if not txt:
         return False
-    action_hits = count_any(txt, [w.lower() for w in _HORTI_MARKET_ACTION_TERMS])
+    action_hits = count_any(txt, _lowered_terms(_HORTI_MARKET_ACTION_TERMS))
     if action_hits == 0:
         return False
     managed_count = int(_managed_commodity_match_summary(title or "", desc or "").get("count") or 0)
     agri_hits = count_any(
         txt,
-        [w.lower() for w in ("\ub18d\uc0b0\ubb3c", "\ub18d\uc5c5", "\ub18d\uac00", "\uc720\ud1b5", "\ud310\ub85c", "\uc0b0\uc9c0\uc720\ud1b5", "\ucd9c\ud558", "\uc218\ucd9c")],
+        _lowered_terms(("\ub18d\uc0b0\ubb3c", "\ub18d\uc5c5", "\ub18d\uac00", "\uc720\ud1b5", "\ud310\ub85c", "\uc0b0\uc9c0\uc720\ud1b5", "\ucd9c\ud558", "\uc218\ucd9c")),
     ) + managed_count
     return agri_hits >= 1 or best_horti_score(title or "", desc or "") >= 1.2
 
@@ -8461,23 +8565,23 @@ def _policy_horti_anchor_stats(title: str, desc: str, dom: str = "", press: str
     txt = f"{ttl} {desc or ''}".lower()
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     price_collapse_issue = is_policy_price_collapse_issue_context(ttl, desc or "")
-    direct_anchor_hits = count_any(txt, [w.lower() for w in _POLICY_HORTI_DIRECT_ANCHOR_TERMS])
-    title_anchor_hits = count_any((ttl or "").lower(), [w.lower() for w in _POLICY_HORTI_DIRECT_ANCHOR_TERMS])
+    direct_anchor_hits = count_any(txt, _lowered_terms(_POLICY_HORTI_DIRECT_ANCHOR_TERMS))
+    title_anchor_hits = count_any((ttl or "").lower(), _lowered_terms(_POLICY_HORTI_DIRECT_ANCHOR_TERMS))
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uac00\ub77d\uc2dc\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\uc0b0\uc9c0\uc720\ud1b5\uc13c\ud130", "\uc720\ud1b5", "\ud310\ub85c", "apc")],
+        _lowered_terms(("\ub3c4\ub9e4\uc2dc\uc7a5", "\uacf5\ud310\uc7a5", "\uac00\ub77d\uc2dc\uc7a5", "\uc0b0\uc9c0\uc720\ud1b5", "\uc0b0\uc9c0\uc720\ud1b5\uc13c\ud130", "\uc720\ud1b5", "\ud310\ub85c", "apc")),
     )
     if has_apc_agri_context(txt):
         market_hits += 1
     mixed_keep_hits = 0
     if "\ub18d\ucd95\uc0b0\ubb3c" in txt:
-        mixed_keep_hits = count_any(txt, [w.lower() for w in _POLICY_HORTI_MIXED_KEEP_TERMS])
+        mixed_keep_hits = count_any(txt, _lowered_terms(_POLICY_HORTI_MIXED_KEEP_TERMS))
 
     txt_wo_neutral = txt
     for phrase in LIVESTOCK_NEUTRAL_PHRASES:
         txt_wo_neutral = txt_wo_neutral.replace((phrase or "").lower(), "")
-    livestock_hits = count_any(txt_wo_neutral, [t.lower() for t in LIVESTOCK_STRICT_TERMS])
-    title_livestock_hits = count_any((ttl or "").lower(), [t.lower() for t in LIVESTOCK_STRICT_TERMS])
+    livestock_hits = count_any(txt_wo_neutral, _lowered_terms(LIVESTOCK_STRICT_TERMS))
+    title_livestock_hits = count_any((ttl or "").lower(), _lowered_terms(LIVESTOCK_STRICT_TERMS))
     avian_ai_context = any(
         marker in txt_wo_neutral
         for marker in (
@@ -8605,25 +8709,25 @@ def is_title_livestock_dominant_context(title: str, desc: str = "") -> bool:
     ttl_wo_neutral = ttl
     for phrase in LIVESTOCK_NEUTRAL_PHRASES:
         ttl_wo_neutral = ttl_wo_neutral.replace((phrase or "").lower(), "")
-    title_livestock_hits = count_any(ttl_wo_neutral, [w.lower() for w in _TITLE_LIVESTOCK_CORE_TERMS])
+    title_livestock_hits = count_any(ttl_wo_neutral, _lowered_terms(_TITLE_LIVESTOCK_CORE_TERMS))
     livestock_core_in_title = ("축산물" in ttl_wo_neutral) or ("축산" in ttl_wo_neutral) or any(w in ttl_wo_neutral for w in ("한우", "한돈", "돼지", "돼지고기", "소고기", "닭고기", "닭", "계란", "달걀"))
-    title_horti_hits = count_any(ttl, [w.lower() for w in _TITLE_HORTI_DIRECT_TERMS]) + count_any(ttl, HORTI_ITEM_TERMS_L)
+    title_horti_hits = count_any(ttl, _lowered_terms(_TITLE_HORTI_DIRECT_TERMS)) + count_any(ttl, HORTI_ITEM_TERMS_L)
     managed_count = int(_managed_commodity_match_summary(title or "", "").get("count") or 0)
-    market_hits = count_any(ttl_wo_neutral, [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")])
-    desc_horti_hits = count_any(desc_l, [w.lower() for w in _TITLE_HORTI_DIRECT_TERMS]) + count_any(desc_l, HORTI_ITEM_TERMS_L)
+    market_hits = count_any(ttl_wo_neutral, _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")))
+    desc_horti_hits = count_any(desc_l, _lowered_terms(_TITLE_HORTI_DIRECT_TERMS)) + count_any(desc_l, HORTI_ITEM_TERMS_L)
     # 제목이 순수 축산 전용("닭고기값 급등", "돼지 육가공")이면 desc 원예 언급을 무시.
     # 단, 거시 물가/수급 기사("2월 물가 축산물 들썩 + desc에 사과/쌀 수급")는 허용.
-    _title_macro_price = count_any(ttl, [w.lower() for w in ("물가", "성수품", "장바구니")]) >= 1
+    _title_macro_price = count_any(ttl, _lowered_terms(("물가", "성수품", "장바구니"))) >= 1
     # desc에서 원예 품목이 자체 수급/가격 맥락으로 등장하는지 (단순 비교 나열이 아님)
     # "배추·마늘처럼", "것과 마찬가지다" 같은 비교 표현이 있으면 비교 나열로 판단
     _desc_comparison_markers = any(m in desc_l for m in ("처럼", "마찬가지", "것과 같", "비슷하게", "마찬가지로"))
     _desc_horti_with_supply_ctx = (
         desc_horti_hits >= 1
         and not _desc_comparison_markers
-        and count_any(desc_l, [w.lower() for w in ("가격", "수급", "출하", "작황", "공급", "수확", "도매")]) >= 1
+        and count_any(desc_l, _lowered_terms(("가격", "수급", "출하", "작황", "공급", "수확", "도매"))) >= 1
         and any(
             (h in desc_l and any(s in desc_l[max(0, desc_l.index(h)-30):desc_l.index(h)+30] for s in ("가격", "수급", "출하", "공급", "상승", "하락", "급등", "폭락")))
-            for h in [w.lower() for w in ("사과", "배추", "양파", "마늘", "고추", "딸기", "감귤", "포도", "토마토", "오이")]
+            for h in _lowered_terms(("사과", "배추", "양파", "마늘", "고추", "딸기", "감귤", "포도", "토마토", "오이"))
             if h in desc_l
         )
     )
@@ -8632,7 +8736,7 @@ def is_title_livestock_dominant_context(title: str, desc: str = "") -> bool:
                              and not _desc_horti_with_supply_ctx)
     macro_mix_keep = desc_horti_hits >= 2 and (not _title_livestock_only) and (
         is_broad_macro_price_context(title or "", desc or "")
-        or count_any(f"{ttl} {desc_l}", [w.lower() for w in ("물가", "수급", "안정", "할인지원", "성수품")]) >= 1
+        or count_any(f"{ttl} {desc_l}", _lowered_terms(("물가", "수급", "안정", "할인지원", "성수품"))) >= 1
     )
     return (
         livestock_core_in_title
@@ -8650,17 +8754,17 @@ def is_agri_training_recruitment_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    training_hits = count_any(txt, [w.lower() for w in _AGRI_TRAINING_RECRUITMENT_TERMS])
+    training_hits = count_any(txt, _lowered_terms(_AGRI_TRAINING_RECRUITMENT_TERMS))
     if training_hits == 0:
         return False
     keep_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격", "수급", "출하", "경락", "경매", "도매시장", "공판장", "가락시장",
             "산지유통", "산지유통센터", "apc", "공동선별", "공선출하", "직거래",
             "연합판매사업", "연합사업", "판매 확대", "판로", "가격안정", "검역", "통관",
             "선적", "병해충", "방제", "예찰",
-        )],
+        )),
     )
     return keep_hits < 2
 
@@ -8669,12 +8773,12 @@ def is_agri_org_rename_context(title: str, desc: str) -> bool:
     txt = f"{title or ''} {desc or ''}".lower()
     if not txt:
         return False
-    rename_hits = count_any(txt, [w.lower() for w in _AGRI_ORG_RENAME_TERMS])
+    rename_hits = count_any(txt, _lowered_terms(_AGRI_ORG_RENAME_TERMS))
     if rename_hits == 0:
         return False
     keep_hits = count_any(
         txt,
-        [w.lower() for w in ("가격", "수급", "출하", "경락", "경매", "도매시장", "공판장", "가락시장", "산지유통", "판매사업", "연합판매사업", "직거래", "가격안정", "검역", "통관", "선적")],
+        _lowered_terms(("가격", "수급", "출하", "경락", "경매", "도매시장", "공판장", "가락시장", "산지유통", "판매사업", "연합판매사업", "직거래", "가격안정", "검역", "통관", "선적")),
     )
     return keep_hits < 2
 
@@ -8683,10 +8787,10 @@ def is_policy_forest_admin_noise_context(title: str, desc: str) -> bool:
     txt = f"{title or ''} {desc or ''}".lower()
     if not txt:
         return False
-    forest_hits = count_any(txt, [w.lower() for w in _POLICY_FOREST_ADMIN_TERMS])
+    forest_hits = count_any(txt, _lowered_terms(_POLICY_FOREST_ADMIN_TERMS))
     if forest_hits == 0:
         return False
-    keep_hits = count_any(txt, [w.lower() for w in ("과수", "사과", "배", "감귤", "딸기", "채소", "원예", "농산물", "묘목")])
+    keep_hits = count_any(txt, _lowered_terms(("과수", "사과", "배", "감귤", "딸기", "채소", "원예", "농산물", "묘목")))
     return keep_hits == 0 and best_horti_score(title or "", desc or "") < 1.6
 
 
@@ -8695,13 +8799,13 @@ def is_policy_budget_drive_noise_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    budget_hits = count_any(txt, [w.lower() for w in _POLICY_BUDGET_DRIVE_TERMS])
+    budget_hits = count_any(txt, _lowered_terms(_POLICY_BUDGET_DRIVE_TERMS))
     if budget_hits == 0:
         return False
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     keep_hits = count_any(
         txt,
-        [w.lower() for w in ("가격안정", "가격 안정", "수급", "출하비용", "보전", "최소가격", "할인지원", "검역", "원산지", "단속", "도매시장", "공판장", "가락시장", "농산물", "원예", "과수", "과일", "채소")],
+        _lowered_terms(("가격안정", "가격 안정", "수급", "출하비용", "보전", "최소가격", "할인지원", "검역", "원산지", "단속", "도매시장", "공판장", "가락시장", "농산물", "원예", "과수", "과일", "채소")),
     ) + managed_count
     return keep_hits < 3 and _local_geo_match(ttl)
 
@@ -8754,20 +8858,20 @@ def _is_community_welfare_noise_context(title: str, desc: str) -> bool:
         return False
 
     # 1) 제목 기반 판정 (신뢰도 높음)
-    title_welfare = count_any(ttl, [w.lower() for w in _SUPPLY_COMMUNITY_WELFARE_TERMS])
+    title_welfare = count_any(ttl, _lowered_terms(_SUPPLY_COMMUNITY_WELFARE_TERMS))
     if title_welfare >= 1:
         # 제목에 직접 수급 신호가 있으면 실제 수급 기사로 간주
-        title_direct = count_any(ttl, [w.lower() for w in _SUPPLY_DIRECT_SIGNAL_TERMS])
+        title_direct = count_any(ttl, _lowered_terms(_SUPPLY_DIRECT_SIGNAL_TERMS))
         if title_direct >= 1:
             return False
         return True
 
     # 2) 제목에 welfare 없음 → 본문에 3개 이상 welfare 신호 + 직접 수급 신호 거의 없음
     mix = f"{ttl} {body}"
-    welfare_hits = count_any(mix, [w.lower() for w in _SUPPLY_COMMUNITY_WELFARE_TERMS])
+    welfare_hits = count_any(mix, _lowered_terms(_SUPPLY_COMMUNITY_WELFARE_TERMS))
     if welfare_hits < 3:
         return False
-    direct_hits = count_any(mix, [w.lower() for w in _SUPPLY_DIRECT_SIGNAL_TERMS])
+    direct_hits = count_any(mix, _lowered_terms(_SUPPLY_DIRECT_SIGNAL_TERMS))
     if direct_hits >= 3:
         return False
     return True
@@ -8802,15 +8906,15 @@ def _is_local_nh_self_support_noise_context(title: str, desc: str) -> bool:
     if "농협" not in ttl:
         return False
     # 자체 지원사업 신호
-    self_support_hits = count_any(mix, [w.lower() for w in _LOCAL_NH_SELF_SUPPORT_TERMS])
+    self_support_hits = count_any(mix, _lowered_terms(_LOCAL_NH_SELF_SUPPORT_TERMS))
     if self_support_hits < 1:
         return False
     # 정부 정책 신호가 강하면 아님 (정부 정책 기사로 취급)
-    gov_policy_hits = count_any(mix, [w.lower() for w in _GOVERNMENT_POLICY_STRONG_TERMS])
+    gov_policy_hits = count_any(mix, _lowered_terms(_GOVERNMENT_POLICY_STRONG_TERMS))
     if gov_policy_hits >= 2:
         return False
     # 직접적 수급 신호가 있으면 아님 (실제 품목 수급 기사로 취급)
-    direct_hits = count_any(mix, [w.lower() for w in _SUPPLY_DIRECT_SIGNAL_TERMS])
+    direct_hits = count_any(mix, _lowered_terms(_SUPPLY_DIRECT_SIGNAL_TERMS))
     if direct_hits >= 2:
         return False
     return True
@@ -8828,31 +8932,31 @@ def _is_policy_community_noise_context(title: str, desc: str) -> bool:
     # 크롤링 본문에는 관련기사·푸터의 '정책' 문구가 섞일 수 있으므로 제목을 우선한다.
     title_community_hits = count_any(
         ttl.lower(),
-        [w.lower() for w in (*_POLICY_COMMUNITY_NOISE_TERMS, "나눔", "이웃돕기", "이웃 돕기")],
+        _lowered_terms((*_POLICY_COMMUNITY_NOISE_TERMS, "나눔", "이웃돕기", "이웃 돕기")),
     )
-    title_policy_hits = count_any(ttl.lower(), [w.lower() for w in _POLICY_NOISE_WHITELIST_TERMS])
+    title_policy_hits = count_any(ttl.lower(), _lowered_terms(_POLICY_NOISE_WHITELIST_TERMS))
     if title_community_hits >= 1 and title_policy_hits == 0:
         return True
     lead = f"{ttl} {(body or '')[:600]}".lower()
     lead_community_hits = count_any(
         lead,
-        [w.lower() for w in (*_POLICY_COMMUNITY_NOISE_TERMS, "나눔", "이웃", "훈훈")],
+        _lowered_terms((*_POLICY_COMMUNITY_NOISE_TERMS, "나눔", "이웃", "훈훈")),
     )
-    lead_policy_hits = count_any(lead, [w.lower() for w in _POLICY_NOISE_WHITELIST_TERMS])
+    lead_policy_hits = count_any(lead, _lowered_terms(_POLICY_NOISE_WHITELIST_TERMS))
     if (lead_community_hits >= 2 and lead_policy_hits == 0) or (
         lead_community_hits >= 3 and lead_policy_hits <= 1
     ):
         return True
-    community_hits = count_any(mix, [w.lower() for w in _POLICY_COMMUNITY_NOISE_TERMS])
-    retail_hits = count_any(mix, [w.lower() for w in _POLICY_RETAIL_NOISE_TERMS])
+    community_hits = count_any(mix, _lowered_terms(_POLICY_COMMUNITY_NOISE_TERMS))
+    retail_hits = count_any(mix, _lowered_terms(_POLICY_RETAIL_NOISE_TERMS))
     if community_hits == 0 and retail_hits == 0:
         return False
     # 화이트리스트 체크: 실제 정책 맥락이 있으면 통과
-    policy_hits = count_any(mix, [w.lower() for w in _POLICY_NOISE_WHITELIST_TERMS])
+    policy_hits = count_any(mix, _lowered_terms(_POLICY_NOISE_WHITELIST_TERMS))
     if community_hits >= 2 and policy_hits == 0:
         return True
     if retail_hits >= 1:
-        retail_wl_hits = count_any(mix, [w.lower() for w in _POLICY_RETAIL_WHITELIST_TERMS])
+        retail_wl_hits = count_any(mix, _lowered_terms(_POLICY_RETAIL_WHITELIST_TERMS))
         if retail_wl_hits == 0 and policy_hits == 0:
             return True
     return False
@@ -8881,11 +8985,11 @@ def is_dist_political_visit_context(title: str, desc: str) -> bool:
     )
     if venue_hits == 0:
         return False
-    actor_hits = count_any(ttl, [w.lower() for w in _DIST_POLITICAL_VISIT_TITLE_TERMS])
-    politics_hits = count_any(txt, [w.lower() for w in _DIST_POLITICAL_VISIT_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _DIST_POLITICAL_VISIT_KEEP_TERMS])
-    agri_hits = count_any(txt, [w.lower() for w in ("농산물", "원예", "과수", "과일", "채소", "화훼")])
-    title_agri_hits = count_any(ttl, [w.lower() for w in ("농산물", "원예", "과수", "과일", "채소", "화훼")])
+    actor_hits = count_any(ttl, _lowered_terms(_DIST_POLITICAL_VISIT_TITLE_TERMS))
+    politics_hits = count_any(txt, _lowered_terms(_DIST_POLITICAL_VISIT_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_DIST_POLITICAL_VISIT_KEEP_TERMS))
+    agri_hits = count_any(txt, _lowered_terms(("농산물", "원예", "과수", "과일", "채소", "화훼")))
+    title_agri_hits = count_any(ttl, _lowered_terms(("농산물", "원예", "과수", "과일", "채소", "화훼")))
     title_keep_hits = count_any(
         ttl,
         [
@@ -8896,10 +9000,10 @@ def is_dist_political_visit_context(title: str, desc: str) -> bool:
             )
         ],
     )
-    title_visit_hits = count_any(ttl, [w.lower() for w in ("찾은", "찾아", "방문", "민심", "지선", "시동", "사과하라", "계엄")])
+    title_visit_hits = count_any(ttl, _lowered_terms(("찾은", "찾아", "방문", "민심", "지선", "시동", "사과하라", "계엄")))
     title_campaign_hits = count_any(
         ttl,
-        [w.lower() for w in ("공약", "1호", "제1호", "의원", "후보", "재선", "선거", "출마", "도전", "비전", "국민의힘", "민주당")],
+        _lowered_terms(("공약", "1호", "제1호", "의원", "후보", "재선", "선거", "출마", "도전", "비전", "국민의힘", "민주당")),
     )
     redevelopment_hits = count_any(
         txt,
@@ -8922,7 +9026,7 @@ def is_dist_political_visit_context(title: str, desc: str) -> bool:
     if venue_hits >= 1 and title_keep_hits == 0 and title_agri_hits == 0 and agri_hits == 0:
         if (actor_hits >= 1 or politics_hits >= 2) and politics_hits >= 1 and keep_hits < 2:
             return True
-        if count_any(ttl, [w.lower() for w in ("찾은", "찾아", "방문")]) >= 1 and count_any(ttl, [w.lower() for w in ("민심", "지선", "시동", "사과하라", "계엄")]) >= 1:
+        if count_any(ttl, _lowered_terms(("찾은", "찾아", "방문"))) >= 1 and count_any(ttl, _lowered_terms(("민심", "지선", "시동", "사과하라", "계엄"))) >= 1:
             return True
     return False
 
@@ -8932,7 +9036,7 @@ def is_dist_local_crop_strategy_noise_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    strategy_hits = count_any(txt, [w.lower() for w in _DIST_LOCAL_CROP_STRATEGY_TERMS])
+    strategy_hits = count_any(txt, _lowered_terms(_DIST_LOCAL_CROP_STRATEGY_TERMS))
     if strategy_hits == 0:
         return False
     if _LOCAL_REGION_IN_TITLE_RX.search(ttl) is None and strategy_hits < 2:
@@ -8943,7 +9047,7 @@ def is_dist_local_crop_strategy_noise_context(title: str, desc: str) -> bool:
         return False
     keep_hits = count_any(
         txt,
-        [w.lower() for w in ("도매시장", "공판장", "가락시장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc", "선별", "저온", "물류", "직거래", "연합판매사업", "판매사업", "검역", "통관", "선적", "출하")],
+        _lowered_terms(("도매시장", "공판장", "가락시장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc", "선별", "저온", "물류", "직거래", "연합판매사업", "판매사업", "검역", "통관", "선적", "출하")),
     )
     return keep_hits < 2
 
@@ -8953,15 +9057,15 @@ def is_pest_input_marketing_noise_context(title: str, desc: str) -> bool:
     txt = f"{title or ''} {desc or ''}".lower()
     if not txt:
         return False
-    marketing_hits = count_any(txt, [w.lower() for w in _PEST_INPUT_MARKETING_TERMS])
+    marketing_hits = count_any(txt, _lowered_terms(_PEST_INPUT_MARKETING_TERMS))
     if marketing_hits < 2:
         return False
     named_pest = re.search(r"[가-힣]{1,8}(나방|진딧물|응애|노린재|총채벌레|깍지벌레|선충)", txt) is not None
-    disease_hits = count_any(txt, [w.lower() for w in ("과수화상병", "탄저병", "역병", "노균병", "흰가루병", "냉해", "동해", "병해충", "방제", "예찰")])
-    action_hits = count_any(txt, [w.lower() for w in _PEST_ACTION_TERMS])
-    deceptive_hits = count_any(txt, [w.lower() for w in ("허위", "과대광고", "광고", "온라인", "표시")])
-    title_real_pest_hits = count_any((title or "").lower(), [w.lower() for w in ("과수화상병", "탄저병", "역병", "노균병", "흰가루병", "병해충", "방제", "예찰", "냉해", "동해")])
-    if ("비료" in ttl) and count_any(ttl, [w.lower() for w in ("허위", "과대광고", "광고", "온라인", "표시")]) >= 1 and title_real_pest_hits == 0:
+    disease_hits = count_any(txt, _lowered_terms(("과수화상병", "탄저병", "역병", "노균병", "흰가루병", "냉해", "동해", "병해충", "방제", "예찰")))
+    action_hits = count_any(txt, _lowered_terms(_PEST_ACTION_TERMS))
+    deceptive_hits = count_any(txt, _lowered_terms(("허위", "과대광고", "광고", "온라인", "표시")))
+    title_real_pest_hits = count_any((title or "").lower(), _lowered_terms(("과수화상병", "탄저병", "역병", "노균병", "흰가루병", "병해충", "방제", "예찰", "냉해", "동해")))
+    if ("비료" in ttl) and count_any(ttl, _lowered_terms(("허위", "과대광고", "광고", "온라인", "표시"))) >= 1 and title_real_pest_hits == 0:
         return True
     return (not named_pest) and disease_hits == 0 and action_hits < 2 and ("비료" in txt) and deceptive_hits >= 2 and title_real_pest_hits == 0
 
@@ -8972,10 +9076,10 @@ def is_supply_price_outlook_context(title: str, desc: str) -> bool:
     if not txt:
         return False
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    group_hits = count_any(txt, [w.lower() for w in _SUPPLY_PRICE_OUTLOOK_GROUP_TERMS])
-    trend_hits = count_any(txt, [w.lower() for w in _SUPPLY_PRICE_OUTLOOK_TREND_TERMS])
-    price_hits = count_any(txt, [w.lower() for w in ("가격", "시세", "수급", "재배면적", "생산량", "출하", "작황")])
-    title_trend_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_PRICE_OUTLOOK_TREND_TERMS])
+    group_hits = count_any(txt, _lowered_terms(_SUPPLY_PRICE_OUTLOOK_GROUP_TERMS))
+    trend_hits = count_any(txt, _lowered_terms(_SUPPLY_PRICE_OUTLOOK_TREND_TERMS))
+    price_hits = count_any(txt, _lowered_terms(("가격", "시세", "수급", "재배면적", "생산량", "출하", "작황")))
+    title_trend_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_PRICE_OUTLOOK_TREND_TERMS))
     return (managed_count >= 2 or group_hits >= 1) and (price_hits >= 2 or trend_hits >= 3) and (title_trend_hits >= 1 or best_horti_score(ttl, "") >= 1.2)
 
 
@@ -9009,10 +9113,10 @@ def is_dist_field_market_response_context(title: str, desc: str, dom: str = "",
         return False
 
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    agri_hits = count_any(txt, [w.lower() for w in _DIST_FIELD_MARKET_RESPONSE_AGRI_TERMS]) + managed_count
-    response_hits = count_any(txt, [w.lower() for w in _DIST_FIELD_MARKET_RESPONSE_TERMS])
-    distress_hits = count_any(txt, [w.lower() for w in _DIST_FIELD_MARKET_RESPONSE_DISTRESS_TERMS])
-    title_hits = count_any(ttl.lower(), [w.lower() for w in _DIST_FIELD_MARKET_RESPONSE_TITLE_TERMS])
+    agri_hits = count_any(txt, _lowered_terms(_DIST_FIELD_MARKET_RESPONSE_AGRI_TERMS)) + managed_count
+    response_hits = count_any(txt, _lowered_terms(_DIST_FIELD_MARKET_RESPONSE_TERMS))
+    distress_hits = count_any(txt, _lowered_terms(_DIST_FIELD_MARKET_RESPONSE_DISTRESS_TERMS))
+    title_hits = count_any(ttl.lower(), _lowered_terms(_DIST_FIELD_MARKET_RESPONSE_TITLE_TERMS))
     trade_press = ((press or "").strip() in AGRI_TRADE_PRESS) or (normalize_host(dom or "") in AGRI_TRADE_HOSTS)
 
     return agri_hits >= 2 and response_hits >= 2 and distress_hits >= 1 and (trade_press or title_hits >= 1)
@@ -9070,14 +9174,14 @@ def is_dist_program_event_noise_context(title: str, desc: str, dom: str = "", pr
     if is_remote_foreign_trade_brief_context(ttl, desc or "", dom_norm):
         return False
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    actor_hits = count_any(txt, [w.lower() for w in _DIST_PROGRAM_EVENT_ACTOR_TERMS])
+    actor_hits = count_any(txt, _lowered_terms(_DIST_PROGRAM_EVENT_ACTOR_TERMS))
     local_program = is_local_agri_policy_program_context(txt)
     local_gov_named = (
         re.search(r"(?:^|[\s·,，])(?:[가-힣]{2,12}(?:특별자치시|특별자치도|광역시|특별시|시|군|구|도))(?=$|[\s·,，])", ttl) is not None
         or re.search(r"(?:^|[\s·,，])(?:[가-힣]{2,12}(?:특별자치시|특별자치도|광역시|특별시|시|군|구|도))(?=$|[\s·,，])", desc or "") is not None
     )
-    strong_title_hits = count_any(ttl_l, [w.lower() for w in _DIST_PROGRAM_EVENT_STRONG_TITLE_TERMS])
-    hard_keep_title_hits = count_any(ttl_l, [w.lower() for w in _DIST_PROGRAM_EVENT_HARD_KEEP_TITLE_TERMS])
+    strong_title_hits = count_any(ttl_l, _lowered_terms(_DIST_PROGRAM_EVENT_STRONG_TITLE_TERMS))
+    hard_keep_title_hits = count_any(ttl_l, _lowered_terms(_DIST_PROGRAM_EVENT_HARD_KEEP_TITLE_TERMS))
     # Strong promo/program titles should not survive just because the body also mentions channels or logistics.
     if strong_title_hits >= 1 and hard_keep_title_hits == 0 and (actor_hits >= 1 or managed_count >= 1 or local_gov_named):
         return True
@@ -9086,8 +9190,8 @@ def is_dist_program_event_noise_context(title: str, desc: str, dom: str = "", pr
     # → is_dist_field_market_response_context → is_dist_program_event_noise_context → …).
     # Instead, we inline the core export-field signal check.
     _inline_export_field = (
-        count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_TERMS]) >= 2
-        and count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_MARKET_TERMS]) >= 1
+        count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_TERMS)) >= 2
+        and count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_MARKET_TERMS)) >= 1
     )
     if (
         is_dist_market_ops_context(ttl, desc or "", dom_norm, press_norm)
@@ -9104,11 +9208,11 @@ def is_dist_program_event_noise_context(title: str, desc: str, dom: str = "", pr
 
     agri_hits = count_any(
         txt,
-        [w.lower() for w in ("농산물", "원예", "과수", "과일", "채소", "화훼", "농가", "산지", "유통", "도매가격")],
+        _lowered_terms(("농산물", "원예", "과수", "과일", "채소", "화훼", "농가", "산지", "유통", "도매가격")),
     ) + managed_count
-    program_hits = count_any(txt, [w.lower() for w in _DIST_PROGRAM_EVENT_NOISE_TERMS])
-    title_hits = count_any(ttl_l, [w.lower() for w in _DIST_PROGRAM_EVENT_NOISE_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _DIST_PROGRAM_EVENT_KEEP_TERMS]) + (1 if has_apc_agri_context(txt) else 0)
+    program_hits = count_any(txt, _lowered_terms(_DIST_PROGRAM_EVENT_NOISE_TERMS))
+    title_hits = count_any(ttl_l, _lowered_terms(_DIST_PROGRAM_EVENT_NOISE_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_DIST_PROGRAM_EVENT_KEEP_TERMS)) + (1 if has_apc_agri_context(txt) else 0)
     if agri_hits == 0:
         return False
     if program_hits == 0 and not local_program:
@@ -9148,12 +9252,12 @@ def is_dist_unanchored_agritech_noise_context(title: str, desc: str, dom: str =
     ):
         return False
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    agri_hits = count_any(txt, [w.lower() for w in ("농산물", "농업", "원예", "과수", "과일", "채소", "화훼", "농가", "산지")]) + managed_count
-    generic_hits = count_any(txt, [w.lower() for w in _DIST_UNANCHORED_AGRITECH_NOISE_TERMS])
-    title_hits = count_any(ttl_l, [w.lower() for w in _DIST_UNANCHORED_AGRITECH_NOISE_TERMS])
+    agri_hits = count_any(txt, _lowered_terms(("농산물", "농업", "원예", "과수", "과일", "채소", "화훼", "농가", "산지"))) + managed_count
+    generic_hits = count_any(txt, _lowered_terms(_DIST_UNANCHORED_AGRITECH_NOISE_TERMS))
+    title_hits = count_any(ttl_l, _lowered_terms(_DIST_UNANCHORED_AGRITECH_NOISE_TERMS))
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc", "선적", "통관", "검역", "물류")],
+        _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc", "선적", "통관", "검역", "물류")),
     ) + (1 if has_apc_agri_context(txt) else 0)
     return agri_hits >= 1 and market_hits == 0 and (title_hits >= 1 or generic_hits >= 2)
 
@@ -9173,13 +9277,13 @@ def is_dist_non_horti_anchorless_noise_context(title: str, desc: str, dom: str =
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     horti_sc = best_horti_score(ttl, desc or "")
     horti_title_sc = best_horti_score(ttl, "")
-    agri_anchor_hits = count_any(txt, [w.lower() for w in _DIST_NON_HORTI_ANCHOR_TERMS]) + managed_count
-    market_anchor_hits = count_any(txt, [w.lower() for w in _DIST_PHYSICAL_MARKET_KEEP_TERMS]) + (1 if has_apc_agri_context(txt) else 0)
-    title_agri_anchor_hits = count_any(ttl_l, [w.lower() for w in _DIST_NON_HORTI_ANCHOR_TERMS])
-    title_market_anchor_hits = count_any(ttl_l, [w.lower() for w in _DIST_PHYSICAL_MARKET_KEEP_TERMS])
+    agri_anchor_hits = count_any(txt, _lowered_terms(_DIST_NON_HORTI_ANCHOR_TERMS)) + managed_count
+    market_anchor_hits = count_any(txt, _lowered_terms(_DIST_PHYSICAL_MARKET_KEEP_TERMS)) + (1 if has_apc_agri_context(txt) else 0)
+    title_agri_anchor_hits = count_any(ttl_l, _lowered_terms(_DIST_NON_HORTI_ANCHOR_TERMS))
+    title_market_anchor_hits = count_any(ttl_l, _lowered_terms(_DIST_PHYSICAL_MARKET_KEEP_TERMS))
     hard_nonagri_title_hits = count_any(
         ttl_l,
-        [w.lower() for w in ("수출", "선적", "글로벌", "경제", "성장축", "의미", "공연", "버스", "하객", "정부", "실적", "기업")],
+        _lowered_terms(("수출", "선적", "글로벌", "경제", "성장축", "의미", "공연", "버스", "하객", "정부", "실적", "기업")),
     )
 
     if title_agri_anchor_hits == 0 and title_market_anchor_hits == 0 and horti_title_sc < 1.2 and hard_nonagri_title_hits >= 1:
@@ -9226,7 +9330,7 @@ def is_dist_official_cost_response_noise_context(title: str, desc: str, dom: str
         return False
     dom_norm = normalize_host(dom or "")
     press_norm = (press or "").strip()
-    market_anchor_hits = count_any(txt, [w.lower() for w in _DIST_PHYSICAL_MARKET_KEEP_TERMS]) + (1 if has_apc_agri_context(txt) else 0)
+    market_anchor_hits = count_any(txt, _lowered_terms(_DIST_PHYSICAL_MARKET_KEEP_TERMS)) + (1 if has_apc_agri_context(txt) else 0)
     if market_anchor_hits >= 2:
         return False
     if (
@@ -9238,12 +9342,12 @@ def is_dist_official_cost_response_noise_context(title: str, desc: str, dom: str
         or is_dist_market_disruption_context(ttl, desc or "")
     ):
         return False
-    actor_hits = count_any(txt, [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "관계부처", "장관", "차관")])
-    response_hits = count_any(ttl_l, [w.lower() for w in ("대응", "점검", "대책", "전방위 대응", "총력")]) + count_any(
+    actor_hits = count_any(txt, _lowered_terms(("정부", "농식품부", "농림축산식품부", "관계부처", "장관", "차관")))
+    response_hits = count_any(ttl_l, _lowered_terms(("대응", "점검", "대책", "전방위 대응", "총력"))) + count_any(
         txt,
-        [w.lower() for w in ("대응", "점검", "대책", "전방위 대응", "총력")],
+        _lowered_terms(("대응", "점검", "대책", "전방위 대응", "총력")),
     )
-    cost_hits = count_any(txt, [w.lower() for w in ("농업비용", "생산비", "비료", "물류", "면세유", "유가", "에너지", "비용")])
+    cost_hits = count_any(txt, _lowered_terms(("농업비용", "생산비", "비료", "물류", "면세유", "유가", "에너지", "비용")))
     return actor_hits >= 1 and response_hits >= 1 and cost_hits >= 2
 
 
@@ -9255,14 +9359,14 @@ def is_policy_event_tail_context(title: str, desc: str, dom: str = "", press: st
         return False
     if is_remote_foreign_trade_brief_context(ttl, desc or "", dom):
         return False
-    event_hits = count_any(txt, [w.lower() for w in _POLICY_EVENT_TAIL_TERMS])
+    event_hits = count_any(txt, _lowered_terms(_POLICY_EVENT_TAIL_TERMS))
     if event_hits == 0:
         return False
-    if count_any(txt, [w.lower() for w in _POLICY_EVENT_KEEP_TERMS]) >= 1:
+    if count_any(txt, _lowered_terms(_POLICY_EVENT_KEEP_TERMS)) >= 1:
         return False
     actor_hits = count_any(
         txt,
-        [w.lower() for w in ("\ub18d\uc2dd\ud488\ubd80", "\ub18d\ub9bc\ucd95\uc0b0\uc2dd\ud488\ubd80", "aT", "\ud55c\uad6d\ub18d\uc218\uc0b0\uc2dd\ud488\uc720\ud1b5\uacf5\uc0ac", "\uc7a5\uad00", "\uc815\ucc45\uad00")],
+        _lowered_terms(("\ub18d\uc2dd\ud488\ubd80", "\ub18d\ub9bc\ucd95\uc0b0\uc2dd\ud488\ubd80", "aT", "\ud55c\uad6d\ub18d\uc218\uc0b0\uc2dd\ud488\uc720\ud1b5\uacf5\uc0ac", "\uc7a5\uad00", "\uc815\ucc45\uad00")),
     )
     return actor_hits >= 1
 
@@ -9316,12 +9420,12 @@ def is_policy_private_commercial_deal_context(title: str, desc: str, dom: str =
     if not lead:
         return False
     # 제목/도입부에 공공 정책 행위자나 수급안정·계약재배 등 정책 맥락이 있으면 정책 기사로 유지
-    if count_any(lead, [w.lower() for w in _POLICY_PRIVATE_DEAL_PUBLIC_TERMS]) >= 1:
+    if count_any(lead, _lowered_terms(_POLICY_PRIVATE_DEAL_PUBLIC_TERMS)) >= 1:
         return False
-    if count_any(lead, [w.lower() for w in _POLICY_PRIVATE_DEAL_KEEP_TERMS]) >= 1:
+    if count_any(lead, _lowered_terms(_POLICY_PRIVATE_DEAL_KEEP_TERMS)) >= 1:
         return False
-    action_hits = count_any(lead, [w.lower() for w in _POLICY_PRIVATE_DEAL_ACTION_TERMS])
-    brand_hits = count_any(lead, [w.lower() for w in _POLICY_PRIVATE_DEAL_BRAND_TERMS])
+    action_hits = count_any(lead, _lowered_terms(_POLICY_PRIVATE_DEAL_ACTION_TERMS))
+    brand_hits = count_any(lead, _lowered_terms(_POLICY_PRIVATE_DEAL_BRAND_TERMS))
     return action_hits >= 1 and brand_hits >= 1
 
 
@@ -9382,18 +9486,18 @@ def is_policy_price_collapse_issue_context(title: str, desc: str) -> bool:
         return False
 
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    agri_hits = count_any(txt, [w.lower() for w in _POLICY_MAJOR_ISSUE_AGRI_TERMS]) + managed_count
-    title_item_hits = count_any((ttl or "").lower(), [w.lower() for w in _TITLE_HORTI_DIRECT_TERMS])
+    agri_hits = count_any(txt, _lowered_terms(_POLICY_MAJOR_ISSUE_AGRI_TERMS)) + managed_count
+    title_item_hits = count_any((ttl or "").lower(), _lowered_terms(_TITLE_HORTI_DIRECT_TERMS))
     if managed_count == 0 and agri_hits == 0 and title_item_hits == 0:
         return False
 
-    price_hits = count_any(txt, [w.lower() for w in _POLICY_PRICE_COLLAPSE_TERMS])
-    title_price_hits = count_any((ttl or "").lower(), [w.lower() for w in _POLICY_PRICE_COLLAPSE_TITLE_TERMS])
-    action_hits = count_any(txt, [w.lower() for w in _POLICY_PRICE_COLLAPSE_ACTION_TERMS])
-    actor_hits = count_any(txt, [w.lower() for w in _POLICY_PRICE_COLLAPSE_ACTOR_TERMS])
+    price_hits = count_any(txt, _lowered_terms(_POLICY_PRICE_COLLAPSE_TERMS))
+    title_price_hits = count_any((ttl or "").lower(), _lowered_terms(_POLICY_PRICE_COLLAPSE_TITLE_TERMS))
+    action_hits = count_any(txt, _lowered_terms(_POLICY_PRICE_COLLAPSE_ACTION_TERMS))
+    actor_hits = count_any(txt, _lowered_terms(_POLICY_PRICE_COLLAPSE_ACTOR_TERMS))
     if re.search(r"(?:^|[\s\"'“”‘’])(?:[가-힣]{2,20})(?:국회의원|도의원|시의원|군의원|구의원|의원)", ttl):
         actor_hits += 1
-    policy_hits = count_any(txt, [w.lower() for w in ("정부", "대정부", "국회", "농식품부", "농림축산식품부")])
+    policy_hits = count_any(txt, _lowered_terms(("정부", "대정부", "국회", "농식품부", "농림축산식품부")))
     return (
         (price_hits >= 2 or (price_hits >= 1 and title_price_hits >= 1))
         and action_hits >= 1
@@ -9451,14 +9555,14 @@ def is_policy_major_issue_context(title: str, desc: str, dom: str = "", press: s
 
     managed_summary = _managed_commodity_match_summary(ttl, desc or "")
     managed_count = int(managed_summary.get("count") or 0)
-    agri_hits = count_any(txt, [w.lower() for w in _POLICY_MAJOR_ISSUE_AGRI_TERMS])
+    agri_hits = count_any(txt, _lowered_terms(_POLICY_MAJOR_ISSUE_AGRI_TERMS))
     if agri_hits == 0 and managed_count == 0:
         return False
 
-    actor_hits = count_any(txt, [w.lower() for w in _POLICY_MAJOR_ISSUE_ACTOR_TERMS])
-    issue_hits = count_any(txt, [w.lower() for w in _POLICY_MAJOR_ISSUE_TERMS])
-    title_issue_hits = count_any((ttl or "").lower(), [w.lower() for w in _POLICY_MAJOR_ISSUE_TITLE_TERMS])
-    proposal_hits = count_any(txt, [w.lower() for w in _POLICY_MAJOR_ISSUE_PROPOSAL_TERMS])
+    actor_hits = count_any(txt, _lowered_terms(_POLICY_MAJOR_ISSUE_ACTOR_TERMS))
+    issue_hits = count_any(txt, _lowered_terms(_POLICY_MAJOR_ISSUE_TERMS))
+    title_issue_hits = count_any((ttl or "").lower(), _lowered_terms(_POLICY_MAJOR_ISSUE_TITLE_TERMS))
+    proposal_hits = count_any(txt, _lowered_terms(_POLICY_MAJOR_ISSUE_PROPOSAL_TERMS))
     officialish = (
         policy_domain_override(dom_norm, txt)
         or (dom_norm in POLICY_DOMAINS)
@@ -9498,7 +9602,7 @@ def is_dist_local_org_tail_context(title: str, desc: str) -> bool:
     if not txt:
         return False
     org_hit = (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(title or "") is not None) or (_LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl_compact) is not None) or (
-        count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_TERMS]) >= 1
+        count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_TERMS)) >= 1
     )
     if not org_hit:
         return False
@@ -9513,14 +9617,14 @@ def is_dist_local_org_tail_context(title: str, desc: str) -> bool:
     if any(kw in txt for kw in _DIST_ORG_RESCUE_TERMS):
         return False
 
-    title_profile_hits = count_any(ttl, [w.lower() for w in _DIST_LOCAL_ORG_PROFILE_TITLE_TERMS]) + count_any(
+    title_profile_hits = count_any(ttl, _lowered_terms(_DIST_LOCAL_ORG_PROFILE_TITLE_TERMS)) + count_any(
         ttl_compact.lower(),
         [re.sub(r"\s+", "", w.lower()) for w in _DIST_LOCAL_ORG_PROFILE_TITLE_TERMS],
     )
-    body_profile_hits = count_any(txt, [w.lower() for w in _DIST_LOCAL_ORG_PROFILE_BODY_TERMS])
+    body_profile_hits = count_any(txt, _lowered_terms(_DIST_LOCAL_ORG_PROFILE_BODY_TERMS))
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("가락시장", "도매시장", "공판장", "공영도매시장", "경락", "경매", "반입", "온라인 도매시장")],
+        _lowered_terms(("가락시장", "도매시장", "공판장", "공영도매시장", "경락", "경매", "반입", "온라인 도매시장")),
     )
     if has_apc_agri_context(txt):
         market_hits += 1
@@ -9568,36 +9672,36 @@ def is_dist_macro_export_noise_context(title: str, desc: str, dom: str = "", pre
         return False
     if is_dist_export_field_context(title, desc, dom, press):
         return False
-    macro_hits = count_any(txt, [w.lower() for w in _DIST_MACRO_EXPORT_NOISE_TERMS]) + count_any(
+    macro_hits = count_any(txt, _lowered_terms(_DIST_MACRO_EXPORT_NOISE_TERMS)) + count_any(
         txt,
-        [w.lower() for w in _DIST_MACRO_LOGISTICS_NOISE_TERMS],
+        _lowered_terms(_DIST_MACRO_LOGISTICS_NOISE_TERMS),
     )
     if macro_hits == 0:
         return False
     title_signature_hits = count_any(
         (ttl or "").lower(),
-        [w.lower() for w in _DIST_EXPORT_FIELD_MACRO_SIGNATURE_TERMS],
+        _lowered_terms(_DIST_EXPORT_FIELD_MACRO_SIGNATURE_TERMS),
     )
     title_concrete_keep_hits = count_any(
         (ttl or "").lower(),
-        [w.lower() for w in _DIST_MACRO_EXPORT_CONCRETE_KEEP_TERMS],
+        _lowered_terms(_DIST_MACRO_EXPORT_CONCRETE_KEEP_TERMS),
     )
     if title_signature_hits >= 2 and title_concrete_keep_hits == 0:
         return True
     concrete_keep_hits = count_any(
         txt,
-        [w.lower() for w in _DIST_MACRO_EXPORT_CONCRETE_KEEP_TERMS],
+        _lowered_terms(_DIST_MACRO_EXPORT_CONCRETE_KEEP_TERMS),
     )
     if concrete_keep_hits >= 1:
         return False
     if is_dist_export_shipping_context(ttl, desc or ""):
         return False
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
-    agri_anchor_hits = count_any(txt, [w.lower() for w in ("농산물", "원예", "과수", "과일", "채소", "화훼", "산지유통", "apc")]) + managed_count
-    market_hits = count_any(txt, [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "물류")])
-    title_macro_hits = count_any((ttl or "").lower(), [w.lower() for w in _DIST_MACRO_EXPORT_NOISE_TERMS]) + count_any(
+    agri_anchor_hits = count_any(txt, _lowered_terms(("농산물", "원예", "과수", "과일", "채소", "화훼", "산지유통", "apc"))) + managed_count
+    market_hits = count_any(txt, _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "물류")))
+    title_macro_hits = count_any((ttl or "").lower(), _lowered_terms(_DIST_MACRO_EXPORT_NOISE_TERMS)) + count_any(
         (ttl or "").lower(),
-        [w.lower() for w in _DIST_MACRO_LOGISTICS_NOISE_TERMS],
+        _lowered_terms(_DIST_MACRO_LOGISTICS_NOISE_TERMS),
     )
     if title_macro_hits >= 1 and market_hits == 0 and agri_anchor_hits <= 2:
         return True
@@ -9609,14 +9713,14 @@ def is_dist_campaign_noise_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    campaign_hits = count_any(txt, [w.lower() for w in _DIST_CAMPAIGN_NOISE_TERMS])
+    campaign_hits = count_any(txt, _lowered_terms(_DIST_CAMPAIGN_NOISE_TERMS))
     if campaign_hits == 0:
         return False
     if is_dist_sales_channel_ops_context(ttl, desc or "") or is_dist_supply_management_center_context(ttl, desc or ""):
         return False
     if is_dist_market_ops_context(ttl, desc or "", "", "") or is_dist_field_market_response_context(ttl, desc or "", "", ""):
         return False
-    market_hits = count_any(txt, [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc", "선적", "출하")])
+    market_hits = count_any(txt, _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc", "선적", "출하")))
     return market_hits == 0
 
 
@@ -9627,7 +9731,7 @@ def is_dist_consumer_tail_context(title: str, desc: str) -> bool:
         return False
     market_hits = count_any(
         txt,
-        [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "직거래", "선적", "통관", "검역")],
+        _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "직거래", "선적", "통관", "검역")),
     ) + (1 if has_apc_agri_context(txt) else 0)
     market_support_hits = count_any(
         txt,
@@ -9647,8 +9751,8 @@ def is_dist_consumer_tail_context(title: str, desc: str) -> bool:
         return False
     if is_retail_promo_context(txt) or is_fruit_foodservice_event_context(txt) or is_flower_consumer_trend_context(txt):
         return True
-    consumer_hits = count_any(txt, [w.lower() for w in _DIST_CONSUMER_TAIL_TERMS])
-    title_consumer_hits = count_any((ttl or "").lower(), [w.lower() for w in _DIST_CONSUMER_TAIL_TERMS])
+    consumer_hits = count_any(txt, _lowered_terms(_DIST_CONSUMER_TAIL_TERMS))
+    title_consumer_hits = count_any((ttl or "").lower(), _lowered_terms(_DIST_CONSUMER_TAIL_TERMS))
     return market_hits == 0 and (consumer_hits >= 2 or title_consumer_hits >= 1)
 
 
@@ -9668,10 +9772,10 @@ def is_dist_export_support_hub_context(title: str, desc: str, dom: str = "", pre
         hub_hits += 1
     if hub_hits == 0:
         return False
-    actor_hits = count_any(txt, [w.lower() for w in ("aT", "한국농수산식품유통공사", "농식품부", "농림축산식품부", "관계부처")])
-    support_hits = count_any(txt, [w.lower() for w in ("애로", "애로사항", "바로 해결", "해결", "원스톱", "지원", "허브", "원스톱 지원")])
-    export_hits = count_any(txt, [w.lower() for w in ("수출", "판로", "해외")])
-    agri_hits = count_any(txt, [w.lower() for w in ("농산물", "농식품", "k-푸드", "k푸드", "원예", "과수", "과일", "채소", "화훼", "aT", "한국농수산식품유통공사")])
+    actor_hits = count_any(txt, _lowered_terms(("aT", "한국농수산식품유통공사", "농식품부", "농림축산식품부", "관계부처")))
+    support_hits = count_any(txt, _lowered_terms(("애로", "애로사항", "바로 해결", "해결", "원스톱", "지원", "허브", "원스톱 지원")))
+    export_hits = count_any(txt, _lowered_terms(("수출", "판로", "해외")))
+    agri_hits = count_any(txt, _lowered_terms(("농산물", "농식품", "k-푸드", "k푸드", "원예", "과수", "과일", "채소", "화훼", "aT", "한국농수산식품유통공사")))
     if is_remote_foreign_trade_brief_context(ttl, desc or "", dom):
         return False
     return actor_hits >= 1 and support_hits >= 3 and export_hits >= 1 and agri_hits >= 1
@@ -9717,18 +9821,18 @@ def is_supply_macro_official_shock_context(title: str, desc: str, dom: str = "",
 
     title_item_hits = count_any(ttl_l, HORTI_ITEM_TERMS_L)
     horti_title_sc = best_horti_score(ttl, "")
-    title_macro_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_SHOCK_TERMS])
-    title_actor_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_ACTOR_TERMS])
-    title_policy_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_POLICY_TERMS])
+    title_macro_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_SHOCK_TERMS))
+    title_actor_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_ACTOR_TERMS))
+    title_policy_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_POLICY_TERMS))
     if title_item_hits == 0 and horti_title_sc < 1.2 and title_actor_hits >= 1 and title_macro_hits >= 3 and title_policy_hits >= 1:
         return True
     if is_supply_feature_article(title, desc) or is_supply_price_outlook_context(title, desc):
         return False
 
-    macro_hits = count_any(txt, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_SHOCK_TERMS])
-    actor_hits = count_any(txt, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_ACTOR_TERMS])
-    policy_hits = count_any(txt, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_POLICY_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_MACRO_OFFICIAL_KEEP_TERMS])
+    macro_hits = count_any(txt, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_SHOCK_TERMS))
+    actor_hits = count_any(txt, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_ACTOR_TERMS))
+    policy_hits = count_any(txt, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_POLICY_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_MACRO_OFFICIAL_KEEP_TERMS))
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     horti_sc = best_horti_score(ttl, desc or "")
     direct_supply = has_direct_supply_chain_signal(txt)
@@ -9756,21 +9860,21 @@ def is_supply_processed_consumer_panic_context(title: str, desc: str) -> bool:
     if not txt:
         return False
     title_l = _nfkc_lower(ttl)
-    potato_processed_title = count_any(title_l, [w.lower() for w in _POTATO_PROCESSED_MARKERS]) + (
+    potato_processed_title = count_any(title_l, _lowered_terms(_POTATO_PROCESSED_MARKERS)) + (
         1 if _contains_compact_marker(title_l, list(_POTATO_PROCESSED_MARKERS)) else 0
     )
     if "감자" in txt and is_fresh_potato_context(txt) and potato_processed_title == 0:
         return False
 
-    processed_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROCESSED_PANIC_TERMS]) + potato_processed_title
-    foreign_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROCESSED_PANIC_FOREIGN_TERMS]) + count_any(
+    processed_hits = count_any(txt, _lowered_terms(_SUPPLY_PROCESSED_PANIC_TERMS)) + potato_processed_title
+    foreign_hits = count_any(txt, _lowered_terms(_SUPPLY_PROCESSED_PANIC_FOREIGN_TERMS)) + count_any(
         txt,
-        [w.lower() for w in _FOREIGN_REMOTE_MARKERS],
+        _lowered_terms(_FOREIGN_REMOTE_MARKERS),
     )
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROCESSED_PANIC_KEEP_TERMS])
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_PROCESSED_PANIC_KEEP_TERMS))
     panic_hits = count_any(
         txt,
-        [w.lower() for w in ("품귀", "품귀설", "사재기", "웃돈", "대란", "생산 중단", "판매 중단")],
+        _lowered_terms(("품귀", "품귀설", "사재기", "웃돈", "대란", "생산 중단", "판매 중단")),
     )
 
     if processed_hits == 0:
@@ -9839,22 +9943,22 @@ def is_supply_program_brand_action_context(title: str, desc: str) -> bool:
         return False
     if is_supply_stabilization_policy_context(txt) or is_policy_market_brief_context(txt):
         return False
-    if count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_EXPORT_TERMS]) >= 2:
+    if count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_EXPORT_TERMS)) >= 2:
         return False
 
-    title_program_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_PROGRAM_BRAND_ACTION_TERMS])
-    program_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROGRAM_BRAND_ACTION_TERMS])
+    title_program_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_PROGRAM_BRAND_ACTION_TERMS))
+    program_hits = count_any(txt, _lowered_terms(_SUPPLY_PROGRAM_BRAND_ACTION_TERMS))
     if title_program_hits == 0 and program_hits < 2:
         return False
 
     market_anchor_hits = count_any(txt, list(_SUPPLY_PROGRAM_ACTION_MARKET_TERMS_L))
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROGRAM_BRAND_KEEP_TERMS])
-    local_org_hits = count_any(txt, [w.lower() for w in _LOCAL_AGRI_ORG_TERMS])
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_PROGRAM_BRAND_KEEP_TERMS))
+    local_org_hits = count_any(txt, _lowered_terms(_LOCAL_AGRI_ORG_TERMS))
     if _LOCAL_AGRI_ORG_IN_TITLE_RX.search(ttl):
         local_org_hits += 1
     strong_price_title_hits = count_any(
         ttl_l,
-        [w.lower() for w in ("가격", "수급", "출하량", "반입량", "도매가격", "경락", "경매", "작황")],
+        _lowered_terms(("가격", "수급", "출하량", "반입량", "도매가격", "경락", "경매", "작황")),
     )
 
     if market_anchor_hits >= 1 and keep_hits >= 4 and strong_price_title_hits >= 1:
@@ -9876,18 +9980,18 @@ def is_supply_price_support_event_context(title: str, desc: str) -> bool:
     if is_supply_stabilization_policy_context(txt) or is_policy_market_brief_context(txt):
         return False
 
-    title_event_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_PRICE_SUPPORT_EVENT_TERMS])
-    event_hits = count_any(txt, [w.lower() for w in _SUPPLY_PRICE_SUPPORT_EVENT_TERMS])
-    support_hits = count_any(txt, [w.lower() for w in _SUPPLY_PRICE_SUPPORT_EVENT_SUPPORT_TERMS])
-    explicit_emergency_hits = count_any(ttl_l, [w.lower() for w in ("긴급", "특판")])
+    title_event_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_PRICE_SUPPORT_EVENT_TERMS))
+    event_hits = count_any(txt, _lowered_terms(_SUPPLY_PRICE_SUPPORT_EVENT_TERMS))
+    support_hits = count_any(txt, _lowered_terms(_SUPPLY_PRICE_SUPPORT_EVENT_SUPPORT_TERMS))
+    explicit_emergency_hits = count_any(ttl_l, _lowered_terms(("긴급", "특판")))
     if title_event_hits == 0 and event_hits < 2 and support_hits == 0:
         return False
 
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_PRICE_SUPPORT_EVENT_KEEP_TERMS])
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_PRICE_SUPPORT_EVENT_KEEP_TERMS))
     if keep_hits >= 2 and support_hits == 0:
         return False
 
-    price_hits = count_any(txt, [w.lower() for w in _SUPPLY_PRICE_SUPPORT_EVENT_PRICE_TERMS])
+    price_hits = count_any(txt, _lowered_terms(_SUPPLY_PRICE_SUPPORT_EVENT_PRICE_TERMS))
     return (
         price_hits >= 1
         and (title_event_hits >= 1 or event_hits >= 2)
@@ -9901,16 +10005,16 @@ def is_supply_official_support_response_context(title: str, desc: str) -> bool:
     ttl_l = _nfkc_lower(ttl)
     if not txt:
         return False
-    actor_hits = count_any(txt, [w.lower() for w in _SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ACTOR_TERMS])
-    issue_hits = count_any(txt, [w.lower() for w in _SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ISSUE_TERMS])
+    actor_hits = count_any(txt, _lowered_terms(_SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ACTOR_TERMS))
+    issue_hits = count_any(txt, _lowered_terms(_SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ISSUE_TERMS))
     if actor_hits == 0 or issue_hits == 0:
         return False
-    action_hits = count_any(txt, [w.lower() for w in _SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ACTION_TERMS])
-    title_action_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ACTION_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_OFFICIAL_SUPPORT_RESPONSE_KEEP_TERMS])
+    action_hits = count_any(txt, _lowered_terms(_SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ACTION_TERMS))
+    title_action_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_OFFICIAL_SUPPORT_RESPONSE_ACTION_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_OFFICIAL_SUPPORT_RESPONSE_KEEP_TERMS))
     concrete_supply_hits = count_any(
         txt,
-        [w.lower() for w in ("도매가격", "경락", "경매", "반입", "출하량", "생산량", "수확량", "재배면적")],
+        _lowered_terms(("도매가격", "경락", "경매", "반입", "출하량", "생산량", "수확량", "재배면적")),
     )
     if keep_hits >= 4 and concrete_supply_hits >= 2 and has_direct_supply_chain_signal(txt):
         return False
@@ -9949,11 +10053,11 @@ def is_supply_acreage_intent_context(title: str, desc: str) -> bool:
 
     survey_hits = count_any(
         txt,
-        [w.lower() for w in ("조사", "실태조사", "전수조사", "집계", "전망", "관측", "예상", "예측")],
+        _lowered_terms(("조사", "실태조사", "전수조사", "집계", "전망", "관측", "예상", "예측")),
     )
     supply_hits = count_any(
         txt,
-        [w.lower() for w in ("수급", "생산량", "출하량", "출하", "작황", "생육", "파종", "정식", "재배")],
+        _lowered_terms(("수급", "생산량", "출하량", "출하", "작황", "생육", "파종", "정식", "재배")),
     )
     managed_hits = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     item_hits = count_any(txt, HORTI_ITEM_TERMS_L) + managed_hits
@@ -9994,18 +10098,18 @@ def is_supply_market_support_program_context(title: str, desc: str, dom: str = "
 
     support_hits = count_any(
         txt,
-        [w.lower() for w in ("출하비용", "보전사업", "지원사업", "손실보전", "물류비 지원", "물류비", "지원금")],
+        _lowered_terms(("출하비용", "보전사업", "지원사업", "손실보전", "물류비 지원", "물류비", "지원금")),
     )
     ops_hits = count_any(
         txt,
-        [w.lower() for w in ("출하", "유통", "경매", "반입", "물류", "도매", "시장 출하")],
+        _lowered_terms(("출하", "유통", "경매", "반입", "물류", "도매", "시장 출하")),
     )
     policy_hits = count_any(
         txt,
-        [w.lower() for w in ("시행", "운영", "확대", "지원", "사업", "정책", "점검")],
+        _lowered_terms(("시행", "운영", "확대", "지원", "사업", "정책", "점검")),
     )
-    title_market_hits = count_any(ttl_l, [w.lower() for w in ("가락시장", "도매시장", "공판장", "유통센터")])
-    title_support_hits = count_any(ttl_l, [w.lower() for w in ("출하비용", "보전사업", "지원사업", "손실보전")])
+    title_market_hits = count_any(ttl_l, _lowered_terms(("가락시장", "도매시장", "공판장", "유통센터")))
+    title_support_hits = count_any(ttl_l, _lowered_terms(("출하비용", "보전사업", "지원사업", "손실보전")))
 
     return (
         (title_market_hits >= 1 and title_support_hits >= 1)
@@ -10020,12 +10124,12 @@ def is_supply_processed_price_roundup_context(title: str, desc: str) -> bool:
     ttl_l = _nfkc_lower(ttl)
     if not txt:
         return False
-    goods_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROCESSED_PRICE_ROUNDUP_GOODS_TERMS])
+    goods_hits = count_any(txt, _lowered_terms(_SUPPLY_PROCESSED_PRICE_ROUNDUP_GOODS_TERMS))
     if goods_hits == 0:
         return False
-    action_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROCESSED_PRICE_ROUNDUP_TERMS])
-    title_action_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_PROCESSED_PRICE_ROUNDUP_TERMS])
-    keep_hits = count_any(txt, [w.lower() for w in _SUPPLY_PROCESSED_PRICE_ROUNDUP_KEEP_TERMS])
+    action_hits = count_any(txt, _lowered_terms(_SUPPLY_PROCESSED_PRICE_ROUNDUP_TERMS))
+    title_action_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_PROCESSED_PRICE_ROUNDUP_TERMS))
+    keep_hits = count_any(txt, _lowered_terms(_SUPPLY_PROCESSED_PRICE_ROUNDUP_KEEP_TERMS))
     if keep_hits >= 2 and has_direct_supply_chain_signal(txt):
         return False
     return (title_action_hits >= 1 or action_hits >= 2) and (goods_hits >= 2 or is_general_consumer_price_noise(txt))
@@ -10039,15 +10143,15 @@ def is_supply_accusatory_quote_context(title: str, desc: str) -> bool:
         return False
     if not any(mark in ttl for mark in ('"', "“", "”", "‘", "’")):
         return False
-    loaded_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_ACCUSATORY_QUOTE_TERMS]) + count_any(
+    loaded_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_ACCUSATORY_QUOTE_TERMS)) + count_any(
         txt,
-        [w.lower() for w in _SUPPLY_ACCUSATORY_QUOTE_TERMS],
+        _lowered_terms(_SUPPLY_ACCUSATORY_QUOTE_TERMS),
     )
     if loaded_hits == 0:
         return False
-    keep_hits = count_any(txt, [t.lower() for t in SUPPLY_TITLE_CORE_TERMS]) + count_any(
+    keep_hits = count_any(txt, _lowered_terms(SUPPLY_TITLE_CORE_TERMS)) + count_any(
         txt,
-        [w.lower() for w in ("도매가격", "경락", "경매", "반입", "출하량", "생산량", "작황", "생육")],
+        _lowered_terms(("도매가격", "경락", "경매", "반입", "출하량", "생산량", "작황", "생육")),
     )
     return keep_hits < 3 or not has_direct_supply_chain_signal(txt)
 
@@ -10105,15 +10209,15 @@ def is_supply_weak_tail_context(title: str, desc: str) -> bool:
     if is_commodity_broad_price_roundup_context(title, desc):
         return True
     if is_supply_org_promo_feature_context(title, desc):
-        launchy_org_hits = count_any(ttl_l, [w.lower() for w in ("첫선", "첫 결실", "첫결실", "첫 출하", "첫출하", "선보여", "선봬")])
+        launchy_org_hits = count_any(ttl_l, _lowered_terms(("첫선", "첫 결실", "첫결실", "첫 출하", "첫출하", "선보여", "선봬")))
         if launchy_org_hits >= 1:
             return True
         return False
 
-    title_core_hits = count_any(ttl_l, [t.lower() for t in SUPPLY_TITLE_CORE_TERMS])
-    promo_hits = count_any(txt, [w.lower() for w in _SUPPLY_WEAK_TAIL_PROMO_TERMS])
-    visit_hits = count_any(txt, [w.lower() for w in _SUPPLY_WEAK_TAIL_VISIT_TERMS])
-    official_hits = count_any(ttl_l, [w.lower() for w in _SUPPLY_WEAK_TAIL_OFFICIAL_TERMS])
+    title_core_hits = count_any(ttl_l, _lowered_terms(SUPPLY_TITLE_CORE_TERMS))
+    promo_hits = count_any(txt, _lowered_terms(_SUPPLY_WEAK_TAIL_PROMO_TERMS))
+    visit_hits = count_any(txt, _lowered_terms(_SUPPLY_WEAK_TAIL_VISIT_TERMS))
+    official_hits = count_any(ttl_l, _lowered_terms(_SUPPLY_WEAK_TAIL_OFFICIAL_TERMS))
 
     if official_hits >= 1 and visit_hits >= 2 and title_core_hits == 0:
         return True
@@ -10212,10 +10316,10 @@ def is_remote_foreign_trade_brief_context(title: str, desc: str, dom: str = "")
     if not txt:
         return False
 
-    foreign_hits = count_any(txt, [w.lower() for w in _FOREIGN_REMOTE_MARKERS])
-    trade_hits = count_any(txt, [w.lower() for w in _REMOTE_FOREIGN_TRADE_TERMS])
-    shipping_hits = count_any(txt, [w.lower() for w in _REMOTE_FOREIGN_SHIPPING_TERMS])
-    domestic_hits = count_any(txt, [w.lower() for w in _REMOTE_FOREIGN_TRADE_DOMESTIC_HINTS])
+    foreign_hits = count_any(txt, _lowered_terms(_FOREIGN_REMOTE_MARKERS))
+    trade_hits = count_any(txt, _lowered_terms(_REMOTE_FOREIGN_TRADE_TERMS))
+    shipping_hits = count_any(txt, _lowered_terms(_REMOTE_FOREIGN_SHIPPING_TERMS))
+    domestic_hits = count_any(txt, _lowered_terms(_REMOTE_FOREIGN_TRADE_DOMESTIC_HINTS))
     horti_sc = best_horti_score(ttl, desc or "")
     horti_title_sc = best_horti_score(ttl, "")
     dom_norm = normalize_host(dom or "")
@@ -10242,10 +10346,10 @@ def is_non_horti_processed_export_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    marker_hits = count_any(txt, [w.lower() for w in _NON_HORTI_PROCESSED_EXPORT_MARKERS])
+    marker_hits = count_any(txt, _lowered_terms(_NON_HORTI_PROCESSED_EXPORT_MARKERS))
     if marker_hits == 0:
         return False
-    if count_any(txt, [w.lower() for w in _NON_HORTI_PROCESSED_EXPORT_ALLOW_MARKERS]) >= 1:
+    if count_any(txt, _lowered_terms(_NON_HORTI_PROCESSED_EXPORT_ALLOW_MARKERS)) >= 1:
         return False
     try:
         topic, topic_sc = best_topic_and_score(ttl, desc or "")
@@ -10267,35 +10371,35 @@ def is_dist_export_field_context(title: str, desc: str, dom: str = "", press: st
         return False
     if is_commodity_political_statement_context(title, desc):
         return False
-    if dom_norm in POLICY_BRIEF_ONLY_DOMAINS and count_any(txt, [w.lower() for w in _POLICY_EXPORT_SUPPORT_TERMS]) >= 2:
+    if dom_norm in POLICY_BRIEF_ONLY_DOMAINS and count_any(txt, _lowered_terms(_POLICY_EXPORT_SUPPORT_TERMS)) >= 2:
         return False
     if is_policy_market_brief_context(txt, dom, press) or is_supply_stabilization_policy_context(txt, dom, press):
         return False
     if is_non_horti_processed_export_context(ttl, desc or ""):
         return False
 
-    export_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_TERMS])
-    market_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_MARKET_TERMS])
-    interview_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_INTERVIEW_TERMS])
-    policy_heavy_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_POLICY_HEAVY_TERMS])
-    agri_hits = count_any(txt, [w.lower() for w in ("농산물", "농식품", "원예", "과수", "과일", "채소", "화훼", "aT", "한국농수산식품유통공사")])
-    org_hits = count_any(txt, [w.lower() for w in ("aT 사장", "at 사장", "한국농수산식품유통공사", "aT", "at")])
+    export_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_TERMS))
+    market_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_MARKET_TERMS))
+    interview_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_INTERVIEW_TERMS))
+    policy_heavy_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_POLICY_HEAVY_TERMS))
+    agri_hits = count_any(txt, _lowered_terms(("농산물", "농식품", "원예", "과수", "과일", "채소", "화훼", "aT", "한국농수산식품유통공사")))
+    org_hits = count_any(txt, _lowered_terms(("aT 사장", "at 사장", "한국농수산식품유통공사", "aT", "at")))
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     item_hits = count_any(txt, HORTI_ITEM_TERMS_L)
-    response_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_RESPONSE_TERMS])
-    title_signature_hits = count_any((ttl or "").lower(), [w.lower() for w in _DIST_EXPORT_FIELD_MACRO_SIGNATURE_TERMS])
-    macro_barrier_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_FIELD_MACRO_POLICY_TERMS])
+    response_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_RESPONSE_TERMS))
+    title_signature_hits = count_any((ttl or "").lower(), _lowered_terms(_DIST_EXPORT_FIELD_MACRO_SIGNATURE_TERMS))
+    macro_barrier_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_FIELD_MACRO_POLICY_TERMS))
     export_execution_hits = count_any(
         txt,
-        [w.lower() for w in ("검역", "통관", "선적", "선적식", "바이어", "공동선별", "공선출하", "산지유통센터", "apc", "물류")],
+        _lowered_terms(("검역", "통관", "선적", "선적식", "바이어", "공동선별", "공선출하", "산지유통센터", "apc", "물류")),
     )
     political_promise_hits = count_any(
         txt,
-        [w.lower() for w in ("예비후보", "후보", "공약", "선언", "비전", "플랫폼 구축", "구축", "납품 확대", "육성", "추진")],
+        _lowered_terms(("예비후보", "후보", "공약", "선언", "비전", "플랫폼 구축", "구축", "납품 확대", "육성", "추진")),
     )
     org_performance_hits = count_any(
         txt,
-        [w.lower() for w in ("경영평가", "종합경영평가", "1등급", "우수", "연속 달성", "연속", "성과", "실적")],
+        _lowered_terms(("경영평가", "종합경영평가", "1등급", "우수", "연속 달성", "연속", "성과", "실적")),
     )
 
     if export_hits == 0 or market_hits == 0:
@@ -10326,15 +10430,15 @@ def is_policy_export_support_brief_context(title: str, desc: str, dom: str = "",
     if is_non_horti_processed_export_context(ttl, desc or ""):
         return False
 
-    policy_hits = count_any(txt, [w.lower() for w in _POLICY_EXPORT_SUPPORT_TERMS])
-    export_hits = count_any(txt, [w.lower() for w in _POLICY_EXPORT_SUPPORT_EXPORT_TERMS])
-    barrier_hits = count_any(txt, [w.lower() for w in _POLICY_EXPORT_BARRIER_TERMS])
-    agri_hits = count_any(txt, [w.lower() for w in ("\ub18d\uc2dd\ud488", "\ub18d\uc0b0\ubb3c", "\uc2dd\ud488\uc0b0\uc5c5", "k-\ud478\ub4dc", "k\ud478\ub4dc")])
+    policy_hits = count_any(txt, _lowered_terms(_POLICY_EXPORT_SUPPORT_TERMS))
+    export_hits = count_any(txt, _lowered_terms(_POLICY_EXPORT_SUPPORT_EXPORT_TERMS))
+    barrier_hits = count_any(txt, _lowered_terms(_POLICY_EXPORT_BARRIER_TERMS))
+    agri_hits = count_any(txt, _lowered_terms(("\ub18d\uc2dd\ud488", "\ub18d\uc0b0\ubb3c", "\uc2dd\ud488\uc0b0\uc5c5", "k-\ud478\ub4dc", "k\ud478\ub4dc")))
     item_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     dom_norm = normalize_host(dom or "")
     officialish = policy_domain_override(dom_norm, txt) or (dom_norm in POLICY_DOMAINS) or any(dom_norm.endswith("." + h) for h in POLICY_DOMAINS) or (press in ("\uc815\ucc45\ube0c\ub9ac\ud551", "\ub18d\uc2dd\ud488\ubd80"))
-    actor_hits = count_any(txt, [w.lower() for w in ("\ub18d\uc2dd\ud488\ubd80", "\ub18d\ub9bc\ucd95\uc0b0\uc2dd\ud488\ubd80", "\uc7a5\uad00", "\ucc28\uad00", "\uad6d\ud68c", "\uc704\uc6d0\ud68c", "\uc5c5\ubb34\uacc4\ud68d", "\uc815\ubd80", "\uad00\uacc4\ubd80\ucc98", "at", "\ud55c\uad6d\ub18d\uc218\uc0b0\uc2dd\ud488\uc720\ud1b5\uacf5\uc0ac")])
-    eventish_hits = count_any(txt, [w.lower() for w in ("\uc138\ubbf8\ub098", "\ud3ec\ub7fc", "\uc124\uba85\ud68c", "\uac04\ub2f4\ud68c", "\ud589\uc0ac", "\uac1c\ucd5c")])
+    actor_hits = count_any(txt, _lowered_terms(("\ub18d\uc2dd\ud488\ubd80", "\ub18d\ub9bc\ucd95\uc0b0\uc2dd\ud488\ubd80", "\uc7a5\uad00", "\ucc28\uad00", "\uad6d\ud68c", "\uc704\uc6d0\ud68c", "\uc5c5\ubb34\uacc4\ud68d", "\uc815\ubd80", "\uad00\uacc4\ubd80\ucc98", "at", "\ud55c\uad6d\ub18d\uc218\uc0b0\uc2dd\ud488\uc720\ud1b5\uacf5\uc0ac")))
+    eventish_hits = count_any(txt, _lowered_terms(("\uc138\ubbf8\ub098", "\ud3ec\ub7fc", "\uc124\uba85\ud68c", "\uac04\ub2f4\ud68c", "\ud589\uc0ac", "\uac1c\ucd5c")))
     actor_anchor = officialish or actor_hits >= 2 or (actor_hits >= 1 and agri_hits >= 1)
     strong_barrier_response = actor_anchor and export_hits >= 1 and barrier_hits >= 2 and (agri_hits >= 1 or item_hits >= 1)
 
@@ -10374,9 +10478,9 @@ def is_dist_export_shipping_context(title: str, desc: str) -> bool:
     if not horti_hit:
         return False
 
-    export_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_SHIPPING_TERMS])
-    chain_hits = count_any(txt, [w.lower() for w in _DIST_EXPORT_CHAIN_TERMS])
-    shipping_hits = count_any(txt, [w.lower() for w in ("선적", "선적식", "수출길", "해외 수출")])
+    export_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_SHIPPING_TERMS))
+    chain_hits = count_any(txt, _lowered_terms(_DIST_EXPORT_CHAIN_TERMS))
+    shipping_hits = count_any(txt, _lowered_terms(("선적", "선적식", "수출길", "해외 수출")))
     destination_hit = _DIST_EXPORT_DESTINATION_RX.search(ttl) is not None
     return export_hits >= 1 and (shipping_hits >= 1 or destination_hit or chain_hits >= 2)
 
@@ -10389,28 +10493,28 @@ def is_finance_asset_policy_noise_context(title: str, desc: str, dom: str = "",
         return False
     asset_title_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "비트코인", "가상자산", "암호화폐", "코인", "etf", "주식", "채권",
             "코스피", "코스닥", "증시", "환율", "원화", "달러",
-        )],
+        )),
     )
     if asset_title_hits == 0:
         return False
     title_agri_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농업", "원예", "과수", "과일", "채소", "화훼",
             "도매시장", "공판장", "수급", "출하", "산지", "농가",
-        )],
+        )),
     )
     if title_agri_hits >= 1 or best_horti_score(title or "", "") >= 1.2:
         return False
     txt_agri_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농림축산식품부", "농업", "원예", "과수", "과일",
             "채소", "화훼", "도매시장", "공판장", "가락시장", "산지유통",
-        )],
+        )),
     )
     # ETF/crypto stories also use words such as "수급" for fund flows, so title
     # asset intent plus no agri anchor is enough to treat them as policy noise.
@@ -10425,41 +10529,41 @@ def is_housing_market_policy_noise_context(title: str, desc: str, dom: str = "",
         return False
     real_market_title_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "가락시장", "전통시장", "농산물시장", "온라인도매시장", "시장격리",
-        )],
+        )),
     )
     agri_title_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농림축산식품부", "농업", "농가", "원예", "과수", "과일", "채소",
             "화훼", "산지", "수급", "가격안정", "출하", "작황",
-        )],
+        )),
     )
     if real_market_title_hits >= 1 or agri_title_hits >= 1 or best_horti_score(title or "", "") >= 1.2:
         return False
     housing_title_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "주택시장", "주거복지", "아파트", "부동산", "재건축", "재개발", "분양", "청약",
             "전세", "월세", "임대차", "대단지", "역세권",
-        )],
+        )),
     )
     if housing_title_hits >= 1:
         return True
     redevelopment_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "용적률", "재개발", "재건축", "도시혁신구역", "주거지구", "분양", "청약",
             "임대차", "부동산", "개발 계획", "개발계획", "개발 공약",
-        )],
+        )),
     )
     agri_text_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농림축산식품부", "농업", "농가", "원예", "과수", "과일",
             "채소", "화훼", "도매시장", "공판장", "가락시장", "산지유통", "수급",
-        )],
+        )),
     )
     return redevelopment_hits >= 2 and agri_text_hits == 0
 
@@ -10472,19 +10576,19 @@ def is_supply_social_policy_noise_context(title: str, desc: str) -> bool:
         return False
     social_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농어촌 기본소득", "기본소득", "지역 소멸", "지역소멸", "인구감소",
             "생활인구", "균형발전", "경제 선순환", "소멸 위기",
-        )],
+        )),
     )
     if social_hits == 0:
         return False
     supply_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "수급", "가격", "시세", "출하", "반입", "경락", "경매", "작황",
             "생산량", "재고", "산지폐기", "폭락", "급락", "하락",
-        )],
+        )),
     )
     title_item_hits = count_any(ttl_l, HORTI_ITEM_TERMS_L)
     return not (supply_hits >= 1 and (title_item_hits >= 1 or best_horti_score(title or "", "") >= 1.2))
@@ -10501,10 +10605,10 @@ def is_supply_price_collapse_field_context(title: str, desc: str, dom: str = "",
             best_horti_score(title or "", "") >= 1.2
             or count_any(
                 ttl_l,
-                [w.lower() for w in (
+                _lowered_terms((
                     "과채류", "채소류", "오이", "호박", "애호박", "토마토", "고추", "가지",
                     "배추", "양배추", "무", "양파", "마늘", "사과", "배", "복숭아", "포도",
-                )],
+                )),
             ) >= 1
         )
         and any(term in ttl_l for term in ("폭락", "급락", "하락", "반토막", "최저", "바닥"))
@@ -10519,27 +10623,27 @@ def is_supply_price_collapse_field_context(title: str, desc: str, dom: str = "",
         return False
     item_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "채솟값", "채소", "카네이션", "꽃가게", "꽃", "화훼", "절화",
             "농산물", "과일", "배추", "무", "양파", "마늘", "사과", "배",
             "과채류", "오이", "호박", "애호박", "토마토", "고추", "가지",
-        )],
+        )),
     )
     if item_hits == 0 and best_horti_score(title or "", "") < 1.2:
         return False
     price_or_demand_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "반토막", "폭락", "급락", "하락", "바닥", "텅텅", "성수기",
             "수요", "소비", "시드는", "눈물", "팔아도 적자", "적자",
-        )],
+        )),
     )
     field_hits = count_any(
         txt_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "통째로 폐기", "산지폐기", "폐기", "농가", "꽃가게", "시장",
             "판매", "출하", "수확", "물량", "성수기",
-        )],
+        )),
     )
     return price_or_demand_hits >= 1 and field_hits >= 1
 
@@ -10557,15 +10661,15 @@ def _is_supply_price_collapse_editorial_context(
     txt = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     promo_frame = count_any(
         ttl,
-        [w.lower() for w in ("풍년의 역설", "소비 촉진", "소비촉진", "농가 돕기")],
+        _lowered_terms(("풍년의 역설", "소비 촉진", "소비촉진", "농가 돕기")),
     ) >= 1
     field_crisis = count_any(
         txt,
-        [w.lower() for w in ("공급 과잉", "가격 폭락", "값이 폭락", "산지폐기", "갈아엎", "수확을 포기")],
+        _lowered_terms(("공급 과잉", "가격 폭락", "값이 폭락", "산지폐기", "갈아엎", "수확을 포기")),
     ) >= 2
-    title_price_signal = count_any(ttl, [w.lower() for w in (
+    title_price_signal = count_any(ttl, _lowered_terms((
         "가격", "값", "시세", "폭락", "급락", "하락", "반토막", "최저", "바닥",
-    )]) >= 1
+    ))) >= 1
     if title_price_signal and not promo_frame:
         return True
     return bool(promo_frame and field_crisis)
@@ -10579,28 +10683,28 @@ def is_dist_apc_nh_core_context(title: str, desc: str) -> bool:
     title_l = _nfkc_lower(title or "")
     donation_title_hits = count_any(
         title_l,
-        [w.lower() for w in ("전달", "기부", "후원", "성금", "장학금", "영농자재", "상당")],
+        _lowered_terms(("전달", "기부", "후원", "성금", "장학금", "영농자재", "상당")),
     )
     concrete_infra_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "apc", "거점산지유통센터", "산지유통센터", "산지유통", "공동선별",
             "공선출하", "선별", "선과", "저온저장", "저장고", "통합마케팅",
-        )],
+        )),
     )
     if donation_title_hits >= 1 and concrete_infra_hits == 0:
         return False
     actor_hits = count_any(
         txt,
-        [w.lower() for w in ("품목농협", "원예농협", "과수농협", "농협", "농협경제지주")],
+        _lowered_terms(("품목농협", "원예농협", "과수농협", "농협", "농협경제지주")),
     )
     infra_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "apc", "거점산지유통센터", "산지유통센터", "산지유통", "공동선별",
             "공선출하", "선별", "선과", "저온저장", "저장고", "출하",
             "판매사업", "경제사업", "연합판매사업", "통합마케팅",
-        )],
+        )),
     )
     return actor_hits >= 1 and infra_hits >= 1
 
@@ -10611,30 +10715,30 @@ def is_dist_low_value_donation_context(title: str, desc: str) -> bool:
     if not txt or is_dist_apc_nh_core_context(title, desc):
         return False
     title_l = _nfkc_lower(title or "")
-    title_handoff_hits = count_any(title_l, [w.lower() for w in ("전달", "기부", "후원", "성금", "장학금")])
-    support_value_hits = count_any(txt, [w.lower() for w in ("영농자재", "상당", "만원", "발전기금", "장학금", "성금")])
+    title_handoff_hits = count_any(title_l, _lowered_terms(("전달", "기부", "후원", "성금", "장학금")))
+    support_value_hits = count_any(txt, _lowered_terms(("영농자재", "상당", "만원", "발전기금", "장학금", "성금")))
     concrete_infra_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "apc", "거점산지유통센터", "산지유통센터", "산지유통", "공동선별",
             "공선출하", "선별", "선과", "저온저장", "저장고", "통합마케팅",
-        )],
+        )),
     )
     if title_handoff_hits >= 1 and support_value_hits >= 1 and concrete_infra_hits == 0:
         return True
     donation_hits = count_any(
         txt,
-        [w.lower() for w in ("전달", "기부", "후원", "영농자재", "상당", "장학금", "발전기금", "성금")],
+        _lowered_terms(("전달", "기부", "후원", "영농자재", "상당", "장학금", "발전기금", "성금")),
     )
     if donation_hits == 0:
         return False
     ops_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "경락", "반입", "산지유통", "산지유통센터",
             "apc", "공동선별", "공선출하", "수출", "검역", "통관", "원산지",
             "물류", "출하", "유통구조", "가격", "수급",
-        )],
+        )),
     )
     return ops_hits == 0
 
@@ -10644,26 +10748,26 @@ def is_pest_fire_blight_farmer_risk_context(title: str, desc: str) -> bool:
     txt = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if "붉은 죽음" in txt and count_any(
         txt,
-        [w.lower() for w in ("사과", "배", "과수", "과수원", "농가", "매몰", "고사", "확산")],
+        _lowered_terms(("사과", "배", "과수", "과수원", "농가", "매몰", "고사", "확산")),
     ) >= 1:
         return True
     if "화상병" in txt:
         risk_hits = count_any(
             txt,
-            [w.lower() for w in (
+            _lowered_terms((
                 "과수화상병", "사과", "과수", "농가", "발생", "확산", "방제", "소독",
                 "초토화", "비상", "긴장", "현장", "진단", "격리", "매몰", "폐원", "붉은 죽음",
-            )],
+            )),
         )
         return risk_hits >= 1
     if "화상병" not in txt:
         return False
     risk_hits = count_any(
         txt,
-        [w.lower() for w in (
+        _lowered_terms((
             "신고", "숨기는", "은폐", "빚더미", "방역망", "보상", "폐원",
             "매몰", "농가", "비상", "확산", "차단",
-        )],
+        )),
     )
     return risk_hits >= 2
 
@@ -10693,7 +10797,7 @@ def is_pest_fire_blight_high_impact_field_report_context(title: str, desc: str,
     txt = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     return count_any(
         txt,
-        [w.lower() for w in ("붉은 죽음", "치료제 없어", "걸리면 답도 없다", "농가 시름", "사과 과수원 덮친")],
+        _lowered_terms(("붉은 죽음", "치료제 없어", "걸리면 답도 없다", "농가 시름", "사과 과수원 덮친")),
     ) >= 1
 
 
@@ -10703,9 +10807,9 @@ def is_pest_national_fire_blight_escalation_context(title: str, desc: str) -> bo
     title_l = _nfkc_lower(title or "")
     if "과수화상병" not in text and "화상병" not in text:
         return False
-    national_hits = count_any(text, [w.lower() for w in ("농진청", "농촌진흥청", "위기단계", "위기 단계", "경계", "주의", "전국")])
-    escalation_hits = count_any(text, [w.lower() for w in ("첫 확진", "첫 발생", "세종", "미발생 지역", "확산 차단", "정밀 예찰", "반경 2km", "상향", "위기 경보", "발생 규모")])
-    title_hits = count_any(title_l, [w.lower() for w in ("농진청", "세종", "첫", "위기단계", "위기 단계", "경계", "주의", "전국")])
+    national_hits = count_any(text, _lowered_terms(("농진청", "농촌진흥청", "위기단계", "위기 단계", "경계", "주의", "전국")))
+    escalation_hits = count_any(text, _lowered_terms(("첫 확진", "첫 발생", "세종", "미발생 지역", "확산 차단", "정밀 예찰", "반경 2km", "상향", "위기 경보", "발생 규모")))
+    title_hits = count_any(title_l, _lowered_terms(("농진청", "세종", "첫", "위기단계", "위기 단계", "경계", "주의", "전국")))
     return national_hits >= 1 and escalation_hits >= 1 and title_hits >= 1
 
 
@@ -10716,9 +10820,9 @@ def is_pest_regional_fire_blight_response_context(title: str, desc: str) -> bool
         return False
     response_hits = count_any(
         text,
-        [w.lower() for w in ("현장진단실", "신속 진단", "초동 방제", "차단 총력", "예찰", "방제 체계", "확산 조기 차단")],
+        _lowered_terms(("현장진단실", "신속 진단", "초동 방제", "차단 총력", "예찰", "방제 체계", "확산 조기 차단")),
     )
-    actor_hits = count_any(text, [w.lower() for w in ("농기원", "농업기술원", "농업기술센터", "도농기원", "농진청")])
+    actor_hits = count_any(text, _lowered_terms(("농기원", "농업기술원", "농업기술센터", "도농기원", "농진청")))
     return response_hits >= 2 and actor_hits >= 1
 
 
@@ -10726,16 +10830,16 @@ def is_pest_fire_blight_diagnostics_response_context(title: str, desc: str) -> b
     text = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
     if not is_pest_regional_fire_blight_response_context(title, desc):
         return False
-    return count_any(text, [w.lower() for w in ("현장진단실", "신속 진단", "초동 방제", "방제 체계")]) >= 2
+    return count_any(text, _lowered_terms(("현장진단실", "신속 진단", "초동 방제", "방제 체계"))) >= 2
 
 
 def is_pest_official_photo_check_context(title: str, desc: str, dom: str = "", press: str = "") -> bool:
     """Official-visit/photo check stories are useful but should yield to farm-risk pest reports."""
     ttl_l = _nfkc_lower(title or "")
     txt_l = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
-    visit_hits = count_any(ttl_l, [w.lower() for w in ("차장", "청장", "실장", "현장 점검", "방제 점검")])
-    pest_hits = count_any(txt_l, [w.lower() for w in ("방제", "예찰", "선충", "병해충", "화상병")])
-    farm_risk_hits = count_any(txt_l, [w.lower() for w in ("농가 피해", "확산", "신고", "보상", "방역망", "폐원")])
+    visit_hits = count_any(ttl_l, _lowered_terms(("차장", "청장", "실장", "현장 점검", "방제 점검")))
+    pest_hits = count_any(txt_l, _lowered_terms(("방제", "예찰", "선충", "병해충", "화상병")))
+    farm_risk_hits = count_any(txt_l, _lowered_terms(("농가 피해", "확산", "신고", "보상", "방역망", "폐원")))
     return visit_hits >= 1 and pest_hits >= 1 and farm_risk_hits == 0
 
 
@@ -10758,7 +10862,7 @@ def is_pest_preparedness_drill_context(title: str, desc: str) -> bool:
     )
     real_outbreak = count_any(
         ttl,
-        [w.lower() for w in ("번졌", "곳 피해", "농가 피해", "확진", "폐원", "매몰", "발생 절반", "피해 면적", "ha", "㏊", "발생 규모")],
+        _lowered_terms(("번졌", "곳 피해", "농가 피해", "확진", "폐원", "매몰", "발생 절반", "피해 면적", "ha", "㏊", "발생 규모")),
     )
     return drill_or_meeting and real_outbreak == 0
 
@@ -10809,8 +10913,8 @@ def dist_operational_diversity_bucket(title: str, desc: str, dom: str = "", pres
     ):
         return "apc_nh"
 
-    apc_nh_hits = count_any(txt, [w.lower() for w in _DIST_APC_NH_DIVERSITY_TERMS])
-    agri_hits = count_any(txt, [w.lower() for w in ("농산물", "농식품", "농업", "농가", "원예", "과수", "과일", "채소", "청과")])
+    apc_nh_hits = count_any(txt, _lowered_terms(_DIST_APC_NH_DIVERSITY_TERMS))
+    agri_hits = count_any(txt, _lowered_terms(("농산물", "농식품", "농업", "농가", "원예", "과수", "과일", "채소", "청과")))
     if (has_apc_agri_context(txt) or apc_nh_hits >= 2) and agri_hits >= 1:
         if not is_dist_program_event_noise_context(ttl, desc or "", dom_norm, pr_norm):
             return "apc_nh"
@@ -10825,7 +10929,7 @@ def dist_operational_diversity_bucket(title: str, desc: str, dom: str = "", pres
     if (
         is_dist_market_ops_context(ttl, desc or "", dom_norm, pr_norm)
         or is_dist_quality_field_ops_context(ttl, desc or "", dom_norm, pr_norm)
-        or count_any(txt, [w.lower() for w in _DIST_MARKET_DIVERSITY_TERMS]) >= 2
+        or count_any(txt, _lowered_terms(_DIST_MARKET_DIVERSITY_TERMS)) >= 2
     ):
         return "market"
 
@@ -10841,12 +10945,12 @@ def is_dist_market_disruption_context(title: str, desc: str) -> bool:
     if is_policy_market_brief_context(txt) or is_supply_stabilization_policy_context(txt):
         return False
 
-    market_hits = count_any(txt, [w.lower() for w in _DIST_MARKET_DISRUPTION_MARKET_TERMS])
-    disruption_hits = count_any(txt, [w.lower() for w in _DIST_MARKET_DISRUPTION_TERMS])
-    impact_hits = count_any(txt, [w.lower() for w in _DIST_MARKET_DISRUPTION_IMPACT_TERMS])
+    market_hits = count_any(txt, _lowered_terms(_DIST_MARKET_DISRUPTION_MARKET_TERMS))
+    disruption_hits = count_any(txt, _lowered_terms(_DIST_MARKET_DISRUPTION_TERMS))
+    impact_hits = count_any(txt, _lowered_terms(_DIST_MARKET_DISRUPTION_IMPACT_TERMS))
     horti_sc = best_horti_score(ttl, desc or "")
     horti_title_sc = best_horti_score(ttl, "")
-    agri_hits = count_any(txt, [w.lower() for w in ("농산물", "과채류", "과일", "채소", "청과", "산지", "출하 농민")])
+    agri_hits = count_any(txt, _lowered_terms(("농산물", "과채류", "과일", "채소", "청과", "산지", "출하 농민")))
 
     if market_hits == 0 or disruption_hits == 0 or impact_hits == 0:
         return False
@@ -10862,11 +10966,11 @@ def dist_market_disruption_scope(title: str, desc: str) -> str:
     txt = f"{ttl} {desc or ''}".lower()
     systemic_core_hits = count_any(
         txt,
-        [w.lower() for w in ("수도권", "도매시장 첫", "출하쏠림", "과채류")],
+        _lowered_terms(("수도권", "도매시장 첫", "출하쏠림", "과채류")),
     )
     market_operation_hits = count_any(
         txt,
-        [w.lower() for w in ("도매시장", "동시 휴업", "동시휴업", "가락", "구리")],
+        _lowered_terms(("도매시장", "동시 휴업", "동시휴업", "가락", "구리")),
     )
     if ("도매시장 첫" in ttl) or systemic_core_hits >= 2 or (systemic_core_hits >= 1 and market_operation_hits >= 2):
         return "systemic"
@@ -10874,7 +10978,7 @@ def dist_market_disruption_scope(title: str, desc: str) -> str:
     commodity_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     aftermath_hits = count_any(
         txt,
-        [w.lower() for w in ("폐기량", "경락값", "경락가", "가격", "시세", "출하량", "출하 조정")],
+        _lowered_terms(("폐기량", "경락값", "경락가", "가격", "시세", "출하량", "출하 조정")),
     )
     if commodity_hits >= 1 and aftermath_hits >= 2:
         return "commodity_aftershock"
@@ -10909,17 +11013,17 @@ def is_policy_general_macro_tail_context(title: str, desc: str, dom: str = "", p
     if not macro_like:
         return False
 
-    agri_hits = count_any(txt, [w.lower() for w in _POLICY_GENERAL_MACRO_AGRI_TERMS])
-    title_agri_hits = count_any(ttl.lower(), [w.lower() for w in _POLICY_GENERAL_MACRO_AGRI_TERMS])
-    market_hits = count_any(txt, [w.lower() for w in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")])
+    agri_hits = count_any(txt, _lowered_terms(_POLICY_GENERAL_MACRO_AGRI_TERMS))
+    title_agri_hits = count_any(ttl.lower(), _lowered_terms(_POLICY_GENERAL_MACRO_AGRI_TERMS))
+    market_hits = count_any(txt, _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")))
     horti_sc = best_horti_score(ttl, desc or "")
     regional_macro_hits = count_any(
         txt,
-        [w.lower() for w in ("부·울·경", "부울경", "부산", "울산", "경남", "민생안정", "특별기간", "긴급 대응", "총동원", "빨간불", "경제")],
+        _lowered_terms(("부·울·경", "부울경", "부산", "울산", "경남", "민생안정", "특별기간", "긴급 대응", "총동원", "빨간불", "경제")),
     )
     title_macro_hits = count_any(
         ttl.lower(),
-        [w.lower() for w in ("긴급 대응", "빨간불", "민생", "특별기간", "총동원", "경제")],
+        _lowered_terms(("긴급 대응", "빨간불", "민생", "특별기간", "총동원", "경제")),
     )
 
     if market_hits >= 1:
@@ -10928,7 +11032,7 @@ def is_policy_general_macro_tail_context(title: str, desc: str, dom: str = "", p
         return False
     if _local_geo_match(ttl) and agri_hits < 3:
         return True
-    if count_any(ttl.lower(), [w.lower() for w in ("부·울·경", "부울경", "긴급 대응", "빨간불")]) >= 2 and title_agri_hits == 0 and market_hits == 0:
+    if count_any(ttl.lower(), _lowered_terms(("부·울·경", "부울경", "긴급 대응", "빨간불"))) >= 2 and title_agri_hits == 0 and market_hits == 0:
         return True
     if regional_macro_hits >= 2 and title_agri_hits == 0 and market_hits == 0 and agri_hits <= 3:
         return True
@@ -10940,9 +11044,9 @@ def has_direct_supply_chain_signal(text: str) -> bool:
     if not t:
         return False
     market_terms = ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")
-    if count_any(t, [w.lower() for w in market_terms]) >= 1:
+    if count_any(t, _lowered_terms(market_terms)) >= 1:
         return True
-    return count_any(t, [w.lower() for w in _DIRECT_SUPPLY_SIGNAL_TERMS]) >= 2
+    return count_any(t, _lowered_terms(_DIRECT_SUPPLY_SIGNAL_TERMS)) >= 2
 
 
 # ── 유가/에너지 주제 기사 판별: 농업은 부수적 언급에 불과한 경우 ──
@@ -10973,14 +11077,14 @@ def is_oil_energy_primary_macro_context(title: str, desc: str) -> bool:
     txt = f"{ttl} {desc or ''}".lower()
     if not txt:
         return False
-    title_oil_hits = count_any(ttl, [w.lower() for w in _OIL_ENERGY_TITLE_TERMS])
+    title_oil_hits = count_any(ttl, _lowered_terms(_OIL_ENERGY_TITLE_TERMS))
     if title_oil_hits == 0:
         return False
-    body_oil_hits = count_any(txt, [w.lower() for w in _OIL_ENERGY_PRIMARY_TERMS])
+    body_oil_hits = count_any(txt, _lowered_terms(_OIL_ENERGY_PRIMARY_TERMS))
     if body_oil_hits < 2:
         return False
-    agri_direct_hits = count_any(txt, [w.lower() for w in _OIL_ENERGY_AGRI_DIRECT_TERMS])
-    title_agri_hits = count_any(ttl, [w.lower() for w in _OIL_ENERGY_AGRI_DIRECT_TERMS])
+    agri_direct_hits = count_any(txt, _lowered_terms(_OIL_ENERGY_AGRI_DIRECT_TERMS))
+    title_agri_hits = count_any(ttl, _lowered_terms(_OIL_ENERGY_AGRI_DIRECT_TERMS))
     # 제목에 농산물 직접 신호가 있으면 유가가 농산물 수급에 미치는 영향 기사 → 허용
     if title_agri_hits >= 1:
         return False
@@ -11075,23 +11179,23 @@ def supply_issue_context_bucket(title: str, desc: str) -> str | None:
     item_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     title_item_hits = count_any(ttl.lower(), HORTI_ITEM_TERMS_L)
 
-    title_export_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_FEATURE_ISSUE_EXPORT_TERMS])
-    title_issue_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TITLE_TERMS])
-    export_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_EXPORT_TERMS])
-    issue_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TITLE_TERMS])
-    recovery_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_RECOVERY_TERMS])
-    farm_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_FARM_TERMS])
-    distress_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS])
-    title_distress_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS])
-    action_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_ACTION_TERMS])
-    input_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_INPUT_TERMS])
-    climate_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS])
-    trade_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TRADE_TERMS])
-    title_trade_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TRADE_TERMS])
-    hard_trade_terms = [w.lower() for w in ("관세", "할당관세", "무관세", "fta", "통상", "비관세장벽", "통관", "검역")]
+    title_export_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_FEATURE_ISSUE_EXPORT_TERMS))
+    title_issue_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_FEATURE_ISSUE_TITLE_TERMS))
+    export_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_EXPORT_TERMS))
+    issue_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_TITLE_TERMS))
+    recovery_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_RECOVERY_TERMS))
+    farm_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_FARM_TERMS))
+    distress_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS))
+    title_distress_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS))
+    action_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_ACTION_TERMS))
+    input_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_INPUT_TERMS))
+    climate_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS))
+    trade_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_TRADE_TERMS))
+    title_trade_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_FEATURE_ISSUE_TRADE_TERMS))
+    hard_trade_terms = _lowered_terms(("관세", "할당관세", "무관세", "fta", "통상", "비관세장벽", "통관", "검역"))
     hard_trade_hits = count_any(txt, hard_trade_terms)
     title_hard_trade_hits = count_any(ttl.lower(), hard_trade_terms)
-    trade_impact_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TRADE_IMPACT_TERMS])
+    trade_impact_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_TRADE_IMPACT_TERMS))
     strong_item_context = title_item_hits >= 1 or horti_title_sc >= 1.2 or horti_sc >= 2.2
     shock_issue = (
         (strong_item_context or (farm_hits >= 1 and (input_hits >= 1 or climate_hits >= 1)))
@@ -11250,7 +11354,7 @@ def supply_feature_context_kind(title: str, desc: str) -> str | None:
     horti_title_sc = best_horti_score(ttl, "")
     item_hits = count_any(txt, HORTI_ITEM_TERMS_L)
     title_item_hits = count_any(ttl.lower(), HORTI_ITEM_TERMS_L)
-    title_core_hits = count_any(ttl.lower(), [w.lower() for w in SUPPLY_TITLE_CORE_TERMS])
+    title_core_hits = count_any(ttl.lower(), _lowered_terms(SUPPLY_TITLE_CORE_TERMS))
     issue_bucket = supply_issue_context_bucket(title, desc)
     if item_hits == 0 and horti_sc < 1.8 and not issue_bucket:
         return None
@@ -11260,12 +11364,12 @@ def supply_feature_context_kind(title: str, desc: str) -> str | None:
     if issue_bucket:
         return "issue"
 
-    field_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_FIELD_TERMS])
-    quality_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_QUALITY_TERMS])
-    compare_hits = count_any(txt, [w.lower() for w in ("수입산", "수입", "만다린", "비교", "블라인드", "선호도")])
-    agri_hits = count_any(txt, [w.lower() for w in ("농가", "농장", "생산지", "재배", "시설", "과원")])
-    visit_hits = count_any(txt, [w.lower() for w in _SUPPLY_WEAK_TAIL_VISIT_TERMS])
-    official_hits = count_any(ttl.lower(), [w.lower() for w in _SUPPLY_WEAK_TAIL_OFFICIAL_TERMS])
+    field_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_FIELD_TERMS))
+    quality_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_QUALITY_TERMS))
+    compare_hits = count_any(txt, _lowered_terms(("수입산", "수입", "만다린", "비교", "블라인드", "선호도")))
+    agri_hits = count_any(txt, _lowered_terms(("농가", "농장", "생산지", "재배", "시설", "과원")))
+    visit_hits = count_any(txt, _lowered_terms(_SUPPLY_WEAK_TAIL_VISIT_TERMS))
+    official_hits = count_any(ttl.lower(), _lowered_terms(_SUPPLY_WEAK_TAIL_OFFICIAL_TERMS))
 
     if (title_item_hits >= 1) or (horti_title_sc >= 1.2) or (horti_sc >= 2.0):
         if official_hits >= 1 and visit_hits >= 2 and title_core_hits == 0:
@@ -11291,8 +11395,8 @@ def is_supply_input_cost_pressure_context(title: str, desc: str) -> bool:
     issue_bucket = supply_issue_context_bucket(title, desc)
     if feature_kind not in {"field", "issue"} and issue_bucket != "commodity_issue":
         return False
-    cost_hits = count_any(txt, [w.lower() for w in _SUPPLY_INPUT_COST_PRESSURE_TERMS])
-    distress_hits = count_any(txt, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS])
+    cost_hits = count_any(txt, _lowered_terms(_SUPPLY_INPUT_COST_PRESSURE_TERMS))
+    distress_hits = count_any(txt, _lowered_terms(_SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS))
     return cost_hits >= 2 and distress_hits >= 1
 
 
@@ -11309,9 +11413,9 @@ def is_local_agri_infra_designation_context(title: str, desc: str) -> bool:
     if not txt or _LOCAL_REGION_IN_TITLE_RX.search(ttl) is None:
         return False
 
-    infra_hit = count_any(txt, [w.lower() for w in _LOCAL_AGRI_INFRA_TERMS])
-    selection_hit = count_any(txt, [w.lower() for w in _LOCAL_AGRI_INFRA_SELECTION_TERMS])
-    operation_hit = count_any(txt, [w.lower() for w in _LOCAL_AGRI_INFRA_OPERATION_TERMS])
+    infra_hit = count_any(txt, _lowered_terms(_LOCAL_AGRI_INFRA_TERMS))
+    selection_hit = count_any(txt, _lowered_terms(_LOCAL_AGRI_INFRA_SELECTION_TERMS))
+    operation_hit = count_any(txt, _lowered_terms(_LOCAL_AGRI_INFRA_OPERATION_TERMS))
     return infra_hit >= 1 and selection_hit >= 2 and operation_hit == 0
 
 
@@ -11325,10 +11429,10 @@ def is_broad_macro_price_context(title: str, desc: str) -> bool:
     if not txt:
         return False
 
-    macro_hits = count_any(txt, [w.lower() for w in ("물가", "소비자물가", "물가지수", "cpi", "장바구니", "밥상", "먹거리", "체감물가", "고물가")])
-    price_hits = count_any(txt, [w.lower() for w in ("가격", "급등", "상승", "하락", "들썩", "불안")])
-    item_hits = count_any(txt, [w.lower() for w in ("사과", "배", "감귤", "딸기", "채소", "과일", "농산물", "축산물", "돼지고기", "소고기", "계란", "달걀", "쌀")])
-    driver_hits = count_any(txt, [w.lower() for w in ("농식품부", "정부", "할인지원", "안정화", "공급", "수급", "유가", "환율", "통계", "kosis")])
+    macro_hits = count_any(txt, _lowered_terms(("물가", "소비자물가", "물가지수", "cpi", "장바구니", "밥상", "먹거리", "체감물가", "고물가")))
+    price_hits = count_any(txt, _lowered_terms(("가격", "급등", "상승", "하락", "들썩", "불안")))
+    item_hits = count_any(txt, _lowered_terms(("사과", "배", "감귤", "딸기", "채소", "과일", "농산물", "축산물", "돼지고기", "소고기", "계란", "달걀", "쌀")))
+    driver_hits = count_any(txt, _lowered_terms(("농식품부", "정부", "할인지원", "안정화", "공급", "수급", "유가", "환율", "통계", "kosis")))
 
     if macro_hits == 0 and ("가격" in txt) and item_hits >= 2 and driver_hits >= 1:
         macro_hits = 1
@@ -11356,22 +11460,22 @@ def is_fruit_foodservice_event_context(text: str) -> bool:
 
 def is_fruit_blossom_tourism_context(title: str, desc: str) -> bool:
     t = _nfkc_lower(f"{title or ''} {desc or ''}".strip())
-    flower_hits = count_any(t, [w.lower() for w in _FRUIT_BLOSSOM_TOURISM_FLOWER_TERMS])
+    flower_hits = count_any(t, _lowered_terms(_FRUIT_BLOSSOM_TOURISM_FLOWER_TERMS))
     if flower_hits == 0:
         return False
-    travel_hits = count_any(t, [w.lower() for w in _FRUIT_BLOSSOM_TOURISM_TRAVEL_TERMS])
+    travel_hits = count_any(t, _lowered_terms(_FRUIT_BLOSSOM_TOURISM_TRAVEL_TERMS))
     if travel_hits == 0:
         return False
-    strong_keep_hits = count_any(t, [w.lower() for w in _FRUIT_BLOSSOM_TOURISM_STRONG_KEEP_TERMS])
-    weak_keep_hits = count_any(t, [w.lower() for w in _FRUIT_BLOSSOM_TOURISM_WEAK_KEEP_TERMS])
+    strong_keep_hits = count_any(t, _lowered_terms(_FRUIT_BLOSSOM_TOURISM_STRONG_KEEP_TERMS))
+    weak_keep_hits = count_any(t, _lowered_terms(_FRUIT_BLOSSOM_TOURISM_WEAK_KEEP_TERMS))
     if strong_keep_hits >= 1:
         return False
     if (
         weak_keep_hits >= 2
         and (
-            count_any(t, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS]) >= 1
-            or count_any(t, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_ACTION_TERMS]) >= 1
-            or count_any(t, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TITLE_TERMS]) >= 1
+            count_any(t, _lowered_terms(_SUPPLY_FEATURE_ISSUE_DISTRESS_TERMS)) >= 1
+            or count_any(t, _lowered_terms(_SUPPLY_FEATURE_ISSUE_ACTION_TERMS)) >= 1
+            or count_any(t, _lowered_terms(_SUPPLY_FEATURE_ISSUE_TITLE_TERMS)) >= 1
         )
     ):
         return False
@@ -11473,12 +11577,12 @@ def is_policy_legislative_reform_context(title: str, desc: str, dom: str = "", p
     ttl_l = _nfkc_lower(ttl)
     if not txt:
         return False
-    law_hits = count_any(txt, [w.lower() for w in _POLICY_LEGISLATIVE_LAW_TERMS])
-    action_hits = count_any(txt, [w.lower() for w in _POLICY_LEGISLATIVE_ACTION_TERMS])
-    agri_hits = count_any(txt, [w.lower() for w in _POLICY_LEGISLATIVE_AGRI_TERMS])
+    law_hits = count_any(txt, _lowered_terms(_POLICY_LEGISLATIVE_LAW_TERMS))
+    action_hits = count_any(txt, _lowered_terms(_POLICY_LEGISLATIVE_ACTION_TERMS))
+    agri_hits = count_any(txt, _lowered_terms(_POLICY_LEGISLATIVE_AGRI_TERMS))
     title_hits = count_any(
         ttl_l,
-        [w.lower() for w in ("입법", "농협법", "농지법", "농안법", "개정", "법안", "농업민생")],
+        _lowered_terms(("입법", "농협법", "농지법", "농안법", "개정", "법안", "농업민생")),
     )
     if law_hits >= 1 and action_hits >= 1 and agri_hits >= 1:
         return True
@@ -11493,23 +11597,23 @@ def _is_agri_supplier_payment_gap_text(title: str, desc: str) -> bool:
         return False
     retail_actor_hits = count_any(
         text,
-        [w.lower() for w in ("홈플러스", "대형마트", "마트", "유통업체", "유통 업체", "납품업체", "협력업체")],
+        _lowered_terms(("홈플러스", "대형마트", "마트", "유통업체", "유통 업체", "납품업체", "협력업체")),
     )
     payment_hits = count_any(
         text,
-        [w.lower() for w in ("미정산", "납품대금", "납품 대금", "정산 지연", "대금 정산", "회생")],
+        _lowered_terms(("미정산", "납품대금", "납품 대금", "정산 지연", "대금 정산", "회생")),
     )
     agri_supplier_hits = count_any(
         text,
-        [w.lower() for w in ("농산물", "농가", "농업인", "산지", "납품업체", "협력업체", "납품 업체", "농산물 협력업체")],
+        _lowered_terms(("농산물", "농가", "농업인", "산지", "납품업체", "협력업체", "납품 업체", "농산물 협력업체")),
     )
     impact_hits = count_any(
         text,
-        [w.lower() for w in ("생존 위기", "피해", "부담", "대책", "호소", "확대", "정산 지연")],
+        _lowered_terms(("생존 위기", "피해", "부담", "대책", "호소", "확대", "정산 지연")),
     )
     title_signal = count_any(
         ttl_l,
-        [w.lower() for w in ("미정산", "납품대금", "납품 대금", "정산 지연", "회생", "농산물", "농가")],
+        _lowered_terms(("미정산", "납품대금", "납품 대금", "정산 지연", "회생", "농산물", "농가")),
     )
     return (
         retail_actor_hits >= 1
@@ -11532,33 +11636,33 @@ def is_companion_animal_product_promo_context(title: str, desc: str) -> bool:
         return False
     pet_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "반려동물", "반려견", "반려묘", "애완동물", "펫푸드", "펫 간식",
             "강아지 간식", "고양이 간식", "사료 토핑",
-        )],
+        )),
     )
     title_pet_hits = count_any(
         title_l,
-        [w.lower() for w in ("반려동물", "반려견", "반려묘", "펫푸드", "펫과함께")],
+        _lowered_terms(("반려동물", "반려견", "반려묘", "펫푸드", "펫과함께")),
     )
     product_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "간식", "사료", "트릿", "요거트큐브", "라이스팝", "신제품",
             "출시", "선보인다", "판매", "다이소", "기호성", "급여",
-        )],
+        )),
     )
     direct_farm_market = bool(
         count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "농가 수취가격", "산지 가격", "계약재배", "원물 조달", "농가 공급",
                 "농산물 공급계약", "재배 농가",
-            )],
+            )),
         ) >= 1
         and (
             re.search(r"\d[\d,]*(?:\.\d+)?\s*(?:톤|t|kg|㎏|억원|만원|원|%)", text, re.IGNORECASE)
-            or count_any(text, [w.lower() for w in ("출하량", "조달량", "계약 물량", "수매량")]) >= 1
+            or count_any(text, _lowered_terms(("출하량", "조달량", "계약 물량", "수매량"))) >= 1
         )
     )
     return bool((title_pet_hits >= 1 or pet_hits >= 2) and product_hits >= 2 and not direct_farm_market)
@@ -11577,7 +11681,7 @@ def is_generic_policy_schedule_context(title: str, desc: str) -> bool:
     list_signals = len(re.findall(r"(?:월|화|수|목|금)\)", text)) + len(re.findall(r"\d{1,2}:\d{2}", text))
     decisive_title = count_any(
         title_l,
-        [w.lower() for w in ("시행", "확정", "개정", "지원", "발표", "의결", "대책")],
+        _lowered_terms(("시행", "확정", "개정", "지원", "발표", "의결", "대책")),
     )
     return list_signals >= 2 or decisive_title == 0
 
@@ -11594,14 +11698,14 @@ def is_local_council_multi_issue_digest_context(title: str, desc: str) -> bool:
         return False
     unrelated_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "공군사관학교", "공사 이전", "관광재단", "성범죄", "도서관", "체육",
             "교통", "산업단지", "도시개발", "문화재단", "교육청",
-        )],
+        )),
     )
     agri_hits = count_any(
         title_l,
-        [w.lower() for w in ("농업", "농산물", "농가", "원예", "과수", "채소")],
+        _lowered_terms(("농업", "농산물", "농가", "원예", "과수", "채소")),
     )
     return unrelated_hits >= 2 and agri_hits <= 1
 
@@ -11612,19 +11716,19 @@ def is_agri_disaster_recovery_support_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     central_actor = count_any(
         text,
-        [w.lower() for w in ("농식품부", "농림축산식품부", "정부")],
+        _lowered_terms(("농식품부", "농림축산식품부", "정부")),
     )
     disaster_hits = count_any(
         text,
-        [w.lower() for w in ("냉해", "저온", "고온", "폭염", "우박", "농작물 피해", "재해")],
+        _lowered_terms(("냉해", "저온", "고온", "폭염", "우박", "농작물 피해", "재해")),
     )
     recovery_hits = count_any(
         text,
-        [w.lower() for w in ("재해복구비", "복구비", "긴급 복구", "복구 지원", "피해 농가")],
+        _lowered_terms(("재해복구비", "복구비", "긴급 복구", "복구 지원", "피해 농가")),
     )
     title_action = count_any(
         title_l,
-        [w.lower() for w in ("복구", "지원", "재해복구비", "복구비")],
+        _lowered_terms(("복구", "지원", "재해복구비", "복구비")),
     )
     quantified = bool(re.search(r"\d[\d,]*(?:\.\d+)?\s*(?:억\s*원|억원|농가|곳)", text))
     return central_actor >= 1 and disaster_hits >= 2 and recovery_hits >= 2 and title_action >= 1 and quantified
@@ -11636,22 +11740,22 @@ def is_agri_trade_opening_policy_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     trade_hits = count_any(
         text,
-        [w.lower() for w in ("cptpp", "fta", "rcep", "시장 개방", "시장개방", "통상 협정", "통상협정")],
+        _lowered_terms(("cptpp", "fta", "rcep", "시장 개방", "시장개방", "통상 협정", "통상협정")),
     )
     agri_hits = count_any(
         text,
-        [w.lower() for w in ("농업", "농가", "농민", "농산물", "과수", "채소", "과일", "민감 품목", "민감품목")],
+        _lowered_terms(("농업", "농가", "농민", "농산물", "과수", "채소", "과일", "민감 품목", "민감품목")),
     )
     impact_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "가입", "검토", "관세", "검역", "개방", "피해", "우려", "반발",
             "수입", "협상", "상생협력기금", "생산 기반", "소득",
-        )],
+        )),
     )
     title_signal = count_any(
         title_l,
-        [w.lower() for w in ("cptpp", "fta", "rcep", "시장 개방", "시장개방", "통상")],
+        _lowered_terms(("cptpp", "fta", "rcep", "시장 개방", "시장개방", "통상")),
     )
     return title_signal >= 1 and trade_hits >= 1 and agri_hits >= 2 and impact_hits >= 2
 
@@ -11662,31 +11766,31 @@ def is_supply_production_crisis_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     crop_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농작물", "원예", "과수", "채소", "고랭지 채소", "감자",
             "배추", "무", "양파", "마늘", "사과", "배", "복숭아", "포도",
             "참외", "수박", "토마토", "고추", "화훼",
-        )],
+        )),
     )
     title_crisis = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "흉작", "결주", "작황 악화", "생육 부진", "수확량 감소", "생산량 감소",
             "공급 부족", "생산 차질", "폐기 속출", "산지폐기", "수확 포기", "갈아엎",
             "가격 폭락", "가격 급락", "값 폭락", "값 급락", "생산비 급등",
             "농가 비명", "농가의 눈물", "농민 2중고", "농가 2중고",
-        )],
+        )),
     )
     field_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농가", "농민", "산지", "재배", "생산", "수확", "작황", "공급량",
             "씨감자", "종자", "폐기", "피해", "출하",
-        )],
+        )),
     )
     policy_led_title = bool(
-        count_any(title_l, [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회")]) >= 1
-        and count_any(title_l, [w.lower() for w in ("대책", "지원", "시행", "개정", "추진", "확정")]) >= 1
+        count_any(title_l, _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회"))) >= 1
+        and count_any(title_l, _lowered_terms(("대책", "지원", "시행", "개정", "추진", "확정"))) >= 1
     )
     return crop_hits >= 1 and title_crisis >= 1 and field_hits >= 2 and not policy_led_title
 
@@ -11699,14 +11803,14 @@ def is_agri_land_pension_policy_context(title: str, desc: str) -> bool:
         return False
     policy_problem_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "고령농", "예산", "대기", "가입", "수급권", "제도", "재정",
             "감정평가", "투기", "도시민", "재테크", "제구실", "개선",
-        )],
+        )),
     )
     title_problem = count_any(
         title_l,
-        [w.lower() for w in ("제구실", "대기", "예산", "고령농", "도시민", "재테크", "문제")],
+        _lowered_terms(("제구실", "대기", "예산", "고령농", "도시민", "재테크", "문제")),
     )
     return title_problem >= 1 and policy_problem_hits >= 3
 
@@ -11717,20 +11821,20 @@ def is_agri_digital_sales_channel_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     channel_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "라이브커머스", "라이브 커머스", "온라인 판매", "온라인판매",
             "온라인 판로", "디지털 판매", "온라인몰", "온라인 몰",
-        )],
+        )),
     )
     agri_sales_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농식품", "농협", "산지", "농가", "판매", "유통", "판로",
-        )],
+        )),
     )
     title_action = count_any(
         title_l,
-        [w.lower() for w in ("강화", "확대", "개설", "도입", "판매", "판로")],
+        _lowered_terms(("강화", "확대", "개설", "도입", "판매", "판로")),
     )
     return channel_hits >= 1 and agri_sales_hits >= 3 and title_action >= 1
 
@@ -11755,11 +11859,11 @@ def is_local_apc_performance_meeting_context(title: str, desc: str) -> bool:
     apc = "apc" in title_l or "산지유통센터" in text
     meeting = count_any(
         title_l,
-        [w.lower() for w in ("사업평가회", "사업 평가회", "성과보고회", "평가 회의", "사업보고회")],
+        _lowered_terms(("사업평가회", "사업 평가회", "성과보고회", "평가 회의", "사업보고회")),
     )
     launch = count_any(
         title_l,
-        [w.lower() for w in ("준공", "개장", "가동", "신설", "착공", "처리능력 확대")],
+        _lowered_terms(("준공", "개장", "가동", "신설", "착공", "처리능력 확대")),
     )
     return apc and meeting >= 1 and launch == 0
 
@@ -11770,18 +11874,18 @@ def is_broad_multi_crop_pest_risk_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     risk_hits = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도열병", "탄저병", "노균병", "열매터짐", "열과", "돌발해충",
             "벼멸구", "풀무치", "갈색여치", "꽃매미", "미국선녀벌레",
-        )],
+        )),
     )
     scope_hits = count_any(
         text,
-        [w.lower() for w in ("전국", "농작물", "벼", "과수", "포도", "복숭아", "자두", "채소")],
+        _lowered_terms(("전국", "농작물", "벼", "과수", "포도", "복숭아", "자두", "채소")),
     )
     action_hits = count_any(
         text,
-        [w.lower() for w in ("예찰", "방제", "제거", "살포", "대응", "주의", "관리")],
+        _lowered_terms(("예찰", "방제", "제거", "살포", "대응", "주의", "관리")),
     )
     return risk_hits >= 3 and scope_hits >= 2 and action_hits >= 1
 
@@ -11802,23 +11906,23 @@ def is_weather_only_crop_cultivation_guidance_context(title: str, desc: str) ->
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     crop = count_any(
         title_l,
-        [w.lower() for w in ("감자", "고랭지", "채소", "과수", "농작물", "작물")],
+        _lowered_terms(("감자", "고랭지", "채소", "과수", "농작물", "작물")),
     )
     cultivation = count_any(
         title_l,
-        [w.lower() for w in ("재배관리", "재배 관리", "생육관리", "생육 관리", "관리 요령")],
+        _lowered_terms(("재배관리", "재배 관리", "생육관리", "생육 관리", "관리 요령")),
     )
-    weather = count_any(text, [w.lower() for w in ("고온기", "폭염", "가뭄", "고온", "토양 수분")])
+    weather = count_any(text, _lowered_terms(("고온기", "폭염", "가뭄", "고온", "토양 수분")))
     water_management = count_any(
         text,
-        [w.lower() for w in ("물주기", "관수", "물길", "배수", "토양 수분", "수분 유지")],
+        _lowered_terms(("물주기", "관수", "물길", "배수", "토양 수분", "수분 유지")),
     )
     pest_title = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "병해충", "방제", "예찰", "병 발생", "해충", "탄저병", "도열병",
             "노균병", "화상병", "바이러스", "나방", "진딧물", "총채벌레",
-        )],
+        )),
     )
     return crop >= 1 and cultivation >= 1 and weather >= 1 and water_management >= 1 and pest_title == 0
 
@@ -11826,12 +11930,12 @@ def is_weather_only_crop_cultivation_guidance_context(title: str, desc: str) ->
 def is_local_lawmaker_agri_demand_context(title: str, desc: str) -> bool:
     """Identify local-lawmakers' demands that lack an enacted policy response."""
     title_l = _nfkc_lower(title or "")
-    lawmaker = count_any(title_l, [w.lower() for w in ("도의원", "시의원", "군의원", "지방의원")])
-    demand = count_any(title_l, [w.lower() for w in ("촉구", "대책 마련", "요구", "5분 발언", "자유발언")])
-    agri = count_any(title_l, [w.lower() for w in ("농산물", "농업", "농가", "농민", "채소", "과수")])
+    lawmaker = count_any(title_l, _lowered_terms(("도의원", "시의원", "군의원", "지방의원")))
+    demand = count_any(title_l, _lowered_terms(("촉구", "대책 마련", "요구", "5분 발언", "자유발언")))
+    agri = count_any(title_l, _lowered_terms(("농산물", "농업", "농가", "농민", "채소", "과수")))
     enacted = count_any(
         title_l,
-        [w.lower() for w in ("조례 통과", "조례 의결", "예산 확정", "시행", "도입 확정", "지원금 지급")],
+        _lowered_terms(("조례 통과", "조례 의결", "예산 확정", "시행", "도입 확정", "지원금 지급")),
     )
     return lawmaker >= 1 and demand >= 1 and agri >= 1 and enacted == 0
 
@@ -11841,11 +11945,11 @@ def is_root_crop_disease_warning_context(title: str, desc: str) -> bool:
     title_l = _nfkc_lower(title or "")
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     root_crop = bool(re.search(r"(?:^|[\s·'\"(])(?:마|참마|산약)(?:[\s·'\")]|$)", title_l))
-    disease = count_any(title_l, [w.lower() for w in ("병해", "병 발생", "병 확산", "썩음병", "역병")])
-    warning = count_any(title_l, [w.lower() for w in ("확산", "우려", "주의", "방제", "발생", "피해")])
+    disease = count_any(title_l, _lowered_terms(("병해", "병 발생", "병 확산", "썩음병", "역병")))
+    warning = count_any(title_l, _lowered_terms(("확산", "우려", "주의", "방제", "발생", "피해")))
     authority_action = count_any(
         text,
-        [w.lower() for w in ("농업기술원", "농기원", "농촌진흥청", "예찰", "적기 방제", "등록 약제")],
+        _lowered_terms(("농업기술원", "농기원", "농촌진흥청", "예찰", "적기 방제", "등록 약제")),
     )
     return root_crop and disease >= 1 and warning >= 1 and authority_action >= 2
 
@@ -11853,11 +11957,11 @@ def is_root_crop_disease_warning_context(title: str, desc: str) -> bool:
 def is_seed_distribution_application_notice_context(title: str, desc: str) -> bool:
     """Identify administrative seed application notices rather than supply news."""
     title_l = _nfkc_lower(title or "")
-    seed = count_any(title_l, [w.lower() for w in ("보급종", "씨감자", "씨 감자", "종자 공급")])
-    application = count_any(title_l, [w.lower() for w in ("신청", "접수", "공급분", "신청하세요")])
+    seed = count_any(title_l, _lowered_terms(("보급종", "씨감자", "씨 감자", "종자 공급")))
+    application = count_any(title_l, _lowered_terms(("신청", "접수", "공급분", "신청하세요")))
     market_fact = count_any(
         title_l,
-        [w.lower() for w in ("가격", "수급", "부족", "품질 논란", "공급 차질", "생산량", "흉작")],
+        _lowered_terms(("가격", "수급", "부족", "품질 논란", "공급 차질", "생산량", "흉작")),
     )
     return seed >= 1 and application >= 1 and market_fact == 0
 
@@ -11869,7 +11973,7 @@ def is_historical_agri_org_series_context(title: str, desc: str) -> bool:
     series = bool(re.search(r"\[(?:[^\]]*\s)?\d{2,3}년사\]", title_l) or "농협 60년사" in title_l)
     retrospective = count_any(
         text,
-        [w.lower() for w in ("창립 전", "역사가 깊", "연혁", "태동", "년사", "발자취")],
+        _lowered_terms(("창립 전", "역사가 깊", "연혁", "태동", "년사", "발자취")),
     )
     return series and retrospective >= 1
 
@@ -11878,10 +11982,10 @@ def is_crop_aerial_control_operation_context(title: str, desc: str) -> bool:
     """Recognize concrete crop aerial-control operations as pest response."""
     title_l = _nfkc_lower(title or "")
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
-    crop = count_any(title_l, [w.lower() for w in ("벼", "논콩", "콩", "과수", "밤나무", "농작물")])
-    operation = count_any(title_l, [w.lower() for w in ("항공방제", "항공 방제", "공동방제", "드론방제", "드론 방제")])
-    execution = count_any(text, [w.lower() for w in ("실시", "투입", "운영", "방제", "피해 예방")])
-    promo = count_any(title_l, [w.lower() for w in ("제품 출시", "신제품", "판매", "추천 제품")])
+    crop = count_any(title_l, _lowered_terms(("벼", "논콩", "콩", "과수", "밤나무", "농작물")))
+    operation = count_any(title_l, _lowered_terms(("항공방제", "항공 방제", "공동방제", "드론방제", "드론 방제")))
+    execution = count_any(text, _lowered_terms(("실시", "투입", "운영", "방제", "피해 예방")))
+    promo = count_any(title_l, _lowered_terms(("제품 출시", "신제품", "판매", "추천 제품")))
     return crop >= 1 and operation >= 1 and execution >= 2 and promo == 0
 
 
@@ -11891,17 +11995,17 @@ def is_rural_entertainment_feature_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     entertainment = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "6시 내고향", "6시내고향", "가수", "배우", "미스김", "방송된", "방송에서",
             "촬영", "프로그램", "주민들과 호흡", "따뜻한 위로", "마음을 전",
-        )],
+        )),
     )
     market = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매가격", "산지가격", "경락가", "출하량", "생산량", "수급", "작황",
             "계약재배", "수매", "판로 계약", "판매액",
-        )],
+        )),
     )
     return entertainment >= 2 and market == 0
 
@@ -11912,20 +12016,20 @@ def is_dist_structural_market_analysis_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     market_title = count_any(
         title_l,
-        [w.lower() for w in ("온라인도매시장", "온라인 도매시장", "농산물 도매시장", "도매시장")],
+        _lowered_terms(("온라인도매시장", "온라인 도매시장", "농산물 도매시장", "도매시장")),
     )
-    agri_hits = count_any(text, [w.lower() for w in ("농산물", "산지", "농가", "출하", "도매시장")])
+    agri_hits = count_any(text, _lowered_terms(("농산물", "산지", "농가", "출하", "도매시장")))
     structure_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "유통 단계", "유통단계", "유통 구조", "유통구조", "거래액", "거래량",
             "정산", "물류", "효율", "성과", "단축 효과", "단축효과", "직배송",
             "수수료", "시장 참여", "활성화",
-        )],
+        )),
     )
     analysis_hits = count_any(
         text,
-        [w.lower() for w in ("분석", "평가", "효과", "미지수", "한계", "검증", "문제", "지적", "실적")],
+        _lowered_terms(("분석", "평가", "효과", "미지수", "한계", "검증", "문제", "지적", "실적")),
     )
     return market_title >= 1 and agri_hits >= 1 and structure_hits >= 2 and analysis_hits >= 1
 
@@ -11951,7 +12055,7 @@ def is_low_value_local_political_context(title: str, desc: str) -> bool:
         best_horti_score(title or "", "") >= 1.2
         and count_any(
             title_l,
-            [w.lower() for w in ("소비 부진", "수확", "수확철", "가격", "수급", "작황", "도매", "생산", "하락", "폭락")],
+            _lowered_terms(("소비 부진", "수확", "수확철", "가격", "수급", "작황", "도매", "생산", "하락", "폭락")),
         ) >= 1
     )
     if direct_field_supply_title and not any(term in text for term in hard_campaign_terms):
@@ -11998,15 +12102,15 @@ def is_low_value_local_promo_context(title: str, desc: str) -> bool:
         return False
     official_supply_response_hits = count_any(
         text,
-        [w.lower() for w in ("농식품부", "농림축산식품부", "정부", "기재부", "한국농수산식품유통공사", "농협")],
+        _lowered_terms(("농식품부", "농림축산식품부", "정부", "기재부", "한국농수산식품유통공사", "농협")),
     )
     broad_supply_item_hits = count_any(
         text,
-        [w.lower() for w in ("농축산물", "농산물", "채소", "과일", "양파", "대파", "수박", "배추", "무")],
+        _lowered_terms(("농축산물", "농산물", "채소", "과일", "양파", "대파", "수박", "배추", "무")),
     )
     supply_response_hits = count_any(
         text,
-        [w.lower() for w in ("수급", "공급 확대", "할인지원", "할인 지원", "가용물량", "비축", "방출", "가격 안정", "물가 안정", "점검", "대비")],
+        _lowered_terms(("수급", "공급 확대", "할인지원", "할인 지원", "가용물량", "비축", "방출", "가격 안정", "물가 안정", "점검", "대비")),
     )
     if official_supply_response_hits >= 1 and broad_supply_item_hits >= 1 and supply_response_hits >= 2:
         return False
@@ -12023,7 +12127,7 @@ def is_low_value_local_promo_context(title: str, desc: str) -> bool:
     )
     supply_distress_anchor_hits = count_any(
         text,
-        [w.lower() for w in ("농가", "산지", "수급", "출하", "재고", "도매", "유통", "공급", "물량", "판로", "대책")],
+        _lowered_terms(("농가", "산지", "수급", "출하", "재고", "도매", "유통", "공급", "물량", "판로", "대책")),
     )
     if price_distress_hits >= 1 and supply_distress_anchor_hits >= 1:
         return False
@@ -12160,22 +12264,22 @@ def is_dist_quality_field_ops_context(title: str, desc: str, dom: str = "", pres
     if is_title_livestock_dominant_context(ttl, desc or ""):
         return False
 
-    primary_supply_title_hits = count_any(ttl_l, [w.lower() for w in _DIST_PRIMARY_SUPPLY_TITLE_TERMS])
+    primary_supply_title_hits = count_any(ttl_l, _lowered_terms(_DIST_PRIMARY_SUPPLY_TITLE_TERMS))
     title_quality_anchor_hits = count_any(
         ttl_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "가락시장", "강서시장", "강서 시장", "도매시장", "공판장", "청과",
             "도매법인", "법인협회", "온라인도매시장", "온라인 도매시장",
             "유통 주체", "공간 분리", "유통 혁신", "농산물 유통",
-        )],
+        )),
     )
     if primary_supply_title_hits >= 1 and title_quality_anchor_hits == 0:
-        supply_signal_hits = count_any(text, [w.lower() for w in _QUALITY_DIRECT_SUPPLY_TERMS])
+        supply_signal_hits = count_any(text, _lowered_terms(_QUALITY_DIRECT_SUPPLY_TERMS))
         if supply_signal_hits >= 2 and best_horti_score(ttl, desc or "") >= 1.4:
             return False
 
-    hard_title_market = count_any(ttl_l, [w.lower() for w in _DIST_QUALITY_FIELD_MARKET_TERMS])
-    hard_title_ops = count_any(ttl_l, [w.lower() for w in _DIST_QUALITY_FIELD_OPS_TERMS])
+    hard_title_market = count_any(ttl_l, _lowered_terms(_DIST_QUALITY_FIELD_MARKET_TERMS))
+    hard_title_ops = count_any(ttl_l, _lowered_terms(_DIST_QUALITY_FIELD_OPS_TERMS))
     if (is_low_value_local_political_context(ttl, desc or "") or is_commodity_political_statement_context(ttl, desc or "")) and (hard_title_market + hard_title_ops) < 2:
         return False
 
@@ -12188,10 +12292,10 @@ def is_dist_quality_field_ops_context(title: str, desc: str, dom: str = "", pres
     ):
         return True
 
-    market_hits = count_any(text, [w.lower() for w in _DIST_QUALITY_FIELD_MARKET_TERMS])
-    ops_hits = count_any(text, [w.lower() for w in _DIST_QUALITY_FIELD_OPS_TERMS])
-    actor_hits = count_any(text, [w.lower() for w in _DIST_QUALITY_FIELD_ACTOR_TERMS])
-    agri_hits = count_any(text, [w.lower() for w in _DIST_QUALITY_FIELD_AGRI_TERMS])
+    market_hits = count_any(text, _lowered_terms(_DIST_QUALITY_FIELD_MARKET_TERMS))
+    ops_hits = count_any(text, _lowered_terms(_DIST_QUALITY_FIELD_OPS_TERMS))
+    actor_hits = count_any(text, _lowered_terms(_DIST_QUALITY_FIELD_ACTOR_TERMS))
+    agri_hits = count_any(text, _lowered_terms(_DIST_QUALITY_FIELD_AGRI_TERMS))
     managed_count = int(_managed_commodity_match_summary(ttl, desc or "").get("count") or 0)
     agri_hits += managed_count
 
@@ -12248,27 +12352,29 @@ def is_dist_primary_supply_price_story(title: str, desc: str) -> bool:
         return True
     if is_dist_quality_field_ops_context(title, desc):
         return False
-    title_supply_hits = count_any(ttl_l, [w.lower() for w in _DIST_PRIMARY_SUPPLY_TITLE_TERMS])
+    title_supply_hits = count_any(ttl_l, _lowered_terms(_DIST_PRIMARY_SUPPLY_TITLE_TERMS))
     if title_supply_hits == 0:
         return False
-    dist_ops_hits = count_any(text, [w.lower() for w in _DIST_QUALITY_FIELD_OPS_TERMS])
+    dist_ops_hits = count_any(text, _lowered_terms(_DIST_QUALITY_FIELD_OPS_TERMS))
     if dist_ops_hits >= 2:
         return False
     return has_direct_supply_chain_signal(text) or best_horti_score(title or "", desc or "") >= 1.4
 
 
 
+# 서브도메인 포함 차단 판정용(".<blocked>" 접미사 tuple — str.endswith가 C 레벨에서 단락 평가)
+_BLOCKED_DOMAIN_SUFFIXES = tuple("." + b for b in BLOCKED_DOMAINS)
+
+@lru_cache(maxsize=8192)
 def is_blocked_domain(dom: str) -> bool:
     if not dom:
         return False
     dom = dom.lower()
-    if dom in BLOCKED_DOMAINS:
-        return True
-    for b in BLOCKED_DOMAINS:
-        if dom.endswith("." + b):
-            return True
-    return False
+    return dom in BLOCKED_DOMAINS or dom.endswith(_BLOCKED_DOMAIN_SUFFIXES)
 
+# is_relevant/compute_rank_score 양쪽에서 같은 text로 반복 호출되는 순수 함수들
+# → process-lifetime 메모이제이션으로 키워드 스캔을 기사당 1회로 줄인다
+@lru_cache(maxsize=16384)
 def agri_strength_score(text: str) -> int:
     return count_any(text, AGRI_STRONG_TERMS)
 
@@ -12395,7 +12501,7 @@ def section_fit_score(title: str, desc: str, section_conf: JsonDict, dom: str =
     pest_fire_blight_risk = is_pest_fire_blight_farmer_risk_context(title, desc)
     dist_anchor_hits = count_any(
         txt,
-        [t.lower() for t in ("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "온라인 도매시장")],
+        _lowered_terms(("가락시장", "도매시장", "공판장", "경락", "경매", "반입", "산지유통", "산지유통센터", "온라인 도매시장")),
     )
     macro_policy = is_macro_policy_issue(txt)
     policy_export_support = is_policy_export_support_brief_context(title, desc)
@@ -12410,10 +12516,10 @@ def section_fit_score(title: str, desc: str, section_conf: JsonDict, dom: str =
             base -= 3.2
         if key == "supply":
             supply_fit_text = _nfkc_lower(f"{title or ''} {desc or ''}")
-            if count_any(_nfkc_lower(title or ""), [w.lower() for w in ("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술")]) >= 1:
+            if count_any(_nfkc_lower(title or ""), _lowered_terms(("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술"))) >= 1:
                 base -= 2.8
             if (
-                count_any(supply_fit_text, [w.lower() for w in ("양액 냉각기", "수경재배 냉각", "장비 점검")]) >= 1
+                count_any(supply_fit_text, _lowered_terms(("양액 냉각기", "수경재배 냉각", "장비 점검"))) >= 1
                 and not _is_supply_climate_output_context(title, desc)
             ):
                 base -= 2.4
@@ -12576,7 +12682,7 @@ def section_fit_score(title: str, desc: str, section_conf: JsonDict, dom: str =
             base -= 1.35
         if broad_macro_price and ((not has_direct_supply_chain_signal(txt)) or policy_market_brief):
             base -= 1.0
-        if is_macro_policy_issue(txt) and count_any((title or "").lower(), [t.lower() for t in ("과일", "과수", "채소", "화훼", "농산물", "청과")]) == 0 and best_horti_score(title or "", "") < 1.6 and best_horti_score(title or "", desc or "") < 1.8 and ((not has_direct_supply_chain_signal(txt)) or policy_market_brief):
+        if is_macro_policy_issue(txt) and count_any((title or "").lower(), _lowered_terms(("과일", "과수", "채소", "화훼", "농산물", "청과"))) == 0 and best_horti_score(title or "", "") < 1.6 and best_horti_score(title or "", desc or "") < 1.8 and ((not has_direct_supply_chain_signal(txt)) or policy_market_brief):
             base -= 0.6
         # 유가/에너지 primary 기사: 품목 수급과 무관하므로 큰 감점
         if is_oil_energy_primary_macro_context(title, desc):
@@ -12592,7 +12698,7 @@ def section_fit_score(title: str, desc: str, section_conf: JsonDict, dom: str =
             base += min(0.48, 0.22 * program_core_count)
         # 시장 인프라 기사 (가락시장 출하비용 보전 등)는 supply에서도 유효
         _supply_market_infra = ("가락시장", "도매시장", "공판장", "출하비용", "보전사업")
-        _smi_hits = count_any(txt, [t.lower() for t in _supply_market_infra])
+        _smi_hits = count_any(txt, _lowered_terms(_supply_market_infra))
         if _smi_hits >= 2:
             base += 0.85
         elif _smi_hits >= 1:
@@ -12617,9 +12723,11 @@ def section_fit_score(title: str, desc: str, section_conf: JsonDict, dom: str =
     _SECTION_FIT_SCORE_CACHE[_cache_key] = _result
     return _result
 
+@lru_cache(maxsize=16384)
 def off_topic_penalty(text: str) -> int:
     return count_any(text, OFFTOPIC_HINTS)
 
+@lru_cache(maxsize=16384)
 def korea_context_score(text: str) -> int:
     return count_any(text, KOREA_CONTEXT_HINTS)
 
@@ -12804,8 +12912,8 @@ TECH_TREND_TERMS = ["스마트팜", "ai", "로봇", "자율", "연중생산", "
 def eventy_penalty(text: str, title: str, section_key: str) -> float:
     t = (text or "").lower()
     ttl = (title or "").lower()
-    hits = count_any(t, [k.lower() for k in EVENTY_TERMS])
-    tech = count_any(t, [k.lower() for k in TECH_TREND_TERMS])
+    hits = count_any(t, _lowered_terms(EVENTY_TERMS))
+    tech = count_any(t, _lowered_terms(TECH_TREND_TERMS))
 
     if hits == 0 and tech == 0:
         return 0.0
@@ -12813,7 +12921,7 @@ def eventy_penalty(text: str, title: str, section_key: str) -> float:
     # 실무 신호가 충분하면 패널티 최소화
     strong_terms = _SECTION_EVENT_STRONG_TERMS_MAP.get(section_key, ())
     title_terms = _SECTION_TITLE_CORE_TERMS_MAP.get(section_key, ())
-    strong_signal = count_any(t, [k.lower() for k in strong_terms]) + count_any(ttl, [k.lower() for k in title_terms])
+    strong_signal = count_any(t, _lowered_terms(strong_terms)) + count_any(ttl, _lowered_terms(title_terms))
     if strong_signal >= 2:
         return 0.0
     if strong_signal == 1:
@@ -12860,7 +12968,7 @@ def governance_interview_penalty(text: str, title: str, section_key: str, horti_
     strong_terms = ("할인", "할인지원", "할당관세", "수급", "가격", "출하", "재고",
                     "가락시장", "도매시장", "공판장", "경락", "경매", "반입",
                     "원산지", "부정유통", "단속", "검역", "통관", "수출")
-    strong_hits = count_any(t, [s.lower() for s in strong_terms])
+    strong_hits = count_any(t, _lowered_terms(strong_terms))
 
     # 예외: 제목에도 품목/시장 신호가 있고 실무 신호가 강하면 약한 감점만
     if strong_hits >= 2 and (market_hits >= 1 or horti_title_sc >= 1.6) and (horti_sc >= 2.2 or ("농산물" in t) or ("농식품" in t)):
@@ -12925,7 +13033,7 @@ def is_local_brief_text(title: str, desc: str, section_key: str) -> bool:
     ttl_l = (title or "").lower()
 
     # 예외: 원예 자조금은 반드시 체크(지역기사라도 실무 핵심)
-    if "자조금" in txt and count_any(txt, [t.lower() for t in ("원예","과수","화훼","과일","채소","청과","사과","배","감귤","딸기","고추","오이","포도")]) >= 1:
+    if "자조금" in txt and count_any(txt, _lowered_terms(("원예","과수","화훼","과일","채소","청과","사과","배","감귤","딸기","고추","오이","포도"))) >= 1:
         return False
 
     # 제목에 지역 단위(시/군/구/읍/면) 표기가 없으면 로컬 단신으로 보지 않음
@@ -12938,7 +13046,7 @@ def is_local_brief_text(title: str, desc: str, section_key: str) -> bool:
     punct = _LOCAL_BRIEF_PUNCT_RX.search(ttl) is not None
 
     # 지자체 행정/공지형 단어(지원/추진/협약/모집...)가 제목/본문에 있으면 단신 가능성↑
-    adminish_hits = count_any(txt, [t.lower() for t in _LOCAL_ADMINISH_TERMS])
+    adminish_hits = count_any(txt, _lowered_terms(_LOCAL_ADMINISH_TERMS))
 
     if (not punct) and adminish_hits == 0:
         # 지역 표기만 있다고 단신으로 보진 않음(오탐 방지)
@@ -12947,15 +13055,15 @@ def is_local_brief_text(title: str, desc: str, section_key: str) -> bool:
     # 제목/본문에 도매·유통 '강 앵커'가 있으면 로컬 단신으로 단정하지 않음
     # 단, '○○ 시장/군수 … 도매시장 현장간부회의/점검'류는 앵커가 있어도 실무 핵심도가 낮은 동정성 기사이므로
     # 로컬 단신으로 간주(빈칸 메우기용으로만 남도록)한다.
-    official_meeting = (_LOCAL_OFFICIAL_IN_TITLE_RX.search(ttl) is not None) and (count_any(txt, [t.lower() for t in _LOCAL_OFFICIAL_MEETING_TERMS]) >= 1)
-    if count_any(txt, [t.lower() for t in _LOCAL_NATIONAL_LEVEL_HINTS]) >= 1:
+    official_meeting = (_LOCAL_OFFICIAL_IN_TITLE_RX.search(ttl) is not None) and (count_any(txt, _lowered_terms(_LOCAL_OFFICIAL_MEETING_TERMS)) >= 1)
+    if count_any(txt, _lowered_terms(_LOCAL_NATIONAL_LEVEL_HINTS)) >= 1:
         official_meeting = False
 
 
     # 예산/투입/사업비/억원 등 '지자체 사업 종합' 단신은(특히 통신·지방면) 유통 핵심 이슈를 밀어내는 경우가 많아
     # 도매시장/공판장/경락/수출 같은 강 앵커가 뚜렷하지 않으면 로컬 단신으로 본다.
     if ("투입" in txt or "예산" in txt or "사업비" in txt or "억원" in txt) and re.search(r"\d{2,5}\s*억", txt):
-        strong_market = count_any(txt, [t.lower() for t in ("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","수출","검역","통관")])
+        strong_market = count_any(txt, _lowered_terms(("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","수출","검역","통관")))
         if strong_market == 0 and not has_apc_agri_context(txt):
             return True
 
@@ -12970,12 +13078,12 @@ def is_local_brief_text(title: str, desc: str, section_key: str) -> bool:
 
     # 지역 농협/조합 성과 소개형 수출·판로 기사는 dist에서 핵심 현장 이슈보다 후순위로 본다.
     if is_local_agri_org_feature_context(title, desc):
-        strong_market = count_any(txt, [t.lower() for t in ("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","온라인 도매시장")])
+        strong_market = count_any(txt, _lowered_terms(("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","온라인 도매시장")))
         if strong_market == 0 and not has_apc_agri_context(txt):
             return True
 
     # 제목의 원예/도매 신호가 약하면(=본문 일부 언급) 단신으로 간주
-    if best_horti_score(title or "", "") < 1.6 and count_any(ttl_l, [t.lower() for t in _DIST_STRONG_ANCHORS]) == 0:
+    if best_horti_score(title or "", "") < 1.6 and count_any(ttl_l, _lowered_terms(_DIST_STRONG_ANCHORS)) == 0:
         return True
 
     # 그 외는 보수적으로 False
@@ -12995,26 +13103,65 @@ def title_signal_bonus(title: str) -> float:
 # -----------------------------
 # Dedupe index
 # -----------------------------
+_SIMHASH_MIN_KEY_LEN = 12  # 너무 짧은 제목키는 3-gram이 빈약해 오컷 위험이 커서 제외
+
+
+@lru_cache(maxsize=16384)
+def simhash64(title_key: str) -> int:
+    """title_key의 문자 3-gram 기반 64-bit SimHash.
+
+    sha 계열 정확 해시와 달리 한두 단어 수준의 제목 변형에서는
+    해밍 거리가 작게 유지되어 근사중복 판정에 쓸 수 있다.
+    """
+    grams = [title_key[i:i + 3] for i in range(len(title_key) - 2)] or [title_key]
+    v = [0] * 64
+    for g in grams:
+        h = int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big")
+        for i in range(64):
+            v[i] += 1 if (h >> i) & 1 else -1
+    return sum(1 << i for i in range(64) if v[i] > 0)
+
+
 class DedupeIndex:
     def __init__(self) -> None:
         self.seen_norm: set[str] = set()
         self.seen_canon: set[str] = set()
         self.seen_press_title: set[str] = set()
+        # SimHash 16-bit 밴드 4개: 해밍 거리<=3이면 비둘기집 원리로
+        # 적어도 한 밴드는 일치하므로, 밴드 버킷의 후보만 정밀 비교한다.
+        self._simhash_bands: list[dict[int, list[int]]] = [{}, {}, {}, {}]
+
+    def _is_near_dup_title(self, title_key: str) -> bool:
+        if not DEDUPE_SIMHASH_ENABLED or len(title_key) < _SIMHASH_MIN_KEY_LEN:
+            return False
+        h = simhash64(title_key)
+        seen_candidates: set[int] = set()
+        for b, bucket in enumerate(self._simhash_bands):
+            for cand in bucket.get((h >> (b * 16)) & 0xFFFF, ()):
+                if cand in seen_candidates:
+                    continue
+                seen_candidates.add(cand)
+                if bin(h ^ cand).count("1") <= DEDUPE_SIMHASH_MAX_HAMMING:
+                    return True
+        for b in range(4):
+            self._simhash_bands[b].setdefault((h >> (b * 16)) & 0xFFFF, []).append(h)
+        return False
 
     def add_and_check(self, canon_url: str, press: str, title_key: str, norm_key: str) -> bool:
         if norm_key in self.seen_norm:
             return False
         if canon_url:
-            h = hashlib.sha256(canon_url.encode("utf-8")).hexdigest()[:32]
-            if h in self.seen_canon:
+            if _canon_url_digest(canon_url) in self.seen_canon:
                 return False
         pt = f"{(press or '').strip()}|{title_key}"
         if pt in self.seen_press_title:
             return False
+        if self._is_near_dup_title(title_key):
+            return False
 
         self.seen_norm.add(norm_key)
         if canon_url:
-            self.seen_canon.add(hashlib.sha256(canon_url.encode("utf-8")).hexdigest()[:32])
+            self.seen_canon.add(_canon_url_digest(canon_url))
         self.seen_press_title.add(pt)
         return True
 
@@ -13022,6 +13169,7 @@ class DedupeIndex:
 # -----------------------------
 # Press mapping (✅ 2번: 아주뉴스/스포츠서울 추가)
 # -----------------------------
+@lru_cache(maxsize=8192)
 def normalize_host(host: str) -> str:
     h = (host or "").lower().strip()
     for pfx in ("www.", "m.", "mobile."):
@@ -13679,6 +13827,7 @@ ABBR_MAP = {
     "youthdaily": "유스데일리",
 }
 
+@lru_cache(maxsize=8192)
 def press_name_from_url(url: str) -> str:
     host = normalize_host(domain_of(url))
     if not host:
@@ -13838,6 +13987,7 @@ TRUSTED_SECONDARY_PRESS = {
 
 _UGC_HOST_HINTS = ("blog.", "tistory.", "brunch.", "post.naver.", "cafe.naver.", "youtube.", "youtu.be")
 
+@lru_cache(maxsize=1024)
 def press_priority(press: str, domain: str) -> int:
     """
     3: 중앙지/일간지/경제지 + 농민신문 + 방송사 + 농식품부·정책브리핑(최상)
@@ -13860,7 +14010,7 @@ def press_priority(press: str, domain: str) -> int:
     # 중간: 농업전문/중소/지방/연구·지자체
     if p in MID_TIER_PRESS or p in TRUSTED_SECONDARY_PRESS:
         return 2
-    if d.endswith(".go.kr") or d.endswith(".re.kr") or d in ALLOWED_GO_KR:
+    if d.endswith(_GOV_SUFFIXES) or d in ALLOWED_GO_KR:
         return 2
     if p and ("방송" in p and p not in TOP_TIER_PRESS):
         return 2
@@ -13942,6 +14092,7 @@ REGIONAL_LOW_TIER_PRESS = {
     "새전북신문",
 }
 
+@lru_cache(maxsize=512)
 def press_tier(press: str, domain: str) -> int:
     """
     4: 공식 정책/기관(농식품부, 정책브리핑 등)
@@ -13972,7 +14123,7 @@ def press_tier(press: str, domain: str) -> int:
         return 3
 
     # 지자체/연구기관(.go.kr/.re.kr) 및 중간 티어 힌트
-    if d.endswith('.go.kr') or d.endswith('.re.kr') or d in ALLOWED_GO_KR:
+    if d.endswith(_GOV_SUFFIXES) or d in ALLOWED_GO_KR:
         return 2
     if p in MID_TIER_PRESS or p in TRUSTED_SECONDARY_PRESS:
         return 2
@@ -14044,7 +14195,7 @@ def low_quality_domain_penalty(domain: str) -> float:
 _NH_NEGATIVE_KWS = ("잔혹사", "비리", "횡령", "배임", "구속", "기소", "수사", "검찰", "부정", "비위", "징계", "해임", "파면", "감사원")
 def is_nh_internal_negative(title: str, desc: str = "") -> bool:
     """농협 회장/임원 관련 부정적 기사 판별"""
-    t = (title + " " + desc).lower()
+    t = _lowered_title_desc(title, desc)
     if "농협" not in t:
         return False
     return any(kw in t for kw in _NH_NEGATIVE_KWS)
@@ -14102,21 +14253,28 @@ def _sort_key_major_first(a: Article) -> Any:
 def is_weekend(d: date) -> bool:
     return d.weekday() >= 5
 
+_KR_HOLIDAY_CACHE: dict[int, frozenset[date]] = {}
+
+def _kr_holidays(year: int) -> frozenset[date]:
+    """해당 연도 공휴일 스냅샷(연도별 1회만 holidays.KR 객체 생성)."""
+    cached = _KR_HOLIDAY_CACHE.get(year)
+    if cached is not None:
+        return cached
+    try:
+        kr_factory = getattr(_holidays_mod, "KR", None)
+        days = frozenset(kr_factory(years=[year], observed=True).keys()) if kr_factory else frozenset()
+    except Exception:
+        days = frozenset()
+    _KR_HOLIDAY_CACHE[year] = days
+    return days
+
 def is_korean_holiday(d: date) -> bool:
     s = d.isoformat()
     if s in EXCLUDE_HOLIDAYS:
         return False
     if s in EXTRA_HOLIDAYS:
         return True
-    try:
-        import holidays
-        kr_factory = getattr(holidays, "KR", None)
-        if kr_factory is None:
-            return False
-        kr = kr_factory(years=[d.year], observed=True)
-        return d in kr
-    except Exception:
-        return False
+    return d in _kr_holidays(d.year)
 
 def is_business_day_kr(d: date) -> bool:
     if is_weekend(d):
@@ -14690,12 +14848,33 @@ def _validate_state(obj: JsonDict) -> JsonDict:
         obj["recent_keep_days"] = 30
     return obj
 
+def _json_loads_fast(raw: str | bytes) -> Any:
+    """orjson이 있으면 고속 파싱, 없으면 stdlib json."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps_indent2(payload: Any) -> str:
+    """json.dumps(..., ensure_ascii=False, indent=2)와 동일한 wire format의 고속 경로."""
+    if _orjson is not None:
+        return _orjson.dumps(payload, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def _json_dumps_compact(payload: Any) -> str:
+    """API 요청 본문 등 사람이 읽지 않는 JSON의 고속 직렬화(비ASCII 유지)."""
+    if _orjson is not None:
+        return _orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
+
+
 def load_state(repo: str, token: str) -> JsonDict:
     raw, _sha = github_get_file(repo, STATE_FILE_PATH, token, ref="main")
     if not raw:
         return {"last_end_iso": None}
     try:
-        obj = json.loads(raw)
+        obj = _json_loads_fast(raw)
         if not isinstance(obj, dict):
             log.warning("[STATE] state file is not a dict, resetting")
             return {"last_end_iso": None}
@@ -14793,7 +14972,7 @@ def save_state(repo: str, token: str, last_end: datetime, recent_items: list[Jso
         "recent_keep_days": CROSSDAY_DEDUPE_DAYS,
         "recent_items": recent_items,
     }
-    raw_new = json.dumps(payload, ensure_ascii=False, indent=2)
+    raw_new = _json_dumps_indent2(payload)
     _raw_old, sha = github_get_file(repo, STATE_FILE_PATH, token, ref="main")
     github_put_file_if_changed(repo, STATE_FILE_PATH, raw_new, token,
                                "Update state", sha=sha, branch="main", old_raw=_raw_old)
@@ -14829,14 +15008,14 @@ def load_archive_manifest(repo: str, token: str) -> tuple[JsonDict, str | None]:
     if not raw:
         return {"dates": []}, sha
     try:
-        return _normalize_manifest(json.loads(raw)), sha
+        return _normalize_manifest(_json_loads_fast(raw)), sha
     except Exception as exc:
         log.warning("[MANIFEST] failed to parse archive manifest JSON: %s", exc)
         return {"dates": []}, sha
 
 def save_archive_manifest(repo: str, token: str, manifest: JsonDict, sha: str | None) -> None:
     manifest = _normalize_manifest(manifest)
-    body = json.dumps(manifest, ensure_ascii=False, indent=2)
+    body = _json_dumps_indent2(manifest)
     github_put_file_if_changed(repo, ARCHIVE_MANIFEST_PATH, body, token,
                                "Update archive manifest", sha=sha, branch="main")
     # Keep per-run cache aligned with what we just saved.
@@ -15246,10 +15425,12 @@ def section_must_terms_ok(text: str, must_terms: list[str] | tuple[str, ...] | s
 
 def policy_domain_override(dom: str, text: str) -> bool:
     if dom in POLICY_DOMAINS or dom in ALLOWED_GO_KR or dom.endswith(".re.kr"):
-        return has_any(text, [k.lower() for k in AGRI_POLICY_KEYWORDS])
+        return has_any(text, _lowered_terms(AGRI_POLICY_KEYWORDS))
     return False
 
 _LOCAL_GEO_PATTERN_RAW = re.compile(r"[가-힣]{2,6}(군|시|구|도)\b")
+# 군 단위 지명(필터/랭킹 공용)
+_COUNTYISH_RE = re.compile(r"[가-힣]{2,}군")
 # 조사·수사 등으로 인한 오탐 방지 (예: "한 마리도", "거리도", "나라시")
 _LOCAL_GEO_FALSE_POSITIVES = frozenset({
     "마리도", "거리도", "자리도", "머리도", "나리도", "모리도",
@@ -15258,8 +15439,9 @@ _LOCAL_GEO_FALSE_POSITIVES = frozenset({
     "가리시", "바리시", "다리도", "다리시",
 })
 
+@lru_cache(maxsize=8192)
 def _local_geo_match(text: str) -> bool:
-    """_LOCAL_GEO_PATTERN 매칭 + 오탐 제외."""
+    """_LOCAL_GEO_PATTERN 매칭 + 오탐 제외 (같은 제목에 대해 필터/랭킹/선별에서 반복 호출되므로 캐시)."""
     for m in _LOCAL_GEO_PATTERN_RAW.finditer(text):
         if m.group() not in _LOCAL_GEO_FALSE_POSITIVES:
             return True
@@ -15327,22 +15509,22 @@ def is_strong_horti_opinion_context(title: str, desc: str, dom: str = "", press:
 
     analysis_hits = count_any(
         txt,
-        [w.lower() for w in ("산업", "농가", "생육", "재배", "작황", "수급", "출하", "저장", "생산", "기후변화", "냉해", "저온", "피해", "현장", "대책")],
+        _lowered_terms(("산업", "농가", "생육", "재배", "작황", "수급", "출하", "저장", "생산", "기후변화", "냉해", "저온", "피해", "현장", "대책")),
     )
     if analysis_hits < 2:
         return False
-    if count_any(ttl.lower(), [w.lower() for w in ("인터뷰", "행사", "간담회", "세미나", "포럼", "개최")]) >= 1:
+    if count_any(ttl.lower(), _lowered_terms(("인터뷰", "행사", "간담회", "세미나", "포럼", "개최"))) >= 1:
         return False
     # 수급/가격 실무 신호가 하나도 없으면 에세이/칼럼으로 판단(제목에만 품목명 있는 경우 방지)
-    _supply_signal_hits = count_any(txt, [w.lower() for w in (
+    _supply_signal_hits = count_any(txt, _lowered_terms((
         "수급", "출하", "경락", "도매시장", "가격", "반입", "산지유통",
         "생산량", "작황", "재배면적", "수확량", "도매가격",
-    )])
+    )))
     if _supply_signal_hits == 0:
         return False
 
     if section_key == "policy":
-        return analysis_hits >= 3 and count_any(txt, [w.lower() for w in ("정책", "제도", "대책", "개선")]) >= 1
+        return analysis_hits >= 3 and count_any(txt, _lowered_terms(("정책", "제도", "대책", "개선"))) >= 1
     if section_key == "dist":
         return is_dist_field_market_response_context(ttl, desc or "", dom, press)
     return True
@@ -15358,7 +15540,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
     """
     ttl = (title or "")
     desc = (desc or "")
-    text = (ttl + " " + desc).lower()
+    text = _lowered_title_desc(ttl, desc)
 
     dom = normalize_host(dom or "")
     key = section_conf["key"]
@@ -15378,7 +15560,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
                 macro_policy_like
                 and count_any(
                     text,
-                    [w.lower() for w in ("농산물", "농식품", "농식품부", "과일", "채소", "사과", "배", "감귤", "딸기", "만감", "포도", "공급", "수급", "안정화")],
+                    _lowered_terms(("농산물", "농식품", "농식품부", "과일", "채소", "사과", "배", "감귤", "딸기", "만감", "포도", "공급", "수급", "안정화")),
                 ) >= 2
             )
         )
@@ -15535,7 +15717,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
     _ENTERTAINMENT_BLOCK_DOMAINS = ("topstarnews.net", "starnewskorea.com", "newsen.com", "osen.co.kr", "xportsnews.com", "sportsseoul.com")
     _is_entertainment_domain = dom in _ENTERTAINMENT_BLOCK_DOMAINS
     if any(w in text for w in _ENTERTAINMENT_BLOCK_TERMS) or _is_entertainment_domain:
-        agri_keep = count_any(text, [w.lower() for w in ("농산물", "농업", "농식품", "수급", "출하", "도매시장", "가락시장", "경락", "공판장", "방제", "병해충")])
+        agri_keep = count_any(text, _lowered_terms(("농산물", "농업", "농식품", "수급", "출하", "도매시장", "가락시장", "경락", "공판장", "방제", "병해충")))
         if agri_keep < 2:
             return _reject("hardblock_entertainment")
 
@@ -15582,8 +15764,8 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         "단감","곶감","참다래","키위","샤인머스캣","만감","한라봉","레드향","천혜향",
         "국화","장미",
     ]
-    livestock_hits = count_any(_t2, [t.lower() for t in LIVESTOCK_STRICT_TERMS])
-    horti_hits_pre = count_any(_t2, [t.lower() for t in _horti_non_livestock])
+    livestock_hits = count_any(_t2, _lowered_terms(LIVESTOCK_STRICT_TERMS))
+    horti_hits_pre = count_any(_t2, _lowered_terms(_horti_non_livestock))
     horti_sc_pre = best_horti_score(ttl, desc)
     # 축산 강신호(축산물/한우/돼지고기/계란 등) + 원예 신호 거의 없음 → 완전 배제
     livestock_core = ("축산물" in _t2) or any(w in _t2 for w in ("한우","한돈","우육","돈육","소고기","돼지고기","닭고기","계란","달걀","우유","낙농","양돈","양계"))
@@ -15599,13 +15781,13 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
     _t3 = text
     for _ph in FISHERY_NEUTRAL_PHRASES:
         _t3 = _t3.replace(_ph.lower(), "")
-    fishery_hits = count_any(_t3, [t.lower() for t in FISHERY_STRICT_TERMS])
-    horti_hits_pre_f = count_any(_t3, [t.lower() for t in _horti_non_livestock])
+    fishery_hits = count_any(_t3, _lowered_terms(FISHERY_STRICT_TERMS))
+    horti_hits_pre_f = count_any(_t3, _lowered_terms(_horti_non_livestock))
     if fishery_hits >= 2 and horti_hits_pre_f == 0 and horti_sc_pre < 1.3:
         return _reject("fishery_only")
 
     # 수산 고유 어종/어업 키워드가 제목에 직접 등장하고 원예 신호가 약하면 우선 배제
-    fishery_title_hits = count_any(ttl.lower(), [t.lower() for t in FISHERY_STRICT_TERMS])
+    fishery_title_hits = count_any(ttl.lower(), _lowered_terms(FISHERY_STRICT_TERMS))
     if fishery_title_hits >= 1 and best_horti_score(ttl, "") < 1.2:
         return _reject("fishery_title_only")
 
@@ -15620,21 +15802,21 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
 
     # ✅ APC는 UPS/전원장비 문맥으로도 자주 등장하므로, '농업/산지유통' 문맥일 때만 인정한다.
     market_ctx_terms = ["가락시장", "도매시장", "공판장", "청과", "경락", "경락가", "반입", "중도매인", "시장도매인", "온라인 도매시장", "산지유통", "산지유통센터"]
-    market_hits = count_any(text, [t.lower() for t in market_ctx_terms])
+    market_hits = count_any(text, _lowered_terms(market_ctx_terms))
     if has_apc_agri_context(text):
         market_hits += 1
 
     # (주의) 가격/물량/재고 등은 산업/IT 기사에도 흔한 범용 단어이므로, 원예 코어가 아니라 '신호(signal)'로만 사용한다.
     supply_signal_terms = ["가격", "시세", "수급", "작황", "출하", "반입", "물량", "재고", "경락", "경락가", "경매"]
-    signal_hits = count_any(text, [t.lower() for t in supply_signal_terms])
+    signal_hits = count_any(text, _lowered_terms(supply_signal_terms))
 
     # 원예 코어(범용 단어 제외) — must_terms 실패 시 예외(살리기) 판단에만 사용
     horti_core_terms = ["원예", "과수", "화훼", "절화", "과채", "시설채소", "하우스", "비가림", "재배", "선별", "산지유통", "산지유통센터", "원예농협", "과수농협", "청과"]
-    horti_core_hits = count_any(text, [t.lower() for t in horti_core_terms])
+    horti_core_hits = count_any(text, _lowered_terms(horti_core_terms))
 
     # (강제 컷) 산업/금융/바이오 오탐: 농업/원예 맥락이 약하면 제외
-    off_hits = count_any(text, [t.lower() for t in HARD_OFFTOPIC_TERMS])
-    agri_ctx_hits = count_any(text, [t.lower() for t in ("농업", "농산물", "농식품", "원예", "과수", "과일", "채소", "화훼", "절화")])
+    off_hits = count_any(text, _lowered_terms(HARD_OFFTOPIC_TERMS))
+    agri_ctx_hits = count_any(text, _lowered_terms(("농업", "농산물", "농식품", "원예", "과수", "과일", "채소", "화훼", "절화")))
     if local_org_feature:
         agri_ctx_hits = max(agri_ctx_hits, 1)
     if key == "policy" and broad_macro_price:
@@ -15642,7 +15824,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         agri_ctx_hits = max(agri_ctx_hits, 1)
 
     # (강제 컷) 전력/에너지/유틸리티 '도매시장/수급' 동음이의어 오탐 차단
-    energy_hits = count_any(text, [t.lower() for t in ENERGY_CONTEXT_TERMS])
+    energy_hits = count_any(text, _lowered_terms(ENERGY_CONTEXT_TERMS))
 
     # '도매시장'은 전력/금융 등에서도 흔히 등장하므로, 농산물 유통 디스앰비규에이터가 없으면 보수적으로 차단한다.
     has_wholesale_disambig = False
@@ -15679,7 +15861,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         return _reject("dist_offtopic_no_agri_context")
 
     # 금융/산업 기사(농협은행/증권/주가/실적 등) 오탐 차단
-    fin_hits = count_any(text, [t.lower() for t in FINANCE_STRICT_TERMS])
+    fin_hits = count_any(text, _lowered_terms(FINANCE_STRICT_TERMS))
     if fin_hits >= 1 and agri_ctx_hits == 0 and market_hits == 0 and horti_sc < 1.8:
         return _reject("finance_strict_no_agri_context")
 
@@ -15695,7 +15877,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
     #   도매/유통 인프라(선별/저온/저장/물류/준공/가동 등) 또는 도매시장 강신호가 함께 있을 때만 통과
     if normalize_host(dom).endswith("news1.kr") and ("/local/" in _path):
         # ✅ 자조금(특히 원예) 이슈는 지역기사라도 반드시 체크 대상: 인프라/도매 앵커가 약해도 통과
-        if "자조금" in text and count_any(text, [t.lower() for t in ("원예","과수","화훼","과일","채소","청과","사과","배","감귤","딸기","고추","오이","포도")]) >= 1:
+        if "자조금" in text and count_any(text, _lowered_terms(("원예","과수","화훼","과일","채소","청과","사과","배","감귤","딸기","고추","오이","포도"))) >= 1:
             return True
         infra_terms = ["준공", "완공", "가동", "확충", "확대", "선별", "저온", "저장", "ca저장", "물류", "통관", "검역", "수출", "원산지", "부정유통", "단속"]
         has_infra = any(t.lower() in text for t in infra_terms)
@@ -15725,15 +15907,15 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         # - 제목에 ○○군/군청/군수 등 지방 행정 신호가 있고,
         # - 제목에 도매/유통 앵커가 없고,
         # - 본문에도 도매/유통 실무 신호가 약하면 dist에서 제외
-        _countyish = (re.search(r"[가-힣]{2,}군", ttl) is not None) or ("군청" in ttl_l) or ("군수" in ttl_l)
+        _countyish = (_COUNTYISH_RE.search(ttl) is not None) or ("군청" in ttl_l) or ("군수" in ttl_l)
         if _countyish:
-            _title_dist_anchor = count_any(ttl_l, [t.lower() for t in (
+            _title_dist_anchor = count_any(ttl_l, _lowered_terms((
                 "도매시장", "공판장", "가락시장", "경락", "경매", "반입",
                 "도매법인", "중도매", "시장도매인",
                 "산지유통", "산지유통센터", "apc",
                 "물류", "저온", "저장", "선별", "집하", "출하", "온라인 도매시장",
                 "원산지", "부정유통", "단속", "검역", "통관", "수출"
-            )])
+            )))
             if (_title_dist_anchor == 0) and (market_hits == 0) and (not has_apc_agri_context(text)):
                 return _reject("dist_county_local_weak_dist_signal")
 
@@ -15741,16 +15923,16 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         horti_title_sc = best_horti_score(ttl, "")
 
         # 제목 기반 앵커(도매/유통/농업) — 제목에 앵커가 없으면 '본문 일부 언급' 오탐 가능성이 높다.
-        dist_anchor_in_title = count_any(ttl_l, [t.lower() for t in (
+        dist_anchor_in_title = count_any(ttl_l, _lowered_terms((
             "도매시장", "공판장", "가락시장", "경락", "경매", "반입",
             "도매법인", "중도매", "시장도매인",
             "산지유통", "산지유통센터", "apc",
             "원산지", "부정유통", "단속", "검역", "통관", "수출", "자조금"
-        )])
-        agri_anchor_in_title = count_any(ttl_l, [t.lower() for t in (
+        )))
+        agri_anchor_in_title = count_any(ttl_l, _lowered_terms((
             "농산물", "농업", "농식품", "원예", "과수", "과일", "채소", "화훼", "절화", "청과",
             "사과", "배", "감귤", "딸기", "고추", "오이", "포도", "월동채소"
-        )])
+        )))
 
         # (강) 사건/정치/역사 이슈가 제목에 있으면, 본문에 시장 키워드가 섞여도 dist에서 제외(핵심/비핵심 모두 차단)
         # - '제주4.3' 같은 명백한 사건 키워드는 dist 핵심으로 절대 올리면 안 됨.
@@ -15758,7 +15940,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
             "제주4.3", "제주4·3", "4.3의", "4·3", "희생자", "추모", "보상",
             "탄핵", "계엄", "내란", "참사", "특별법"
         )
-        hard_hits = count_any(ttl_l, [t.lower() for t in hard_politics_terms])
+        hard_hits = count_any(ttl_l, _lowered_terms(hard_politics_terms))
         if hard_hits >= 1 and ("/society/" in _path or "/politics/" in _path or "/the300/" in _path):
             if dist_anchor_in_title == 0 and agri_anchor_in_title == 0:
                 return _reject("dist_politics_hard_title")
@@ -15768,7 +15950,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
             "4.3", "제주4.3", "희생자", "보상", "추모", "내란", "탄핵", "계엄", "정당", "총선", "대선", "국회",
             "검찰", "재판", "선고", "구속", "기소", "특별법", "사건", "참사"
         )
-        politics_hits = count_any(ttl_l, [t.lower() for t in politics_title_terms])
+        politics_hits = count_any(ttl_l, _lowered_terms(politics_title_terms))
         if politics_hits >= 1 and ("/society/" in _path or "/politics/" in _path or "/the300/" in _path):
             if dist_anchor_in_title == 0 and agri_anchor_in_title == 0 and horti_title_sc < 1.3 and market_hits == 0:
                 return _reject("dist_politics_heavy_title")
@@ -15777,7 +15959,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
     # 지역 동정/기금전달(특히 ○○농협 + 발전기금/장학금 등) 오탐 제거
     if _LOCAL_COOP_RX.search(text) and any(w.lower() in text for w in COMMUNITY_DONATION_TERMS):
         hard_ctx_terms = ["가락시장","도매시장","공판장","경락","경매","반입","중도매인","시장도매인","수출","검역","통관","원산지","단속","부정유통","수급","가격","시세","출하","재고","저장","선별","저온","물류"]
-        hard_hits = count_any(text, [t.lower() for t in hard_ctx_terms])
+        hard_hits = count_any(text, _lowered_terms(hard_ctx_terms))
         if hard_hits == 0 and horti_sc < 2.4:
             return _reject("local_coop_donation")
 
@@ -15790,8 +15972,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
 
     if (
         dom in ALLOWED_GO_KR
-        or dom.endswith(".re.kr")
-        or dom.endswith(".go.kr")
+        or dom.endswith(_GOV_SUFFIXES)
     ) and key not in ("policy", "pest"):
         return False
 
@@ -15809,7 +15990,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         else:
             if key == "pest":
                 pest_managed_count = int(_managed_commodity_match_summary(ttl, desc).get("count") or 0)
-                pest_signal_hits = count_any(text, [t.lower() for t in PEST_STRICT_TERMS]) + count_any(text, [t.lower() for t in PEST_WEATHER_TERMS])
+                pest_signal_hits = count_any(text, _lowered_terms(PEST_STRICT_TERMS)) + count_any(text, _lowered_terms(PEST_WEATHER_TERMS))
                 if is_pest_story_focus_strong(ttl, desc) or (pest_managed_count >= 1 and pest_signal_hits >= 1):
                     pass
                 else:
@@ -15850,7 +16031,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         if policy_market_brief and not direct_price_collapse_field:
             return _reject("supply_policy_market_brief")
 
-        title_supply_core_hits = count_any(ttl.lower(), [t.lower() for t in SUPPLY_TITLE_CORE_TERMS])
+        title_supply_core_hits = count_any(ttl.lower(), _lowered_terms(SUPPLY_TITLE_CORE_TERMS))
         if is_dist_export_shipping_context(ttl, desc) and (not has_direct_supply_chain_signal(text)) and market_hits == 0 and title_supply_core_hits == 0:
             return _reject("supply_dist_export_shipping")
         if is_dist_export_field_context(ttl, desc, dom, press) and (not has_direct_supply_chain_signal(text)) and market_hits == 0 and title_supply_core_hits == 0:
@@ -15890,8 +16071,8 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
             return _reject("policy_dist_market_disruption")
         if is_policy_general_macro_tail_context(ttl, desc, dom, press):
             return _reject("policy_macro_general_economy")
-        regional_macro_title_hits = count_any(ttl.lower(), [w.lower() for w in ("부·울·경", "부울경", "긴급 대응", "빨간불", "민생 안정", "특별기간")])
-        policy_anchor_hits = count_any(text, [w.lower() for w in ("농산물", "과일", "채소", "원예", "과수", "화훼", "도매시장", "공판장", "가락시장", "산지유통", "산지유통센터")])
+        regional_macro_title_hits = count_any(ttl.lower(), _lowered_terms(("부·울·경", "부울경", "긴급 대응", "빨간불", "민생 안정", "특별기간")))
+        policy_anchor_hits = count_any(text, _lowered_terms(("농산물", "과일", "채소", "원예", "과수", "화훼", "도매시장", "공판장", "가락시장", "산지유통", "산지유통센터")))
         if regional_macro_title_hits >= 2 and policy_anchor_hits == 0 and best_horti_score(ttl, desc) < 1.4:
             return _reject("policy_regional_macro_noise")
         # 병해충 실행형 기사는 수집 단계에서 누락시키지 않고 후단 재분류/정리에서 pest로 보낸다.
@@ -15913,8 +16094,8 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
             if is_retail_sales_trend_context(text):
                 return _reject("policy_retail_sales_trend")
             policy_signal_terms = ["가격 안정", "성수품", "할인지원", "할당관세", "검역", "원산지", "수입", "수출", "관세", "도매시장", "온라인 도매시장", "유통", "수급"]
-            agri_base = count_any(text, [t.lower() for t in ("농식품", "농산물", "농업")])
-            sig = count_any(text, [t.lower() for t in policy_signal_terms])
+            agri_base = count_any(text, _lowered_terms(("농식품", "농산물", "농업")))
+            sig = count_any(text, _lowered_terms(policy_signal_terms))
             if (not policy_market_brief) and (not policy_major_issue) and (not macro_policy_like) and (not broad_macro_price) and not (policy_anchor_ok or (agri_base >= 1 and sig >= 1)):
                 return _reject("policy_context_gate")
 
@@ -15953,7 +16134,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
     # 유통/현장(dist): '농산물/원예 유통' 맥락이 없는 일반 물류/유통/브랜드 기사는 강하게 차단
     if key == "dist":
         agri_anchor_terms = ("농산물", "농업", "농식품", "농식품부", "농림축산식품부", "원예", "과수", "과일", "채소", "화훼", "절화", "청과")
-        agri_anchor_hits = count_any(text, [t.lower() for t in agri_anchor_terms])
+        agri_anchor_hits = count_any(text, _lowered_terms(agri_anchor_terms))
         if is_dist_political_visit_context(ttl, desc):
             return _reject("dist_political_visit")
         if is_local_agri_infra_designation_context(ttl, desc):
@@ -15975,8 +16156,8 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
                      "선별", "저온", "저온저장", "저장고", "ca저장", "물류",
                      "원산지", "부정유통", "단속",
                      "검역", "통관", "수출"]
-        soft_hits = count_any(text, [t.lower() for t in dist_soft])
-        hard_hits = count_any(text, [t.lower() for t in dist_hard])
+        soft_hits = count_any(text, _lowered_terms(dist_soft))
+        hard_hits = count_any(text, _lowered_terms(dist_hard))
 
         # APC는 농업 문맥일 때만 soft 신호로 카운트
         apc_ctx = has_apc_agri_context(text)
@@ -16059,9 +16240,9 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         dist_ops_terms = ["원산지", "부정유통", "단속", "검역", "통관", "수출"]
         dist_market_terms = ["가락시장", "도매시장", "공판장", "공영도매시장", "청과", "경락", "경매", "반입",
                              "중도매인", "시장도매인", "온라인 도매시장", "산지유통", "산지유통센터"]
-        ops_hits = count_any(text, [t.lower() for t in dist_ops_terms])
-        title_market_hits = count_any(ttl.lower(), [t.lower() for t in dist_market_terms])
-        title_ops_hits = count_any(ttl.lower(), [t.lower() for t in dist_ops_terms])
+        ops_hits = count_any(text, _lowered_terms(dist_ops_terms))
+        title_market_hits = count_any(ttl.lower(), _lowered_terms(dist_market_terms))
+        title_ops_hits = count_any(ttl.lower(), _lowered_terms(dist_ops_terms))
 
         if (ops_hits >= 1 and hard_hits >= 1 and market_hits == 0 and (not apc_ctx)
                 and agri_anchor_hits == 0 and horti_sc < 1.9 and title_market_hits == 0 and (not local_org_feature)):
@@ -16098,16 +16279,16 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
         if is_pest_input_marketing_noise_context(ttl, desc):
             return _reject("pest_input_marketing_noise")
         managed_count = int(_managed_commodity_match_summary(ttl, desc).get("count") or 0)
-        agri_ctx_hits = count_any(text, [t.lower() for t in PEST_AGRI_CONTEXT_TERMS]) + managed_count
+        agri_ctx_hits = count_any(text, _lowered_terms(PEST_AGRI_CONTEXT_TERMS)) + managed_count
         fire_blight_farm_risk = is_pest_fire_blight_farmer_risk_context(ttl, desc)
         locust_outbreak = is_pest_locust_outbreak_context(ttl, desc)
         if agri_ctx_hits < 1 and not fire_blight_farm_risk and not locust_outbreak:
             return _reject("pest_no_agri_context")
 
-        rice_hits = count_any(text, [t.lower() for t in PEST_RICE_TERMS])
-        strict_hits = count_any(text, [t.lower() for t in PEST_STRICT_TERMS])
-        weather_hits = count_any(text, [t.lower() for t in PEST_WEATHER_TERMS])
-        horti_hits = count_any(text, [t.lower() for t in PEST_HORTI_TERMS]) + managed_count
+        rice_hits = count_any(text, _lowered_terms(PEST_RICE_TERMS))
+        strict_hits = count_any(text, _lowered_terms(PEST_STRICT_TERMS))
+        weather_hits = count_any(text, _lowered_terms(PEST_WEATHER_TERMS))
+        horti_hits = count_any(text, _lowered_terms(PEST_HORTI_TERMS)) + managed_count
 
         # 벼 병해충은 원예수급부와 거리가 멀어 기본 제외(원예 신호 동반 시만 허용)
         if rice_hits >= 1 and horti_hits == 0:
@@ -16121,7 +16302,7 @@ def is_relevant(title: str, desc: str, dom: str, url: str, section_conf: JsonDic
 
     return True
 
-def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, section_conf: JsonDict, press: str) -> float:
+def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, section_conf: JsonDict, press: str, now: datetime | None = None) -> float:
     """중요도 스코어.
     목표:
     - 원예수급(과수/화훼/시설채소) 실무에 직접 영향을 주는 의사결정 신호(가격/물량/대책/검역/방제)를 최우선
@@ -16129,15 +16310,14 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
     - 농협(경제지주/공판장/하나로/온라인도매) 관련성 반영
     - 지방 방제/협의회/행사성 기사 상단 배치 억제 + 중복 이슈 억제
     """
-    text = (title + " " + desc).lower()
+    text = _lowered_title_desc(title, desc)
     title_l = (title or "").lower()
 
     # (핵심) 원예수급/품목 신호 점수(품목 라벨 + 오탐 억제)
     horti_sc = best_horti_score(title, desc)
     horti_title_sc = best_horti_score(title, "")
     key_strength = keyword_strength(text, section_conf) if SCORING_KEYWORD_STRENGTH_BOOST_ENABLED else 0
-    market_ctx_terms = ["가락시장", "도매시장", "공판장", "청과", "경락", "경락가", "반입", "온라인도매시장", "온라인 도매시장", "산지유통", "산지유통센터"]
-    market_hits = count_any(text, [t.lower() for t in market_ctx_terms])
+    market_hits = count_any(text, _lowered_terms(("가락시장", "도매시장", "공판장", "청과", "경락", "경락가", "반입", "온라인도매시장", "온라인 도매시장", "산지유통", "산지유통센터")))
     if has_apc_agri_context(text):
         market_hits += 1
     macro_policy_like = is_macro_policy_issue(text)
@@ -16238,7 +16418,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
     if key == "supply":
         score += weighted_hits(text, SUPPLY_WEIGHT_MAP)
         score += min(2.2, 0.25 * key_strength)
-        score += count_any(title_l, [t.lower() for t in SUPPLY_TITLE_CORE_TERMS]) * 1.2
+        score += count_any(title_l, _lowered_terms(SUPPLY_TITLE_CORE_TERMS)) * 1.2
         if managed_focus_max >= _MANAGED_COMMODITY_FOCUS_STRONG_MIN:
             score += min(2.6, 0.42 * managed_focus_max)
         elif managed_focus_max >= _MANAGED_COMMODITY_FOCUS_MATCH_MIN:
@@ -16261,7 +16441,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
                 score += 0.7
             elif supply_issue_bucket == "commodity_issue":
                 score += 1.4
-                shock_hits = count_any(text, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_INPUT_TERMS]) + count_any(text, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS])
+                shock_hits = count_any(text, _lowered_terms(_SUPPLY_FEATURE_ISSUE_INPUT_TERMS)) + count_any(text, _lowered_terms(_SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS))
                 if shock_hits >= 2:
                     score += 0.9
             if horti_title_sc >= 1.4:
@@ -16316,7 +16496,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
         if dist_sales_channel_ops:
             sales_channel_signature_hits = count_any(
                 text,
-                [t.lower() for t in ("연합판매사업", "직거래", "직거래 장터", "온라인 판매", "온라인 판로", "온라인 도매시장", "거래처 다변화", "공동사업법인", "유통채널")],
+                _lowered_terms(("연합판매사업", "직거래", "직거래 장터", "온라인 판매", "온라인 판로", "온라인 도매시장", "거래처 다변화", "공동사업법인", "유통채널")),
             )
             _supply_dist_penalties.append(7.4 + (4.0 if sales_channel_signature_hits >= 2 else 0.0))
         if dist_field_market_response:
@@ -16341,7 +16521,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
             score -= 9.0
         if broad_macro_price and ((not direct_supply_story) or policy_market_brief):
             score -= 2.0 if supply_price_collapse_field else 5.0
-        if macro_policy_like and count_any(title_l, [t.lower() for t in ("과일", "과수", "채소", "화훼", "농산물", "청과")]) == 0 and horti_title_sc < 1.6 and horti_sc < 1.8 and ((not direct_supply_story) or policy_market_brief):
+        if macro_policy_like and count_any(title_l, _lowered_terms(("과일", "과수", "채소", "화훼", "농산물", "청과"))) == 0 and horti_title_sc < 1.6 and horti_sc < 1.8 and ((not direct_supply_story) or policy_market_brief):
             score -= 4.2
         if oil_energy_primary_macro:
             score -= 6.0
@@ -16351,7 +16531,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
     elif key == "dist":
         score += weighted_hits(text, DIST_WEIGHT_MAP)
         score += min(2.0, 0.22 * key_strength)
-        score += count_any(title_l, [t.lower() for t in DIST_TITLE_CORE_TERMS]) * 1.2
+        score += count_any(title_l, _lowered_terms(DIST_TITLE_CORE_TERMS)) * 1.2
         if is_dist_political_visit_context(title, desc):
             score -= 10.0
         if is_local_agri_infra_designation_context(title, desc):
@@ -16421,7 +16601,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
             score += 8.4
             sales_channel_signature_hits = count_any(
                 text,
-                [t.lower() for t in ("연합판매사업", "직거래", "직거래 장터", "온라인 판매", "온라인 판로", "온라인 도매시장", "거래처 다변화", "공동사업법인", "유통채널")],
+                _lowered_terms(("연합판매사업", "직거래", "직거래 장터", "온라인 판매", "온라인 판로", "온라인 도매시장", "거래처 다변화", "공동사업법인", "유통채널")),
             )
             if sales_channel_signature_hits >= 2:
                 score += 2.6
@@ -16441,7 +16621,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
             score += 4.0
             export_resolution_hits = count_any(
                 text,
-                [t.lower() for t in ("비관세장벽", "애로", "애로 해결", "간담회", "현장간담회", "원스톱", "n-데스크", "n desk", "상시 애로")],
+                _lowered_terms(("비관세장벽", "애로", "애로 해결", "간담회", "현장간담회", "원스톱", "n-데스크", "n desk", "상시 애로")),
             )
             if export_resolution_hits >= 2 and horti_sc >= 1.2:
                 score += 3.2
@@ -16459,7 +16639,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
     elif key == "policy":
         score += weighted_hits(text, POLICY_WEIGHT_MAP)
         score += min(1.8, 0.20 * key_strength)
-        score += count_any(title_l, [t.lower() for t in POLICY_TITLE_CORE_TERMS]) * 1.2
+        score += count_any(title_l, _lowered_terms(POLICY_TITLE_CORE_TERMS)) * 1.2
         if is_title_livestock_dominant_context(title, desc):
             score -= 10.0
         if is_policy_forest_admin_noise_context(title, desc):
@@ -16470,7 +16650,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
             score -= 18.0
         if policy_major_issue:
             score += 5.8
-            score += 0.9 * count_any(title_l, [t.lower() for t in _POLICY_MAJOR_ISSUE_TITLE_TERMS])
+            score += 0.9 * count_any(title_l, _lowered_terms(_POLICY_MAJOR_ISSUE_TITLE_TERMS))
         if policy_price_collapse_issue:
             score += 2.8
         if dist_market_disruption:
@@ -16512,11 +16692,11 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
             # policy actions even though beans are outside the managed item board.
             score += 18.0
         # 유통 구조·가격 결정 구조 개선 연구/제도 제안 기사
-        _dist_struct_reform_hits = count_any(text, [w.lower() for w in (
+        _dist_struct_reform_hits = count_any(text, _lowered_terms((
             "유통 구조", "유통구조", "가격 결정 구조", "가격결정구조", "산지정보", "산지 정보",
             "선별 기준", "등급 체계", "등급체계", "품질 기준", "품질기준",
-        )])
-        if _dist_struct_reform_hits >= 2 and count_any(text, [w.lower() for w in ("개선", "개혁", "혁신", "제안", "보고서", "연구", "과제")]) >= 1:
+        )))
+        if _dist_struct_reform_hits >= 2 and count_any(text, _lowered_terms(("개선", "개혁", "혁신", "제안", "보고서", "연구", "과제"))) >= 1:
             score += 4.0
         # 공식 정책 소스 추가 가점
         if normalize_host(dom) in OFFICIAL_HOSTS or press in ("농식품부", "정책브리핑"):
@@ -16569,13 +16749,13 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
         foreign_politics = ("트럼프", "바이든", "푸틴", "시진핑", "백악관", "미국 대통령")
         if any(w in title_l for w in foreign_politics):
             # 제목이 정치/외교이고 방제 신호가 제목에서 드러나지 않으면 추가 감점
-            if count_any(title_l, [t.lower() for t in PEST_STRICT_TERMS]) == 0 and count_any(title_l, [t.lower() for t in PEST_WEATHER_TERMS]) == 0:
+            if count_any(title_l, _lowered_terms(PEST_STRICT_TERMS)) == 0 and count_any(title_l, _lowered_terms(PEST_WEATHER_TERMS)) == 0:
                 score -= 4.2
         # 양곡(벼) 방제는 제외: 남아있더라도 강하게 감점
-        rice_hits = count_any(text, [t.lower() for t in PEST_RICE_TERMS])
-        pest_horti_hits = count_any(text, [t.lower() for t in PEST_HORTI_TERMS])
+        rice_hits = count_any(text, _lowered_terms(PEST_RICE_TERMS))
+        pest_horti_hits = count_any(text, _lowered_terms(PEST_HORTI_TERMS))
         if rice_hits >= 1 and pest_horti_hits == 0:
-            title_pest_hits = count_any(title_l, [t.lower() for t in ("병해충", "방제", "예찰", "약제", "과수화상병", "탄저병")])
+            title_pest_hits = count_any(title_l, _lowered_terms(("병해충", "방제", "예찰", "약제", "과수화상병", "탄저병")))
             # 벼 기사라도 병해충/방제가 제목·본문에서 명확하면 완전 배제하지 않고 보수 감점
             score -= 2.6 if title_pest_hits >= 1 else 7.0
         if pest_official_photo_check:
@@ -16589,7 +16769,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
 
     # ✅ dist(유통/현장): 전문 매체(농업/유통) 실무 신호를 더 반영하고, 통신(연합뉴스)이 상단을 과도하게 잠식하는 경우를 억제
     if key == "dist":
-        wholesale_hits = count_any(text, [t.lower() for t in WHOLESALE_MARKET_TERMS])
+        wholesale_hits = count_any(text, _lowered_terms(WHOLESALE_MARKET_TERMS))
         apc_ctx = has_apc_agri_context(text)
         dist_anchor = market_hits + wholesale_hits + (1 if apc_ctx else 0)
         if dist_disruption_scope == "systemic":
@@ -16670,7 +16850,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
 
     # ✅ dist에서 군(郡) 단위 지역 단신/행정 동정성 기사 추가 억제(News1 자조금 같은 핵심 이슈가 아래로 밀리는 것을 방지)
     if key == "dist":
-        if (re.search(r"[가-힣]{2,}군", title) is not None) or ("군청" in title_l) or ("군수" in title_l):
+        if (_COUNTYISH_RE.search(title) is not None) or ("군청" in title_l) or ("군수" in title_l):
             if market_hits == 0 and (not has_apc_agri_context(text)):
                 score -= 5.0
 
@@ -16695,7 +16875,7 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
     # 방송사 영상 리포트는 네이버 API description이 짧아 텍스트 기반 점수가 구조적으로 낮다.
     # 농업 맥락이 명확하면 최소 점수를 보장하여 핵심 후보에 포함되도록 한다.
     if (press or "").strip() in BROADCAST_PRESS:
-        _bc_agri_signal = count_any(text, [w.lower() for w in ("농산물", "농업", "농식품", "원예", "과수", "채소", "화훼", "농가", "농어민", "농자재", "수급", "출하", "도매시장", "가격", "물가")])
+        _bc_agri_signal = count_any(text, _lowered_terms(("농산물", "농업", "농식품", "원예", "과수", "채소", "화훼", "농가", "농어민", "농자재", "수급", "출하", "도매시장", "가격", "물가")))
         if _bc_agri_signal >= 2:
             _bc_floor = 32.0  # 농업 맥락 강한 방송 리포트의 최소 점수
             if key == "supply" and (press or "").strip() in {"KBS", "MBC", "SBS"} and supply_price_collapse_field:
@@ -16734,13 +16914,14 @@ def compute_rank_score(title: str, desc: str, dom: str, pub_dt_kst: datetime, se
 
     # 식품안전/위생 단독 이슈는 원예수급 핵심에서 멀어 감점(도매시장/품목 신호가 있으면 유지)
     if any(w in text for w in ("식품안전", "위생", "haccp", "식중독")):
-        if market_hits == 0 and horti_sc < 1.8 and count_any(text, [t.lower() for t in ("농산물", "원산지", "검역", "도매시장")]) < 1:
+        if market_hits == 0 and horti_sc < 1.8 and count_any(text, _lowered_terms(("농산물", "원산지", "검역", "도매시장"))) < 1:
             score -= 3.0
 
     # 최신성: 48시간 내 기사 보정(너무 과도하지 않게)
+    # 배치 호출 시 now를 한 번만 스냅샷해 전달하면 기사마다 시계 조회를 생략하고 런 내 점수가 결정적이 된다.
     try:
-        now_kst = datetime.now(timezone(timedelta(hours=9)))
-        age_h = (now_kst - pub_dt_kst).total_seconds() / 3600.0
+        ref_now = now or datetime.now(tz=KST)
+        age_h = (ref_now - pub_dt_kst).total_seconds() / 3600.0
         if age_h <= 8:
             score += 0.8
         elif age_h <= 24:
@@ -17143,7 +17324,7 @@ def _near_duplicate_title(a: "Article", b: "Article", section_key: str) -> bool:
             for term in ("과수화상병", "탄저병", "냉해", "동해", "토마토뿔나방", "월동해충")
         )
         same_commodity = bool(set(_pest_article_commodity_keys(a)) & set(_pest_article_commodity_keys(b)))
-        pest_action_terms = [w.lower() for w in ("사전 방제", "사전방제", "방제", "예찰", "약제", "무상 공급", "무상공급", "예방교육", "확산 차단")]
+        pest_action_terms = _lowered_terms(("사전 방제", "사전방제", "방제", "예찰", "약제", "무상 공급", "무상공급", "예방교육", "확산 차단"))
         a_action_hits = count_any(a_text, pest_action_terms)
         b_action_hits = count_any(b_text, pest_action_terms)
         if same_region and same_disease and a_action_hits >= 1 and b_action_hits >= 1:
@@ -17175,7 +17356,7 @@ def _near_duplicate_title(a: "Article", b: "Article", section_key: str) -> bool:
         common_core = len((ta & tb) & _DIST_CORE_TOKENS)
         a_text = ((a.title or "") + " " + (a.description or "")).lower()
         b_text = ((b.title or "") + " " + (b.description or "")).lower()
-        sales_channel_terms = [w.lower() for w in ("연합판매사업", "직거래", "평가회", "워크숍")]
+        sales_channel_terms = _lowered_terms(("연합판매사업", "직거래", "평가회", "워크숍"))
         a_sales_hits = count_any(a_text, sales_channel_terms)
         b_sales_hits = count_any(b_text, sales_channel_terms)
         sales_group_a = _dist_sales_channel_group_key(a.title or "", a.description or "")
@@ -17278,15 +17459,15 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
     horti_sc = best_horti_score(a.title or "", a.description or "")
     horti_title_sc = best_horti_score(a.title or "", "")
     market_ctx_terms = ["가락시장", "도매시장", "공판장", "청과", "경락", "경락가", "반입", "중도매인", "시장도매인", "온라인 도매시장", "산지유통", "산지유통센터"]
-    market_hits = count_any(text, [t.lower() for t in market_ctx_terms])
+    market_hits = count_any(text, _lowered_terms(market_ctx_terms))
     if has_apc_agri_context(text):
         market_hits += 1
 
     agri_anchor_terms = ("농산물", "농업", "농식품", "농식품부", "농림축산식품부", "원예", "과수", "과일", "채소", "화훼", "절화", "청과")
-    agri_anchor_hits = count_any(text, [t.lower() for t in agri_anchor_terms])
+    agri_anchor_hits = count_any(text, _lowered_terms(agri_anchor_terms))
 
     # 공통: 칼럼/기고/인물/행사성은 코어에서 제외
-    if has_any(title, [w.lower() for w in _HEADLINE_STOPWORDS]):
+    if has_any(title, _lowered_terms(_HEADLINE_STOPWORDS)):
         return False
 
     # 공통: 행정/정치 인터뷰·동정성(도지사/시장 등) 기사에 대한 코어 차단(부분 언급 오탐 방지)
@@ -17297,7 +17478,7 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
                        "원산지", "부정유통", "단속", "검역", "통관", "수출")
         # 농산물 맥락이 강하고(앵커/시장/품목) + 실무 신호가 명확할 때만 예외적으로 코어 허용
         if not (((market_hits >= 1) or (horti_title_sc >= 1.6) or (agri_anchor_hits >= 2 and horti_title_sc >= 1.3))
-                and count_any(text, [t.lower() for t in strong_keep]) >= 2):
+                and count_any(text, _lowered_terms(strong_keep)) >= 2):
             return False
 
 
@@ -17314,7 +17495,7 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
         strong_keep2 = ("할인", "할인지원", "할당관세", "수급", "가격", "출하", "재고",
                         "가락시장", "도매시장", "공판장", "경락", "경매", "반입",
                         "원산지", "부정유통", "단속", "검역", "통관", "수출")
-        if count_any(text, [t.lower() for t in strong_keep2]) < 2 and market_hits == 0 and horti_sc < 2.8:
+        if count_any(text, _lowered_terms(strong_keep2)) < 2 and market_hits == 0 and horti_sc < 2.8:
             return False
 
     if section_key == "supply":
@@ -17343,7 +17524,7 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
 
         horti_title_sc = best_horti_score(a.title or "", "")
 
-        if not has_any(text, [t.lower() for t in signal_terms]):
+        if not has_any(text, _lowered_terms(signal_terms)):
             return False
 
         # 시장/도매 신호가 있으면 코어 가능
@@ -17388,7 +17569,7 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
             return False
 
         # 정책 코어는 '정책 액션' + '농식품/유통 맥락'이 동시 충족되어야 함
-        return has_any(text, [t.lower() for t in action_terms]) and has_any(text, [t.lower() for t in ctx_terms]) and ((horti_sc >= 1.8) or (market_hits >= 1) or (agri_anchor_hits >= 2))
+        return has_any(text, _lowered_terms(action_terms)) and has_any(text, _lowered_terms(ctx_terms)) and ((horti_sc >= 1.8) or (market_hits >= 1) or (agri_anchor_hits >= 2))
 
     if section_key == "dist":
         # 유통 코어는 '도매시장/산지유통/APC/단속/검역' 등 강신호가 충분하고,
@@ -17409,7 +17590,7 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
                       "중도매인", "시장도매인", "온라인 도매시장",
                       "선별", "저온", "저온저장", "저장고", "ca저장", "물류",
                       "수출", "선적", "선적식", "수출길", "검역", "통관", "원산지", "부정유통", "단속", "산지유통", "산지유통센터"]
-        dist_hits = count_any(text, [t.lower() for t in dist_terms])
+        dist_hits = count_any(text, _lowered_terms(dist_terms))
         apc_ctx = has_apc_agri_context(text)
         if apc_ctx:
             dist_hits += 1
@@ -17430,15 +17611,15 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
 
         # '수출/검역/통관/원산지 단속'만으로 걸린 일반 기사 누수 방지(시장/APC/원예 맥락 없는 경우)
         ops_terms = ("원산지", "부정유통", "단속", "검역", "통관", "수출")
-        ops_hits = count_any(text, [t.lower() for t in ops_terms])
+        ops_hits = count_any(text, _lowered_terms(ops_terms))
         if (ops_hits >= 1 and market_hits == 0 and (not apc_ctx)
                 and agri_anchor_hits == 0 and horti_sc < 2.0):
             return False
 
         # 방송사 지역기사의 '부분 언급' 누수 방지(KBS/SBS 등)
         if ((a.press or "").strip() in BROADCAST_PRESS and _local_geo_match(a.title or "")):
-            title_market_hits = count_any(title, [t.lower() for t in ("가락시장", "도매시장", "공판장", "공영도매시장",
-                                                                      "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")])
+            title_market_hits = count_any(title, _lowered_terms(("가락시장", "도매시장", "공판장", "공영도매시장",
+                                                                      "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")))
             if title_market_hits == 0 and (not apc_ctx) and horti_sc < 2.2 and horti_title_sc < 1.6:
                 return False
 
@@ -17465,15 +17646,15 @@ def _headline_gate(a: "Article", section_key: str) -> bool:
         if is_pest_fire_blight_farmer_risk_context(a.title or "", a.description or ""):
             return True
         # 농업 맥락 + 병해충/방제(또는 냉해/동해 피해) 가시적이어야 코어
-        if not has_any(text, [t.lower() for t in PEST_AGRI_CONTEXT_TERMS]):
+        if not has_any(text, _lowered_terms(PEST_AGRI_CONTEXT_TERMS)):
             return False
         # 코어는 '헤드라인'에서 병해충/방제/기상피해 신호가 드러나야 한다(수필/일기/정치 제목 누수 방지).
-        title_hits = count_any(title, [t.lower() for t in PEST_STRICT_TERMS]) + count_any(title, [t.lower() for t in PEST_WEATHER_TERMS])
+        title_hits = count_any(title, _lowered_terms(PEST_STRICT_TERMS)) + count_any(title, _lowered_terms(PEST_WEATHER_TERMS))
         if title_hits == 0:
             return False
 
-        strict_hits = count_any(text, [t.lower() for t in PEST_STRICT_TERMS])
-        weather_hits = count_any(text, [t.lower() for t in PEST_WEATHER_TERMS])
+        strict_hits = count_any(text, _lowered_terms(PEST_STRICT_TERMS))
+        weather_hits = count_any(text, _lowered_terms(PEST_WEATHER_TERMS))
         return (strict_hits >= 2) or (strict_hits >= 1 and weather_hits >= 1) or (weather_hits >= 2)
 
     return True
@@ -17528,7 +17709,7 @@ def _headline_gate_relaxed(a: "Article", section_key: str) -> bool:
     horti_sc = best_horti_score(a.title or "", a.description or "")
     horti_title_sc = best_horti_score(a.title or "", "")
     market_ctx_terms = ["가락시장", "도매시장", "공판장", "청과", "경락", "경락가", "반입", "중도매인", "시장도매인", "온라인 도매시장", "산지유통", "산지유통센터"]
-    market_hits = count_any(text, [t.lower() for t in market_ctx_terms])
+    market_hits = count_any(text, _lowered_terms(market_ctx_terms))
     if has_apc_agri_context(text):
         market_hits += 1
 
@@ -17575,11 +17756,11 @@ def _headline_gate_relaxed(a: "Article", section_key: str) -> bool:
             return False
         # supply는 '품목/농산물 앵커' + '수급 신호' 결합이 약한 기사(단순 언급)를 하단으로 밀기 위해 더 보수적으로 본다.
         agri_anchor_terms = ("농산물", "농업", "농식품", "농식품부", "농림축산식품부", "원예", "과수", "과일", "채소", "화훼", "절화", "청과")
-        agri_anchor_hits = count_any(text, [t.lower() for t in agri_anchor_terms])
+        agri_anchor_hits = count_any(text, _lowered_terms(agri_anchor_terms))
         signal_terms = ("가격", "시세", "수급", "작황", "출하", "반입", "물량", "재고", "경락", "경매")
         supply_feature_kind = supply_feature_context_kind(a.title or "", a.description or "")
 
-        sig_hits = count_any(text, [t.lower() for t in signal_terms])
+        sig_hits = count_any(text, _lowered_terms(signal_terms))
 
         # 제목에서 품목/원예 신호가 거의 없고(본문 일부 언급 가능), 행정/인터뷰성 헤드라인이면 상단 노출(특히 core 보완 단계)에서 제외
         horti_title_sc = best_horti_score(a.title or "", "")
@@ -17616,12 +17797,12 @@ def _headline_gate_relaxed(a: "Article", section_key: str) -> bool:
             return True
         # dist는 is_relevant가 있어도 '일반 물류/유통/단속' 누수가 있어, 완화 게이트에서도 맥락을 한 번 더 본다.
         agri_anchor_terms = ("농산물", "농업", "농식품", "농식품부", "농림축산식품부", "원예", "과수", "과일", "채소", "화훼", "절화", "청과")
-        agri_anchor_hits = count_any(text, [t.lower() for t in agri_anchor_terms])
+        agri_anchor_hits = count_any(text, _lowered_terms(agri_anchor_terms))
         dist_hard = ("가락시장", "도매시장", "공판장", "공영도매시장", "청과", "경락", "경매", "반입",
                      "중도매인", "시장도매인", "온라인 도매시장",
                      "선별", "저온", "저온저장", "저장고", "ca저장", "원산지", "부정유통", "단속", "검역", "통관", "수출", "물류",
                      "산지유통", "산지유통센터")
-        hard_hits = count_any(text, [t.lower() for t in dist_hard])
+        hard_hits = count_any(text, _lowered_terms(dist_hard))
         apc_ctx = has_apc_agri_context(text)
         local_org_feature = is_local_agri_org_feature_context(a.title or "", a.description or "")
         dist_export_field = is_dist_export_field_context(a.title or "", a.description or "", normalize_host(a.domain or ""), (a.press or "").strip())
@@ -17653,14 +17834,14 @@ def _headline_gate_relaxed(a: "Article", section_key: str) -> bool:
 
         # 운영/집행 키워드만 있는 일반 기사 누수 차단
         ops_terms = ("원산지", "부정유통", "단속", "검역", "통관", "수출")
-        ops_hits = count_any(text, [t.lower() for t in ops_terms])
+        ops_hits = count_any(text, _lowered_terms(ops_terms))
         if ops_hits >= 1 and market_hits == 0 and (not apc_ctx) and agri_anchor_hits == 0 and horti_sc < 2.0:
             return False
 
         # 방송사 지역기사의 약한 유통 문맥은 제외
         if ((a.press or "").strip() in BROADCAST_PRESS and _local_geo_match(a.title or "")):
-            title_market_hits = count_any(title, [t.lower() for t in ("가락시장", "도매시장", "공판장", "공영도매시장",
-                                                                      "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")])
+            title_market_hits = count_any(title, _lowered_terms(("가락시장", "도매시장", "공판장", "공영도매시장",
+                                                                      "경락", "경매", "반입", "산지유통", "산지유통센터", "apc")))
             if title_market_hits == 0 and (not apc_ctx) and horti_sc < 2.1 and horti_title_sc < 1.5:
                 return False
 
@@ -17866,7 +18047,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
     # HF 시맨틱 조정을 threshold cut 이전에 적용한다.
     # threshold 바로 아래 기사도 HF boost로 구제될 수 있도록,
     # max_boost 마진만큼 넓은 pre-pool에서 HF를 먼저 실행한다.
-    sec_conf = next((x for x in SECTIONS if x.get("key") == section_key), {})
+    sec_conf = SECTION_CONF_BY_KEY.get(section_key, {})
     section_card_min_fit = _selection_guardrail_number(
         "section_card_min_fit",
         SECTION_FIT_MIN_FOR_TOP,
@@ -18189,7 +18370,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
         direct_supply = has_direct_supply_chain_signal(text_l)
         training_title_hits = count_any(
             _nfkc_lower(title),
-            [w.lower() for w in _MANAGED_COMMODITY_BOARD_TRAINING_TITLE_TERMS],
+            _lowered_terms(_MANAGED_COMMODITY_BOARD_TRAINING_TITLE_TERMS),
         )
         if is_supply_social_policy_noise_context(title, desc):
             return True
@@ -18378,7 +18559,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
             return True
         aggregate_hits = count_any(
             txt_local,
-            [t.lower() for t in ("농축산물", "농산물", "과일류", "채소류", "과일", "채소", "전주 대비", "전년 대비", "평년 대비", "대체로")],
+            _lowered_terms(("농축산물", "농산물", "과일류", "채소류", "과일", "채소", "전주 대비", "전년 대비", "평년 대비", "대체로")),
         )
         return press_priority(a.press, a.domain) == 1 and aggregate_hits >= 3
 
@@ -18404,7 +18585,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
             return True
         if _is_local_nh_self_support_noise_context(a.title or "", a.description or ""):
             return True
-        launchy_hits = count_any(title_local, [w.lower() for w in ("첫선", "첫 결실", "첫결실", "첫 출하", "첫출하", "선보여", "선봬")])
+        launchy_hits = count_any(title_local, _lowered_terms(("첫선", "첫 결실", "첫결실", "첫 출하", "첫출하", "선보여", "선봬")))
         if launchy_hits >= 1 and (not is_supply_feature_article(a.title or "", a.description or "")) and (not is_supply_price_outlook_context(a.title or "", a.description or "")):
             try:
                 if section_fit_score(a.title or "", a.description or "", sec_conf, a.domain or "", a.press or "") < 1.0:
@@ -18452,11 +18633,11 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
             or best_horti_score(a.title or "", "") >= 1.2
             or best_horti_score(a.title or "", a.description or "") >= 2.2
         )
-        trade_hits = count_any(txt_local, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TRADE_TERMS])
-        hard_trade_terms = [w.lower() for w in ("관세", "할당관세", "무관세", "fta", "통상", "비관세장벽", "통관", "검역")]
+        trade_hits = count_any(txt_local, _lowered_terms(_SUPPLY_FEATURE_ISSUE_TRADE_TERMS))
+        hard_trade_terms = _lowered_terms(("관세", "할당관세", "무관세", "fta", "통상", "비관세장벽", "통관", "검역"))
         title_trade_hits = count_any(title_local, hard_trade_terms)
         hard_trade_hits = count_any(txt_local, hard_trade_terms)
-        trade_impact_hits = count_any(txt_local, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_TRADE_IMPACT_TERMS])
+        trade_impact_hits = count_any(txt_local, _lowered_terms(_SUPPLY_FEATURE_ISSUE_TRADE_IMPACT_TERMS))
         if strong_item_context and title_trade_hits >= 1 and hard_trade_hits >= 1 and trade_hits >= 1 and trade_impact_hits >= 1:
             return False
         if (
@@ -18568,7 +18749,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
         if ("하나로마트" in txt_local or "공익적 역할" in txt_local) and not strong_dist_signal:
             hard_wholesale_hits = count_any(
                 txt_local,
-                [w.lower() for w in ("가락시장", "도매시장", "공판장", "청과", "경락", "경매", "온라인도매시장", "온라인 도매시장", "산지유통", "출하", "물류")],
+                _lowered_terms(("가락시장", "도매시장", "공판장", "청과", "경락", "경매", "온라인도매시장", "온라인 도매시장", "산지유통", "출하", "물류")),
             )
             if hard_wholesale_hits == 0:
                 return True
@@ -18586,11 +18767,11 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
             is_local_agri_org_feature_context(a.title or "", a.description or "")
             and count_any(
                 txt_local,
-                [w.lower() for w in ("경영평가", "종합경영평가", "1등급", "우수", "연속 달성", "연속", "성과", "실적", "복지 증진")],
+                _lowered_terms(("경영평가", "종합경영평가", "1등급", "우수", "연속 달성", "연속", "성과", "실적", "복지 증진")),
             ) >= 2
             and count_any(
                 txt_local,
-                [w.lower() for w in ("검역", "통관", "선적", "선적식", "바이어", "공동선별", "공선출하", "산지유통센터", "apc", "물류")],
+                _lowered_terms(("검역", "통관", "선적", "선적식", "바이어", "공동선별", "공선출하", "산지유통센터", "apc", "물류")),
             ) == 0
         )
         if org_performance_noise:
@@ -18703,15 +18884,15 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
         if section_key == "supply":
             signal_hits = count_any(
                 txt_local,
-                [t.lower() for t in ("가격", "시세", "수급", "작황", "출하", "반입", "물량", "재고", "경락", "경매")],
+                _lowered_terms(("가격", "시세", "수급", "작황", "출하", "반입", "물량", "재고", "경락", "경매")),
             )
             feature_kind = supply_feature_context_kind(a.title or "", a.description or "")
             issue_bucket = supply_issue_context_bucket(a.title or "", a.description or "")
             price_outlook = is_supply_price_outlook_context(a.title or "", a.description or "")
             price_collapse_field = is_supply_price_collapse_field_context(a.title or "", a.description or "", dom_local, pr_local)
             shock_issue = issue_bucket == "commodity_issue" and (
-                count_any(txt_local, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_INPUT_TERMS])
-                + count_any(txt_local, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS])
+                count_any(txt_local, _lowered_terms(_SUPPLY_FEATURE_ISSUE_INPUT_TERMS))
+                + count_any(txt_local, _lowered_terms(_SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS))
             ) >= 2
             feature_like = feature_kind is not None
             direct_supply = has_direct_supply_chain_signal(txt_local)
@@ -18750,7 +18931,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
         if section_key == "dist":
             market_anchor_hits = count_any(
                 txt_local,
-                [t.lower() for t in ("가락시장", "도매시장", "공판장", "공영도매시장", "경락", "경매", "반입", "온라인도매시장", "온라인 도매시장", "산지유통", "산지유통센터")],
+                _lowered_terms(("가락시장", "도매시장", "공판장", "공영도매시장", "경락", "경매", "반입", "온라인도매시장", "온라인 도매시장", "산지유통", "산지유통센터")),
             )
             apc_ctx_local = has_apc_agri_context(txt_local)
             if apc_ctx_local:
@@ -19086,7 +19267,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
                 continue
             if is_trade_policy_issue(mix) and _h < 2.2:
                 continue
-            if is_macro_policy_issue(mix) and count_any((a.title or "").lower(), [t.lower() for t in ("과일", "과수", "채소", "화훼", "농산물", "청과")]) == 0 and best_horti_score(a.title or "", "") < 1.6 and best_horti_score(a.title or "", a.description or "") < 1.8 and ((not has_direct_supply_chain_signal(mix)) or is_policy_market_brief_context(mix, dom, pr)):
+            if is_macro_policy_issue(mix) and count_any((a.title or "").lower(), _lowered_terms(("과일", "과수", "채소", "화훼", "농산물", "청과"))) == 0 and best_horti_score(a.title or "", "") < 1.6 and best_horti_score(a.title or "", a.description or "") < 1.8 and ((not has_direct_supply_chain_signal(mix)) or is_policy_market_brief_context(mix, dom, pr)):
                 continue
             if is_local_agri_org_feature_context(a.title or "", a.description or ""):
                 continue
@@ -19215,10 +19396,10 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
                     if (not has_direct_supply_chain_signal(text)) or focus_max_local < (_MANAGED_COMMODITY_FOCUS_MATCH_MIN + 0.6):
                         continue
             # 원산지/단속/검역/수출 키워드만으로 걸린 일반 기사 누수 방지(시장/APC 앵커가 없으면 제외)
-            ops_hits = count_any(text, [t.lower() for t in ("원산지","부정유통","단속","검역","통관","수출")])
-            market_anchor_hits = count_any(text, [t.lower() for t in ("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","온라인 도매시장","산지유통","산지유통센터")])
+            ops_hits = count_any(text, _lowered_terms(("원산지","부정유통","단속","검역","통관","수출")))
+            market_anchor_hits = count_any(text, _lowered_terms(("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","온라인 도매시장","산지유통","산지유통센터")))
             apc_ctx_local = has_apc_agri_context(text)
-            agri_anchor_hits_local = count_any(text, [t.lower() for t in ("농산물","농업","농식품","원예","과수","과일","채소","화훼","절화","청과")])
+            agri_anchor_hits_local = count_any(text, _lowered_terms(("농산물","농업","농식품","원예","과수","과일","채소","화훼","절화","청과")))
             if ops_hits >= 1 and market_anchor_hits == 0 and (not apc_ctx_local) and agri_anchor_hits_local == 0 and best_horti_score(a.title or "", a.description or "") < 1.9:
                 continue
             fit_sc_core = _fit_score_local(a)
@@ -19407,8 +19588,8 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
             if not _passes_section_fit_gate(a, score_floor=thr):
                 continue
             # 추가 안전장치: 농산물/원예 앵커가 약하면 '일반 물류/경제'로 보고 제외
-            agri_anchor_hits = count_any(text, [t.lower() for t in ("농산물","농업","농식품","원예","과수","과일","채소","화훼","절화","청과")])
-            if agri_anchor_hits == 0 and (not field_market_response) and best_horti_score(a.title, a.description) < 1.8 and count_any(text, [t.lower() for t in ("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","온라인 도매시장","산지유통","산지유통센터")]) == 0:
+            agri_anchor_hits = count_any(text, _lowered_terms(("농산물","농업","농식품","원예","과수","과일","채소","화훼","절화","청과")))
+            if agri_anchor_hits == 0 and (not field_market_response) and best_horti_score(a.title, a.description) < 1.8 and count_any(text, _lowered_terms(("가락시장","도매시장","공판장","공영도매시장","경락","경매","반입","온라인 도매시장","산지유통","산지유통센터"))) == 0:
                 continue
             if not _headline_gate_relaxed(a, section_key):
                 continue
@@ -19870,9 +20051,9 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
             txt_local = ((a.title or "") + " " + (a.description or "")).lower()
             if section_key == "supply":
                 issue_bucket = supply_issue_context_bucket(a.title or "", a.description or "")
-                shock_hits = count_any(txt_local, [w.lower() for w in _SUPPLY_FEATURE_ISSUE_INPUT_TERMS]) + count_any(
+                shock_hits = count_any(txt_local, _lowered_terms(_SUPPLY_FEATURE_ISSUE_INPUT_TERMS)) + count_any(
                     txt_local,
-                    [w.lower() for w in _SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS],
+                    _lowered_terms(_SUPPLY_FEATURE_ISSUE_CLIMATE_TERMS),
                 )
                 if issue_bucket == "commodity_issue" and shock_hits >= 2 and press_priority(a.press, a.domain) >= 2:
                     cut = min(cut, max(BASE_MIN_SCORE.get("supply", 6.0) + 0.4, thr - 11.5))
@@ -20653,7 +20834,7 @@ def select_top_articles(candidates: list[Article], section_key: str, max_n: int)
                 txt = (a.title + " " + a.description).lower()
                 return {
                     "horti_sc": round(best_horti_score(a.title, a.description), 2),
-                    "market_hits": (count_any(txt, [t.lower() for t in ("가락시장","도매시장","공판장","청과","경락","경매","반입","온라인 도매시장","산지유통","산지유통센터")]) + (1 if has_apc_agri_context(txt) else 0)),
+                    "market_hits": (count_any(txt, _lowered_terms(("가락시장","도매시장","공판장","청과","경락","경매","반입","온라인 도매시장","산지유통","산지유통센터"))) + (1 if has_apc_agri_context(txt) else 0)),
                     "strength": round(agri_strength_score(txt), 2),
                     "korea": round(korea_context_score(txt), 2),
                     "offtopic_pen": round(off_topic_penalty(txt), 2),
@@ -21251,7 +21432,6 @@ def collect_rss_candidates(section_conf: SectionConfig, start_kst: datetime, end
                 dbg_clear_current_query()
             canon = canonicalize_url(link)
             title_key = norm_title_key(title)
-            topic = extract_topic(title, desc)
             norm_key = make_norm_key(canon, press, title_key)
 
             if CROSSDAY_DEDUPE_ENABLED and (canon in RECENT_HISTORY_CANON or norm_key in RECENT_HISTORY_NORM):
@@ -21259,6 +21439,7 @@ def collect_rss_candidates(section_conf: SectionConfig, start_kst: datetime, end
 
             if not _local_dedupe.add_and_check(canon, press, title_key, norm_key):
                 continue
+            topic = extract_topic(title, desc)
             score = compute_rank_score(title, desc, dom, pub, section_conf, press)
             out.append(Article(
                 section=section_conf["key"],
@@ -21682,19 +21863,19 @@ def _article_matches_coverage_seed(article: "Article", seed: str, section_key: s
     if section_key == "policy":
         policy_hits = count_any(
             text_l,
-            [w.lower() for w in ("정책", "대책", "지원", "보전", "브리핑", "수급", "건의안", "촉구", "제도", "관리센터")],
+            _lowered_terms(("정책", "대책", "지원", "보전", "브리핑", "수급", "건의안", "촉구", "제도", "관리센터")),
         )
         return policy_hits >= 1 or managed_count >= 1 or best_horti_score(title, desc) >= 1.2
     if section_key == "dist":
         dist_hits = count_any(
             text_l,
-            [w.lower() for w in ("도매시장", "공판장", "가락시장", "경락", "경매", "반입", "산지유통", "선적", "검역", "통관", "직거래", "판로", "유통")],
+            _lowered_terms(("도매시장", "공판장", "가락시장", "경락", "경매", "반입", "산지유통", "선적", "검역", "통관", "직거래", "판로", "유통")),
         ) + (1 if has_apc_agri_context(text_l) else 0)
         return dist_hits >= 1 or managed_count >= 1
     if section_key == "pest":
         pest_hits = count_any(
             text_l,
-            [w.lower() for w in ("방제", "병해충", "약제", "예찰", "과수화상병", "탄저병", "냉해", "동해", "저온피해")],
+            _lowered_terms(("방제", "병해충", "약제", "예찰", "과수화상병", "탄저병", "냉해", "동해", "저온피해")),
         )
         return pest_hits >= 1 or managed_count >= 1
     return text_hits >= 1
@@ -22199,17 +22380,17 @@ def _is_editorial_quality_candidate(article: "Article", section_key: str) -> boo
     if section_key == "supply":
         market_hits = count_any(
             text_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격", "경락", "반입", "출하", "생산량", "재배면적", "작황", "수급",
                 "급등", "급락", "폭등", "폭락", "부족", "과잉", "생육", "피해",
-            )],
+            )),
         )
         title_hits = count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격", "경락", "반입", "출하", "생산량", "재배면적", "작황", "수급",
                 "급등", "급락", "폭등", "폭락", "부족", "과잉", "생육", "피해",
-            )],
+            )),
         )
         crop_context = managed_count > 0 or best_horti_score(title, desc) >= 1.4
         return crop_context and title_hits >= 1 and market_hits >= 2 and metric
@@ -22217,17 +22398,17 @@ def _is_editorial_quality_candidate(article: "Article", section_key: str) -> boo
     if section_key == "policy":
         actor_hits = count_any(
             text_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "농식품부", "농림축산식품부", "정부", "국회", "농진청", "농촌진흥청",
                 "기획재정부", "관세청", "농어촌공사", "지자체",
-            )],
+            )),
         )
         action_hits = count_any(
             text_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "지원", "시행", "추진", "확대", "개정", "입법예고", "예산", "융자",
                 "상환", "할인", "할당관세", "검역", "단속", "협약", "대책", "제도",
-            )],
+            )),
         )
         strong_context = bool(
             is_policy_announcement_issue(text_l, dom, press)
@@ -22241,11 +22422,11 @@ def _is_editorial_quality_candidate(article: "Article", section_key: str) -> boo
     if section_key == "dist":
         ops_hits = count_any(
             text_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "도매시장", "공판장", "경락", "경매", "반입", "온라인도매시장",
                 "온라인 도매시장", "산지유통센터", "apc", "공동선별", "공선출하",
                 "통합마케팅", "물류", "콜드체인", "계약재배", "선적", "수출",
-            )],
+            )),
         )
         ops_context = bool(
             is_dist_hard_logistics_metric_context(title, desc)
@@ -22315,6 +22496,7 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
             + list(managed_pest_queries)
         )
     items: list[Article] = []
+    _score_now = now_kst()  # 수집 배치 동안 동일한 기준 시각으로 최신성 보정(기사별 시계 조회 생략)
     _local_dedupe = DedupeIndex()  # 섹션 내부 dedupe (전역은 최종 선택 단계에서)
     max_n = MAX_PER_SECTION
 
@@ -22341,10 +22523,7 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
         if not isinstance(data, dict):
             return
         for it in (data.get("items", []) or []):
-            title = clean_text(it.get("title", ""))
-            desc = clean_text(it.get("description", ""))
-            link = strip_tracking_params(it.get("link", "") or "")
-            origin = strip_tracking_params(it.get("originallink", "") or link)
+            # 싼 게이트(시간창/차단 도메인)를 먼저 통과한 기사만 본문 정리 비용을 지불한다
             pub = parse_pubdate_to_kst(it.get("pubDate", ""))
 
             # 수집 단계와 후반 정리 단계의 윈도우 기준을 반드시 동일하게 유지
@@ -22352,10 +22531,18 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
             if pub < effective_start_kst or pub >= end_kst:
                 continue
 
-            dom = domain_of(origin) or domain_of(link)
+            link_raw = it.get("link", "") or ""
+            origin_raw = it.get("originallink", "") or link_raw
+            # 추적 파라미터는 호스트에 영향이 없으므로 도메인 게이트는 raw URL로 판정
+            dom = domain_of(origin_raw) or domain_of(link_raw)
             if not dom or is_blocked_domain(dom):
                 continue
 
+            title = clean_text(it.get("title", ""))
+            desc = clean_text(it.get("description", ""))
+            link = strip_tracking_params(link_raw)
+            origin = strip_tracking_params(origin_raw)
+
             press = normalize_press_label(press_name_from_url(origin or link), (origin or link))
             dbg_set_current_query(q, "naver_api")
             try:
@@ -22370,7 +22557,6 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
 
             canon = canonicalize_url(origin or link)
             title_key = norm_title_key(title)
-            topic = extract_topic(title, desc)
             norm_key = make_norm_key(canon, press, title_key)
 
             # 크로스데이(최근 N일) 중복 방지: 72h 윈도우 확장 시 같은 기사가 반복 노출되는 것 최소화
@@ -22380,6 +22566,8 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
             if not _local_dedupe.add_and_check(canon, press, title_key, norm_key):
                 continue
 
+            # dedupe까지 통과한 기사만 topic 추출(키워드 스캔) 비용을 지불한다
+            topic = extract_topic(title, desc)
             art = Article(
                 section=section_key,
                 title=title,
@@ -22397,7 +22585,7 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
                 source_query=q,
                 source_channel="naver_api",
             )
-            art.score = compute_rank_score(title, desc, dom, pub, section_conf, press)
+            art.score = compute_rank_score(title, desc, dom, pub, section_conf, press, now=_score_now)
             items.append(art)
             hits_by_query[q] = hits_by_query.get(q, 0) + 1
 
@@ -22406,26 +22594,28 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
         if not isinstance(data, dict):
             return
         for it in (data.get("items", []) or []):
-            title = clean_text(it.get("title", ""))
-            desc = clean_text(it.get("description", ""))
-            link = strip_tracking_params(it.get("link", "") or "")
-            origin = link
-            if not link:
+            link_raw = it.get("link", "") or ""
+            if not link_raw:
                 continue
 
             pub = parse_pubdate_to_kst(it.get("pubDate", ""))
             if pub <= datetime.min.replace(tzinfo=KST):
-                pub2 = _best_effort_article_pubdate_kst(origin or link)
+                pub2 = _best_effort_article_pubdate_kst(link_raw)
                 pub = pub2 if isinstance(pub2, datetime) else pub
             if pub <= datetime.min.replace(tzinfo=KST):
                 continue
             if pub < effective_start_kst or pub >= end_kst:
                 continue
 
-            dom = domain_of(origin) or domain_of(link)
+            dom = domain_of(link_raw)
             if not dom or is_blocked_domain(dom):
                 continue
 
+            title = clean_text(it.get("title", ""))
+            desc = clean_text(it.get("description", ""))
+            link = strip_tracking_params(link_raw)
+            origin = link
+
             press = normalize_press_label(press_name_from_url(origin or link), (origin or link))
             dbg_set_current_query(q, "web")
             try:
@@ -22438,7 +22628,6 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
 
             canon = canonicalize_url(origin or link)
             title_key = norm_title_key(title)
-            topic = extract_topic(title, desc)
             norm_key = make_norm_key(canon, press, title_key)
 
             if CROSSDAY_DEDUPE_ENABLED and (canon in RECENT_HISTORY_CANON or norm_key in RECENT_HISTORY_NORM):
@@ -22446,6 +22635,8 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
             if not _local_dedupe.add_and_check(canon, press, title_key, norm_key):
                 continue
 
+            # dedupe까지 통과한 기사만 topic 추출(키워드 스캔) 비용을 지불한다
+            topic = extract_topic(title, desc)
             art = Article(
                 section=section_key,
                 title=title,
@@ -22463,7 +22654,7 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
                 source_query=q,
                 source_channel="web",
             )
-            art.score = compute_rank_score(title, desc, dom, pub, section_conf, press)
+            art.score = compute_rank_score(title, desc, dom, pub, section_conf, press, now=_score_now)
             items.append(art)
             hits_by_query[q] = hits_by_query.get(q, 0) + 1
 
@@ -22510,7 +22701,6 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
 
             canon = canonicalize_url(origin or link)
             title_key = norm_title_key(title)
-            topic = extract_topic(title, desc)
             norm_key = make_norm_key(canon, press, title_key)
 
             if CROSSDAY_DEDUPE_ENABLED and (canon in RECENT_HISTORY_CANON or norm_key in RECENT_HISTORY_NORM):
@@ -22518,6 +22708,8 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
             if not _local_dedupe.add_and_check(canon, press, title_key, norm_key):
                 continue
 
+            # dedupe까지 통과한 기사만 topic 추출(키워드 스캔) 비용을 지불한다
+            topic = extract_topic(title, desc)
             art = Article(
                 section=section_key,
                 title=title,
@@ -22535,7 +22727,7 @@ def collect_candidates_for_section(section_conf: SectionConfig, start_kst: datet
                 source_query=q,
                 source_channel=source_channel,
             )
-            art.score = compute_rank_score(title, desc, dom, pub, section_conf, press)
+            art.score = compute_rank_score(title, desc, dom, pub, section_conf, press, now=_score_now)
             items.append(art)
             google_hits_by_query[q] = google_hits_by_query.get(q, 0) + 1
 
@@ -23142,6 +23334,7 @@ def _maybe_add_krei_issues_to_policy(raw_by_section: dict[str, list["Article"]],
 
 
 
+@lru_cache(maxsize=16384)
 def is_macro_policy_issue(text: str) -> bool:
     """'주요 이슈' 성격의 물가/가격 기사인지 판단.
     - 정책 발표(대책/지원 등) 형태가 아니어도, 성수품(사과/배 등) 가격/물가 흐름은 policy 섹션에서 다룬다.
@@ -23155,12 +23348,12 @@ def is_macro_policy_issue(text: str) -> bool:
     if is_macro_trade_noise_context(t):
         return False
     agri_macro_keep = tuple(MACRO_POLICY_KEEP_TERMS)
-    if is_general_consumer_price_noise(t) and best_horti_score("", t) < 1.6 and count_any(t, [w.lower() for w in agri_macro_keep]) == 0:
+    if is_general_consumer_price_noise(t) and best_horti_score("", t) < 1.6 and count_any(t, _lowered_terms(agri_macro_keep)) == 0:
         return False
 
     # 1) 물가/통계/성수품 신호(명시적)
     macro_terms = ("물가", "소비자물가", "물가지수", "cpi", "kosis", "차례상", "성수품", "체감", "물가정보")
-    macro_hit = count_any(t, [w.lower() for w in macro_terms])
+    macro_hit = count_any(t, _lowered_terms(macro_terms))
 
     # 2) 명절 전후 가격 이슈(암시적) — '물가' 단어가 없어도 주요 이슈로 라우팅
     if macro_hit == 0 and any(w in t for w in ("설", "명절", "추석", "대목")):
@@ -23309,7 +23502,7 @@ def _global_section_reassign(raw_by_section: dict[str, list["Article"]], start_k
 
             # quick prefilter (reduce false moves)
             if k == "dist":
-                dist_like = count_any(txt, [t.lower() for t in ("도매시장","공판장","가락시장","경락","경매","반입","산지유통","산지유통센터","apc","물류","원산지","단속","검역","통관","수출","선적","수출길","유통","도매")])
+                dist_like = count_any(txt, _lowered_terms(("도매시장","공판장","가락시장","경락","경매","반입","산지유통","산지유통센터","apc","물류","원산지","단속","검역","통관","수출","선적","수출길","유통","도매")))
                 strong_local_org = local_org_feature and (not dist_local_org_tail) and has_apc_agri_context(txt)
                 if is_dist_macro_export_noise_context(a.title or "", a.description or "", dom, press):
                     continue
@@ -23594,7 +23787,7 @@ def _enforce_pest_priority_over_policy(raw_by_section: dict[str, list["Article"]
         except Exception:
             pass
 
-    pest_conf = next((x for x in (SECTIONS or []) if isinstance(x, dict) and x.get("key") == "pest"), None)
+    pest_conf = SECTION_CONF_BY_KEY.get("pest")
 
     for a in policy_items:
         txt = ((a.title or "") + " " + (a.description or "")).lower()
@@ -23615,7 +23808,7 @@ def _enforce_pest_priority_over_policy(raw_by_section: dict[str, list["Article"]
             "대응 방안", "대응방안",
         )
         if any(kw in title_l for kw in _POLICY_STRONG_TITLE_KWS):
-            title_pest_hits = count_any(title_l, [w.lower() for w in PEST_STRICT_TERMS])
+            title_pest_hits = count_any(title_l, _lowered_terms(PEST_STRICT_TERMS))
             if title_pest_hits == 0:
                 # 정책 기사 확정 — pest로 이동하지 않음
                 keep_policy.append(a)
@@ -23813,12 +24006,12 @@ def _has_pest_or_growth_risk_signal(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     if not text:
         return False
-    if count_any(text, [w.lower() for w in _PEST_NAMED_DISEASE_TERMS]) >= 1:
+    if count_any(text, _lowered_terms(_PEST_NAMED_DISEASE_TERMS)) >= 1:
         return True
-    if count_any(text, [w.lower() for w in _PEST_CONTROL_ACTION_TERMS]) >= 1:
+    if count_any(text, _lowered_terms(_PEST_CONTROL_ACTION_TERMS)) >= 1:
         return True
-    growth_hits = count_any(text, [w.lower() for w in _PEST_GROWTH_RISK_TERMS])
-    crop_hits = count_any(text, [w.lower() for w in _PEST_CROP_CONTEXT_TERMS])
+    growth_hits = count_any(text, _lowered_terms(_PEST_GROWTH_RISK_TERMS))
+    crop_hits = count_any(text, _lowered_terms(_PEST_CROP_CONTEXT_TERMS))
     return growth_hits >= 1 and crop_hits >= 1
 
 
@@ -23845,35 +24038,35 @@ def is_non_agri_foodservice_equipment_promo_context(title: str, desc: str) -> bo
         return False
     foodservice_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "프랜차이즈", "가맹점", "가맹점주", "매장 운영", "외식업", "음식점",
             "주방", "조리 효율", "직영점", "본사 지원",
-        )],
+        )),
     )
     equipment_hits = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "기계", "장비", "도입비", "구매비", "비용 전액", "전액 지원", "자동화 기기",
             "칼질", "절단기", "조리기기", "주방기기",
-        )],
+        )),
     )
     if foodservice_hits < 2 or equipment_hits < 2:
         return False
     title_agri_hits = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "농업", "농가", "농산물", "원예", "재배", "산지", "출하", "수확",
             "도매시장", "공판장", "경락", "병해충", "방제", "예찰", "작황",
-        )],
+        )),
     )
     if title_agri_hits > 0:
         return False
     field_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "계약재배", "산지 농가", "공동선별", "공선출하", "도매가격", "경락가격",
             "재배면적", "생산량", "출하량", "병해충 방제",
-        )],
+        )),
     )
     return field_hits < 2
 
@@ -23884,11 +24077,11 @@ def is_foodservice_menu_price_story(title: str, desc: str) -> bool:
     ttl = _nfkc_lower(title or "")
     if not ttl:
         return False
-    if count_any(ttl, [w.lower() for w in _FOODSERVICE_MENU_TITLE_TERMS]) < 1:
+    if count_any(ttl, _lowered_terms(_FOODSERVICE_MENU_TITLE_TERMS)) < 1:
         return False
-    if count_any(ttl, [w.lower() for w in _FOODSERVICE_PRICE_TERMS]) < 1:
+    if count_any(ttl, _lowered_terms(_FOODSERVICE_PRICE_TERMS)) < 1:
         return False
-    if count_any(ttl, [w.lower() for w in _SUPPLY_DIRECT_MARKET_TITLE_TERMS]) >= 1:
+    if count_any(ttl, _lowered_terms(_SUPPLY_DIRECT_MARKET_TITLE_TERMS)) >= 1:
         return False
     # 제목에 원예 품목이 있으면 품목 수급·가격 기사로 본다 (예: 외식 불황에 배추값 약세)
     if _extract_event_commodities(title or ""):
@@ -23896,7 +24089,7 @@ def is_foodservice_menu_price_story(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     supply_chain_hits = count_any(
         text,
-        [w.lower() for w in ("산지", "도매시장", "경락", "출하량", "수급난", "작황", "원물", "산지가격", "계약재배")],
+        _lowered_terms(("산지", "도매시장", "경락", "출하량", "수급난", "작황", "원물", "산지가격", "계약재배")),
     )
     return supply_chain_hits <= 0
 
@@ -23923,11 +24116,11 @@ def _is_policy_org_event_without_policy_action(title: str, desc: str) -> bool:
     ttl_l = ttl.lower()
     if not _POLICY_ORG_EVENT_ORG_RX.search(ttl):
         return False
-    if count_any(ttl_l, [w.lower() for w in _POLICY_ORG_EVENT_TERMS]) < 1:
+    if count_any(ttl_l, _lowered_terms(_POLICY_ORG_EVENT_TERMS)) < 1:
         return False
     if any(actor in ttl_l for actor in _EVENT_GOV_ACTOR_TERMS):
         return False
-    if count_any(ttl_l, [w.lower() for w in _POLICY_ACTION_TITLE_TERMS]) >= 1:
+    if count_any(ttl_l, _lowered_terms(_POLICY_ACTION_TITLE_TERMS)) >= 1:
         return False
     return True
 
@@ -23944,10 +24137,10 @@ def is_national_food_price_policy_story(title: str, desc: str) -> bool:
     ))
     food_market = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "먹거리", "농산물", "농축산물", "농축수산물", "채소", "과일",
             "계란", "수급", "가격", "물가",
-        )],
+        )),
     ) >= 2
     return field_check and national_actor and food_market
 
@@ -23998,36 +24191,36 @@ def is_quantified_public_crop_disease_guidance(title: str, desc: str) -> bool:
         return False
     title_crop = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "과수", "사과", "배", "복숭아", "포도", "고추", "토마토", "멜론",
             "마늘", "양파", "채소", "원예작물", "농작물",
-        )],
+        )),
     ) >= 1
     title_risk_or_action = count_any(
         ttl,
-        [w.lower() for w in tuple(_PEST_NAMED_DISEASE_TERMS) + (
+        _lowered_terms(tuple(_PEST_NAMED_DISEASE_TERMS) + (
             "병해충", "병원균", "토양 관리", "토양관리", "토양 소독", "토양소독",
             "방제", "예찰", "복합 해충", "복합해충",
-        )],
+        )),
     ) >= 1
     crop = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "과수", "사과", "배", "복숭아", "포도", "고추", "토마토", "멜론",
             "마늘", "양파", "채소", "원예작물", "농작물",
-        )],
+        )),
     ) >= 1
     risk = count_any(
         text,
-        [w.lower() for w in tuple(_PEST_NAMED_DISEASE_TERMS) + (
+        _lowered_terms(tuple(_PEST_NAMED_DISEASE_TERMS) + (
             "병해충", "병원균", "토양 소독", "토양소독", "복합 해충", "복합해충",
-        )],
+        )),
     ) >= 1
     action = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "방제", "예찰", "예방", "관리", "소독", "살포", "제거", "차단",
-        )],
+        )),
     ) >= 2
     public_actor = any(term in text for term in (
         "농촌진흥청", "농진청", "농업기술원", "농기원", "농업기술센터", "검역본부",
@@ -24039,7 +24232,7 @@ def is_quantified_public_crop_disease_guidance(title: str, desc: str) -> bool:
     )
     quantified = bool(
         re.search(r"\d+(?:\.\d+)?\s*(?:%|℃|일|회|억원|만원|농가|ha|㏊)", text)
-        or count_any(text, [w.lower() for w in ("발생 시기", "적기 방제", "등록 농약", "방제 수칙")]) >= 1
+        or count_any(text, _lowered_terms(("발생 시기", "적기 방제", "등록 농약", "방제 수칙"))) >= 1
     )
     return (
         (title_crop or (title_risk_or_action and crop))
@@ -24143,10 +24336,10 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         and re.search(r"\d[\d,]*(?:\.\d+)?\s*(?:억|조)", text)
         and count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "온라인도매시장", "스마트apc", "스마트 apc", "유통비용", "농협 역할",
                 "산지유통", "도매시장", "성과 검증", "사업 평가",
-            )],
+            )),
         ) >= 2
     )
     if (
@@ -24161,7 +24354,7 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         return "dist_primary_supply_price_story"
     if section_key == "dist" and count_any(
         _nfkc_lower(a.title or ""),
-        [w.lower() for w in ("트럼프", "이란", "호르무즈", "화물선 피격")],
+        _lowered_terms(("트럼프", "이란", "호르무즈", "화물선 피격")),
     ) >= 1:
         return "dist_geopolitical_noise"
     if section_key == "dist" and (
@@ -24176,10 +24369,10 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
             and any(term in dist_text for term in ("풍년의 역설", "경북도", "소비촉진", "소비 촉진", "소비 활성화"))
             and count_any(
                 dist_text,
-                [w.lower() for w in (
+                _lowered_terms((
                     "수매", "선별", "공판장", "도매시장", "온라인도매시장", "정산",
                     "미수금", "물류", "처리량", "산지특송", "도달 시간", "경매",
-                )],
+                )),
             ) == 0
         ):
             return "dist_duplicate_supply_price_response"
@@ -24237,14 +24430,14 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         if _is_supply_reader_role_misfit(a):
             return "supply_reader_role_misfit"
         supply_text_l = _nfkc_lower(f"{a.title or ''} {a.description or ''}")
-        if count_any(_nfkc_lower(a.title or ""), [w.lower() for w in ("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술")]) >= 1:
+        if count_any(_nfkc_lower(a.title or ""), _lowered_terms(("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술"))) >= 1:
             return "supply_lifestyle_column_tail"
         if (
-            count_any(supply_text_l, [w.lower() for w in ("양액 냉각기", "수경재배 냉각", "장비 점검")]) >= 1
+            count_any(supply_text_l, _lowered_terms(("양액 냉각기", "수경재배 냉각", "장비 점검"))) >= 1
             and not _is_supply_climate_output_context(a.title or "", a.description or "")
             and count_any(
             supply_text_l,
-            [w.lower() for w in ("가격", "값", "수급", "경락", "반입", "출하량", "생산량", "작황")],
+            _lowered_terms(("가격", "값", "수급", "경락", "반입", "출하량", "생산량", "작황")),
             ) <= 1
         ):
             return "supply_production_tech_tail"
@@ -24281,7 +24474,7 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         fit_sc = float(getattr(a, "selection_fit_score", 0.0) or 0.0)
         if fit_sc <= 0.0:
             try:
-                section_conf = next((s for s in SECTIONS if s.get("key") == section_key), {})
+                section_conf = SECTION_CONF_BY_KEY.get(section_key, {})
                 fit_sc = float(section_fit_score(a.title or "", a.description or "", section_conf, a.domain or "", a.press or ""))
             except Exception:
                 fit_sc = 0.0
@@ -24319,15 +24512,15 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         if section_key == "policy":
             grain_policy_hits = count_any(
                 text,
-                [w.lower() for w in ("국제곡물", "곡물가", "곡물 가격", "사료", "원맥", "대두", "옥수수", "밀 가격")],
+                _lowered_terms(("국제곡물", "곡물가", "곡물 가격", "사료", "원맥", "대두", "옥수수", "밀 가격")),
             )
             actor_hits = count_any(
                 text,
-                [w.lower() for w in ("농식품부", "농림축산식품부", "정부", "기재부", "aT", "한국농수산식품유통공사")],
+                _lowered_terms(("농식품부", "농림축산식품부", "정부", "기재부", "aT", "한국농수산식품유통공사")),
             )
             action_hits = count_any(
                 text,
-                [w.lower() for w in ("물량 확보", "확보", "수입", "비축", "공급", "수급", "안정", "대책", "점검", "할당관세")],
+                _lowered_terms(("물량 확보", "확보", "수입", "비축", "공급", "수급", "안정", "대책", "점검", "할당관세")),
             )
             policy_grain_rescue = grain_policy_hits >= 1 and actor_hits >= 1 and action_hits >= 1
         if not policy_grain_rescue and not any(h in text for h in _HORTI_RESCUE):
@@ -24356,7 +24549,7 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
             ))
             and count_any(
                 _nfkc_lower(f"{a.title or ''} {a.description or ''}"),
-                [w.lower() for w in ("출하", "선별", "물류", "운송", "거래", "배송", "운영")],
+                _lowered_terms(("출하", "선별", "물류", "운송", "거래", "배송", "운영")),
             ) >= 2
         )
         if not direct_dist_logistics:
@@ -24401,86 +24594,86 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         _supply_title_l = _nfkc_lower(a.title or "")
         _supply_text_l = _nfkc_lower(f"{a.title or ''} {a.description or ''}")
         _supply_market_ops_misfiled = (
-            count_any(_supply_text_l, [w.lower() for w in ("가락시장", "도매시장", "공판장")]) >= 1
-            and count_any(_supply_text_l, [w.lower() for w in ("경매", "경락", "반입", "경매시간", "경매 시각", "경매개시")]) >= 1
+            count_any(_supply_text_l, _lowered_terms(("가락시장", "도매시장", "공판장"))) >= 1
+            and count_any(_supply_text_l, _lowered_terms(("경매", "경락", "반입", "경매시간", "경매 시각", "경매개시"))) >= 1
             and count_any(
                 _supply_title_l,
-                [w.lower() for w in (
+                _lowered_terms((
                     "가격", "값", "폭락", "하락", "급등", "수급", "작황", "생산량",
                     "재배면적", "수확농가", "농업관측", "관측", "전망", "껑충", "품절",
-                )],
+                )),
             ) <= 0
         )
         if _supply_market_ops_misfiled:
             return "supply_market_ops_not_supply"
         _supply_pest_management_misfiled = (
-            count_any(_supply_text_l, [w.lower() for w in ("병해 예방", "병해 관리", "방제", "병해충", "바이러스", "총채벌레", "탄저병")]) >= 1
-            and count_any(_supply_text_l, [w.lower() for w in ("사과 과원", "과원 관리", "묘판", "고추 병해", "작물 병해")]) >= 1
+            count_any(_supply_text_l, _lowered_terms(("병해 예방", "병해 관리", "방제", "병해충", "바이러스", "총채벌레", "탄저병"))) >= 1
+            and count_any(_supply_text_l, _lowered_terms(("사과 과원", "과원 관리", "묘판", "고추 병해", "작물 병해"))) >= 1
             and count_any(
                 _supply_title_l,
-                [w.lower() for w in ("가격", "값", "폭락", "하락", "급등", "수급", "출하", "생산량", "재배면적", "수확농가")],
+                _lowered_terms(("가격", "값", "폭락", "하락", "급등", "수급", "출하", "생산량", "재배면적", "수확농가")),
             ) <= 0
         )
         if _supply_pest_management_misfiled:
             return "supply_pest_management_not_supply"
         _supply_machine_demo = (
-            count_any(_supply_text_l, [w.lower() for w in ("기계가 척척", "전 과정 기계화", "파종부터 수확")]) >= 1
-            and count_any(_supply_text_l, [w.lower() for w in ("가격", "값", "수급", "도매", "경락", "수매", "제값", "생산비 절감")]) <= 0
+            count_any(_supply_text_l, _lowered_terms(("기계가 척척", "전 과정 기계화", "파종부터 수확"))) >= 1
+            and count_any(_supply_text_l, _lowered_terms(("가격", "값", "수급", "도매", "경락", "수매", "제값", "생산비 절감"))) <= 0
         )
         _supply_procurement_promo = (
-            count_any(_supply_text_l, [w.lower() for w in ("공동구매", "농심천심", "상생 구매", "행사를 개최")]) >= 2
-            and count_any(_supply_text_l, [w.lower() for w in ("가격 지지", "수매", "규격외", "못난이", "시장격리", "수급")]) <= 0
+            count_any(_supply_text_l, _lowered_terms(("공동구매", "농심천심", "상생 구매", "행사를 개최"))) >= 2
+            and count_any(_supply_text_l, _lowered_terms(("가격 지지", "수매", "규격외", "못난이", "시장격리", "수급"))) <= 0
         )
         if _supply_machine_demo or _supply_procurement_promo:
             return "supply_editorial_weak_tail"
     if section_key == "policy":
         _policy_title_l = _nfkc_lower(a.title or "")
         _policy_text_l = _nfkc_lower(f"{a.title or ''} {a.description or ''}")
-        if count_any(_policy_text_l, [w.lower() for w in ("임시회 폐회", "의회 사실상 마무리", "회기 마무리")]) >= 1:
+        if count_any(_policy_text_l, _lowered_terms(("임시회 폐회", "의회 사실상 마무리", "회기 마무리"))) >= 1:
             return "policy_assembly_schedule_filler"
         _policy_industry_meeting = (
-            count_any(_policy_text_l, [w.lower() for w in ("품목농협", "조합장", "운영협의회", "회의")]) >= 2
-            and count_any(_policy_text_l, [w.lower() for w in ("촉구", "건의", "지원책", "규제 혁신", "농협법")]) >= 1
-            and count_any(_policy_title_l, [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "법안", "예산")]) <= 0
+            count_any(_policy_text_l, _lowered_terms(("품목농협", "조합장", "운영협의회", "회의"))) >= 2
+            and count_any(_policy_text_l, _lowered_terms(("촉구", "건의", "지원책", "규제 혁신", "농협법"))) >= 1
+            and count_any(_policy_title_l, _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "법안", "예산"))) <= 0
         )
         if _policy_industry_meeting:
             return "policy_industry_meeting_request_filler"
         _policy_vague_supply_response = (
             "안정적 공급 대책 추진" in _policy_title_l
-            and count_any(_policy_title_l, [w.lower() for w in ("배추", "무", "3.4", "3만", "계란", "닭고기", "비축", "수입")]) <= 0
+            and count_any(_policy_title_l, _lowered_terms(("배추", "무", "3.4", "3만", "계란", "닭고기", "비축", "수입"))) <= 0
         )
         if _policy_vague_supply_response:
             return "policy_vague_supply_response_tail"
         policy_ship_hits = count_any(
             text,
-            [w.lower() for w in ("첫 출하", "본격 출하", "햇 감자", "햇감자", "출하")],
+            _lowered_terms(("첫 출하", "본격 출하", "햇 감자", "햇감자", "출하")),
         )
         policy_actor_hits = count_any(
             text,
-            [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "기재부", "농진청", "국회", "지자체", "도", "시군")],
+            _lowered_terms(("정부", "농식품부", "농림축산식품부", "기재부", "농진청", "국회", "지자체", "도", "시군")),
         )
         policy_action_hits = count_any(
             text,
-            [w.lower() for w in ("대책", "정책", "제도", "법안", "예산", "관세", "할당관세", "감면", "지원", "수급", "가격 안정", "비축")],
+            _lowered_terms(("대책", "정책", "제도", "법안", "예산", "관세", "할당관세", "감면", "지원", "수급", "가격 안정", "비축")),
         )
         if policy_ship_hits >= 1 and policy_actor_hits <= 0 and policy_action_hits <= 1:
             return "policy_shipping_story_not_policy"
-        if "고향사랑기부" in text and count_any(text, [w.lower() for w in ("이벤트", "답례품", "상생 이벤트")]) >= 1:
+        if "고향사랑기부" in text and count_any(text, _lowered_terms(("이벤트", "답례품", "상생 이벤트"))) >= 1:
             return "policy_private_support_promo"
         if (
             ("시범사업" in text and "수급 안정" in text and policy_actor_hits <= 0)
             or ("준고랭지" in text and "배추" in text and "시범사업" in text)
         ):
             return "policy_local_field_trial_not_policy"
-        if count_any(text, [w.lower() for w in ("실천 캠페인", "비료 사용 처방", "적정 시비 실천")]) >= 1:
+        if count_any(text, _lowered_terms(("실천 캠페인", "비료 사용 처방", "적정 시비 실천"))) >= 1:
             return "policy_private_support_promo"
         if (
-            count_any(text, [w.lower() for w in ("상생마케팅", "소비촉진", "물류기자재", "4천만원 지원", "실천 캠페인", "비료 사용 처방")]) >= 1
+            count_any(text, _lowered_terms(("상생마케팅", "소비촉진", "물류기자재", "4천만원 지원", "실천 캠페인", "비료 사용 처방"))) >= 1
             or ("대아청과" in text and "지원" in text)
         ):
             direct_policy_hits = count_any(
                 text,
-                [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "정책", "대책", "제도", "법안", "관세", "예산")],
+                _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "정책", "대책", "제도", "법안", "관세", "예산")),
             )
             if direct_policy_hits <= 0:
                 return "policy_private_support_promo"
@@ -24507,21 +24700,21 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         if _dist_national_export_logistics:
             return ""
         if (
-            count_any(text, [w.lower() for w in ("전자송품장", "출하비용 보전", "출하 비용 보전")]) >= 1
-            and count_any(text, [w.lower() for w in ("정부", "농식품부", "기재부", "정책", "추진")]) >= 1
+            count_any(text, _lowered_terms(("전자송품장", "출하비용 보전", "출하 비용 보전"))) >= 1
+            and count_any(text, _lowered_terms(("정부", "농식품부", "기재부", "정책", "추진"))) >= 1
         ):
             return "dist_policy_price_response_not_dist"
-        if count_any(text, [w.lower() for w in ("박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스", "클릭 한 번", "인기몰이")]) >= 1:
+        if count_any(text, _lowered_terms(("박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스", "클릭 한 번", "인기몰이"))) >= 1:
             return "dist_event_sales_promo"
-        if count_any(text, [w.lower() for w in ("관광기념품", "관광 기념품")]) >= 1:
+        if count_any(text, _lowered_terms(("관광기념품", "관광 기념품"))) >= 1:
             return "dist_non_agri_tourism_policy"
         _dist_support_promo_hits = count_any(
             text,
-            [w.lower() for w in ("물류기자재", "기자재", "후원금", "4천만원", "생산 안정", "생산안정", "상생마케팅", "소비촉진")],
+            _lowered_terms(("물류기자재", "기자재", "후원금", "4천만원", "생산 안정", "생산안정", "상생마케팅", "소비촉진")),
         )
         _dist_hard_ops_hits = count_any(
             text,
-            [w.lower() for w in ("도매시장", "공판장", "경매", "경락", "반입", "온라인도매시장", "산지유통센터", "수출", "선적", "검역", "저온유통")],
+            _lowered_terms(("도매시장", "공판장", "경매", "경락", "반입", "온라인도매시장", "산지유통센터", "수출", "선적", "검역", "저온유통")),
         )
         if (_dist_support_promo_hits >= 1 or ("대아청과" in text and "지원" in text)) and _dist_hard_ops_hits <= 1:
             return "dist_support_promo_without_ops"
@@ -24611,11 +24804,11 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
     if section_key == "pest":
         pest_labor_hits = count_any(
             text,
-            [w.lower() for w in ("봉지 씌우기", "봉지씌우기", "일손돕기", "일손 돕기", "고향주부모임", "농가 찾아")],
+            _lowered_terms(("봉지 씌우기", "봉지씌우기", "일손돕기", "일손 돕기", "고향주부모임", "농가 찾아")),
         )
         pest_direct_hits = count_any(
             text,
-            [w.lower() for w in ("과수화상병", "탄저병", "돌발해충", "노린재", "총채벌레", "진딧물", "방제", "예찰", "병해충")],
+            _lowered_terms(("과수화상병", "탄저병", "돌발해충", "노린재", "총채벌레", "진딧물", "방제", "예찰", "병해충")),
         )
         if pest_labor_hits >= 1 and pest_direct_hits <= 0:
             return "pest_labor_help_not_pest"
@@ -24626,8 +24819,8 @@ def _postbuild_article_reject_reason(a: "Article", section_key: str, *, apply_se
         if is_pest_diplomacy_not_pest_context(a.title or "", a.description or ""):
             return "pest_diplomacy_not_pest"
         pest_crop_disease_prevention = (
-            count_any(text, [w.lower() for w in ("고추 병해", "병해 예방", "병해 관리")]) >= 1
-            and count_any(text, [w.lower() for w in ("예방", "방제", "예찰", "관리")]) >= 1
+            count_any(text, _lowered_terms(("고추 병해", "병해 예방", "병해 관리"))) >= 1
+            and count_any(text, _lowered_terms(("예방", "방제", "예찰", "관리"))) >= 1
         )
         if not (
             is_pest_story_focus_strong(a.title or "", a.description or "")
@@ -24651,7 +24844,7 @@ def _debug_article_signals(a: "Article") -> JsonDict:
     return {
         "horti_sc": round(best_horti_score(a.title or "", a.description or ""), 2),
         "market_hits": (
-            count_any(txt, [t.lower() for t in ("가락시장", "도매시장", "공판장", "청과", "경락", "경매", "반입", "온라인 도매시장", "산지유통", "산지유통센터")])
+            count_any(txt, _lowered_terms(("가락시장", "도매시장", "공판장", "청과", "경락", "경매", "반입", "온라인 도매시장", "산지유통", "산지유통센터")))
             + (1 if has_apc_agri_context(txt) else 0)
         ),
         "strength": round(agri_strength_score(txt), 2),
@@ -24737,7 +24930,7 @@ def _sync_debug_with_final_sections(final_by_section: dict[str, list["Article"]]
         for section_key, payload in list(sections.items()):
             if not isinstance(payload, dict):
                 continue
-            section_conf = next((s for s in (SECTIONS or []) if isinstance(s, dict) and s.get("key") == str(section_key)), {})
+            section_conf = SECTION_CONF_BY_KEY.get(str(section_key), {})
             rows = payload.get("top")
             if not isinstance(rows, list):
                 continue
@@ -24780,8 +24973,8 @@ def _rebalance_underfilled_dist_from_supply(final_by_section: dict[str, list["Ar
     # Quality-first mode: do not move generic supply stories into distribution merely to fill a section.
     # Explicit APC/sales-channel/export execution stories may still move because they are distribution work.
     quality_first_dist_crossfill = _selection_guardrail_bool("quality_first_disable_supply_to_dist_underfill", True)
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), None)
-    supply_conf = next((s for s in SECTIONS if s.get("key") == "supply"), None)
+    dist_conf = SECTION_CONF_BY_KEY.get("dist")
+    supply_conf = SECTION_CONF_BY_KEY.get("supply")
     if not dist_conf or not supply_conf:
         return 0
 
@@ -25042,7 +25235,7 @@ def _demote_dist_editorial_weak_core(final_by_section: dict[str, list["Article"]
             and not _postbuild_article_reject_reason(article, "dist")
         ]
         if eligible:
-            dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+            dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
 
             def _rank(article: Article) -> tuple[Any, ...]:
                 fit_sc = float(getattr(article, "selection_fit_score", 0.0) or 0.0)
@@ -25112,12 +25305,12 @@ def _replace_supply_board_price_tail_from_raw(
         idx for idx, article in enumerate(supply_items)
         if (
             not bool(getattr(article, "is_core", False))
-            and count_any(_nfkc_lower(article.title or ""), [w.lower() for w in ("한눈에 보는 시세", "시세]")]) >= 1
+            and count_any(_nfkc_lower(article.title or ""), _lowered_terms(("한눈에 보는 시세", "시세]"))) >= 1
         )
     ]
     if not victim_indexes:
         return 0
-    supply_conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+    supply_conf = SECTION_CONF_BY_KEY.get("supply", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in supply_items
@@ -25142,10 +25335,10 @@ def _replace_supply_board_price_tail_from_raw(
             text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
             response_hits = count_any(
                 text_l,
-                [w.lower() for w in (
+                _lowered_terms((
                     "시장격리", "수급 안정", "수급안정", "가격 급락", "가격 폭락",
                     "공급과잉", "산지 폐기", "비축", "수출 확대", "출하 조절",
-                )],
+                )),
             )
             managed_count = int(_managed_commodity_match_summary(article.title or "", article.description or "").get("count") or 0)
             if response_hits < 1 or managed_count < 1:
@@ -25272,14 +25465,14 @@ def _is_optional_dist_editorial_tail(article: "Article") -> bool:
         return True
     if (
         re.search(r"[가-힣]{2,}군", title) is not None
-        and count_any(text, [w.lower() for w in ("직거래", "수도권", "할인행사", "소비촉진", "캠페인", "판로")]) >= 2
+        and count_any(text, _lowered_terms(("직거래", "수도권", "할인행사", "소비촉진", "캠페인", "판로"))) >= 2
         and not is_dist_market_education_tail_context(title, desc)
     ):
         return True
     if (
-        count_any(text, [w.lower() for w in ("하나로마트", "농협유통", "농협 유통", "마트")]) >= 1
-        and count_any(text, [w.lower() for w in ("사전 예약", "사전예약", "예약 판매", "예약판매")]) >= 1
-        and count_any(text, [w.lower() for w in ("수급", "도매시장", "공판장", "경락", "경매", "반입", "반입량", "물량", "출하량", "산지유통")]) == 0
+        count_any(text, _lowered_terms(("하나로마트", "농협유통", "농협 유통", "마트"))) >= 1
+        and count_any(text, _lowered_terms(("사전 예약", "사전예약", "예약 판매", "예약판매"))) >= 1
+        and count_any(text, _lowered_terms(("수급", "도매시장", "공판장", "경락", "경매", "반입", "반입량", "물량", "출하량", "산지유통"))) == 0
     ):
         return True
     dom = normalize_host(article.domain or "")
@@ -25287,7 +25480,7 @@ def _is_optional_dist_editorial_tail(article: "Article") -> bool:
     if (
         count_any(
             text,
-            [w.lower() for w in ("스마트팜", "신품종", "품목맞춤형", "품목 맞춤형", "기후변화", "재배기술")],
+            _lowered_terms(("스마트팜", "신품종", "품목맞춤형", "품목 맞춤형", "기후변화", "재배기술")),
         ) >= 2
         and not (
             is_dist_market_ops_context(title, desc, dom, press)
@@ -25322,10 +25515,10 @@ def _is_soft_fallback_dist_ops_tail(article: "Article") -> bool:
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     ops_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "가락시장", "산지유통", "출하 거점", "출하거점",
             "직거래", "판로", "수도권", "유통협력", "유통 협력", "수출", "물류",
-        )],
+        )),
     )
     if managed_count <= 0 or ops_hits < 2:
         return False
@@ -25364,32 +25557,32 @@ def _dist_replacement_candidate_rank(article: "Article", dist_conf: JsonDict) ->
         return None
     if is_dist_primary_supply_price_story(title, desc):
         return None
-    if count_any(text_l, [w.lower() for w in ("예규·판례", "예규 판례", "저가 신고", "저가신고", "관세", "세관")]) >= 1:
+    if count_any(text_l, _lowered_terms(("예규·판례", "예규 판례", "저가 신고", "저가신고", "관세", "세관"))) >= 1:
         return None
     dist_title_anchor_hits = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "가락시장", "도매시장", "공판장", "apc", "산지유통", "물류", "파렛트", "팰릿",
             "출하", "직거래", "수출", "선적", "공동선별", "공선출하", "검역", "중동",
             "k-푸드", "k푸드",
-        )],
+        )),
     )
     if (
-        count_any(text_l, [w.lower() for w in ("특강", "강연", "입점 설명회", "농협은행장", "소식]")]) >= 1
+        count_any(text_l, _lowered_terms(("특강", "강연", "입점 설명회", "농협은행장", "소식]"))) >= 1
         and dist_title_anchor_hits <= 0
         and not hard_logistics
         and not national_export_logistics
     ):
         return None
-    if count_any(text_l, [w.lower() for w in ("구매 협조", "구매협조", "소비 촉진 호소", "서한문 발송")]) >= 1:
+    if count_any(text_l, _lowered_terms(("구매 협조", "구매협조", "소비 촉진 호소", "서한문 발송"))) >= 1:
         return None
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     direct_agri_ops = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "원예", "과수", "과일", "채소", "양파", "감자", "단감", "멜론", "참외",
             "가락시장", "도매시장", "공판장", "산지유통", "apc", "파렛트", "팰릿", "농식품", "k-푸드", "k푸드",
-        )],
+        )),
     )
     if managed_count <= 0 and direct_agri_ops <= 0:
         return None
@@ -25464,7 +25657,7 @@ def _replace_optional_dist_tail_from_raw(
     ]
     if not weak_indexes:
         return 0
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in dist_items
@@ -25567,7 +25760,7 @@ def _promote_dist_hard_logistics_core(
         for article in dist_items
     ):
         return 0
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in dist_items
@@ -25734,7 +25927,7 @@ def _promote_dist_national_export_logistics_core(
     ):
         return 0
 
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in dist_items
@@ -25771,7 +25964,7 @@ def _promote_dist_national_export_logistics_core(
         text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
         response_priority = count_any(
             text_l,
-            [w.lower() for w in ("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처", "물류비 지원")],
+            _lowered_terms(("정부", "농식품부", "대응", "지원", "방어", "총력", "수출바우처", "물류비 지원")),
         )
         ranked.append((
             (
@@ -25825,7 +26018,7 @@ def _promote_dist_national_export_logistics_core(
             local_or_event = int(
                 is_local_brief_text(title, desc, "dist")
                 or is_dist_program_event_noise_context(title, desc, normalize_host(article.domain or ""), (article.press or "").strip())
-                or count_any(text, [w.lower() for w in ("간담회", "협의", "협력 강화", "직거래", "할인행사", "캠페인")]) >= 1
+                or count_any(text, _lowered_terms(("간담회", "협의", "협력 강화", "직거래", "할인행사", "캠페인"))) >= 1
             )
             optional_tail = int(_is_optional_dist_editorial_tail(article))
             return (
@@ -25964,7 +26157,7 @@ def _dedupe_dist_national_export_logistics(
 
     if not isinstance(raw_by_section, dict):
         return 0
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in dist_items
@@ -26025,7 +26218,7 @@ def _ensure_dist_specific_export_logistics_tail(
     dist_items = [a for a in (final_by_section.get("dist") or []) if isinstance(a, Article)]
     if not any(is_dist_export_logistics_response_context(a.title or "", a.description or "", a.domain or "", a.press or "") for a in dist_items):
         return 0
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in dist_items
@@ -26037,12 +26230,12 @@ def _ensure_dist_specific_export_logistics_tail(
         title_l = _nfkc_lower(article.title or "")
         concrete_hits = count_any(
             text_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "gcc", "중동 수출", "물류난", "해상 물류", "물류 차질", "우회 운송",
                 "운임", "딸기", "수출 37", "37.6", "72억원", "수출바우처",
-            )],
+            )),
         )
-        title_hits = count_any(title_l, [w.lower() for w in ("gcc", "물류난", "운임", "37.6", "k-푸드", "k푸드")])
+        title_hits = count_any(title_l, _lowered_terms(("gcc", "물류난", "운임", "37.6", "k-푸드", "k푸드")))
         trusted_wire = 1 if (article.press or "").strip() in {"뉴시스", "뉴스1", "연합뉴스"} else 0
         trusted_wire = max(trusted_wire, 1 if normalize_host(article.domain or "") in {"newsis.com", "yna.co.kr", "news1.kr"} else 0)
         try:
@@ -26161,8 +26354,8 @@ def _is_policy_governance_weaker_core(article: "Article") -> bool:
         return False
     return (
         "농협" in text
-        and count_any(text, [t.lower() for t in ("직선제", "지배 구조", "지배구조", "회장", "개혁안", "감사위", "대의원")]) >= 1
-        and count_any(text, [t.lower() for t in ("농안법", "시행령", "입법예고", "경영비", "차액 지원", "수급", "가격안정제도")]) == 0
+        and count_any(text, _lowered_terms(("직선제", "지배 구조", "지배구조", "회장", "개혁안", "감사위", "대의원"))) >= 1
+        and count_any(text, _lowered_terms(("농안법", "시행령", "입법예고", "경영비", "차액 지원", "수급", "가격안정제도"))) == 0
     )
 
 
@@ -26178,7 +26371,7 @@ def _promote_priority_policy_core(final_by_section: dict[str, list["Article"]],
     ]
     if not priority_items or any(bool(getattr(article, "is_core", False)) for article in priority_items):
         return 0
-    policy_conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    policy_conf = SECTION_CONF_BY_KEY.get("policy", {})
     target = max(
         priority_items,
         key=lambda article: (
@@ -26255,7 +26448,7 @@ def _drop_optional_policy_macro_tail(final_by_section: dict[str, list["Article"]
                 )
                 or (
                     "생산자물가" in _nfkc_lower(article.title or "")
-                    and count_any(_nfkc_lower(article.title or ""), [w.lower() for w in ("중동", "원자재", "충격")]) >= 1
+                    and count_any(_nfkc_lower(article.title or ""), _lowered_terms(("중동", "원자재", "충격"))) >= 1
                 )
             )
             and not is_policy_price_stabilization_system_context(article.title or "", article.description or "", article.domain or "", article.press or "")
@@ -26269,7 +26462,7 @@ def _drop_optional_policy_macro_tail(final_by_section: dict[str, list["Article"]
         title_l = _nfkc_lower(article.title or "")
         issue_explainer = count_any(
             title_l,
-            [w.lower() for w in ("애그플레이션", "엘리뇨", "이란전쟁", "중동전쟁", "전쟁 장기화")],
+            _lowered_terms(("애그플레이션", "엘리뇨", "이란전쟁", "중동전쟁", "전쟁 장기화")),
         )
         return (
             0 if issue_explainer >= 1 else 1,
@@ -26294,15 +26487,15 @@ def _drop_optional_policy_macro_tail(final_by_section: dict[str, list["Article"]
 def _is_policy_keepable_macro_issue(title: str, desc: str) -> bool:
     title_l = _nfkc_lower(title or "")
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
-    if count_any(title_l, [w.lower() for w in ("애그플레이션", "엘리뇨", "이란전쟁", "중동전쟁", "전쟁 장기화")]) <= 0:
+    if count_any(title_l, _lowered_terms(("애그플레이션", "엘리뇨", "이란전쟁", "중동전쟁", "전쟁 장기화"))) <= 0:
         return False
     issue_context_hits = count_any(
         text,
-        [w.lower() for w in ("농산물", "수급", "물가", "곡물", "밀", "대두", "원자재")],
+        _lowered_terms(("농산물", "수급", "물가", "곡물", "밀", "대두", "원자재")),
     )
     response_hits = count_any(
         text,
-        [w.lower() for w in ("농식품부", "정부", "점검", "대책", "확보", "수급")],
+        _lowered_terms(("농식품부", "정부", "점검", "대책", "확보", "수급")),
     )
     return issue_context_hits >= 2 and response_hits >= 1
 
@@ -26317,43 +26510,43 @@ def _is_pest_weather_disaster_noise(article: "Article") -> bool:
         return False
     title_l = _nfkc_lower(title)
     lead_l = _nfkc_lower(f"{title} {desc[:420]}")
-    if count_any(title_l, [w.lower() for w in ("병해 예방", "고추 병해", "병해 관리")]) >= 1:
+    if count_any(title_l, _lowered_terms(("병해 예방", "고추 병해", "병해 관리"))) >= 1:
         return False
     title_weather_hits = count_any(
         title_l,
-        [w.lower() for w in ("장마", "태풍", "집중호우", "호우", "폭우", "농업재해")],
+        _lowered_terms(("장마", "태풍", "집중호우", "호우", "폭우", "농업재해")),
     )
     weather_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "장마", "태풍", "집중호우", "호우", "폭우", "풍수해", "농업재해", "재해대책",
             "기상특보", "침수", "배수로", "시설물 피해",
-        )],
+        )),
     )
     if weather_hits <= 0:
         return False
     title_named_pest = _has_named_pest_signal(title_l) or count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "과수화상병", "화상병", "탄저병", "역병", "흰가루병", "노균병",
             "뿌리응애", "돌발해충", "토마토뿔나방", "총채벌레", "진딧물", "노린재", "응애",
-        )],
+        )),
     ) >= 1
     lead_named_pest = _has_named_pest_signal(lead_l) or count_any(
         lead_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "과수화상병", "화상병", "탄저병", "역병", "흰가루병", "노균병",
             "뿌리응애", "돌발해충", "토마토뿔나방", "총채벌레", "진딧물", "노린재", "응애",
-        )],
+        )),
     ) >= 1
     if title_named_pest or (title_weather_hits <= 0 and lead_named_pest):
         return False
     disaster_context_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "대비", "피해 예방", "피해 최소화", "재해대책", "추진계획", "시설물", "현장 기술지원",
             "상황 전파", "협력체계", "선제적 차단", "대응 강화",
-        )],
+        )),
     )
     return title_weather_hits >= 1 or (weather_hits >= 1 and disaster_context_hits >= 2)
 
@@ -26369,7 +26562,7 @@ def _is_weak_pest_tail(article: "Article") -> bool:
     title_l = _nfkc_lower(title)
     title_signal = _pest_title_signal_count(title)
     title_has_named_pest = _has_named_pest_signal(title)
-    if "콩" in text and count_any(text, [w.lower() for w in PEST_HORTI_TERMS]) == 0:
+    if "콩" in text and count_any(text, _lowered_terms(PEST_HORTI_TERMS)) == 0:
         return True
     if title_signal <= 0 and not title_has_named_pest:
         return True
@@ -26397,7 +26590,7 @@ def _pest_replacement_candidate_rank(article: "Article", pest_conf: JsonDict) ->
     title = article.title or ""
     desc = article.description or ""
     text_l = _nfkc_lower(f"{title} {desc}")
-    if "콩" in text_l and count_any(text_l, [w.lower() for w in PEST_HORTI_TERMS]) == 0:
+    if "콩" in text_l and count_any(text_l, _lowered_terms(PEST_HORTI_TERMS)) == 0:
         return None
     if not (
         is_pest_fire_blight_farmer_risk_context(title, desc)
@@ -26451,10 +26644,10 @@ def _pest_diversity_replacement_rank(article: "Article", pest_conf: JsonDict) ->
     horti_named = managed_count >= 1 or best_horti_score(title, desc) >= 1.6
     named_pest = _has_named_pest_signal(title) or count_any(
         text_l,
-        [w.lower() for w in ("탄저병", "총채벌레", "진딧물", "흰비단병", "과수화상병")],
+        _lowered_terms(("탄저병", "총채벌레", "진딧물", "흰비단병", "과수화상병")),
     ) >= 1
-    crop_disease_named = count_any(text_l, [w.lower() for w in ("고추 병해", "병해 예방", "병해 관리")]) >= 1
-    if "콩" in text_l and count_any(text_l, [w.lower() for w in PEST_HORTI_TERMS]) == 0:
+    crop_disease_named = count_any(text_l, _lowered_terms(("고추 병해", "병해 예방", "병해 관리"))) >= 1
+    if "콩" in text_l and count_any(text_l, _lowered_terms(PEST_HORTI_TERMS)) == 0:
         return None
     if not horti_named and not named_pest and not crop_disease_named and not is_pest_fire_blight_farmer_risk_context(title, desc):
         return None
@@ -26475,12 +26668,12 @@ def _pest_fire_blight_priority_rank(article: "Article", pest_conf: JsonDict) ->
         fit_sc = 0.0
     text = _nfkc_lower(f"{title} {desc}")
     incident_only = int(
-        count_any(text, [w.lower() for w in ("미살포", "보상금 감경", "행정 처분", "폐원 절차")]) >= 1
+        count_any(text, _lowered_terms(("미살포", "보상금 감경", "행정 처분", "폐원 절차"))) >= 1
         and not is_pest_national_fire_blight_escalation_context(title, desc)
     )
     title_l = _nfkc_lower(title)
-    title_alert_hits = count_any(title_l, [w.lower() for w in ("위기단계", "위기 단계", "경계", "주의", "전국")])
-    alert_hits = count_any(text, [w.lower() for w in ("위기단계", "위기 단계", "경계", "주의", "상향", "전국", "7개 농가", "2.5헥타르")])
+    title_alert_hits = count_any(title_l, _lowered_terms(("위기단계", "위기 단계", "경계", "주의", "전국")))
+    alert_hits = count_any(text, _lowered_terms(("위기단계", "위기 단계", "경계", "주의", "상향", "전국", "7개 농가", "2.5헥타르")))
     return (
         1 if is_pest_national_fire_blight_escalation_context(title, desc) else 0,
         1 if is_pest_fire_blight_field_report_context(title, desc) else 0,
@@ -26503,7 +26696,7 @@ def _promote_pest_priority_fire_blight_from_raw(
         return 0
     pest_items = [a for a in (final_by_section.get("pest") or []) if isinstance(a, Article)]
 
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -26620,7 +26813,7 @@ def _promote_pest_regional_fire_blight_response_from_raw(
     if any(is_pest_fire_blight_diagnostics_response_context(a.title or "", a.description or "") for a in pest_items):
         return 0
 
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -26675,7 +26868,7 @@ def _promote_pest_regional_fire_blight_response_from_raw(
         horti_named = best_horti_score(article.title or "", article.description or "") >= 1.4
         named_pest = _has_named_pest_signal(article.title or "") or count_any(
             text,
-            [w.lower() for w in ("과수화상병", "탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")],
+            _lowered_terms(("과수화상병", "탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")),
         ) >= 1
         return (
             0 if not horti_named else 1,
@@ -26718,7 +26911,7 @@ def _promote_pest_fire_blight_field_report_from_raw(
     ):
         return 0
 
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -26821,7 +27014,7 @@ def _replace_weak_pest_tail_from_raw(
         1 for article in pest_items
         if _pest_editorial_theme_key(article) == "fire_blight"
     )
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -26926,7 +27119,7 @@ def _replace_duplicate_pest_theme_tail_from_raw(
     if not duplicate_indexes:
         return 0
 
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -27109,11 +27302,11 @@ def _drop_weak_pest_notice_tail(final_by_section: dict[str, list["Article"]], *,
         text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
         title_named = _has_named_pest_signal(title_l) or count_any(
             title_l,
-            [w.lower() for w in ("탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")],
+            _lowered_terms(("탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")),
         ) >= 1
-        generic_notice = count_any(title_l, [w.lower() for w in ("병해충", "예찰", "관리", "비상")]) >= 1 and not title_named
+        generic_notice = count_any(title_l, _lowered_terms(("병해충", "예찰", "관리", "비상"))) >= 1 and not title_named
         non_horti = best_horti_score(article.title or "", article.description or "") < 1.4
-        local_notice = _local_geo_match(article.title or "") or count_any(text_l, [w.lower() for w in ("농업기술센터", "농기센터", "당부")]) >= 1
+        local_notice = _local_geo_match(article.title or "") or count_any(text_l, _lowered_terms(("농업기술센터", "농기센터", "당부"))) >= 1
         if generic_notice or non_horti or local_notice:
             candidates.append(article)
     if not candidates:
@@ -27151,12 +27344,12 @@ def _is_generic_pest_notice_tail(article: "Article") -> bool:
     text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
     title_named = _has_named_pest_signal(title_l) or count_any(
         title_l,
-        [w.lower() for w in ("탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")],
+        _lowered_terms(("탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")),
     ) >= 1
-    generic_notice = count_any(title_l, [w.lower() for w in ("병해충", "예찰", "관리", "비상")]) >= 1 and not title_named
+    generic_notice = count_any(title_l, _lowered_terms(("병해충", "예찰", "관리", "비상"))) >= 1 and not title_named
     non_horti = best_horti_score(article.title or "", article.description or "") < 1.4
     local_generic_notice = (
-        (_local_geo_match(article.title or "") or count_any(text_l, [w.lower() for w in ("농업기술센터", "농기센터", "당부")]) >= 1)
+        (_local_geo_match(article.title or "") or count_any(text_l, _lowered_terms(("농업기술센터", "농기센터", "당부"))) >= 1)
         and not title_named
     )
     return bool(generic_notice or non_horti or local_generic_notice)
@@ -27176,7 +27369,7 @@ def _replace_generic_pest_notice_tail_from_raw(
         1 for article in pest_items
         if is_pest_fire_blight_farmer_risk_context(article.title or "", article.description or "")
     )
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -27203,7 +27396,7 @@ def _replace_generic_pest_notice_tail_from_raw(
             managed_count = int(_managed_commodity_match_summary(article.title or "", article.description or "").get("count") or 0)
             named_pest = _has_named_pest_signal(article.title or "") or count_any(
                 text_l,
-                [w.lower() for w in ("탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")],
+                _lowered_terms(("탄저병", "총채벌레", "진딧물", "흰비단병", "토마토뿔나방")),
             ) >= 1
             ranked.append((
                 (
@@ -27293,7 +27486,7 @@ def _ensure_pest_fire_blight_alert_incident_balance(
         text = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
         return (
             is_pest_national_fire_blight_escalation_context(article.title or "", article.description or "")
-            and count_any(text, [w.lower() for w in ("위기단계", "위기 단계", "경계", "주의", "상향", "전국")]) >= 1
+            and count_any(text, _lowered_terms(("위기단계", "위기 단계", "경계", "주의", "상향", "전국"))) >= 1
         )
 
     if not any(_is_alert(article) for article in fire_items):
@@ -27305,7 +27498,7 @@ def _ensure_pest_fire_blight_alert_incident_balance(
     ):
         return 0
 
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -27326,7 +27519,7 @@ def _ensure_pest_fire_blight_alert_incident_balance(
             if is_pest_national_fire_blight_escalation_context(article.title or "", article.description or ""):
                 continue
             text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
-            if count_any(text_l, [w.lower() for w in ("미살포", "행정 처분", "행정처분", "보상금 감경", "폐원 절차")]) >= 1:
+            if count_any(text_l, _lowered_terms(("미살포", "행정 처분", "행정처분", "보상금 감경", "폐원 절차"))) >= 1:
                 continue
             reject_reason = _postbuild_article_reject_reason(article, "pest")
             if reject_reason not in ("", "selection_feedback_low_fit", "selection_feedback_core_fit") and not (
@@ -27340,7 +27533,7 @@ def _ensure_pest_fire_blight_alert_incident_balance(
             candidates.append((
                 (
                     1 if "첫" in _nfkc_lower(article.title or "") else 0,
-                    count_any(text_l, [w.lower() for w in ("확산 차단", "차단 총력", "매몰", "예찰", "방제")]),
+                    count_any(text_l, _lowered_terms(("확산 차단", "차단 총력", "매몰", "예찰", "방제"))),
                     press_priority(article.press, article.domain),
                     round(fit_sc, 3),
                     round(float(getattr(article, "score", 0.0) or 0.0), 3),
@@ -27416,8 +27609,8 @@ def _recover_dist_core_from_supply_ops(
         return 0
     supply_items = [a for a in (final_by_section.get("supply") or []) if isinstance(a, Article)]
 
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
-    supply_conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
+    supply_conf = SECTION_CONF_BY_KEY.get("supply", {})
     hard_dist_ops_terms = (
         "가락시장", "공영도매시장", "도매시장", "파렛트", "팰릿", "운송지원",
         "운송 지원", "물류비", "반입", "경매", "하역", "정산",
@@ -27687,7 +27880,7 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
 
     # ✅ 정책/기관 도메인(정책브리핑/농식품부/aT/농관원/KREI 등)은 수급/유통 쿼리에도 걸릴 수 있다.
     #    수집 단계에서는 살려두되, 최종 섹션은 policy로 강제 이동(누락/오분류 방지).
-    policy_conf = next((s for s in SECTIONS if s.get("key") == "policy"), None)
+    policy_conf = SECTION_CONF_BY_KEY.get("policy")
     if policy_conf is not None:
         moved = 0
         for sk, lst in list(raw_by_section.items()):
@@ -27714,18 +27907,18 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
                     _h = 0.0
                 if is_trade_policy_issue(_mix_text) and (not dist_export_field_like) and _h < 2.2:
                     # dist 앵커(도매시장/APC/경락/반입 등)가 강하면 dist로 남겨야 하므로 여기서 이동하지 않음
-                    _dist_hits = count_any(_mix_text, [t.lower() for t in (
+                    _dist_hits = count_any(_mix_text, _lowered_terms((
                         "가락시장","도매시장","공판장","공영도매시장","경락","경매","반입",
                         "산지유통","산지유통센터","apc","도매법인","중도매","시장도매인",
                         "물류","물류센터","출하","집하"
-                    )])
+                    )))
                     if _dist_hits < 2 and (not has_apc_agri_context(_mix_text)):
                         trade_like = True
 
                 policy_general_macro_tail = is_policy_general_macro_tail_context(a.title or "", a.description or "", d, p)
                 policy_agri_anchor_hits = count_any(
                     _mix_text,
-                    [w.lower() for w in ("농산물", "농업", "농가", "원예", "과수", "과일", "채소", "화훼", "도매시장", "공판장", "가락시장", "산지유통", "산지유통센터", "면세유", "비료")],
+                    _lowered_terms(("농산물", "농업", "농가", "원예", "과수", "과일", "채소", "화훼", "도매시장", "공판장", "가락시장", "산지유통", "산지유통센터", "면세유", "비료")),
                 )
                 move_to_policy = False
                 if is_policy_announcement_issue(_mix_text, d, p) or is_policy_market_brief_context(_mix_text, d, p) or trade_like or is_supply_stabilization_policy_context(_mix_text, d, p) or policy_export_support_like:
@@ -27779,8 +27972,8 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
     # ✅ 섹션 재조정(rebalancing)
     # - policy가 '판매 데이터 기반 소비 트렌드/소매 분석' 기사로 과밀해지는 것을 방지
     # - dist가 비는 날(도매시장/APC 기사 표현이 간접적인 경우) supply에서 dist로 이동시켜 누락을 줄임
-    supply_conf = next((s for s in SECTIONS if s.get("key") == "supply"), None)
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), None)
+    supply_conf = SECTION_CONF_BY_KEY.get("supply")
+    dist_conf = SECTION_CONF_BY_KEY.get("dist")
 
     if supply_conf is not None and policy_conf is not None:
         moved_ps = 0
@@ -27858,13 +28051,13 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
                 p = (a.press or "").strip()
 
                 # dist-like 판정(보수적): 유통/도매/APC/도매법인/하역/물류/수출/검역 등 + 원예 맥락
-                dist_like_hits = count_any(txt, [t.lower() for t in (
+                dist_like_hits = count_any(txt, _lowered_terms((
                     "가락시장","도매시장","공판장","공영도매시장","경락","경매","반입",
                     "산지유통","산지유통센터","apc","도매법인","중도매","시장도매인",
                     "하역","하역비","하역대란","물류","물류센터","출하","집하",
                     "원산지","부정유통","단속","검역","통관","수출","선적","수출길","유통","도매",
                     "난방비","면세유","유통비용","유통구조","주5일","휴무","콜드체인","중도매인"
-                )])
+                )))
                 if is_dist_export_shipping_context(a.title, a.description):
                     dist_like_hits = max(dist_like_hits, 3)
                 if is_dist_export_field_context(a.title, a.description, d, p):
@@ -27877,7 +28070,7 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
                 if (
                     dist_like_hits >= dist_min_hits
                     and not is_dist_primary_supply_price_story(a.title or "", a.description or "")
-                    and (best_horti_score(a.title, a.description) >= 1.6 or count_any(txt, [t.lower() for t in ("농산물","농식품","원예","과수","과일","채소","청과","화훼","절화")]) >= 1)
+                    and (best_horti_score(a.title, a.description) >= 1.6 or count_any(txt, _lowered_terms(("농산물","농식품","원예","과수","과일","채소","청과","화훼","절화"))) >= 1)
                 ):
                     # dist 기준으로도 통과할 때만 이동
                     try:
@@ -27998,7 +28191,7 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
             a.section = "policy"
             # policy 기준으로 재스코어링 (원래 섹션 점수가 policy 선정에 오용되는 것을 방지)
             try:
-                _p_conf = next((s for s in SECTIONS if s.get("key") == "policy"), None)
+                _p_conf = SECTION_CONF_BY_KEY.get("policy")
                 if _p_conf:
                     a.score = compute_rank_score(a.title, a.description, d, a.pub_dt_kst, _p_conf, p)
             except Exception:
@@ -28062,7 +28255,7 @@ def build_sections_from_raw(raw_by_section: dict[str, list[Article]], start_kst:
 
     if pest_fire_blight_rescue_seed:
         try:
-            pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), None)
+            pest_conf = SECTION_CONF_BY_KEY.get("pest")
             pest_idx = DedupeIndex()
             pest_items = list(raw_by_section.get("pest", []) or [])
             for _a in pest_items:
@@ -28624,7 +28817,7 @@ def _build_sections_phase123(
     try:
         pest_final = final_by_section.setdefault("pest", [])
         if not any(is_pest_fire_blight_farmer_risk_context(a.title or "", a.description or "") for a in pest_final):
-            pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), None)
+            pest_conf = SECTION_CONF_BY_KEY.get("pest")
             fire_candidates: dict[str, Article] = {}
             for _raw_items in (raw_by_section or {}).values():
                 for a in _raw_items or []:
@@ -29571,7 +29764,7 @@ def _openai_summarize_rows(rows: list[JsonDict]) -> dict[str, str]:
     feedback_text = _load_openai_summary_feedback()
     if feedback_text:
         system = system + "\n\n최근 품질 평가에서 바로 반영할 요약 지침:\n" + feedback_text
-    user = "기사 목록(JSON):\n" + json.dumps(rows, ensure_ascii=False)
+    user = "기사 목록(JSON):\n" + _json_dumps_compact(rows)
 
     payload: JsonDict = {
         "model": OPENAI_MODEL,
@@ -29636,7 +29829,7 @@ def _openai_summarize_rows(rows: list[JsonDict]) -> dict[str, str]:
 
         last_resp = r
         if r.ok:
-            response_payload = r.json()
+            response_payload = _json_loads_fast(r.content)
             try:
                 from editorial_eval import normalize_openai_usage
 
@@ -29646,10 +29839,20 @@ def _openai_summarize_rows(rows: list[JsonDict]) -> dict[str, str]:
             except Exception as exc:
                 log.debug("[OpenAI] usage accounting skipped: %s", exc)
             text = openai_extract_text(response_payload).strip()
+            # 출력 한도에 걸려 잘린 응답(status=incomplete)은 JSON 파싱 실패로
+            # 조용히 빈 결과가 되기 쉽다. 명시적으로 로그를 남겨 누락 행
+            # 재시도 경로가 이어받는다는 사실을 추적 가능하게 한다.
+            if str(response_payload.get("status") or "").strip().lower() == "incomplete":
+                details = response_payload.get("incomplete_details")
+                reason = str(details.get("reason") or "") if isinstance(details, dict) else ""
+                log.warning(
+                    "[OpenAI] incomplete response (reason=%s); omitted rows fall back to the missing-row retry",
+                    reason or "unknown",
+                )
             out: dict[str, str] = {}
             try:
-                parsed = json.loads(text)
-            except json.JSONDecodeError:
+                parsed = _json_loads_fast(text)
+            except Exception:
                 parsed = {}
             if isinstance(parsed, dict) and isinstance(parsed.get("summaries"), list):
                 for item in parsed["summaries"]:
@@ -29794,8 +29997,39 @@ def openai_summarize_batch(articles: list[Article], cache: dict[str, SummaryCach
     if not to_sum:
         return {}
 
+    # 배치 내 근사중복 병합: norm_key가 달라도 제목+설명이 사실상 같은
+    # 전재 기사(연합뉴스→뉴스1→뉴시스 등)는 대표 1행만 모델에 보내고,
+    # 응답 요약을 묶음의 모든 기사에 되돌려 적용해 토큰/지연을 줄인다.
+    def _summary_dup_tokens(a: Article) -> frozenset[str]:
+        return frozenset(re.findall(r"[0-9a-z가-힣]{2,}", f"{a.title} {a.description}".lower()))
+
+    dup_members: dict[str, list[str]] = {}
+    reps: list[Article] = []
+    if OPENAI_SUMMARY_DUP_JACCARD > 0.0:
+        rep_tokens: list[tuple[str, frozenset[str]]] = []
+        for a in to_sum:
+            toks = _summary_dup_tokens(a)
+            merged_key = ""
+            if toks:
+                for rk, rt in rep_tokens:
+                    union = len(toks | rt)
+                    if union and (len(toks & rt) / union) >= OPENAI_SUMMARY_DUP_JACCARD:
+                        merged_key = rk
+                        break
+            if merged_key:
+                dup_members[merged_key].append(a.norm_key)
+            else:
+                rep_tokens.append((a.norm_key, toks))
+                dup_members[a.norm_key] = []
+                reps.append(a)
+        merged_n = len(to_sum) - len(reps)
+        if merged_n:
+            log.info("[OpenAI] merged %d near-duplicate rows before summarize (%d -> %d)", merged_n, len(to_sum), len(reps))
+    else:
+        reps = list(to_sum)
+
     rows_all = []
-    for a in to_sum:
+    for a in reps:
         rows_all.append({
             "id": a.norm_key,
             "press": a.press,
@@ -29837,15 +30071,24 @@ def openai_summarize_batch(articles: list[Article], cache: dict[str, SummaryCach
         return True
 
     bs = max(5, int(OPENAI_BATCH_SIZE or 25))
-    for i in range(0, len(rows_all), bs):
-        if _OPENAI_QUOTA_EXHAUSTED:
-            break
-        rows = rows_all[i:i+bs]
-        part = _openai_summarize_rows(rows)
-        if part:
-            for k, v in part.items():
-                returned_keys.add(str(k or "").strip())
-                accept_summary(k, v)
+    chunks = [rows_all[i:i+bs] for i in range(0, len(rows_all), bs)]
+    # 청크가 여러 개면 동시 전송(전체 지연은 가장 느린 청크 수준으로 단축).
+    # mapping/cache 갱신(accept_summary)은 메인 스레드에서만 수행한다.
+    parts: list[dict[str, str]] = []
+    if len(chunks) > 1 and OPENAI_SUMMARY_MAX_WORKERS > 1 and not _OPENAI_QUOTA_EXHAUSTED:
+        with ThreadPoolExecutor(max_workers=min(OPENAI_SUMMARY_MAX_WORKERS, len(chunks))) as ex:
+            parts = list(ex.map(_openai_summarize_rows, chunks))
+    else:
+        for rows in chunks:
+            if _OPENAI_QUOTA_EXHAUSTED:
+                break
+            parts.append(_openai_summarize_rows(rows))
+    for part in parts:
+        for k, v in (part or {}).items():
+            returned_keys.add(str(k or "").strip())
+            accept_summary(k, v)
+            for member in dup_members.get(str(k or "").strip(), ()):
+                accept_summary(member, v)
 
     # A large structured-output batch can occasionally omit a few rows. Retry
     # only rows omitted by the model. A returned-but-rejected summary is left to
@@ -29861,7 +30104,10 @@ def openai_summarize_batch(articles: list[Article], cache: dict[str, SummaryCach
         retry_part = _openai_summarize_rows(retry_rows)
         for row in retry_rows:
             key = str(row.get("id") or "").strip()
-            accept_summary(key, str((retry_part or {}).get(key) or ""))
+            value = str((retry_part or {}).get(key) or "")
+            accept_summary(key, value)
+            for member in dup_members.get(key, ()):
+                accept_summary(member, value)
 
     return mapping
 
@@ -30427,7 +30673,9 @@ def build_daily_url(base_url: str, report_date: str, cache_bust: bool = False, r
 # -----------------------------
 # Rendering (HTML)
 # -----------------------------
+@lru_cache(maxsize=512)
 def esc(s: str) -> str:
+    # URL/날짜/섹션 제목 등 같은 문자열이 페이지 렌더링 중 반복 escape되므로 캐시한다.
     return html.escape(s or "")
 
 PWA_APP_TITLE = "농산물 뉴스 브리프"
@@ -31778,7 +32026,7 @@ def _commodity_board_item_article_metrics(
     section_key = str(getattr(article, "section", "") or "").strip()
     if selection_fit_score <= 0.0 and section_key:
         try:
-            sec_conf = next((s for s in SECTIONS if s.get("key") == section_key), {})
+            sec_conf = SECTION_CONF_BY_KEY.get(section_key, {})
             selection_fit_score = round(
                 float(section_fit_score(title, desc, sec_conf, normalize_host(getattr(article, "domain", "") or ""), getattr(article, "press", "") or "")),
                 3,
@@ -31963,7 +32211,7 @@ def _commodity_board_item_article_representative_metrics(
     weak_blossom_tourism = fruit_blossom_tourism and not operational_issue_signal
     weak_sales_promo = is_commodity_sales_promo_context(title, desc) and not market_response
     weak_political_statement = is_commodity_political_statement_context(title, desc) and not market_response
-    support_low_value_title_hits = count_any(title_l, [w.lower() for w in _COMMODITY_SUPPORT_LOW_VALUE_TITLE_TERMS])
+    support_low_value_title_hits = count_any(title_l, _lowered_terms(_COMMODITY_SUPPORT_LOW_VALUE_TITLE_TERMS))
     weak_support_advice = is_commodity_support_advice_context(title, desc) and not market_response
     weak_consumer_guide = is_commodity_consumer_guide_context(title, desc) and not market_response
     weak_regional_branding = is_commodity_regional_branding_context(title, desc) and not market_response
@@ -32231,7 +32479,7 @@ def _commodity_board_active_min_rank(item: dict[str, Any]) -> int:
 
 
 def _commodity_board_title_issue_hits(title: str) -> int:
-    return count_any(_nfkc_lower(title), [w.lower() for w in _MANAGED_COMMODITY_BOARD_STRONG_ISSUE_TITLE_TERMS])
+    return count_any(_nfkc_lower(title), _lowered_terms(_MANAGED_COMMODITY_BOARD_STRONG_ISSUE_TITLE_TERMS))
 
 
 def _commodity_board_article_is_active_candidate(
@@ -32294,7 +32542,7 @@ def _commodity_board_article_is_active_candidate(
         str(getattr(article, "section", "") or "").strip() == "pest"
         and (
             _has_named_pest_signal(_cb_title)
-            or count_any(_nfkc_lower(_cb_title), [w.lower() for w in _PEST_NAMED_DISEASE_TERMS]) >= 1
+            or count_any(_nfkc_lower(_cb_title), _lowered_terms(_PEST_NAMED_DISEASE_TERMS)) >= 1
         )
     )
     if not _title_item_focus_ok:
@@ -32307,8 +32555,8 @@ def _commodity_board_article_is_active_candidate(
     _fit_score = float(article_metrics.get("selection_fit_score") or 0.0)
     _title_l_for_foreign_noise = _nfkc_lower(_cb_title)
     _foreign_unmanaged_title = (
-        count_any(_title_l_for_foreign_noise, [w.lower() for w in ("두리안", "망고", "바나나", "아보카도", "파인애플")]) >= 1
-        and count_any(_title_l_for_foreign_noise, [w.lower() for w in ("베트남", "중국", "태국", "미국", "일본", "해외", "현지")]) >= 1
+        count_any(_title_l_for_foreign_noise, _lowered_terms(("두리안", "망고", "바나나", "아보카도", "파인애플"))) >= 1
+        and count_any(_title_l_for_foreign_noise, _lowered_terms(("베트남", "중국", "태국", "미국", "일본", "해외", "현지"))) >= 1
     )
     if _foreign_unmanaged_title and _title_hits == 0:
         return False
@@ -32611,7 +32859,7 @@ def _normalize_supply_section_from_board(
                 _bp_fit = section_fit_score(
                     article.title or "",
                     article.description or "",
-                    next((s for s in SECTIONS if s.get("key") == "supply"), {}),
+                    SECTION_CONF_BY_KEY.get("supply", {}),
                     article.domain or "",
                     article.press or "",
                 )
@@ -32918,7 +33166,7 @@ def _is_foodservice_supply_chain_slot_story(article: Article) -> bool:
 
     climate_hits = count_any(
         text,
-        [w.lower() for w in ("폭염", "폭우", "장마", "이상기후", "고온", "극한호우", "기후 변화", "기후변화")],
+        _lowered_terms(("폭염", "폭우", "장마", "이상기후", "고온", "극한호우", "기후 변화", "기후변화")),
     )
     supply_chain_hits = count_any(
         text,
@@ -32933,12 +33181,12 @@ def _is_foodservice_supply_chain_slot_story(article: Article) -> bool:
     )
     market_hits = count_any(
         text,
-        [w.lower() for w in ("가격", "값", "수급", "공급", "물량", "비축", "재고", "도매", "출하", "작황", "생산 차질")],
+        _lowered_terms(("가격", "값", "수급", "공급", "물량", "비축", "재고", "도매", "출하", "작황", "생산 차질")),
     )
     title_signal = bool(re.search(r"금\s*\([^)]*[金金][^)]*\)\s*추|금추", _nfkc_lower(title)))
     government_supply = bool(
-        count_any(text, [w.lower() for w in ("정부", "농림축산식품부", "농식품부")]) >= 1
-        and count_any(text, [w.lower() for w in ("수급 안정", "수매 비축", "비축", "공급", "도매시장")]) >= 1
+        count_any(text, _lowered_terms(("정부", "농림축산식품부", "농식품부"))) >= 1
+        and count_any(text, _lowered_terms(("수급 안정", "수매 비축", "비축", "공급", "도매시장"))) >= 1
     )
 
     return bool(
@@ -32974,7 +33222,7 @@ def _foodservice_supply_chain_slot_rank(article: Article, section_conf: JsonDict
     )
     market_hits = count_any(
         text,
-        [w.lower() for w in ("가격", "값", "수급", "공급", "물량", "비축", "재고", "도매", "출하", "작황", "생산 차질")],
+        _lowered_terms(("가격", "값", "수급", "공급", "물량", "비축", "재고", "도매", "출하", "작황", "생산 차질")),
     )
     title_signal = 1 if re.search(r"금\s*\([^)]*[金金][^)]*\)\s*추|금추", _nfkc_lower(title)) else 0
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
@@ -33041,21 +33289,21 @@ def _preferred_tail_block_reason(
             return ""
         nonmarket_hits = count_any(
             text,
-            [w.lower() for w in ("화장품", "뷰티", "레시피", "요리", "맛집", "관광", "체험", "시식")],
+            _lowered_terms(("화장품", "뷰티", "레시피", "요리", "맛집", "관광", "체험", "시식")),
         )
         market_hits = count_any(
             text,
-            [w.lower() for w in ("가격", "수급", "출하", "반입", "경락", "도매", "작황", "생산량", "공급", "시장격리")],
+            _lowered_terms(("가격", "수급", "출하", "반입", "경락", "도매", "작황", "생산량", "공급", "시장격리")),
         )
         if nonmarket_hits and market_hits <= 0 and not protected_thin_section:
             return "supply_nonmarket_tail"
         consumer_health_hits = count_any(
             title_l,
-            [w.lower() for w in ("라면", "먹었더니", "혈당", "염증", "건강", "효능", "다이어트", "암 예방")],
+            _lowered_terms(("라면", "먹었더니", "혈당", "염증", "건강", "효능", "다이어트", "암 예방")),
         )
         title_market_hits = count_any(
             title_l,
-            [w.lower() for w in ("가격", "수급", "출하", "반입", "경락", "도매", "작황", "생산량", "공급", "시장격리")],
+            _lowered_terms(("가격", "수급", "출하", "반입", "경락", "도매", "작황", "생산량", "공급", "시장격리")),
         )
         if consumer_health_hits >= 1 and title_market_hits <= 0 and not protected_thin_section:
             return "supply_consumer_health_tail"
@@ -33063,7 +33311,7 @@ def _preferred_tail_block_reason(
             return "supply_input_advice_tail"
         if (
             current_count >= MIN_FALLBACK_PER_SECTION
-            and count_any(title_l, [w.lower() for w in ("롯데리아", "외식업계", "햄버거", "프랜차이즈")]) >= 1
+            and count_any(title_l, _lowered_terms(("롯데리아", "외식업계", "햄버거", "프랜차이즈"))) >= 1
             and not protected_thin_section
         ):
             return "supply_restaurant_price_tail"
@@ -33072,13 +33320,13 @@ def _preferred_tail_block_reason(
         if (
             current_count >= SOFT_MIN_PER_SECTION
             and title_market_hits <= 0
-            and count_any(title_l, [w.lower() for w in ("곤충사료", "사료 개발", "vc 투자기업", "미스터아빠", "유통망 구축")]) >= 1
+            and count_any(title_l, _lowered_terms(("곤충사료", "사료 개발", "vc 투자기업", "미스터아빠", "유통망 구축"))) >= 1
             and not protected_thin_section
         ):
             return "supply_nonmarket_development_tail"
         brand_promo_hits = count_any(
             title_l,
-            [w.lower() for w in ("브랜드", "혁신", "행정", "홍보", "마케팅", "소비자 선택")],
+            _lowered_terms(("브랜드", "혁신", "행정", "홍보", "마케팅", "소비자 선택")),
         )
         if brand_promo_hits >= 1 and title_market_hits <= 0 and not protected_thin_section:
             return "supply_brand_promo_tail"
@@ -33086,15 +33334,15 @@ def _preferred_tail_block_reason(
             managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
             lead_market_hits = count_any(
                 lead_l,
-                [w.lower() for w in ("가격", "수급", "출하", "반입", "경락", "도매", "작황", "생산량", "공급", "시장격리", "폐기", "비축")],
+                _lowered_terms(("가격", "수급", "출하", "반입", "경락", "도매", "작황", "생산량", "공급", "시장격리", "폐기", "비축")),
             )
             if managed_count <= 0 or lead_market_hits <= 0:
                 return "supply_weak_preferred_tail"
             if (
                 current_count >= SOFT_MIN_PER_SECTION
                 and "출하" in lead_l
-                and count_any(lead_l, [w.lower() for w in ("가격", "수급", "시장격리", "폐기", "비축", "공급과잉", "도매")]) <= 0
-                and count_any(lead_l, [w.lower() for w in ("경산", "와촌", "특산품", "명품 과일")]) >= 1
+                and count_any(lead_l, _lowered_terms(("가격", "수급", "시장격리", "폐기", "비축", "공급과잉", "도매"))) <= 0
+                and count_any(lead_l, _lowered_terms(("경산", "와촌", "특산품", "명품 과일"))) >= 1
             ):
                 return "supply_local_launch_preferred_tail"
     elif section_key == "policy":
@@ -33113,30 +33361,30 @@ def _preferred_tail_block_reason(
             return "policy_livestock_non_horti_tail"
         non_policy_product_hits = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "화장품", "피부장벽", "박람회", "sial", "시알", "브랜드 홍보",
                 "집중 조명", "바이어", "소비자", "시음", "시식",
-            )],
+            )),
         )
         title_non_policy_product_hits = count_any(
             title_l,
-            [w.lower() for w in ("화장품", "피부장벽", "박람회", "sial", "시알", "브랜드 홍보", "바이어")],
+            _lowered_terms(("화장품", "피부장벽", "박람회", "sial", "시알", "브랜드 홍보", "바이어")),
         )
         title_policy_material_hits = count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격안정", "경영비", "지원", "입법", "법안", "법률", "제도",
                 "개정", "농협법", "농지법", "직선제", "대책", "공정위", "담합",
-            )],
+            )),
         )
         if title_non_policy_product_hits >= 1 and title_policy_material_hits <= 0 and not protected_thin_section:
             return "policy_non_policy_product_tail"
         policy_material_hits = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격안정", "경영비", "지원", "법", "제도",
                 "개정", "농협법", "농지법", "직선제", "대책", "공정위", "담합",
-            )],
+            )),
         )
         if non_policy_product_hits >= 1 and policy_material_hits <= 0 and not protected_thin_section:
             return "policy_non_policy_product_tail"
@@ -33146,23 +33394,23 @@ def _preferred_tail_block_reason(
             phrase_l = (phrase or "").lower()
             livestock_text = livestock_text.replace(phrase_l, " ")
             lead_livestock_text = lead_livestock_text.replace(phrase_l, " ")
-        livestock_hits = count_any(livestock_text, [w.lower() for w in ("축산", "축산농가", "가축", "한우", "양돈", "낙농")])
+        livestock_hits = count_any(livestock_text, _lowered_terms(("축산", "축산농가", "가축", "한우", "양돈", "낙농")))
         horti_policy_hits = count_any(
             text,
-            [w.lower() for w in ("농산물", "원예", "과수", "채소", "과일", "수급", "가격안정", "농협법", "농지법", "농업민생")],
+            _lowered_terms(("농산물", "원예", "과수", "채소", "과일", "수급", "가격안정", "농협법", "농지법", "농업민생")),
         )
         if livestock_hits >= 1 and horti_policy_hits <= 0 and not protected_thin_section:
             return "policy_livestock_non_horti_tail"
-        lead_livestock_hits = count_any(lead_livestock_text, [w.lower() for w in ("축산", "축산농가", "가축", "한우", "양돈", "낙농")])
+        lead_livestock_hits = count_any(lead_livestock_text, _lowered_terms(("축산", "축산농가", "가축", "한우", "양돈", "낙농")))
         title_horti_policy_hits = count_any(
             title_l,
-            [w.lower() for w in ("농산물", "원예", "과수", "채소", "과일", "수급", "가격안정", "농협법", "농지법", "농업민생", "농협")],
+            _lowered_terms(("농산물", "원예", "과수", "채소", "과일", "수급", "가격안정", "농협법", "농지법", "농업민생", "농협")),
         )
         if lead_livestock_hits >= 1 and title_horti_policy_hits <= 0 and not protected_thin_section:
             return "policy_livestock_non_horti_tail"
         retail_finance_hits = count_any(
             title_l,
-            [w.lower() for w in ("홈플러스", "메리츠", "청산", "회생", "유동성", "채권단", "마트")],
+            _lowered_terms(("홈플러스", "메리츠", "청산", "회생", "유동성", "채권단", "마트")),
         )
         if retail_finance_hits >= 1 and title_horti_policy_hits <= 0 and not protected_thin_section:
             return "policy_retail_finance_tail"
@@ -33171,16 +33419,16 @@ def _preferred_tail_block_reason(
                 return "policy_digest_tail"
             title_policy_anchor_hits = count_any(
                 title_l,
-                [w.lower() for w in ("정부", "농식품부", "농협", "국회", "입법", "법안", "법률", "제도", "지원", "대책", "개정", "직선제", "가격안정")],
+                _lowered_terms(("정부", "농식품부", "농협", "국회", "입법", "법안", "법률", "제도", "지원", "대책", "개정", "직선제", "가격안정")),
             )
             if title_policy_anchor_hits <= 0:
                 soft_fallback_issue_hits = count_any(
                     text,
-                    [w.lower() for w in (
+                    _lowered_terms((
                         "농산물", "원예", "과수", "채소", "과일", "수급", "가격",
                         "물가", "생산자물가", "애그플레이션", "원자재", "중동전쟁",
                         "이란전쟁", "공정위", "담합", "전분당", "농자재", "지원",
-                    )],
+                    )),
                 )
                 if current_count >= SOFT_MIN_PER_SECTION or soft_fallback_issue_hits < 2:
                     return "policy_anchorless_preferred_tail"
@@ -33207,7 +33455,7 @@ def _recover_supply_underfill_from_raw(
 ) -> int:
     if not isinstance(final_by_section, dict) or not isinstance(raw_by_section, dict):
         return 0
-    supply_conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+    supply_conf = SECTION_CONF_BY_KEY.get("supply", {})
     max_n = max(1, int(max_items or MAX_PER_SECTION))
     target = min(max_n, PREFERRED_PER_SECTION)
     supply_items = [article for article in (final_by_section.get("supply") or []) if isinstance(article, Article)]
@@ -33355,20 +33603,20 @@ def _policy_underfill_recovery_rank(article: Article, policy_conf: JsonDict) ->
     )
     actor_hits = count_any(
         text,
-        [w.lower() for w in ("농식품부", "농림축산식품부", "정부", "기재부", "aT", "한국농수산식품유통공사")],
+        _lowered_terms(("농식품부", "농림축산식품부", "정부", "기재부", "aT", "한국농수산식품유통공사")),
     )
     action_hits = count_any(
         text,
-        [w.lower() for w in ("물량 확보", "확보", "수입", "비축", "공급", "수급", "안정", "안정화", "대책", "점검", "할당관세", "발표", "추진")],
+        _lowered_terms(("물량 확보", "확보", "수입", "비축", "공급", "수급", "안정", "안정화", "대책", "점검", "할당관세", "발표", "추진")),
     )
     grain_macro_hits = count_any(
         text,
-        [w.lower() for w in ("국제곡물", "곡물가", "곡물 가격", "사료", "원맥", "대두", "옥수수", "밀 가격")],
+        _lowered_terms(("국제곡물", "곡물가", "곡물 가격", "사료", "원맥", "대두", "옥수수", "밀 가격")),
     )
     central_agri_macro = (
         actor_hits >= 1
         and action_hits >= 1
-        and count_any(text, [w.lower() for w in ("농산물", "농식품", "식품", "곡물", "사료", "수급", "공급", "물가")]) >= 1
+        and count_any(text, _lowered_terms(("농산물", "농식품", "식품", "곡물", "사료", "수급", "공급", "물가"))) >= 1
     )
     grain_macro_policy = grain_macro_hits >= 1 and actor_hits >= 1 and action_hits >= 1
 
@@ -33382,7 +33630,7 @@ def _policy_underfill_recovery_rank(article: Article, policy_conf: JsonDict) ->
     local_price_support = is_policy_local_price_support_context(title, desc)
     field_support_issue = count_any(
         text,
-        [w.lower() for w in ("필수 농자재", "농자재 직접지원", "경영비 지원", "생산비 부담")],
+        _lowered_terms(("필수 농자재", "농자재 직접지원", "경영비 지원", "생산비 부담")),
     ) >= 2
     local_program = is_local_agri_policy_program_context(text)
     price_collapse_issue = is_policy_price_collapse_issue_context(title, desc)
@@ -33450,7 +33698,7 @@ def _recover_policy_underfill_from_raw(
 ) -> int:
     if not isinstance(final_by_section, dict) or not isinstance(raw_by_section, dict):
         return 0
-    policy_conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    policy_conf = SECTION_CONF_BY_KEY.get("policy", {})
     max_n = max(1, int(max_items or MAX_PER_SECTION))
     target = min(max_n, PREFERRED_PER_SECTION)
     policy_items = [article for article in (final_by_section.get("policy") or []) if isinstance(article, Article)]
@@ -33661,7 +33909,7 @@ def _is_policy_preferred_gap_story(article: Article) -> bool:
     )
     policy_actor_hits = count_any(
         text,
-        [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "krei", "한국농촌경제연구원")],
+        _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "krei", "한국농촌경제연구원")),
     )
     if structural_hits < 2:
         return False
@@ -33761,7 +34009,7 @@ def _is_policy_supply_response_gap_story(article: Article) -> bool:
         return False
     actor_hits = count_any(
         text,
-        [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "기재부", "aT", "한국농수산식품유통공사")],
+        _lowered_terms(("정부", "농식품부", "농림축산식품부", "기재부", "aT", "한국농수산식품유통공사")),
     )
     response_hits = count_any(
         text,
@@ -33811,7 +34059,7 @@ def _policy_supply_response_gap_rank(article: Article, section_conf: JsonDict) -
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     central_actor_hits = count_any(
         text,
-        [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "기재부")],
+        _lowered_terms(("정부", "농식품부", "농림축산식품부", "기재부")),
     )
     specific_response_hits = count_any(
         text,
@@ -33898,19 +34146,19 @@ def _is_supply_field_support_gap_story(article: Article) -> bool:
 
     title_action_hits = count_any(
         title_l,
-        [w.lower() for w in ("수매", "매입", "지원", "기계화", "기계", "소비촉진", "제값받기", "상생마케팅")],
+        _lowered_terms(("수매", "매입", "지원", "기계화", "기계", "소비촉진", "제값받기", "상생마케팅")),
     )
     procurement_hits = count_any(
         text,
-        [w.lower() for w in ("수매", "매입", "가공용", "못난이", "규격외", "제값받기", "소비촉진", "상생마케팅", "가격 지지")],
+        _lowered_terms(("수매", "매입", "가공용", "못난이", "규격외", "제값받기", "소비촉진", "상생마케팅", "가격 지지")),
     )
     mechanization_hits = count_any(
         text,
-        [w.lower() for w in ("기계화", "기계", "파종", "수확", "저장", "재배 전 과정", "노동력", "생산비 절감")],
+        _lowered_terms(("기계화", "기계", "파종", "수확", "저장", "재배 전 과정", "노동력", "생산비 절감")),
     )
     support_hits = count_any(
         text,
-        [w.lower() for w in ("지원", "농협", "정부", "지자체", "농가", "사업", "기술", "현장", "시범")],
+        _lowered_terms(("지원", "농협", "정부", "지자체", "농가", "사업", "기술", "현장", "시범")),
     )
     return bool(
         title_action_hits >= 1
@@ -33934,11 +34182,11 @@ def _supply_field_support_gap_rank(article: Article, section_conf: JsonDict) ->
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     procurement_hits = count_any(
         text,
-        [w.lower() for w in ("수매", "매입", "가공용", "못난이", "규격외", "제값받기", "소비촉진", "상생마케팅")],
+        _lowered_terms(("수매", "매입", "가공용", "못난이", "규격외", "제값받기", "소비촉진", "상생마케팅")),
     )
     mechanization_hits = count_any(
         text,
-        [w.lower() for w in ("기계화", "기계", "파종", "수확", "저장", "재배 전 과정", "노동력", "생산비 절감")],
+        _lowered_terms(("기계화", "기계", "파종", "수확", "저장", "재배 전 과정", "노동력", "생산비 절감")),
     )
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
     return (
@@ -33967,12 +34215,12 @@ def _is_policy_fertilizer_support_gap_story(article: Article) -> bool:
         return False
     if is_policy_livestock_dominant_context(title, desc, normalize_host(article.domain or ""), (article.press or "").strip()):
         return False
-    if count_any(title_l, [w.lower() for w in ("허위", "과대광고", "광고", "알맞게 사용", "사용해야", "요령")]) >= 1:
+    if count_any(title_l, _lowered_terms(("허위", "과대광고", "광고", "알맞게 사용", "사용해야", "요령"))) >= 1:
         return False
 
     actor_hits = count_any(
         text,
-        [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "시", "군", "도", "지자체", "농협")],
+        _lowered_terms(("정부", "농식품부", "농림축산식품부", "시", "군", "도", "지자체", "농협")),
     )
     support_hits = count_any(
         text,
@@ -33996,7 +34244,7 @@ def _is_policy_fertilizer_support_gap_story(article: Article) -> bool:
         "보조금" in text
         or "긴급 투입" in text
         or "지원사업" in text
-        or ("지원" in text and count_any(text, [w.lower() for w in ("농가", "사업", "접수", "신청", "부담")]) >= 1)
+        or ("지원" in text and count_any(text, _lowered_terms(("농가", "사업", "접수", "신청", "부담"))) >= 1)
     )
     return actor_hits >= 1 and support_hits >= 1 and specific_support
 
@@ -34011,10 +34259,10 @@ def _policy_fertilizer_support_gap_rank(article: Article, section_conf: JsonDict
         fit_sc = float(section_fit_score(title, desc, section_conf, article.domain or "", article.press or ""))
     except Exception:
         fit_sc = 0.0
-    central_actor_hits = count_any(text, [w.lower() for w in ("정부", "농식품부", "농림축산식품부")])
+    central_actor_hits = count_any(text, _lowered_terms(("정부", "농식품부", "농림축산식품부")))
     support_hits = count_any(
         text,
-        [w.lower() for w in ("보조금", "지원사업", "지원 사업", "긴급 투입", "투입", "지원", "접수", "신청")],
+        _lowered_terms(("보조금", "지원사업", "지원 사업", "긴급 투입", "투입", "지원", "접수", "신청")),
     )
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
     fit_bucket = 1 if fit_sc >= 1.0 else 0
@@ -34043,16 +34291,16 @@ def _is_policy_agri_finance_support_gap_story(article: Article) -> bool:
         return False
     if is_policy_livestock_dominant_context(title, desc, normalize_host(article.domain or ""), (article.press or "").strip()):
         return False
-    finance_hits = count_any(title_l, [w.lower() for w in ("무이자자금", "무이자 자금", "도농상생기금", "상생기금", "영농비", "경영비", "영농자금", "경영자금", "민생 지원")])
-    direct_finance_title_hits = count_any(title_l, [w.lower() for w in ("무이자자금", "무이자 자금", "영농비", "경영비", "영농자금", "경영자금")])
-    support_hits = count_any(text, [w.lower() for w in ("지원", "기금", "경제사업 활성화", "농촌지역", "농가", "농축협")])
-    actor_hits = count_any(text, [w.lower() for w in ("농협중앙회", "농협", "농축협", "상생협력위원회")])
+    finance_hits = count_any(title_l, _lowered_terms(("무이자자금", "무이자 자금", "도농상생기금", "상생기금", "영농비", "경영비", "영농자금", "경영자금", "민생 지원")))
+    direct_finance_title_hits = count_any(title_l, _lowered_terms(("무이자자금", "무이자 자금", "영농비", "경영비", "영농자금", "경영자금")))
+    support_hits = count_any(text, _lowered_terms(("지원", "기금", "경제사업 활성화", "농촌지역", "농가", "농축협")))
+    actor_hits = count_any(text, _lowered_terms(("농협중앙회", "농협", "농축협", "상생협력위원회")))
     topical_support_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농가 부담", "부담 완화", "경영비", "영농비", "영농자금", "비료", "사료", "자재비",
             "재해", "수급", "가격 안정", "산지", "원예", "과수", "과일", "채소", "시설하우스",
-        )],
+        )),
     )
     amount_signal = bool(re.search(r"\d+\s*(억|억원)", text))
     return (
@@ -34074,14 +34322,14 @@ def _policy_agri_finance_support_gap_rank(article: Article, section_conf: JsonDi
         fit_sc = float(section_fit_score(title, desc, section_conf, article.domain or "", article.press or ""))
     except Exception:
         fit_sc = 0.0
-    finance_hits = count_any(text, [w.lower() for w in ("무이자자금", "무이자 자금", "영농비", "경영비", "영농자금", "경영자금", "민생 지원", "도농상생기금", "상생기금", "경제사업 활성화")])
-    direct_title_hits = count_any(_nfkc_lower(title), [w.lower() for w in ("무이자자금", "무이자 자금", "영농비", "경영비", "영농자금", "경영자금")])
+    finance_hits = count_any(text, _lowered_terms(("무이자자금", "무이자 자금", "영농비", "경영비", "영농자금", "경영자금", "민생 지원", "도농상생기금", "상생기금", "경제사업 활성화")))
+    direct_title_hits = count_any(_nfkc_lower(title), _lowered_terms(("무이자자금", "무이자 자금", "영농비", "경영비", "영농자금", "경영자금")))
     topical_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농가 부담", "부담 완화", "경영비", "영농비", "비료", "사료", "자재비", "재해",
             "수급", "가격 안정", "산지", "원예", "과수", "과일", "채소", "시설하우스",
-        )],
+        )),
     )
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
     return (
@@ -34118,9 +34366,9 @@ def _policy_agri_supplier_payment_gap_rank(article: Article, section_conf: JsonD
         fit_sc = float(section_fit_score(title, desc, section_conf, article.domain or "", article.press or ""))
     except Exception:
         fit_sc = 0.0
-    payment_hits = count_any(text, [w.lower() for w in ("미정산", "납품대금", "납품 대금", "정산 지연", "대금 정산")])
-    agri_supplier_hits = count_any(text, [w.lower() for w in ("농산물", "농가", "산지", "납품업체", "협력업체", "납품 업체")])
-    impact_hits = count_any(text, [w.lower() for w in ("생존 위기", "피해", "부담", "대책", "호소", "확대")])
+    payment_hits = count_any(text, _lowered_terms(("미정산", "납품대금", "납품 대금", "정산 지연", "대금 정산")))
+    agri_supplier_hits = count_any(text, _lowered_terms(("농산물", "농가", "산지", "납품업체", "협력업체", "납품 업체")))
+    impact_hits = count_any(text, _lowered_terms(("생존 위기", "피해", "부담", "대책", "호소", "확대")))
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
     return (
         min(5, payment_hits),
@@ -34147,20 +34395,20 @@ def _is_policy_climate_adaptation_gap_story(article: Article) -> bool:
         return False
     if is_policy_livestock_dominant_context(title, desc, normalize_host(article.domain or ""), (article.press or "").strip()):
         return False
-    facility_hits = count_any(title_l, [w.lower() for w in ("시설하우스", "온실", "시설원예")])
-    climate_hits = count_any(text, [w.lower() for w in ("폭염", "고온", "기후변화", "이상기후", "장마", "집중호우")])
+    facility_hits = count_any(title_l, _lowered_terms(("시설하우스", "온실", "시설원예")))
+    climate_hits = count_any(text, _lowered_terms(("폭염", "고온", "기후변화", "이상기후", "장마", "집중호우")))
     adaptation_hits = count_any(
         text,
-        [w.lower() for w in ("환기창", "천장 환기", "차광", "냉방", "스마트팜", "시설 개선", "기술", "극복", "대응")],
+        _lowered_terms(("환기창", "천장 환기", "차광", "냉방", "스마트팜", "시설 개선", "기술", "극복", "대응")),
     )
-    horti_hits = count_any(text, [w.lower() for w in ("농가", "원예", "작물", "채소", "과채", "토마토", "참외", "멜론")])
+    horti_hits = count_any(text, _lowered_terms(("농가", "원예", "작물", "채소", "과채", "토마토", "참외", "멜론")))
     official_actor_hits = count_any(
         text,
-        [w.lower() for w in ("정부", "농진청", "농촌진흥청", "농업기술원", "농업기술센터", "시범사업")],
+        _lowered_terms(("정부", "농진청", "농촌진흥청", "농업기술원", "농업기술센터", "시범사업")),
     )
     local_program_hits = count_any(
         text,
-        [w.lower() for w in ("지자체 협력사업", "협력사업", "설치 지원", "설치지원", "지원사업")],
+        _lowered_terms(("지자체 협력사업", "협력사업", "설치 지원", "설치지원", "지원사업")),
     )
     coop_actor = "농협" in text and local_program_hits >= 1
     return (
@@ -34184,7 +34432,7 @@ def _policy_climate_adaptation_gap_rank(article: Article, section_conf: JsonDict
         fit_sc = 0.0
     adaptation_hits = count_any(
         text,
-        [w.lower() for w in ("환기창", "천장 환기", "차광", "냉방", "스마트팜", "시설 개선", "기술", "극복", "대응")],
+        _lowered_terms(("환기창", "천장 환기", "차광", "냉방", "스마트팜", "시설 개선", "기술", "극복", "대응")),
     )
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
     return (
@@ -34200,8 +34448,8 @@ def is_foreign_unmanaged_commodity_context(title: str, desc: str) -> bool:
     text = _nfkc_lower(f"{title or ''} {desc or ''}")
     if not text.strip():
         return False
-    unmanaged_hits = count_any(text, [w.lower() for w in ("두리안", "망고", "바나나", "아보카도", "파인애플")])
-    foreign_hits = count_any(text, [w.lower() for w in ("베트남", "중국", "태국", "미국", "일본", "해외", "현지")])
+    unmanaged_hits = count_any(text, _lowered_terms(("두리안", "망고", "바나나", "아보카도", "파인애플")))
+    foreign_hits = count_any(text, _lowered_terms(("베트남", "중국", "태국", "미국", "일본", "해외", "현지")))
     if unmanaged_hits <= 0 or foreign_hits <= 0:
         return False
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
@@ -34233,24 +34481,24 @@ def _is_dist_preferred_gap_story(article: Article) -> bool:
         return False
     if is_dist_primary_supply_price_story(title, desc):
         return False
-    if count_any(text, [w.lower() for w in ("예규·판례", "예규 판례", "저가 신고", "저가신고", "관세", "세관")]) >= 1:
+    if count_any(text, _lowered_terms(("예규·판례", "예규 판례", "저가 신고", "저가신고", "관세", "세관"))) >= 1:
         return False
-    if count_any(text, [w.lower() for w in ("구매 협조", "구매협조", "소비 촉진 호소", "서한문 발송")]) >= 1:
+    if count_any(text, _lowered_terms(("구매 협조", "구매협조", "소비 촉진 호소", "서한문 발송"))) >= 1:
         return False
     title_anchor_hits = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "산지유통", "물류", "출하", "직거래", "수출", "선적",
             "공동선별", "공선출하", "검역", "온라인도매시장", "온라인 도매시장",
-        )],
+        )),
     )
     if (
-        count_any(text, [w.lower() for w in ("특강", "강연", "입점 설명회", "농협은행장", "소식]")]) >= 1
+        count_any(text, _lowered_terms(("특강", "강연", "입점 설명회", "농협은행장", "소식]"))) >= 1
         and title_anchor_hits <= 0
     ):
         return False
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
-    agri_hits = count_any(text, [w.lower() for w in ("농산물", "채소", "과일", "친환경농산물")])
+    agri_hits = count_any(text, _lowered_terms(("농산물", "채소", "과일", "친환경농산물")))
     if managed_count <= 0 and agri_hits <= 0:
         return False
     explicit_online = "온라인 도매시장" in text or "온라인도매시장" in text
@@ -34352,25 +34600,25 @@ def _dist_preferred_gap_rank(article: Article, dist_conf: JsonDict) -> tuple[Any
     digital_sales = is_agri_digital_sales_channel_context(title, desc)
     title_export_hits = count_any(
         _nfkc_lower(title),
-        [w.lower() for w in ("수출", "선적", "대만", "싱가포르", "공동선별", "공선출하")],
+        _lowered_terms(("수출", "선적", "대만", "싱가포르", "공동선별", "공선출하")),
     )
     structural_ops_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "산지유통", "산지 유통", "저온유통", "저온 유통", "저온유통체계", "저온 유통체계",
             "유통 데이터", "유통데이터", "데이터 공유", "데이터공유", "스마트 APC", "APC",
             "공동선별", "공선출하", "선적", "수출", "도매시장", "공판장", "경매",
-        )],
+        )),
     )
     ops_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "온라인 도매시장", "온라인도매시장", "도매시장", "공판장", "유통 구조", "유통구조",
             "유통 혁신", "유통혁신", "생산·유통관리", "산지유통", "산지 유통",
             "저온유통", "저온 유통", "저온유통체계", "저온 유통체계", "유통체계",
             "유통 데이터", "유통데이터", "데이터 공유", "데이터공유", "스마트 APC", "APC",
             "수출", "선적", "공동선별", "공선출하",
-        )],
+        )),
     )
     pub_sort = getattr(article, "pub_dt_kst", None) or datetime.min.replace(tzinfo=KST)
     return (
@@ -34400,7 +34648,7 @@ def _is_dist_structural_ops_gap_story(article: Article) -> bool:
     title_l = _nfkc_lower(title)
     structural_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "APC",
             "스마트 APC",
             "산지유통센터",
@@ -34411,11 +34659,11 @@ def _is_dist_structural_ops_gap_story(article: Article) -> bool:
             "데이터 공유",
             "데이터공유",
             "AI 기반",
-        )],
+        )),
     )
     action_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "공유",
             "구축",
             "운영",
@@ -34424,9 +34672,9 @@ def _is_dist_structural_ops_gap_story(article: Article) -> bool:
             "혁신",
             "경쟁력 강화",
             "성패",
-        )],
+        )),
     )
-    return structural_hits >= 2 and action_hits >= 1 and count_any(title_l, [w.lower() for w in ("APC", "산지유통", "산지 유통")]) >= 1
+    return structural_hits >= 2 and action_hits >= 1 and count_any(title_l, _lowered_terms(("APC", "산지유통", "산지 유통"))) >= 1
 
 
 def _soft_fallback_dist_recovery_rank(
@@ -34450,7 +34698,7 @@ def _soft_fallback_dist_recovery_rank(
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     title_ops_hits = count_any(
         _nfkc_lower(title),
-        [t.lower() for t in ("가락시장", "도매시장", "공판장", "APC", "산지유통", "물류", "파렛트", "출하", "직거래", "수출")],
+        _lowered_terms(("가락시장", "도매시장", "공판장", "APC", "산지유통", "물류", "파렛트", "출하", "직거래", "수출")),
     )
     return (
         0,
@@ -34474,7 +34722,7 @@ def _is_soft_fallback_policy_issue_tail(article: Article) -> bool:
     desc = article.description or ""
     text = _nfkc_lower(f"{title} {desc}")
     title_l = _nfkc_lower(title)
-    field_support = count_any(title_l, [w.lower() for w in ("필수 농자재", "농자재 직접지원", "경영비 지원")]) >= 1
+    field_support = count_any(title_l, _lowered_terms(("필수 농자재", "농자재 직접지원", "경영비 지원"))) >= 1
     if not field_support:
         if _preferred_tail_block_reason(
             article,
@@ -34486,12 +34734,12 @@ def _is_soft_fallback_policy_issue_tail(article: Article) -> bool:
     macro_issue = (
         "애그플레이션" in text
         or (
-            count_any(text, [w.lower() for w in ("농산물", "농식품", "농자재", "원자재", "중동전쟁", "이란전쟁")]) >= 1
-            and count_any(text, [w.lower() for w in ("물가", "생산자물가", "가격", "수급", "충격")]) >= 1
+            count_any(text, _lowered_terms(("농산물", "농식품", "농자재", "원자재", "중동전쟁", "이란전쟁"))) >= 1
+            and count_any(text, _lowered_terms(("물가", "생산자물가", "가격", "수급", "충격"))) >= 1
         )
         or (
             "공정위" in text
-            and count_any(text, [w.lower() for w in ("담합", "전분당", "과징금", "포상금")]) >= 1
+            and count_any(text, _lowered_terms(("담합", "전분당", "과징금", "포상금"))) >= 1
         )
     )
     return bool(macro_issue or field_support)
@@ -34836,7 +35084,7 @@ def _final_story_signature(section_key: str, article: Article) -> tuple[str, ...
     if (
         section_key == "policy"
         and count_any(text, ("lng", "lpg", "발전용lng", "발전용 lng")) >= 1
-        and count_any(text, [w.lower() for w in ("할당관세", "할당 관세", "관세 0%", "관세율 0%", "무관세")]) >= 1
+        and count_any(text, _lowered_terms(("할당관세", "할당 관세", "관세 0%", "관세율 0%", "무관세"))) >= 1
     ):
         return ("policy_energy_tariff_relief",)
     if section_key == "policy" and _is_policy_agri_finance_support_gap_story(article):
@@ -35240,7 +35488,7 @@ def _final_global_story_dedupe(
 def _fresh_section_fit(article: "Article", sec: str) -> float:
     """현재 텍스트 기준으로 섹션 적합도를 재계산(스냅샷 메타데이터와 무관)."""
     try:
-        sec_conf = next((s for s in SECTIONS if s.get("key") == sec), {})
+        sec_conf = SECTION_CONF_BY_KEY.get(sec, {})
         return float(section_fit_score(
             getattr(article, "title", "") or "", getattr(article, "description", "") or "",
             sec_conf, getattr(article, "domain", "") or "", getattr(article, "press", "") or "",
@@ -35776,14 +36024,14 @@ def _cap_final_low_tier_sources(
                     text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
                     if _has_named_pest_signal(title_l) or count_any(
                         title_l,
-                        [w.lower() for w in _PEST_NAMED_DISEASE_TERMS],
+                        _lowered_terms(_PEST_NAMED_DISEASE_TERMS),
                     ) >= 1:
                         editorial_bonus += 5.0
                     if any(actor in text_l for actor in ("농촌진흥청", "농진청", "농림축산검역본부")):
                         editorial_bonus += 4.0
                     if (
                         best_horti_score(article.title or "", article.description or "") >= 1.6
-                        and count_any(title_l, [w.lower() for w in ("방제", "예찰", "피해", "확산", "발생")]) >= 1
+                        and count_any(title_l, _lowered_terms(("방제", "예찰", "피해", "확산", "발생"))) >= 1
                     ):
                         editorial_bonus += 3.0
                     if _is_pest_weather_disaster_noise(article):
@@ -36121,15 +36369,15 @@ def _is_pest_direct_gap_story(article: Article) -> bool:
         return False
     pest_hits = count_any(
         text,
-        [w.lower() for w in ("돌발해충", "노린재", "뿌리응애", "응애", "달팽이", "민달팽이", "과수화상병", "화상병", "탄저병", "총채벌레", "진딧물")],
+        _lowered_terms(("돌발해충", "노린재", "뿌리응애", "응애", "달팽이", "민달팽이", "과수화상병", "화상병", "탄저병", "총채벌레", "진딧물")),
     )
     crop_disease_hits = count_any(
         text,
-        [w.lower() for w in ("고추 병해", "병해 예방", "병해 관리")],
+        _lowered_terms(("고추 병해", "병해 예방", "병해 관리")),
     )
     action_hits = count_any(
         text,
-        [w.lower() for w in ("피해", "예방", "방제", "공동 방제", "긴급 방제", "예찰", "관리", "필수", "증가", "확산", "차단", "유입 차단", "검역", "폐기", "반송", "약제비", "긴급 지원", "매몰", "비상")],
+        _lowered_terms(("피해", "예방", "방제", "공동 방제", "긴급 방제", "예찰", "관리", "필수", "증가", "확산", "차단", "유입 차단", "검역", "폐기", "반송", "약제비", "긴급 지원", "매몰", "비상")),
     )
     weak_context = any(term in text for term in ("비타민c", "외교", "묘목 북", "냉해 없어", "등록 완료", "신젠타", "인시피오"))
     return (pest_hits >= 1 or crop_disease_hits >= 1) and action_hits >= 1 and not weak_context
@@ -36145,8 +36393,8 @@ def _pest_direct_gap_rank(article: Article, conf: JsonDict) -> tuple[Any, ...]:
         except Exception:
             fit = 0.0
     text = _nfkc_lower(f"{title} {desc}".strip())
-    crop_bonus = count_any(text, [w.lower() for w in ("과수", "사과", "배 농가", "농작물", "고추", "맥문동")])
-    action_bonus = count_any(text, [w.lower() for w in ("공동 방제", "긴급 방제", "방제", "예찰", "피해 예방", "유입 차단", "약제비", "매몰", "친환경 관리")])
+    crop_bonus = count_any(text, _lowered_terms(("과수", "사과", "배 농가", "농작물", "고추", "맥문동")))
+    action_bonus = count_any(text, _lowered_terms(("공동 방제", "긴급 방제", "방제", "예찰", "피해 예방", "유입 차단", "약제비", "매몰", "친환경 관리")))
     return (
         min(4, crop_bonus + action_bonus),
         fit,
@@ -36166,7 +36414,7 @@ def _refill_pest_direct_gap_from_raw(
         return 0
     max_n = max(1, min(MAX_PER_SECTION, int(target or PREFERRED_PER_SECTION)))
     pest_items = [article for article in (final_by_section.get("pest") or []) if isinstance(article, Article)]
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -36338,11 +36586,11 @@ def _is_pest_crop_protection_input_fallback(article: Article) -> bool:
         return False
     product_hits = count_any(
         text,
-        [w.lower() for w in ("방제제", "약제", "농약", "살충제", "신젠타", "인시피오", "등록 완료")],
+        _lowered_terms(("방제제", "약제", "농약", "살충제", "신젠타", "인시피오", "등록 완료")),
     )
     pest_hits = count_any(
         text,
-        [w.lower() for w in ("나방", "노린재", "응애", "총채벌레", "진딧물", "해충", "병해충", "방제")],
+        _lowered_terms(("나방", "노린재", "응애", "총채벌레", "진딧물", "해충", "병해충", "방제")),
     )
     return product_hits >= 1 and pest_hits >= 2
 
@@ -36354,8 +36602,8 @@ def _is_pest_climate_risk_fallback(article: Article) -> bool:
     if not text:
         return False
     climate_hit = any(term in text for term in ("기후위기", "이상기후", "우박", "집중호우", "폭염"))
-    crop_hits = count_any(text, [w.lower() for w in ("사과", "과수", "농가", "원예", "채소", "시설하우스")])
-    response_hits = count_any(text, [w.lower() for w in ("스마트농업", "대응", "피해", "예방", "관리", "리스크", "위기")])
+    crop_hits = count_any(text, _lowered_terms(("사과", "과수", "농가", "원예", "채소", "시설하우스")))
+    response_hits = count_any(text, _lowered_terms(("스마트농업", "대응", "피해", "예방", "관리", "리스크", "위기")))
     return climate_hit and crop_hits >= 1 and response_hits >= 1
 
 
@@ -36406,7 +36654,7 @@ def _refill_pest_diversity_gap_from_raw(
     pest_items = [article for article in (final_by_section.get("pest") or []) if isinstance(article, Article)]
     if not pest_items:
         return 0
-    pest_conf = next((s for s in SECTIONS if s.get("key") == "pest"), {})
+    pest_conf = SECTION_CONF_BY_KEY.get("pest", {})
     existing_keys = {
         _article_selection_identity(article)
         for article in pest_items
@@ -36543,15 +36791,15 @@ def _relaxed_preferred_gap_rank(article: Article, section_key: str, conf: JsonDi
     text = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
     supply_price_issue = section_key == "supply" and count_any(
         text,
-        [w.lower() for w in ("가격", "값", "폭락", "하락", "수급", "출하", "시세", "생산량", "소비 촉진")],
+        _lowered_terms(("가격", "값", "폭락", "하락", "수급", "출하", "시세", "생산량", "소비 촉진")),
     ) >= 1
     policy_action_issue = section_key == "policy" and count_any(
         text,
-        [w.lower() for w in ("정부", "농식품부", "농진청", "지원", "관세", "할당관세", "정책", "대책", "재배면적", "보조", "수입 농산물")],
+        _lowered_terms(("정부", "농식품부", "농진청", "지원", "관세", "할당관세", "정책", "대책", "재배면적", "보조", "수입 농산물")),
     ) >= 2
     dist_ops_issue = section_key == "dist" and count_any(
         text,
-        [w.lower() for w in ("경매", "공판장", "도매", "출하", "산지", "유통", "공급", "판매", "선적")],
+        _lowered_terms(("경매", "공판장", "도매", "출하", "산지", "유통", "공급", "판매", "선적")),
     ) >= 2
     pest_issue = section_key == "pest" and (_is_pest_direct_gap_story(article) or _is_pest_diversity_fallback_story(article))
     return (
@@ -36778,7 +37026,7 @@ def _is_supply_editorial_weak_tail(article: Article) -> bool:
     )
     preferred_market_hits = count_any(
         text_l,
-        [w.lower() for w in ("가격", "값", "수급", "출하", "생산량", "공급과잉", "하락", "수매", "제값", "수출길", "약세")],
+        _lowered_terms(("가격", "값", "수급", "출하", "생산량", "공급과잉", "하락", "수매", "제값", "수출길", "약세")),
     )
     preferred_market_exception = bool(
         preferred_reason == "supply_weak_preferred_tail"
@@ -36800,56 +37048,56 @@ def _is_supply_editorial_weak_tail(article: Article) -> bool:
         "supply_local_launch_preferred_tail",
     } and not preferred_market_exception:
         return True
-    if count_any(title_l, [w.lower() for w in ("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술")]) >= 1:
+    if count_any(title_l, _lowered_terms(("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술"))) >= 1:
         return True
     if (
-        count_any(text_l, [w.lower() for w in ("양액 냉각기", "수경재배 냉각", "장비 점검")]) >= 1
+        count_any(text_l, _lowered_terms(("양액 냉각기", "수경재배 냉각", "장비 점검"))) >= 1
         and not _is_supply_climate_output_context(article.title or "", article.description or "")
         and count_any(
             text_l,
-            [w.lower() for w in ("가격", "값", "수급", "경락", "반입", "출하량", "생산량", "작황")],
+            _lowered_terms(("가격", "값", "수급", "경락", "반입", "출하량", "생산량", "작황")),
         ) <= 1
     ):
         return True
     machine_hits = count_any(
         text_l,
-        [w.lower() for w in ("기계화", "기계로", "기계가 척척", "수집기", "기술 공개", "기술 선보여", "장비 보급", "작업 기계", "전 과정 기계", "파종부터 수확")],
+        _lowered_terms(("기계화", "기계로", "기계가 척척", "수집기", "기술 공개", "기술 선보여", "장비 보급", "작업 기계", "전 과정 기계", "파종부터 수확")),
     )
     market_hits = count_any(
         text_l,
-        [w.lower() for w in ("가격", "값", "수급", "출하", "생산량", "공급과잉", "하락", "수매", "제값", "수출길")],
+        _lowered_terms(("가격", "값", "수급", "출하", "생산량", "공급과잉", "하락", "수매", "제값", "수출길")),
     )
     if machine_hits >= 1 and market_hits <= 1:
         return True
     if (
-        count_any(title_l, [w.lower() for w in ("해법 찾는다", "토론회", "대책 논의")]) >= 1
-        and count_any(text_l, [w.lower() for w in ("국회 토론회", "토론회", "농협", "생산자단체", "대책 마련")]) >= 1
+        count_any(title_l, _lowered_terms(("해법 찾는다", "토론회", "대책 논의"))) >= 1
+        and count_any(text_l, _lowered_terms(("국회 토론회", "토론회", "농협", "생산자단체", "대책 마련"))) >= 1
         and "수출길" not in text_l
     ):
         return True
-    if count_any(text_l, [w.lower() for w in ("상생마케팅 후원금", "가공용 수매 지원", "못난이 매실")]) >= 1:
+    if count_any(text_l, _lowered_terms(("상생마케팅 후원금", "가공용 수매 지원", "못난이 매실"))) >= 1:
         return True
     if count_any(
         text_l,
-        [w.lower() for w in ("물류기자재", "기자재", "후원금", "4천만원", "생산 안정", "생산안정")],
+        _lowered_terms(("물류기자재", "기자재", "후원금", "4천만원", "생산 안정", "생산안정")),
     ) >= 1 and market_hits <= 1:
         return True
-    if count_any(text_l, [w.lower() for w in ("공동구매", "농심천심", "상생 구매", "행사를 개최")]) >= 2 and market_hits <= 2:
+    if count_any(text_l, _lowered_terms(("공동구매", "농심천심", "상생 구매", "행사를 개최"))) >= 2 and market_hits <= 2:
         return True
-    if count_any(title_l, [w.lower() for w in ("축제", "거리축제")]) >= 1:
+    if count_any(title_l, _lowered_terms(("축제", "거리축제"))) >= 1:
         return True
     if count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "나눔 행사", "나눔행사", "공동 기부", "할인 행사", "할인행사",
             "소비 촉진", "소비촉진", "농가 돕기", "사주기 운동",
-        )],
+        )),
     ) >= 1:
         return True
-    if count_any(title_l, [w.lower() for w in ("본격 출하", "첫 출하")]) >= 1:
+    if count_any(title_l, _lowered_terms(("본격 출하", "첫 출하"))) >= 1:
         strong_market_hits = count_any(
             title_l,
-            [w.lower() for w in ("가격", "수급", "생산량", "공급", "경락", "도매", "시장격리", "수매")],
+            _lowered_terms(("가격", "수급", "생산량", "공급", "경락", "도매", "시장격리", "수매")),
         )
         if strong_market_hits <= 0:
             return True
@@ -36862,22 +37110,22 @@ def _is_supply_editorial_weak_core(article: Article) -> bool:
     text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
     support_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "물류기자재", "기자재", "농자재", "자재 지원", "후원금", "4천만원",
             "생산기반", "생산 안정", "생산안정", "상생마케팅",
-        )],
+        )),
     )
     market_hits = count_any(
         text_l,
-        [w.lower() for w in ("가격", "값", "수급", "경락", "도매", "반입", "생산량", "작황", "폭락", "약세", "하락", "시장격리", "수매")],
+        _lowered_terms(("가격", "값", "수급", "경락", "도매", "반입", "생산량", "작황", "폭락", "약세", "하락", "시장격리", "수매")),
     )
     pest_care_hits = count_any(
         text_l,
-        [w.lower() for w in ("병해", "방제", "예찰", "과수화상병", "탄저병", "무름병", "배수", "묘판", "방충망")],
+        _lowered_terms(("병해", "방제", "예찰", "과수화상병", "탄저병", "무름병", "배수", "묘판", "방충망")),
     )
     promo_hits = count_any(
         _nfkc_lower(article.title or ""),
-        [w.lower() for w in ("축제", "거리축제", "나눔 행사", "나눔행사", "공동 기부", "할인 행사", "할인행사")],
+        _lowered_terms(("축제", "거리축제", "나눔 행사", "나눔행사", "공동 기부", "할인 행사", "할인행사")),
     )
     return (
         (support_hits >= 1 and market_hits <= 1)
@@ -36910,57 +37158,57 @@ def _is_supply_editorial_market_replacement(article: Article) -> bool:
         )
         and count_any(
             text_l,
-            [w.lower() for w in ("가격", "값", "수급", "출하", "생산량", "공급과잉", "하락", "수매", "제값", "수출길", "약세")],
+            _lowered_terms(("가격", "값", "수급", "출하", "생산량", "공급과잉", "하락", "수매", "제값", "수출길", "약세")),
         ) >= 2
     )
     if preferred_reason and not preferred_market_exception:
         return False
-    if count_any(title_l, [w.lower() for w in ("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술")]) >= 1:
+    if count_any(title_l, _lowered_terms(("로컬푸드 이야기", "발효와 가공", "시간을 파는 기술"))) >= 1:
         return False
     if (
-        count_any(text_l, [w.lower() for w in ("양액 냉각기", "수경재배 냉각", "장비 점검")]) >= 1
+        count_any(text_l, _lowered_terms(("양액 냉각기", "수경재배 냉각", "장비 점검"))) >= 1
         and not _is_supply_climate_output_context(title, desc)
         and count_any(
             text_l,
-            [w.lower() for w in ("가격", "값", "수급", "경락", "반입", "출하량", "생산량", "작황")],
+            _lowered_terms(("가격", "값", "수급", "경락", "반입", "출하량", "생산량", "작황")),
         ) <= 1
     ):
         return False
-    if count_any(title_l, [w.lower() for w in (
+    if count_any(title_l, _lowered_terms((
         "효능", "건강", "레시피", "축제", "행사", "원조 주장", "첫 출하", "기능성",
         "농가 돕기", "사주기 운동",
-    )]) >= 1:
+    ))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("직거래장터", "직거래 장터", "오세요", "농특세", "농어촌특별세", "농어촌기본소득")]) >= 1:
+    if count_any(text_l, _lowered_terms(("직거래장터", "직거래 장터", "오세요", "농특세", "농어촌특별세", "농어촌기본소득"))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("저온유통", "산지 유통", "유통 경쟁력", "농협몰", "디지털 전환")]) >= 1:
+    if count_any(text_l, _lowered_terms(("저온유통", "산지 유통", "유통 경쟁력", "농협몰", "디지털 전환"))) >= 1:
         return False
     if count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "화장품", "뷰티", "맛집", "관광", "거리축제", "서한문 발송",
             "삼성", "lg", "반도체", "기판", "효소", "저당", "식이섬유", "제품 출시",
             "커피", "음료", "닭가슴살", "건강 플랫폼",
             "상생마케팅 후원금",
             "소비 할인", "판촉", "저렴하게 구매", "최대 30%", "최대 23%", "제철 맞은",
-        )],
+        )),
     ) >= 1:
         return False
     managed_count = int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     aggregate_vegetable_market = bool(
         ("월동채소" in title_l or "채소류" in title_l)
-        and count_any(text_l, [w.lower() for w in ("가격", "수급", "생산량", "하락", "약세")]) >= 2
+        and count_any(text_l, _lowered_terms(("가격", "수급", "생산량", "하락", "약세"))) >= 2
     )
     if managed_count <= 0 and not aggregate_vegetable_market and best_horti_score(title, desc) < 1.6:
         return False
     market_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격", "값", "수급", "출하", "생산량", "작황", "공급과잉", "하락", "급증",
             "수매", "시장격리", "제값", "수출길", "수출", "소비촉진", "약세", "부진",
-        )],
+        )),
     )
-    if count_any(text_l, [w.lower() for w in ("생산량 급증", "가격은 전년보다 하락", "가격 하락", "전년보다 하락", "소비 부진", "배추값", "배추 값", "넉달째 약세")]) >= 1:
+    if count_any(text_l, _lowered_terms(("생산량 급증", "가격은 전년보다 하락", "가격 하락", "전년보다 하락", "소비 부진", "배추값", "배추 값", "넉달째 약세"))) >= 1:
         return True
     return market_hits >= 2
 
@@ -36976,11 +37224,11 @@ def _supply_editorial_market_rank(article: Article, conf: JsonDict) -> tuple[Any
         pass
     high_signal = count_any(
         text_l,
-        [w.lower() for w in ("가격 역전", "값 역전", "수급", "공급과잉", "수매", "제값", "수출길", "생산량 급증", "소비 부진", "배추값", "배추 값", "약세")],
+        _lowered_terms(("가격 역전", "값 역전", "수급", "공급과잉", "수매", "제값", "수출길", "생산량 급증", "소비 부진", "배추값", "배추 값", "약세")),
     )
     market_hits = count_any(
         text_l,
-        [w.lower() for w in ("가격", "값", "수급", "출하", "생산량", "하락", "수매", "제값", "수출길", "소비촉진", "약세", "부진")],
+        _lowered_terms(("가격", "값", "수급", "출하", "생산량", "하락", "수매", "제값", "수출길", "소비촉진", "약세", "부진")),
     )
     return (
         high_signal,
@@ -37006,10 +37254,10 @@ def _is_supply_publish_wrong_section_noise(article: Article) -> bool:
         return True
     return count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "삼계탕", "냉면", "외식비", "4인가족", "보신탕", "개고기", "흑염소",
             "맛집", "레시피", "요리", "먹방",
-        )],
+        )),
     ) >= 1
 
 
@@ -37026,7 +37274,7 @@ def _replace_supply_editorial_weak_tail_from_raw(
     ]
     if not victim_indexes:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+    conf = SECTION_CONF_BY_KEY.get("supply", {})
     ranked: list[tuple[tuple[Any, ...], Article]] = []
     existing_keys = {_article_selection_identity(article) for article in items if _article_selection_identity(article)}
     for source_section in ("supply", "dist", "policy"):
@@ -37129,7 +37377,7 @@ def _is_policy_editorial_weak_tail(article: Article) -> bool:
         preferred_reason == "policy_anchorless_preferred_tail"
         and count_any(
             text_l,
-            [w.lower() for w in ("국가책임농정", "예산", "법제화", "농특세", "가격 안정", "식량안보법")],
+            _lowered_terms(("국가책임농정", "예산", "법제화", "농특세", "가격 안정", "식량안보법")),
         ) >= 2
     )
     if preferred_reason in {
@@ -37151,63 +37399,63 @@ def _is_policy_editorial_weak_tail(article: Article) -> bool:
         return True
     advocacy_hits = count_any(
         title_l,
-        [w.lower() for w in ("보장하라", "촉구", "기자회견", "한목소리", "대책 마련하라", "요구했다", "요구해")],
+        _lowered_terms(("보장하라", "촉구", "기자회견", "한목소리", "대책 마련하라", "요구했다", "요구해")),
     )
     execution_hits = count_any(
         text_l,
-        [w.lower() for w in ("시행", "집행", "예산 확정", "비축물량", "방출", "법안 통과", "개정안 의결", "지원 결정")],
+        _lowered_terms(("시행", "집행", "예산 확정", "비축물량", "방출", "법안 통과", "개정안 의결", "지원 결정")),
     )
     if advocacy_hits >= 1 and execution_hits <= 0:
         return True
-    if count_any(title_l, [w.lower() for w in ("계절노동자", "계절근로자")]) >= 1 and execution_hits <= 0:
+    if count_any(title_l, _lowered_terms(("계절노동자", "계절근로자"))) >= 1 and execution_hits <= 0:
         return True
-    if "농어촌 기본소득 효과" in title_l and count_any(title_l, [w.lower() for w in ("이사 가자", "귀촌")]) >= 1:
+    if "농어촌 기본소득 효과" in title_l and count_any(title_l, _lowered_terms(("이사 가자", "귀촌"))) >= 1:
         return True
-    if count_any(title_l, [w.lower() for w in ("접수 시작", "지원사업 접수", "신청 접수")]) >= 1:
+    if count_any(title_l, _lowered_terms(("접수 시작", "지원사업 접수", "신청 접수"))) >= 1:
         return True
-    if count_any(text_l, [w.lower() for w in ("일손돕기", "일손 돕기", "농촌일손", "농촌 일손", "농가 일손", "마늘농가 일손")]) >= 1:
+    if count_any(text_l, _lowered_terms(("일손돕기", "일손 돕기", "농촌일손", "농촌 일손", "농가 일손", "마늘농가 일손"))) >= 1:
         return True
     if "도시 농축협" in title_l or "무이자자금" in title_l:
         return True
-    if count_any(title_l, [w.lower() for w in ("로컬푸드직매장", "푸드센터", "장바구니 물가", "최대 23% 할인", "제철기획전", "최대 30% 할인", "농사랑")]) >= 1:
+    if count_any(title_l, _lowered_terms(("로컬푸드직매장", "푸드센터", "장바구니 물가", "최대 23% 할인", "제철기획전", "최대 30% 할인", "농사랑"))) >= 1:
         return True
-    if count_any(title_l, [w.lower() for w in ("가계 물가충격", "월 44만원 적자", "하위 20%")]) >= 1:
+    if count_any(title_l, _lowered_terms(("가계 물가충격", "월 44만원 적자", "하위 20%"))) >= 1:
         direct_policy_hits = count_any(
             title_l,
-            [w.lower() for w in ("농산물", "농식품", "수급", "농가", "지원", "대책", "비료", "정산", "납품대금")],
+            _lowered_terms(("농산물", "농식품", "수급", "농가", "지원", "대책", "비료", "정산", "납품대금")),
         )
         if direct_policy_hits <= 0:
             return True
-    if count_any(text_l, [w.lower() for w in ("지역 접수", "접수 기간", "읍·면", "읍면")]) >= 1:
+    if count_any(text_l, _lowered_terms(("지역 접수", "접수 기간", "읍·면", "읍면"))) >= 1:
         return True
-    if count_any(text_l, [w.lower() for w in ("국정과제 이행", "역량 집중", "친환경 유기농업 2배 확대")]) >= 1:
+    if count_any(text_l, _lowered_terms(("국정과제 이행", "역량 집중", "친환경 유기농업 2배 확대"))) >= 1:
         direct_policy_hits = count_any(
             title_l,
-            [w.lower() for w in ("수급", "가격", "농가 부담", "지원", "대책", "법안", "제도", "비료")],
+            _lowered_terms(("수급", "가격", "농가 부담", "지원", "대책", "법안", "제도", "비료")),
         )
         if direct_policy_hits <= 0:
             return True
-    if count_any(text_l, [w.lower() for w in ("기념행사", "기념 행사", "상생 캠페인", "상생캠페인", "소비 촉진 행사", "소비촉진 캠페인")]) >= 1:
+    if count_any(text_l, _lowered_terms(("기념행사", "기념 행사", "상생 캠페인", "상생캠페인", "소비 촉진 행사", "소비촉진 캠페인"))) >= 1:
         direct_policy_hits = count_any(
             title_l,
-            [w.lower() for w in ("수급", "가격", "농가 부담", "지원", "대책", "법안", "제도", "비료", "정산", "납품대금")],
+            _lowered_terms(("수급", "가격", "농가 부담", "지원", "대책", "법안", "제도", "비료", "정산", "납품대금")),
         )
         if direct_policy_hits <= 0:
             return True
-    if count_any(title_l, [w.lower() for w in ("첫 출하", "본격 출하", "햇 감자", "햇감자")]) >= 1:
+    if count_any(title_l, _lowered_terms(("첫 출하", "본격 출하", "햇 감자", "햇감자"))) >= 1:
         direct_policy_hits = count_any(
             text_l,
-            [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "정책", "대책", "제도", "법안", "관세", "예산")],
+            _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "정책", "대책", "제도", "법안", "관세", "예산")),
         )
         if direct_policy_hits <= 0:
             return True
     if count_any(
         text_l,
-        [w.lower() for w in ("물류기자재", "기자재", "후원금", "4천만원", "상생마케팅", "소비촉진", "실천 캠페인", "비료 사용 처방")],
+        _lowered_terms(("물류기자재", "기자재", "후원금", "4천만원", "상생마케팅", "소비촉진", "실천 캠페인", "비료 사용 처방")),
     ) >= 1 or ("대아청과" in text_l and "지원" in text_l):
         direct_policy_hits = count_any(
             text_l,
-            [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "정책", "대책", "제도", "법안", "관세", "예산")],
+            _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "정책", "대책", "제도", "법안", "관세", "예산")),
         )
         if direct_policy_hits <= 0:
             return True
@@ -37230,44 +37478,44 @@ def _is_policy_broad_editorial_replacement(article: Article) -> bool:
         preferred_reason == "policy_anchorless_preferred_tail"
         and count_any(
             text_l,
-            [w.lower() for w in ("국가책임농정", "예산", "법제화", "농특세", "가격 안정", "식량안보법")],
+            _lowered_terms(("국가책임농정", "예산", "법제화", "농특세", "가격 안정", "식량안보법")),
         ) >= 2
     )
     if preferred_reason and not anchor_exception:
         return False
     if _is_policy_structure_issue_replacement(article):
         return True
-    if count_any(text_l, [w.lower() for w in ("일손돕기", "일손 돕기", "농촌일손", "농촌 일손", "농가 일손", "마늘농가 일손")]) >= 1:
+    if count_any(text_l, _lowered_terms(("일손돕기", "일손 돕기", "농촌일손", "농촌 일손", "농가 일손", "마늘농가 일손"))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("성과 포상", "박람회", "축제", "판매량", "첫 출하", "거리축제")]) >= 1:
+    if count_any(text_l, _lowered_terms(("성과 포상", "박람회", "축제", "판매량", "첫 출하", "거리축제"))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("로컬푸드직매장", "푸드센터", "장바구니 물가", "최대 23% 할인", "제철기획전", "최대 30% 할인", "농사랑", "제철 맞은", "저렴하게 구매")]) >= 1:
+    if count_any(text_l, _lowered_terms(("로컬푸드직매장", "푸드센터", "장바구니 물가", "최대 23% 할인", "제철기획전", "최대 30% 할인", "농사랑", "제철 맞은", "저렴하게 구매"))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("국정과제 이행", "역량 집중", "친환경 유기농업 2배 확대")]) >= 1:
+    if count_any(text_l, _lowered_terms(("국정과제 이행", "역량 집중", "친환경 유기농업 2배 확대"))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("기념행사", "기념 행사", "상생 캠페인", "상생캠페인", "소비 촉진 행사", "소비촉진 캠페인", "대아청과", "물류기자재", "4천만원", "실천 캠페인", "비료 사용 처방")]) >= 1:
+    if count_any(text_l, _lowered_terms(("기념행사", "기념 행사", "상생 캠페인", "상생캠페인", "소비 촉진 행사", "소비촉진 캠페인", "대아청과", "물류기자재", "4천만원", "실천 캠페인", "비료 사용 처방"))) >= 1:
         return False
-    if count_any(text_l, [w.lower() for w in ("유통공사·도민 펀드", "유통공사", "도민 펀드")]) >= 1:
+    if count_any(text_l, _lowered_terms(("유통공사·도민 펀드", "유통공사", "도민 펀드"))) >= 1:
         return False
     if count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "샤인머스캣", "훔치", "원조 주장", "코리안 멜론", "일본서 들여온",
             "950억 손실", "소 잃고", "日,", "日 ",
             "외국인 계절근로자", "계절근로자", "농번기 인력난", "추가 입국",
-        )],
+        )),
     ) >= 1:
         return False
     broad_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "정부", "농식품부", "농림축산식품부", "국가책임농정", "농특세", "농어촌기본소득",
             "예산", "법제화", "유통공사", "도민 펀드", "가격 안정", "무기질비료",
-        )],
+        )),
     )
     issue_hits = count_any(
         text_l,
-        [w.lower() for w in ("농산물", "농가", "수급", "가격", "농업", "농촌", "비료", "원예", "과수")],
+        _lowered_terms(("농산물", "농가", "수급", "가격", "농업", "농촌", "비료", "원예", "과수")),
     )
     return broad_hits >= 1 and issue_hits >= 1
 
@@ -37284,11 +37532,11 @@ def _policy_broad_editorial_rank(article: Article, conf: JsonDict) -> tuple[Any,
             fit = 0.0
     national_hits = count_any(
         text_l,
-        [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국가책임농정", "농특세", "농어촌기본소득", "예산", "법제화")],
+        _lowered_terms(("정부", "농식품부", "농림축산식품부", "국가책임농정", "농특세", "농어촌기본소득", "예산", "법제화")),
     )
     structural_hits = count_any(
         text_l,
-        [w.lower() for w in ("유통공사", "도민 펀드", "경쟁력 높여야", "가격 안정")],
+        _lowered_terms(("유통공사", "도민 펀드", "경쟁력 높여야", "가격 안정")),
     )
     structure_issue = _policy_structure_issue_strength(article)
     return (
@@ -37312,7 +37560,7 @@ def _replace_policy_editorial_weak_tail_from_raw(
     victim_indexes = [idx for idx, article in enumerate(items) if _is_policy_editorial_weak_tail(article)]
     if not victim_indexes:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    conf = SECTION_CONF_BY_KEY.get("policy", {})
     ranked: list[tuple[tuple[Any, ...], Article]] = []
     existing_keys = {_article_selection_identity(article) for article in items if _article_selection_identity(article)}
     for source_section in ("policy", "supply"):
@@ -37342,10 +37590,10 @@ def _replace_policy_editorial_weak_tail_from_raw(
             if _section_replacement_conflicts(candidate, final_by_section, "policy", items, replace_idx):
                 candidate_text = _nfkc_lower(f"{candidate.title or ''} {candidate.description or ''}")
                 strong_execution = bool(
-                    count_any(candidate_text, [w.lower() for w in ("정부", "농식품부", "농림축산식품부")]) >= 1
+                    count_any(candidate_text, _lowered_terms(("정부", "농식품부", "농림축산식품부"))) >= 1
                     and count_any(
                         candidate_text,
-                        [w.lower() for w in ("비축", "방출", "시행", "집행", "지원", "수급 안정", "예산 확정")],
+                        _lowered_terms(("비축", "방출", "시행", "집행", "지원", "수급 안정", "예산 확정")),
                     ) >= 2
                 )
                 if not strong_execution or _section_replacement_identity_or_title_conflicts(candidate, items, replace_idx):
@@ -37390,11 +37638,11 @@ def _policy_structure_issue_strength(article: Article) -> int:
     if not isinstance(article, Article):
         return 0
     text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
-    if count_any(text_l, [w.lower() for w in ("샤인머스캣", "유통공사", "도민 펀드", "입맛 공략")]) >= 1:
+    if count_any(text_l, _lowered_terms(("샤인머스캣", "유통공사", "도민 펀드", "입맛 공략"))) >= 1:
         return 0
-    if count_any(text_l, [w.lower() for w in ("못난이 매실", "가공용 수매", "상생마케팅", "소비촉진", "제값받기", "직거래장터", "직거래 장터", "첫 출하", "기능성")]) >= 1:
+    if count_any(text_l, _lowered_terms(("못난이 매실", "가공용 수매", "상생마케팅", "소비촉진", "제값받기", "직거래장터", "직거래 장터", "첫 출하", "기능성"))) >= 1:
         return 0
-    if count_any(text_l, [w.lower() for w in ("양파산업 위기", "양파 산업 위기")]) >= 1:
+    if count_any(text_l, _lowered_terms(("양파산업 위기", "양파 산업 위기"))) >= 1:
         return 4
     if "수출길 넓히고" in text_l:
         return 3
@@ -37419,11 +37667,11 @@ def _replace_policy_weak_tail_with_structure_issue_from_raw(
     victim_indexes = [
         idx for idx, article in enumerate(items)
         if _is_policy_editorial_weak_tail(article)
-        or count_any(_nfkc_lower(article.title or ""), [w.lower() for w in ("유통공사", "도민 펀드", "시설하우스", "로컬푸드직매장", "푸드센터", "제철기획전", "농사랑")]) >= 1
+        or count_any(_nfkc_lower(article.title or ""), _lowered_terms(("유통공사", "도민 펀드", "시설하우스", "로컬푸드직매장", "푸드센터", "제철기획전", "농사랑"))) >= 1
     ]
     if not victim_indexes:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    conf = SECTION_CONF_BY_KEY.get("policy", {})
     existing_keys = {_article_selection_identity(article) for article in items if _article_selection_identity(article)}
     candidates: list[tuple[tuple[Any, ...], Article]] = []
     for source_section in ("policy", "supply"):
@@ -37506,10 +37754,10 @@ def _is_dist_editorial_promo_tail(article: Article) -> bool:
         any(term in title_l for term in ("나눔행사", "할인판매", "농가 돕기", "소비 활성화 행사"))
         and count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "수매", "선별", "공판장", "도매시장", "온라인도매시장",
                 "정산", "미수금", "물류", "처리량",
-            )],
+            )),
         ) == 0
     ):
         return True
@@ -37517,10 +37765,10 @@ def _is_dist_editorial_promo_tail(article: Article) -> bool:
         any(term in title_l for term in ("완판", "주민 호응"))
         and count_any(
             title_l,
-            [w.lower() for w in (
+            _lowered_terms((
                 "수매", "선별", "공판장", "도매시장", "온라인도매시장", "직거래",
                 "정산", "미수금", "물류", "처리량", "산지특송", "도달 시간",
-            )],
+            )),
         ) == 0
     ):
         return True
@@ -37544,46 +37792,46 @@ def _is_dist_editorial_promo_tail(article: Article) -> bool:
         return True
     promo_hits = count_any(
         text_l,
-        [w.lower() for w in ("출하식", "입맛 공략", "판촉", "브랜드", "고당도", "당도", "판매 촉진", "엄선", "관광기념품", "박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스", "인기몰이")],
+        _lowered_terms(("출하식", "입맛 공략", "판촉", "브랜드", "고당도", "당도", "판매 촉진", "엄선", "관광기념품", "박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스", "인기몰이")),
     )
     support_promo_hits = count_any(
         text_l,
-        [w.lower() for w in ("물류기자재", "기자재", "후원금", "4천만원", "생산 안정", "생산안정", "상생마케팅", "소비촉진")],
+        _lowered_terms(("물류기자재", "기자재", "후원금", "4천만원", "생산 안정", "생산안정", "상생마케팅", "소비촉진")),
     )
     ops_hits = count_any(
         text_l,
-        [w.lower() for w in ("도매시장", "공판장", "경매", "경락", "반입", "저온유통", "산지 유통", "수출길", "수출", "검역", "선적", "농협몰", "디지털 전환")],
+        _lowered_terms(("도매시장", "공판장", "경매", "경락", "반입", "저온유통", "산지 유통", "수출길", "수출", "검역", "선적", "농협몰", "디지털 전환")),
     )
     weak_activity_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "지원금", "지원금 전달", "기부", "후원", "견학", "방문", "놀랍다",
             "사업 수주", "협력 결실", "홍보", "판매 총력전",
-        )],
+        )),
     )
     hard_operation_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "톤백", "수매", "선별", "처리물량", "처리 물량", "반입량", "경락가",
             "경매시간", "경매 시각", "휴업", "운영 변경", "해킹", "보안",
             "출하정보", "출하 정보", "운송비 절감", "정산", "가동률",
-        )],
+        )),
     )
     title_weak_activity_hits = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "지원", "기부", "후원", "견학", "방문", "놀랍다", "사업 수주",
             "협력 결실", "홍보", "판매 총력전", "선보여", "유치 나섰다",
             "유치에 나섰다", "건의", "국비 확보 총력", "본격 판매",
-        )],
+        )),
     )
     title_hard_operation_hits = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "톤백", "수매", "선별", "처리물량", "반입량", "경락가", "경매시간",
             "경매 시각", "휴업", "운영 변경", "해킹", "보안", "출하정보",
             "운송비 절감", "정산", "가동률",
-        )],
+        )),
     )
     if title_weak_activity_hits >= 1 and title_hard_operation_hits <= 0:
         return True
@@ -37593,9 +37841,9 @@ def _is_dist_editorial_promo_tail(article: Article) -> bool:
         return True
     if "관광기념품" in text_l or "관광 기념품" in text_l:
         return True
-    if count_any(text_l, [w.lower() for w in ("박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스", "클릭 한 번", "인기몰이")]) >= 1:
+    if count_any(text_l, _lowered_terms(("박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스", "클릭 한 번", "인기몰이"))) >= 1:
         return True
-    return count_any(title_l, [w.lower() for w in ("본격 출하", "첫 출하")]) >= 1 and promo_hits >= 1 and ops_hits <= 0
+    return count_any(title_l, _lowered_terms(("본격 출하", "첫 출하"))) >= 1 and promo_hits >= 1 and ops_hits <= 0
 
 
 def _is_dist_direct_platform_launch_story(article: Article) -> bool:
@@ -37628,7 +37876,7 @@ def _is_dist_market_facility_cooperation_story(article: Article) -> bool:
         and "농협" in title
     )
     channel = any(term in title for term in ("유통 활성화", "유통활성화", "판로", "협력", "맞손"))
-    facility_hits = count_any(text, [w.lower() for w in ("전자경매", "저온창고", "경매장", "거래 현황")])
+    facility_hits = count_any(text, _lowered_terms(("전자경매", "저온창고", "경매장", "거래 현황")))
     commodity_hits = int(_managed_commodity_match_summary(article.title or "", article.description or "").get("count") or 0)
     return bool(actors and channel and facility_hits >= 2 and commodity_hits >= 1)
 
@@ -37669,8 +37917,8 @@ def _is_dist_editorial_ops_replacement(article: Article) -> bool:
     export_growth = _is_dist_export_growth_context(title, desc)
     apc_automation = _is_dist_apc_automation_context(title, desc)
     auction_ops_exception = bool(
-        count_any(title_l, [w.lower() for w in ("경매사", "공판장", "도매시장")]) >= 1
-        and count_any(text_l, [w.lower() for w in ("출하", "경매", "공판장", "경락", "반입")]) >= 2
+        count_any(title_l, _lowered_terms(("경매사", "공판장", "도매시장"))) >= 1
+        and count_any(text_l, _lowered_terms(("출하", "경매", "공판장", "경락", "반입"))) >= 2
     )
     if (
         _is_dist_editorial_promo_tail(article)
@@ -37701,35 +37949,35 @@ def _is_dist_editorial_ops_replacement(article: Article) -> bool:
         return False
     if apc_channel_expansion or direct_platform_launch or market_facility_cooperation or export_growth or apc_automation:
         return True
-    if count_any(text_l, [w.lower() for w in ("축제", "헌혈", "대문어", "소비주간", "판촉 릴레이", "물류기자재", "지원금 전달", "후원금 전달", "생산안정", "생산 안정", "박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스")]) >= 1:
+    if count_any(text_l, _lowered_terms(("축제", "헌혈", "대문어", "소비주간", "판촉 릴레이", "물류기자재", "지원금 전달", "후원금 전달", "생산안정", "생산 안정", "박람회", "온라인 생중계 판매", "생중계 판매", "라이브커머스"))) >= 1:
         return False
     if count_any(
         _nfkc_lower(title),
-        [w.lower() for w in (
+        _lowered_terms((
             "견학", "방문", "놀랍다", "사업 수주", "협력 결실", "커피·음료 트렌드",
             "뉴요커", "플랫폼", "선보여", "지원", "기부", "후원", "유치 나섰다",
             "유치에 나섰다", "건의", "국비 확보 총력", "본격 판매",
-        )],
+        )),
     ) >= 1:
         return False
     ops_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "물류", "저온유통", "산지 유통", "유통망", "농협몰",
             "유통 망", "디지털 전환", "수출길", "수출", "온라인", "직거래",
             "휴업", "시범휴업", "경매시간", "경매 시각", "경매개시", "시장 운영",
             "검역", "선적", "qr코드", "안전 사용 지침", "안전사용 지침",
             "수매", "순회수집", "매입", "선별", "처리량", "산지특송", "도달 시간",
             "경매사", "유통 활성화",
-        )],
+        )),
     )
     agri_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "양파", "매실", "수박", "복숭아", "청도", "제주", "산지",
             "과수", "원예", "고추", "마늘", "샤인머스캣", "도매시장", "공영도매시장",
             "공영 도매시장", "가락시장", "강서시장", "강서 시장", "농협", "청과", "출하조직",
-        )],
+        )),
     ) + int(_managed_commodity_match_summary(title, desc).get("count") or 0)
     return apc_channel_expansion or (ops_hits >= 1 and agri_hits >= 1)
 
@@ -37747,31 +37995,31 @@ def _dist_editorial_ops_rank(article: Article, conf: JsonDict) -> tuple[Any, ...
             fit = 0.0
     hard_ops = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "물류", "저온유통", "산지 유통", "유통망",
             "유통 망", "농협몰", "디지털 전환", "수출길", "수출", "검역",
             "선적", "휴업", "시범휴업", "경매시간", "경매 시각", "qr코드",
             "안전 사용 지침", "수매", "순회수집", "매입", "선별", "처리량",
             "산지특송", "도달 시간", "당일 배송", "경매사", "유통 활성화",
-        )],
+        )),
     )
     title_ops = count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "물류", "저온유통", "산지 유통", "유통망",
             "유통 망", "농협몰", "디지털 전환", "수출길", "수출", "검역",
             "선적", "휴업", "시범휴업", "경매시간", "경매 시각", "qr코드",
             "수매", "순회수집", "매입", "선별", "처리량", "산지특송",
             "도달 시간", "당일 배송", "경매사", "유통 활성화",
-        )],
+        )),
     )
     hard_metric_hits = count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "톤백", "수매", "선별", "처리물량", "처리 물량", "반입량", "경락가",
             "경매시간", "경매 시각", "휴업", "운영 변경", "해킹", "보안",
             "출하정보", "출하 정보", "운송비 절감", "정산", "가동률",
-        )],
+        )),
     )
     return (
         hard_metric_hits,
@@ -37796,7 +38044,7 @@ def _replace_dist_editorial_promo_tail_from_raw(
     victim_indexes = [idx for idx, article in enumerate(items) if _is_dist_editorial_promo_tail(article)]
     if not victim_indexes:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    conf = SECTION_CONF_BY_KEY.get("dist", {})
     ranked: list[tuple[tuple[Any, ...], Article]] = []
     existing_keys = {_article_selection_identity(article) for article in items if _article_selection_identity(article)}
     for source_section in ("dist", "supply"):
@@ -37892,7 +38140,7 @@ def _refill_dist_editorial_ops_gap_from_raw(
     items = [article for article in (final_by_section.get("dist") or []) if isinstance(article, Article)]
     if len(items) >= max_n:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    conf = SECTION_CONF_BY_KEY.get("dist", {})
     raw_count = len(raw_by_section.get("dist", []) or [])
     ranked: list[tuple[tuple[Any, ...], Article]] = []
     for source_section in ("dist", "supply", "policy"):
@@ -37965,7 +38213,7 @@ def _promote_publish_dist_operational_cores(final_by_section: dict[str, list[Art
     items = [article for article in (final_by_section.get("dist") or []) if isinstance(article, Article)]
     if not items:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    conf = SECTION_CONF_BY_KEY.get("dist", {})
     eligible = [
         article
         for article in items
@@ -38022,7 +38270,7 @@ def _promote_publish_supply_market_cores(final_by_section: dict[str, list[Articl
     items = [article for article in (final_by_section.get("supply") or []) if isinstance(article, Article)]
     if not items:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+    conf = SECTION_CONF_BY_KEY.get("supply", {})
     eligible = [
         article
         for article in items
@@ -38271,17 +38519,17 @@ def _is_publish_information_light(article: Article) -> bool:
     text = _publish_editorial_text(article)
     scene_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "바라보고", "둘러보고", "기념촬영", "사진 제공", "표정을", "전광판",
             "현장을 찾", "참석해", "격려했다",
-        )],
+        )),
     )
     action_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격", "수급", "생산량", "출하량", "경락가", "지원 규모", "예산",
             "시행", "확정", "개정", "방제", "발생", "피해", "처리량", "물류비",
-        )],
+        )),
     )
     numeric_facts = len(
         re.findall(
@@ -38316,17 +38564,17 @@ def _is_publish_supply_production_structure_story(article: Article) -> bool:
         crop_focus
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "대체작목", "재배 전환", "재배면적", "생산 기술", "안정 생산",
                 "생산 기반", "작황 전망", "생육 부진",
-            )],
+            )),
         ) >= 1
         and count_any(
             _publish_editorial_text(article),
-            [w.lower() for w in (
+            _lowered_terms((
                 "농업기술원", "농촌진흥청", "농진청", "생산량", "재배면적",
                 "출하량", "수급", "안정 생산", "기술 보급", "실증",
-            )],
+            )),
         ) >= 1
     )
 
@@ -38347,10 +38595,10 @@ def _is_publish_supply_quantified_shipment_story(article: Article) -> bool:
     )
     operations = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "공동선별", "공동 선별", "공동출하", "공동 출하", "공판장",
             "도매시장", "출하 시스템", "분산 출하", "출하 물량", "수도권",
-        )],
+        )),
     )
     return bool(volume_fact and operations >= 2)
 
@@ -38575,11 +38823,11 @@ def _is_publish_stale_reprint(article: Article) -> bool:
         re.search(r"지난달\s*\d{1,2}일", text)
         and count_any(
             text,
-            [w.lower() for w in ("기자회견", "토론회", "간담회", "행사", "협의회", "출하 기념식")],
+            _lowered_terms(("기자회견", "토론회", "간담회", "행사", "협의회", "출하 기념식")),
         ) >= 1
         and count_any(
             title,
-            [w.lower() for w in ("시행", "확정", "신설", "지원", "투입", "유예", "발생", "확산")],
+            _lowered_terms(("시행", "확정", "신설", "지원", "투입", "유예", "발생", "확산")),
         ) == 0
     )
     if stale_event:
@@ -38610,10 +38858,10 @@ def _is_dist_market_cooperation_story(article: Article) -> bool:
     )
     operational_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "경매", "경매인", "출하", "판로", "포장", "선별", "도매시장",
             "공판장", "농가소득", "유통 현장", "협력 체계",
-        )],
+        )),
     )
     return market_title and operational_hits >= 3
 
@@ -38668,17 +38916,17 @@ def _is_high_value_policy_market_opinion_tail(article: Article) -> bool:
     agri_market = any(term in title for term in ("농산물", "농가", "원예", "채소", "과수"))
     distress = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격 폭락", "가격폭락", "시세 침체", "장기 시세 침체", "가격 하락",
             "생산비 폭등", "수급 불안", "농가 경영난",
-        )],
+        )),
     )
     policy_action = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격 안정 대책", "가격안정 대책", "가격안정제", "최저가격",
             "공공수급", "시장격리", "수급 대책", "정부 대책", "대책 시급",
-        )],
+        )),
     )
     return bool(
         opinion
@@ -38697,21 +38945,21 @@ def _is_supply_agritech_research_story(article: Article) -> bool:
     text = _publish_editorial_text(article)
     technology = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "농림위성", "농업위성", "첨단농업", "스마트농업 기술", "농업 r&d",
             "연구개발", "실증 연구", "기술 개발",
-        )],
+        )),
     )
     market_title = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격", "시세", "수급", "출하", "생산량", "작황", "경락", "반입",
             "시장격리", "수매", "공급 부족", "공급과잉",
-        )],
+        )),
     )
     concrete_market_evidence = count_any(
         text,
-        [w.lower() for w in ("도매가격", "경락가", "출하량", "반입량", "수매량", "생산량")],
+        _lowered_terms(("도매가격", "경락가", "출하량", "반입량", "수매량", "생산량")),
     )
     return technology >= 1 and market_title == 0 and concrete_market_evidence == 0
 
@@ -38758,23 +39006,23 @@ def _is_publish_supply_editorial_weak(article: Article) -> bool:
         return True
     if any(term in title for term in ("본격 출하", "첫 출하")) and count_any(
         title,
-        [w.lower() for w in ("가격", "수급", "생산량", "출하량", "경락", "수매", "관측")],
+        _lowered_terms(("가격", "수급", "생산량", "출하량", "경락", "수매", "관측")),
     ) <= 0:
         return True
     if "수매" in title and not re.search(r"\d", title) and count_any(
         title,
-        [w.lower() for w in ("가격", "수급", "톤", "t ", "시장격리", "정부 비축", "전량")],
+        _lowered_terms(("가격", "수급", "톤", "t ", "시장격리", "정부 비축", "전량")),
     ) <= 0:
         return True
     climate_crop_risk = (
         int(_managed_commodity_match_summary(article.title or "", "").get("count") or 0) >= 1
         and count_any(
             title,
-            [w.lower() for w in ("초비상", "버리게", "작황 악화", "생육 부진", "폭염", "장마", "피해")],
+            _lowered_terms(("초비상", "버리게", "작황 악화", "생육 부진", "폭염", "장마", "피해")),
         ) >= 1
         and count_any(
             text,
-            [w.lower() for w in ("가격", "수급", "작황", "생산량", "출하량", "피해", "급등", "하락")],
+            _lowered_terms(("가격", "수급", "작황", "생산량", "출하량", "피해", "급등", "하락")),
         ) >= 1
     )
     if climate_crop_risk:
@@ -38798,17 +39046,17 @@ def _is_non_agri_venture_policy_story(article: Article) -> bool:
     text = _publish_editorial_text(article)
     venture_hits = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "벤처투자", "표준계약서", "rcps", "cps", "사전동의권", "전환우선주",
             "스타트업벤처", "투자계약",
-        )],
+        )),
     )
     agri_hits = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농업", "농가", "농산물", "농식품", "농촌", "원예", "과수", "채소",
             "도매시장", "수급", "영농",
-        )],
+        )),
     )
     return venture_hits >= 2 and agri_hits == 0
 
@@ -38829,10 +39077,10 @@ def _policy_import_management_council_rank(article: Article) -> tuple[Any, ...]:
         1 if any(term in title for term in ("거버넌스 출범", "협의체 출범", "협의체 첫발")) else 0,
         count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "농식품부", "식약처", "관세청", "검역", "통관", "생산자단체",
                 "소비자단체", "중장기", "제도 개선",
-            )],
+            )),
         ),
         float(getattr(article, "score", 0.0) or 0.0),
         _publish_article_effective_fit("policy", article),
@@ -39006,10 +39254,10 @@ def _is_dist_food_safety_check_without_market_ops(article: Article) -> bool:
     food_safety = any(term in title for term in ("잔류농약", "안전성 검사", "안심하고 드세요"))
     market_ops = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "경매", "정산", "물류", "수매", "선별",
             "출하", "반입", "중량 미달", "거래 질서",
-        )],
+        )),
     )
     return food_safety and market_ops == 0
 
@@ -39047,7 +39295,7 @@ def _is_dist_photo_filler_story(article: Article) -> bool:
     hard_metric = re.search(r"\d+(?:\.\d+)?\s*(?:억|만|t|톤|%|건|상자)", title) is not None
     hard_ops = count_any(
         title,
-        [w.lower() for w in ("공동선별", "수출", "선적", "물류", "정산", "처리량", "경락", "경매")],
+        _lowered_terms(("공동선별", "수출", "선적", "물류", "정산", "처리량", "경락", "경매")),
     )
     return bool(
         (implicit_photo and not hard_metric)
@@ -39080,7 +39328,7 @@ def _is_authority_crop_growth_warning(article: Article) -> bool:
             "생육관리", "생육 관리", "장해", "냉해", "침수", "장마",
             "일소", "햇볕 뎀", "햇볕데임", "고온",
         ))
-        and count_any(title, [w.lower() for w in ("주의", "관리", "예방", "대비")]) >= 1
+        and count_any(title, _lowered_terms(("주의", "관리", "예방", "대비"))) >= 1
     )
 
 
@@ -39098,13 +39346,13 @@ def _is_authority_crop_integrated_pest_guidance(article: Article) -> bool:
     ))
     named_risks = count_any(
         text,
-        [w.lower() for w in tuple(_PEST_NAMED_DISEASE_TERMS) + (
+        _lowered_terms(tuple(_PEST_NAMED_DISEASE_TERMS) + (
             "진딧물", "총채벌레", "응애", "노균병", "흰가루병",
-        )],
+        )),
     )
     actions = count_any(
         text,
-        [w.lower() for w in ("예찰", "방제", "등록 약제", "병든 식물체 제거", "통풍")],
+        _lowered_terms(("예찰", "방제", "등록 약제", "병든 식물체 제거", "통풍")),
     )
     return bool(crop_in_title and field_guidance and authority and named_risks >= 2 and actions >= 2)
 
@@ -39114,7 +39362,7 @@ def _is_pest_generic_or_equipment_tail(article: Article) -> bool:
     generic_weather_notice = bool(
         any(term in title for term in ("집중호우 대비", "장마철 농작물 관리", "농작물 관리 철저"))
         and not _has_named_pest_signal(title)
-        and count_any(title, [w.lower() for w in _PEST_NAMED_DISEASE_TERMS]) == 0
+        and count_any(title, _lowered_terms(_PEST_NAMED_DISEASE_TERMS)) == 0
     )
     return generic_weather_notice or any(term in title for term in (
         "주간농사정보", "주간농사메모", "최신 방제기로", "방제장비 지원",
@@ -39202,14 +39450,14 @@ def _is_pest_actionable_weekly_advisory(article: Article) -> bool:
     text = _publish_editorial_text(article)
     named_risks = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "먹노린재", "잎도열병", "역병", "잘록병", "시들음병", "잎마름병",
             "뿌리혹병", "탄저병", "세균성점무늬병",
-        )],
+        )),
     )
     crop_hits = count_any(
         text,
-        [w.lower() for w in ("벼", "콩", "감자", "참깨", "고추", "배추")],
+        _lowered_terms(("벼", "콩", "감자", "참깨", "고추", "배추")),
     )
     return bool(
         "주간농사정보" in title
@@ -39273,7 +39521,7 @@ def _is_supply_quantified_import_substitution_story(article: Article) -> bool:
     return bool(
         any(term in title for term in ("식품 수입액", "수입 식품"))
         and any(term in title for term in ("수입 채소", "채소 급증"))
-        and count_any(title, [w.lower() for w in ("배추", "무", "양파")]) >= 2
+        and count_any(title, _lowered_terms(("배추", "무", "양파"))) >= 2
         and any(term in text for term in ("기후변화", "작황 부진", "가격 폭등", "대체재"))
         and len(re.findall(r"\d+(?:\.\d+)?", text)) >= 3
     )
@@ -39348,7 +39596,7 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
         and normalize_host(article.domain or "") in {"biz.heraldcorp.com", "heraldcorp.com"}
         and count_any(
             title,
-            [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "기재부", "aT", "전담기구")],
+            _lowered_terms(("정부", "농식품부", "농림축산식품부", "기재부", "aT", "전담기구")),
         ) <= 0
     ):
         return True
@@ -39357,7 +39605,7 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
         and any(term in title for term in ("소비촉진", "직거래 행사", "판촉"))
         and count_any(
             title,
-            [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "법안", "예산", "정책")],
+            _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "법안", "예산", "정책")),
         ) == 0
     ):
         return True
@@ -39375,10 +39623,10 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
         ))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "정부", "농식품부", "농림축산식품부", "국회", "법안", "시행령",
                 "조례", "예산", "전국", "광역", "제도", "정책",
-            )],
+            )),
         ) == 0
     )
     if local_field_notice:
@@ -39387,7 +39635,7 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
         any(term in title for term in ("농가 돕기", "사주기 운동", "소비 촉진", "소비촉진"))
         and count_any(
             title,
-            [w.lower() for w in ("정부", "농식품부", "농림축산식품부", "국회", "법안", "예산", "정책")],
+            _lowered_terms(("정부", "농식품부", "농림축산식품부", "국회", "법안", "예산", "정책")),
         ) == 0
     ):
         return True
@@ -39404,7 +39652,7 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
         and re.search(r"\d", title) is not None
         and count_any(
             text,
-            [w.lower() for w in ("농산물", "농축산물", "농축수산물", "먹거리", "계란", "채소", "과일")],
+            _lowered_terms(("농산물", "농축산물", "농축수산물", "먹거리", "계란", "채소", "과일")),
         ) >= 1
     ):
         return False
@@ -39432,17 +39680,17 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
         return True
     if any(term in title for term in ("축산물 가격", "가축 폐사", "축산재해")) and count_any(
         title,
-        [w.lower() for w in ("농산물", "채소", "과일", "원예", "수급 전반")],
+        _lowered_terms(("농산물", "채소", "과일", "원예", "수급 전반")),
     ) <= 0:
         return True
     if any(term in title for term in ("lpg", "천연가스", "발전용 lng")) and count_any(
         title,
-        [w.lower() for w in ("농업", "농가", "농산물", "원예", "면세유")],
+        _lowered_terms(("농업", "농가", "농산물", "원예", "면세유")),
     ) <= 0:
         return True
     if "추경예산" in title and count_any(
         title,
-        [w.lower() for w in ("농업", "농가", "농산물", "원예", "수급", "가격", "농식품")],
+        _lowered_terms(("농업", "농가", "농산물", "원예", "수급", "가격", "농식품")),
     ) <= 0:
         return True
     if any(term in title for term in ("농촌일손 집중지원", "나눔 릴레이")):
@@ -39479,16 +39727,16 @@ def _is_publish_policy_editorial_weak(article: Article) -> bool:
     if (
         count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "농식품부", "농림축산식품부", "정부", "기재부", "공정위", "aT",
-            )],
+            )),
         ) >= 1
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "수급 점검", "비축", "할당관세", "미수금", "금융지원", "전담기구",
                 "비관세장벽", "시행", "확정", "신설", "수급 안정", "실행계획", "수립",
-            )],
+            )),
         ) >= 1
     ):
         return False
@@ -39550,27 +39798,27 @@ def _is_publish_dist_editorial_weak(article: Article) -> bool:
         and any(term in text for term in ("농가 공급", "재배 농가", "보급", "전량 공급"))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "도매시장", "공판장", "경매", "산지유통", "apc", "물류", "수출",
                 "온라인도매시장", "판매", "계약", "정산", "선별",
-            )],
+            )),
         ) == 0
     )
     if production_input_delivery:
         return True
     if (
-        count_any(title, [w.lower() for w in ("경매사", "공판장", "도매시장")]) >= 1
-        and count_any(text, [w.lower() for w in ("출하", "경매", "공판장", "경락", "반입")]) >= 2
+        count_any(title, _lowered_terms(("경매사", "공판장", "도매시장"))) >= 1
+        and count_any(text, _lowered_terms(("출하", "경매", "공판장", "경락", "반입"))) >= 2
     ):
         return False
     if (
         any(term in title for term in ("나눔행사", "할인판매", "농가 돕기", "소비 활성화 행사"))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "수매", "선별", "공판장", "도매시장", "온라인도매시장",
                 "정산", "미수금", "물류", "처리량",
-            )],
+            )),
         ) == 0
     ):
         return True
@@ -39578,16 +39826,16 @@ def _is_publish_dist_editorial_weak(article: Article) -> bool:
         any(term in title for term in ("완판", "주민 호응"))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "수매", "선별", "공판장", "도매시장", "온라인도매시장", "직거래",
                 "정산", "미수금", "물류", "처리량", "산지특송", "도달 시간",
-            )],
+            )),
         ) == 0
     ):
         return True
     if any(term in title for term in ("블랙위너", "과일 쇼핑", "품종까지")):
         return True
-    if count_any(title, [w.lower() for w in ("트럼프", "이란", "호르무즈", "화물선 피격")]) >= 1:
+    if count_any(title, _lowered_terms(("트럼프", "이란", "호르무즈", "화물선 피격"))) >= 1:
         return True
     if "생산·구매사 맞춤형 매칭" in title or "농어촌" in title and "판로 열고 식탁물가" in title:
         return True
@@ -39596,9 +39844,9 @@ def _is_publish_dist_editorial_weak(article: Article) -> bool:
         and any(term in title for term in ("선별", "포장"))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "도매시장", "공판장", "물류", "수매", "수출", "정산", "경락", "거래", "apc",
-            )],
+            )),
         ) <= 0
     ):
         return True
@@ -39609,10 +39857,10 @@ def _is_publish_dist_editorial_weak(article: Article) -> bool:
         and any(term in text for term in ("풍년의 역설", "경북도", "소비촉진", "소비 촉진", "소비 활성화"))
         and count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "수매", "선별", "공판장", "도매시장", "온라인도매시장", "정산",
                 "미수금", "물류", "처리량", "산지특송", "도달 시간", "경매",
-            )],
+            )),
         ) == 0
     ):
         return True
@@ -39667,7 +39915,7 @@ def _is_publish_dist_editorial_weak(article: Article) -> bool:
         return True
     if any(term in title for term in ("첫 출하", "본격 출하")) and count_any(
         title,
-        [w.lower() for w in ("경매", "온라인도매시장", "도매시장", "출하량", "계약", "수매")],
+        _lowered_terms(("경매", "온라인도매시장", "도매시장", "출하량", "계약", "수매")),
     ) <= 0:
         return True
     if any(term in title for term in (
@@ -39691,9 +39939,9 @@ def _is_publish_pest_editorial_weak(article: Article) -> bool:
         any(term in title for term in ("[주간 농사 메모]", "[주간농사메모]", "주간 농사메모"))
         and count_any(
             title,
-            [w.lower() for w in tuple(_PEST_NAMED_DISEASE_TERMS) + (
+            _lowered_terms(tuple(_PEST_NAMED_DISEASE_TERMS) + (
                 "과수화상병", "토마토뿔나방", "노린재", "총채벌레", "진딧물",
-            )],
+            )),
         ) == 0
     ):
         return True
@@ -39709,7 +39957,7 @@ def _is_publish_pest_editorial_weak(article: Article) -> bool:
         and any(term in title for term in ("완화", "풀렸다", "해소", "제외", "규제"))
         and count_any(
             title,
-            [w.lower() for w in ("발생", "확산", "피해", "방제", "예찰", "주의", "경보")],
+            _lowered_terms(("발생", "확산", "피해", "방제", "예찰", "주의", "경보")),
         ) == 0
     )
     if export_facilitation:
@@ -39718,25 +39966,25 @@ def _is_publish_pest_editorial_weak(article: Article) -> bool:
         re.match(r"^[가-힣]{2,5}\s*[\(\[]", title)
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "발생", "확산", "피해", "주의", "경보", "긴급", "검역", "합동방제",
-            )],
+            )),
         ) == 0
     )
     if person_profile:
         return True
     title_scope_hits = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "과수화상병", "화상병", "역병", "탄저병", "세균성점무늬병",
             "토마토뿔나방", "노린재", "총채벌레", "진딧물", "돌발해충",
             "풀무치", "메뚜기", "병해충", "토양 소독", "토양소독", "방제", "예찰",
             "갈색무늬병", "점무늬병", "응애", "복합해충", "복합 해충",
-        )],
+        )),
     )
     incidental_body_mention = bool(
         title_scope_hits == 0
-        and count_any(text, [w.lower() for w in ("병해충", "화상병", "방제")]) >= 1
+        and count_any(text, _lowered_terms(("병해충", "화상병", "방제"))) >= 1
     )
     if incidental_body_mention:
         return True
@@ -39748,10 +39996,10 @@ def _is_publish_pest_editorial_weak(article: Article) -> bool:
         and any(term in title for term in ("당부", "재배관리", "관리 요령"))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "과수화상병", "탄저병", "세균성점무늬병", "토마토뿔나방",
                 "노린재", "총채벌레", "진딧물",
-            )],
+            )),
         ) <= 0
     ):
         return True
@@ -39828,25 +40076,25 @@ def _publish_editorial_candidate_rank(section_key: str, article: Article) -> tup
     if section_key == "supply":
         strong = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격", "값", "시세", "수급", "생산량", "재배면적", "출하량", "시장격리",
                 "수매", "공급과잉", "소비 부진", "관측", "폭락", "하락", "급등", "약세",
-            )],
+            )),
         )
         priority = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "월동채소", "채소류 농업관측", "농산물값은 폭락", "히트플레이션",
                 "마늘 8500톤 수매", "여름철 ‘배추값’", "여름철 '배추값'",
                 "농가 '초비상'", "농가 ‘초비상’", "작황 악화", "생육 부진",
                 "늦은장마", "늦은 장마", "출하 몰려", "가격 급락",
-            )],
+            )),
         )
         return (priority, strong, fit, score, press_priority(article.press, article.domain))
     if section_key == "policy":
         priority = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "할당관세", "비축물량", "정부 비축", "수급 점검", "2112만개", "비관세장벽",
                 "가격안정제", "농업 에너지 보조", "홈플러스 미수금", "전담기구",
                 "cptpp", "계절근로자", "정책자금", "상환 1년 유예", "검역",
@@ -39855,21 +40103,21 @@ def _publish_editorial_candidate_rank(section_key: str, article: Article) -> tup
                 "정부비축 국산 콩", "국산 콩", "수급 안정", "실행계획", "주요 농정 현안",
                 "농산물 우수관리 인증", "수입농산물 관리", "수입 농산물 관리", "관리 개선방안",
                 "민·관", "민관",
-            )],
+            )),
         )
         execution = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "정부", "농식품부", "농림축산식품부", "기재부", "국회", "공정위", "aT",
                 "시행", "확정", "신설", "공급", "방출", "지원", "대책", "법안", "예산",
                 "확대", "유예", "행정", "재정", "수립", "대응", "강화", "인증", "공급",
-            )],
+            )),
         )
         return (priority, execution, fit, score, press_priority(article.press, article.domain))
     if section_key == "dist":
         priority = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "해킹", "미수금", "구매상담회", "생산자와 구매사", "직거래", "온라인도매시장",
                 "산지 직거래", "경매시간", "경매개시", "가락시장", "도매시장", "공판장",
                 "apc 자동화", "스마트 apc", "ax 도매시장", "b2b 농산물 도매", "외상거래",
@@ -39879,17 +40127,17 @@ def _publish_editorial_candidate_rank(section_key: str, article: Article) -> tup
                 "톤백", "수매", "순회수집", "매입", "선별", "매입·선별", "농가 부담",
                 "홈플러스", "미정산", "미수금", "납품대금", "상환 1년 유예",
                 "로컬푸드직매장 성공", "경매사 초청", "시범휴업", "유통 활성화",
-            )],
+            )),
         )
         operations = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "도매시장", "공판장", "경매", "직거래", "apc", "산지유통", "물류", "미수금",
                 "자동화", "온라인도매시장", "거래", "수매", "선별", "플랫폼",
                 "매칭", "판로", "공동출하", "로컬푸드", "개장", "출하",
                 "미정산", "납품대금", "정책자금", "상환 유예", "순회수집", "매입",
                 "산지특송", "도달 시간", "당일 배송", "경매사", "유통 활성화",
-            )],
+            )),
         )
         return (priority, operations, fit, score, press_priority(article.press, article.domain))
     if section_key == "pest":
@@ -39897,25 +40145,25 @@ def _publish_editorial_candidate_rank(section_key: str, article: Article) -> tup
         named_family = 1 if family and family != "general_pest" else 0
         escalation = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "확산", "발생", "피해", "위기단계", "경계", "주의보", "경보",
                 "곳 피해", "검역병해충", "제외", "긴급",
-            )],
+            )),
         )
         direct = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "과수화상병", "탄저병", "세균성점무늬병", "토마토뿔나방",
                 "노린재", "돌발해충", "총채벌레", "진딧물", "병해충",
-            )],
+            )),
         )
         response = count_any(
             title,
-            [w.lower() for w in ("방제", "예찰", "검역", "포장관리", "매몰", "긴급 대응")],
+            _lowered_terms(("방제", "예찰", "검역", "포장관리", "매몰", "긴급 대응")),
         )
         authority = count_any(
             _publish_editorial_text(article),
-            [w.lower() for w in ("농업기술원", "농기원", "검역본부", "충북도", "경북도")],
+            _lowered_terms(("농업기술원", "농기원", "검역본부", "충북도", "경북도")),
         )
         opinion_penalty = 1 if any(term in title for term in ("[취재수첩]", "[사설]", "[기고]")) else 0
         return (
@@ -39944,14 +40192,14 @@ def _publish_editorial_victim_priority(section_key: str, article: Article) -> tu
         award_label
         and count_any(
             text,
-            [w.lower() for w in ("부부", "조합원", "대표", "이사", "회장", "공로", "기념 촬영")],
+            _lowered_terms(("부부", "조합원", "대표", "이사", "회장", "공로", "기념 촬영")),
         ) >= 1
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격", "수급", "출하량", "생산량", "지원 규모", "예산", "시행",
                 "경매", "공판장", "물류", "방제", "발생", "피해",
-            )],
+            )),
         ) == 0
     )
     section_mismatch = bool(
@@ -40090,7 +40338,7 @@ def _is_publish_editorial_candidate(section_key: str, article: Article) -> bool:
         and _is_publish_policy_price_package_title(_publish_editorial_title(article))
         and count_any(
             _publish_editorial_text(article),
-            [w.lower() for w in ("농산물", "농축산물", "농축수산물", "먹거리", "채소", "과일")],
+            _lowered_terms(("농산물", "농축산물", "농축수산물", "먹거리", "채소", "과일")),
         ) >= 1
     )
     policy_agri_law_exception = bool(
@@ -40157,21 +40405,21 @@ def _is_publish_editorial_candidate(section_key: str, article: Article) -> bool:
         broad_horti = any(term in title for term in ("농산물", "월동채소", "채소류", "과일", "원예"))
         market_hits = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "가격", "값", "시세", "수급", "생산량", "재배면적", "출하량", "시장격리",
                 "수매", "공급과잉", "소비 부진", "관측", "폭락", "하락", "급등", "약세",
                 "소비촉진",
-            )],
+            )),
         )
         climate_crop_risk = (
             commodity_hits >= 1
             and count_any(
                 title,
-                [w.lower() for w in ("초비상", "버리게", "작황 악화", "생육 부진", "폭염", "장마", "피해")],
+                _lowered_terms(("초비상", "버리게", "작황 악화", "생육 부진", "폭염", "장마", "피해")),
             ) >= 1
             and count_any(
                 _publish_editorial_text(article),
-                [w.lower() for w in ("가격", "수급", "작황", "생산량", "출하량", "피해", "급등", "하락")],
+                _lowered_terms(("가격", "수급", "작황", "생산량", "출하량", "피해", "급등", "하락")),
             ) >= 1
         )
         production_structure_change = _is_publish_supply_production_structure_story(article)
@@ -40202,13 +40450,13 @@ def _is_publish_editorial_candidate(section_key: str, article: Article) -> bool:
             return True
         policy_hits = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "정부", "농식품부", "농림축산식품부", "기재부", "국회", "공정위", "aT",
                 "정책", "대책", "제도", "법안", "예산", "할당관세", "비축", "지원", "수급 점검",
                 "가격안정제", "전담기구", "비관세장벽", "미수금", "수급 안정",
                 "실행계획", "농정", "농경연", "인증", "영농자재", "공급",
                 "수입농산물 관리", "수입 농산물 관리", "관리 개선방안", "민·관", "민관",
-            )],
+            )),
         )
         return (
             policy_hits >= 2
@@ -40250,21 +40498,21 @@ def _is_publish_editorial_candidate(section_key: str, article: Article) -> bool:
             return True
         ops_hits = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "도매시장", "공판장", "경매", "직거래", "apc", "산지유통", "물류", "미수금",
                 "자동화", "온라인도매시장", "거래", "수매", "선별", "플랫폼",
                 "매칭", "판로", "공동출하", "로컬푸드", "개장", "출하",
                 "미정산", "납품대금", "정책자금", "경매사", "유통 활성화",
-            )],
+            )),
         )
         agri_hits = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "농산물", "농식품", "농가", "산지", "배추", "양파", "마늘", "복숭아",
                 "자두", "고추", "포도", "과일", "원예", "가락시장", "가락 시장",
                 "도매시장", "도매 시장", "공판장", "apc",
                 "바나나", "로컬푸드", "농협", "청과", "출하조직",
-            )],
+            )),
         )
         return ops_hits >= 1 and agri_hits >= 1
     if section_key == "pest":
@@ -40273,17 +40521,17 @@ def _is_publish_editorial_candidate(section_key: str, article: Article) -> bool:
         text = _publish_editorial_text(article)
         direct_hits = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "과수화상병", "탄저병", "세균성점무늬병", "토마토뿔나방",
                 "노린재", "돌발해충", "총채벌레", "진딧물", "병해충",
-            )],
+            )),
         )
         action_hits = count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "발생", "확산", "피해", "방제", "예찰", "검역", "주의", "경보",
                 "포장관리", "트랩",
-            )],
+            )),
         )
         return direct_hits >= 1 and action_hits >= 1
     return False
@@ -40352,7 +40600,7 @@ def _publish_pest_core_rank(article: Article) -> tuple[Any, ...]:
     fit = float(getattr(article, "selection_fit_score", 0.0) or 0.0)
     field_risk = count_any(
         title,
-        [w.lower() for w in ("발생", "확산", "피해", "주의", "우려", "경보", "위기단계")],
+        _lowered_terms(("발생", "확산", "피해", "주의", "우려", "경보", "위기단계")),
     )
     domestic_field = not (
         any(term in title for term in ("일본", "日 "))
@@ -40360,21 +40608,21 @@ def _publish_pest_core_rank(article: Article) -> tuple[Any, ...]:
     )
     authority = count_any(
         text,
-        [w.lower() for w in ("농업기술원", "농기원", "검역본부", "충북도", "경북도")],
+        _lowered_terms(("농업기술원", "농기원", "검역본부", "충북도", "경북도")),
     )
     named_pest = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "과수화상병", "화상병", "탄저병", "세균성점무늬병", "토마토뿔나방",
             "노린재", "총채벌레", "진딧물",
-        )],
+        )),
     )
     direct_damage = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "무더기로 죽", "원인 불명", "확산", "피해", "발생", "탄저병",
             "과수화상병", "화상병", "세균성점무늬병", "검역",
-        )],
+        )),
     )
     generic_memo = any(term in title for term in ("주간농사메모", "병해충 발생 여부 수시 예찰"))
     opinion = any(term in title for term in ("[취재수첩]", "[사설]", "[기고]", "[칼럼]"))
@@ -40451,7 +40699,7 @@ def _ensure_publish_policy_official_package_representative(
     replacement = _mark_editorial_replacement(
         best,
         "policy",
-        next((section for section in SECTIONS if section.get("key") == "policy"), {}),
+        SECTION_CONF_BY_KEY.get("policy", {}),
         "policy_official_package_representative",
         "prefer_official_quantified_price_package",
     )
@@ -40466,18 +40714,18 @@ def _policy_nonpackage_replacement_rank(article: Article) -> tuple[Any, ...]:
     text = _publish_editorial_text(article)
     issue_priority = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "밀 재배 면적", "통계치", "농사용 다리", "불법 딱지",
             "화학물질 유출", "보상 못 받아", "계절근로자", "계절노동자",
             "cptpp", "검역 변수", "농산물 가격폭락", "농자재값 폭등",
-        )],
+        )),
     )
     producer_policy = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농가", "농민", "농업인", "농업계", "생산자", "검역", "통계",
             "보상", "행정", "재정", "지원", "대책",
-        )],
+        )),
     )
     return (
         issue_priority,
@@ -40559,7 +40807,7 @@ def _replace_extra_publish_policy_price_package(
         replacement = _mark_editorial_replacement(
             candidates[0],
             "policy",
-            next((section for section in SECTIONS if section.get("key") == "policy"), {}),
+            SECTION_CONF_BY_KEY.get("policy", {}),
             "policy_publish_nonpackage_replacement",
             "replace_duplicate_price_package_with_distinct_policy_issue",
         )
@@ -40577,7 +40825,7 @@ def _publish_article_effective_fit(section_key: str, article: Article) -> float:
     fit = float(getattr(article, "selection_fit_score", 0.0) or 0.0)
     if fit > 0.0:
         return fit
-    conf = next((section for section in SECTIONS if section.get("key") == section_key), {})
+    conf = SECTION_CONF_BY_KEY.get(section_key, {})
     try:
         return float(section_fit_score(article.title or "", article.description or "", conf, article.domain or "", article.press or ""))
     except Exception:
@@ -40690,7 +40938,7 @@ def _replace_publish_overused_domain_same_story(
             replacement = _mark_editorial_replacement(
                 candidates[0][1],
                 section_key,
-                next((section for section in SECTIONS if section.get("key") == section_key), {}),
+                SECTION_CONF_BY_KEY.get(section_key, {}),
                 f"{section_key}_publish_story_domain_diversity_upgrade",
                 "replace_repeated_domain_with_equivalent_story",
             )
@@ -40714,18 +40962,18 @@ def _is_publish_supply_support_program_story(article: Article) -> bool:
     text = _publish_editorial_text(article)
     support_hits = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "농자재 지원", "자재 지원", "영농기자재 지원", "물류·영농기자재",
             "포장용 랩", "그물랩", "출하조직에 농자재", "산지 파트너십",
-        )],
+        )),
     )
     promo_hits = count_any(
         title,
-        [w.lower() for w in ("소비촉진 행사", "착한 소비 캠페인", "사주기 운동", "농가 돕기")],
+        _lowered_terms(("소비촉진 행사", "착한 소비 캠페인", "사주기 운동", "농가 돕기")),
     )
     market_hits = count_any(
         text,
-        [w.lower() for w in ("가격 하락", "가격 폭락", "값 하락", "급락", "수급", "생산량 증가")],
+        _lowered_terms(("가격 하락", "가격 폭락", "값 하락", "급락", "수급", "생산량 증가")),
     )
     return bool(
         support_hits >= 1
@@ -40739,9 +40987,9 @@ def _is_supply_broad_market_price_crash_story(article: Article) -> bool:
     if _is_publish_supply_editorial_weak(article):
         return False
     broad_crop = any(term in text for term in ("농산물", "채소", "여름작물", "배추", "오이", "감자", "파프리카"))
-    flow_hits = count_any(text, [w.lower() for w in ("출하 몰려", "출하", "반입", "물량", "공급")])
-    price_hits = count_any(text, [w.lower() for w in ("가격 급락", "값 급락", "가격 하락", "값 하락", "하락", "급락")])
-    weather_hits = count_any(text, [w.lower() for w in ("늦은장마", "늦은 장마", "장마", "무더위", "폭염")])
+    flow_hits = count_any(text, _lowered_terms(("출하 몰려", "출하", "반입", "물량", "공급")))
+    price_hits = count_any(text, _lowered_terms(("가격 급락", "값 급락", "가격 하락", "값 하락", "하락", "급락")))
+    weather_hits = count_any(text, _lowered_terms(("늦은장마", "늦은 장마", "장마", "무더위", "폭염")))
     return bool(broad_crop and flow_hits >= 1 and price_hits >= 1 and weather_hits >= 1)
 
 
@@ -40814,7 +41062,7 @@ def _replace_publish_supply_support_with_broad_market_crash(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "supply",
-        next((section for section in SECTIONS if section.get("key") == "supply"), {}),
+        SECTION_CONF_BY_KEY.get("supply", {}),
         "supply_publish_broad_market_crash_replacement",
         "replace_support_program_with_broad_price_crash_story",
     )
@@ -40889,7 +41137,7 @@ def _replace_publish_supply_duplicate_with_climate_output(
         key=lambda idx: (
             1 if count_any(
                 _publish_editorial_title(items[idx]),
-                [w.lower() for w in ("소비촉진", "행사", "캠페인", "사주기 운동")],
+                _lowered_terms(("소비촉진", "행사", "캠페인", "사주기 운동")),
             ) >= 1 else 0,
             0 if bool(getattr(items[idx], "is_core", False)) else 1,
             0 - _publish_article_effective_fit("supply", items[idx]),
@@ -40898,7 +41146,7 @@ def _replace_publish_supply_duplicate_with_climate_output(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "supply",
-        next((section for section in SECTIONS if section.get("key") == "supply"), {}),
+        SECTION_CONF_BY_KEY.get("supply", {}),
         "supply_publish_climate_output_replacement",
         "replace_duplicate_regional_response_with_measured_climate_output_story",
     )
@@ -40924,7 +41172,7 @@ def _replace_publish_supply_climate_output_with_multi_price(
         if _is_supply_climate_output_context(article.title or "", article.description or "")
         and count_any(
             _publish_editorial_text(article),
-            [w.lower() for w in ("양액 냉각기", "수경재배", "장비 점검", "신기술 시범사업")],
+            _lowered_terms(("양액 냉각기", "수경재배", "장비 점검", "신기술 시범사업")),
         ) >= 1
     ]
     if not victim_indexes:
@@ -40979,7 +41227,7 @@ def _replace_publish_supply_climate_output_with_multi_price(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "supply",
-        next((section for section in SECTIONS if section.get("key") == "supply"), {}),
+        SECTION_CONF_BY_KEY.get("supply", {}),
         "supply_publish_authoritative_multi_price_replacement",
         "replace_production_technology_tail_with_quantified_national_price_bulletin",
     )
@@ -41013,8 +41261,8 @@ def _is_policy_internal_at_execution_story(article: Article) -> bool:
     text = _publish_editorial_text(article)
     return bool(
         "aT" in (article.title or "")
-        and count_any(title, [w.lower() for w in ("ai 전환", "esg", "실행계획", "경영평가", "경평", "워크숍")]) >= 1
-        and count_any(text, [w.lower() for w in ("경영평가", "워크숍", "개선과제", "대국민 서비스", "업무 혁신")]) >= 1
+        and count_any(title, _lowered_terms(("ai 전환", "esg", "실행계획", "경영평가", "경평", "워크숍"))) >= 1
+        and count_any(text, _lowered_terms(("경영평가", "워크숍", "개선과제", "대국민 서비스", "업무 혁신"))) >= 1
     )
 
 
@@ -41145,7 +41393,7 @@ def _move_publish_market_policy_from_dist_to_policy(
     replacement_policy = _mark_editorial_replacement(
         policy_replacements[0],
         "policy",
-        next((section for section in SECTIONS if section.get("key") == "policy"), {}),
+        SECTION_CONF_BY_KEY.get("policy", {}),
         "policy_publish_market_forecast_reassigned",
         "move_government_market_forecast_story_from_dist",
     )
@@ -41155,7 +41403,7 @@ def _move_publish_market_policy_from_dist_to_policy(
     replacement_dist = _mark_editorial_replacement(
         dist_replacements[0],
         "dist",
-        next((section for section in SECTIONS if section.get("key") == "dist"), {}),
+        SECTION_CONF_BY_KEY.get("dist", {}),
         "dist_publish_garak_market_ops_replacement",
         "backfill_dist_with_garak_market_operations_story",
     )
@@ -41218,7 +41466,7 @@ def _replace_publish_policy_weak_tail_with_market_demand(
         victim_indexes = [
             idx
             for idx, article in enumerate(policy_items)
-            if count_any(_publish_editorial_title(article), [w.lower() for w in ("수입농산물 관리", "수입 농산물 관리", "관리 개선방안")]) >= 1
+            if count_any(_publish_editorial_title(article), _lowered_terms(("수입농산물 관리", "수입 농산물 관리", "관리 개선방안"))) >= 1
         ]
     if not victim_indexes:
         return 0
@@ -41233,7 +41481,7 @@ def _replace_publish_policy_weak_tail_with_market_demand(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "policy",
-        next((section for section in SECTIONS if section.get("key") == "policy"), {}),
+        SECTION_CONF_BY_KEY.get("policy", {}),
         "policy_publish_market_demand_replacement",
         "replace_internal_or_future_tail_with_producer_cost_price_demand",
     )
@@ -41297,7 +41545,7 @@ def _force_publish_market_forecast_into_policy(
                     for idx, article in enumerate(policy_items)
                     if count_any(
                         _publish_editorial_title(article),
-                        [w.lower() for w in ("수입농산물 관리", "수입 농산물 관리", "관리 개선방안")],
+                        _lowered_terms(("수입농산물 관리", "수입 농산물 관리", "관리 개선방안")),
                     ) >= 1
                 ]
             if victim_indexes:
@@ -41311,7 +41559,7 @@ def _force_publish_market_forecast_into_policy(
                 replacement = _mark_editorial_replacement(
                     candidates[0],
                     "policy",
-                    next((section for section in SECTIONS if section.get("key") == "policy"), {}),
+                    SECTION_CONF_BY_KEY.get("policy", {}),
                     "policy_publish_market_forecast_forced",
                     "force_government_market_forecast_story_into_policy",
                 )
@@ -41369,7 +41617,7 @@ def _force_publish_market_forecast_into_policy(
         replacement = _mark_editorial_replacement(
             candidates[0],
             "dist",
-            next((section for section in SECTIONS if section.get("key") == "dist"), {}),
+            SECTION_CONF_BY_KEY.get("dist", {}),
             "dist_publish_policy_forecast_backfill",
             "replace_policy_forecast_left_in_dist_with_distribution_story",
         )
@@ -41524,7 +41772,7 @@ def _replace_publish_dist_extra_onion_exports_with_ops(
         replacement = _mark_editorial_replacement(
             candidates[0],
             "dist",
-            next((section for section in SECTIONS if section.get("key") == "dist"), {}),
+            SECTION_CONF_BY_KEY.get("dist", {}),
             "dist_publish_onion_duplicate_ops_replacement",
             "replace_extra_onion_export_with_market_operations_story",
         )
@@ -41594,7 +41842,7 @@ def _replace_publish_dist_support_promo_with_apc_channel_expansion(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "dist",
-        next((section for section in SECTIONS if section.get("key") == "dist"), {}),
+        SECTION_CONF_BY_KEY.get("dist", {}),
         "dist_publish_apc_channel_expansion_replacement",
         "replace_duplicate_support_handoff_with_measured_apc_channel_shift",
     )
@@ -41696,7 +41944,7 @@ def _replace_publish_dist_weak_tails_with_structural_ops(
         replacement = _mark_editorial_replacement(
             pick,
             "dist",
-            next((section for section in SECTIONS if section.get("key") == "dist"), {}),
+            SECTION_CONF_BY_KEY.get("dist", {}),
             "dist_publish_structural_ops_replacement",
             "replace_event_or_support_tail_with_measured_export_or_apc_automation",
         )
@@ -41807,7 +42055,7 @@ def _replace_publish_pest_weak_tail_with_direct_risk(
         replacement = _mark_editorial_replacement(
             candidates[0],
             "pest",
-            next((section for section in SECTIONS if section.get("key") == "pest"), {}),
+            SECTION_CONF_BY_KEY.get("pest", {}),
             "pest_publish_direct_field_risk_replacement",
             "replace_weak_notice_or_feature_with_direct_field_risk",
         )
@@ -41889,7 +42137,7 @@ def _replace_publish_pest_generic_tail_with_direct_warning(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "pest",
-        next((section for section in SECTIONS if section.get("key") == "pest"), {}),
+        SECTION_CONF_BY_KEY.get("pest", {}),
         "pest_publish_direct_warning_replacement",
         "replace_generic_consultation_or_feature_with_named_weather_disease_warning",
     )
@@ -41978,7 +42226,7 @@ def _replace_publish_pest_feature_tail_with_weekly_advisory(
         replacement = _mark_editorial_replacement(
             pick,
             "pest",
-            next((section for section in SECTIONS if section.get("key") == "pest"), {}),
+            SECTION_CONF_BY_KEY.get("pest", {}),
             "pest_publish_weekly_advisory_replacement",
             "replace_cultivation_feature_tail_with_current_weekly_pest_guidance",
         )
@@ -42037,7 +42285,7 @@ def _replace_publish_pest_unknown_incident_with_locust_outbreak(
     replacement = _mark_editorial_replacement(
         pick,
         "pest",
-        next((section for section in SECTIONS if section.get("key") == "pest"), {}),
+        SECTION_CONF_BY_KEY.get("pest", {}),
         "pest_publish_locust_outbreak_replacement",
         "replace_unknown_cause_incident_with_named_outbreak_and_active_control",
     )
@@ -42055,7 +42303,7 @@ def _is_pest_quantified_control_technology_story(article: Article) -> bool:
     orchard = any(term in text for term in ("만감류", "감귤", "과수", "과원"))
     pest_control = count_any(
         text,
-        [w.lower() for w in ("병해충 방제", "해충 방제", "방제 시간", "방제 효과", "농약 부착률")],
+        _lowered_terms(("병해충 방제", "해충 방제", "방제 시간", "방제 효과", "농약 부착률")),
     )
     quantified = len(re.findall(r"\d+(?:\.\d+)?\s*%", text))
     field_technology = any(term in title for term in ("농약 치기", "방제", "무인방제"))
@@ -42078,7 +42326,7 @@ def _replace_publish_pest_duplicate_warning_with_quantified_control(
         if "고추" in _publish_editorial_text(article)
         and count_any(
             _publish_editorial_text(article),
-            [w.lower() for w in ("탄저병", "세균성점무늬병", "장마철", "고온다습")],
+            _lowered_terms(("탄저병", "세균성점무늬병", "장마철", "고온다습")),
         ) >= 2
     ]
     if len(pepper_indexes) < 2:
@@ -42123,7 +42371,7 @@ def _replace_publish_pest_duplicate_warning_with_quantified_control(
     replacement = _mark_editorial_replacement(
         candidates[0],
         "pest",
-        next((section for section in SECTIONS if section.get("key") == "pest"), {}),
+        SECTION_CONF_BY_KEY.get("pest", {}),
         "pest_publish_quantified_control_diversity_replacement",
         "replace_duplicate_pepper_warning_with_measured_orchard_control_story",
     )
@@ -42138,10 +42386,10 @@ def _publish_core_badge_penalty(section_key: str, article: Article) -> int:
     if section_key == "supply":
         return count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "소비촉진", "공동 기부", "캠페인", "행사", "농자재 지원",
                 "자재 지원", "출하조직에 농자재", "포장용 랩", "사주기 운동",
-            )],
+            )),
         )
     if section_key == "policy":
         if (
@@ -42152,13 +42400,13 @@ def _publish_core_badge_penalty(section_key: str, article: Article) -> int:
             return 0
         return int(
             _is_policy_internal_at_execution_story(article)
-            or count_any(title, [w.lower() for w in ("고랭지 농업의 미래", "미래를 설계하다")]) >= 1
+            or count_any(title, _lowered_terms(("고랭지 농업의 미래", "미래를 설계하다"))) >= 1
             or count_any(
                 title,
-                [w.lower() for w in (
+                _lowered_terms((
                     "물가 안정", "1조 원", "1조원",
                     "수입농산물 관리", "수입 농산물 관리", "관리 개선방안",
-                )],
+                )),
             ) >= 1
         )
     if section_key == "dist":
@@ -42215,10 +42463,10 @@ def _is_publish_high_confidence_core_candidate(section_key: str, article: Articl
             return False
         official_action = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "정부", "농식품부", "농림축산식품부", "국회", "시행", "확정",
                 "확대", "비축", "공급", "유예", "개정", "법안", "예산",
-            )],
+            )),
         ) >= 2
         return bool(official_action and score >= 25.0 and fit >= 3.6)
     if section_key == "pest":
@@ -42233,18 +42481,18 @@ def _is_publish_high_confidence_core_candidate(section_key: str, article: Articl
             return True
         named_pest = count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "과수화상병", "화상병", "탄저병", "세균성점무늬병",
                 "토마토뿔나방", "노린재", "총채벌레", "진딧물",
-            )],
+            )),
         ) >= 1
         direct_risk = count_any(
             title,
-            [w.lower() for w in ("발생", "확산", "피해", "주의", "우려", "경보", "위기단계", "검역")],
+            _lowered_terms(("발생", "확산", "피해", "주의", "우려", "경보", "위기단계", "검역")),
         ) >= 1
         authority_or_field = count_any(
             text,
-            [w.lower() for w in ("농업기술원", "농기원", "검역본부", "농가", "과수원", "재배지")],
+            _lowered_terms(("농업기술원", "농기원", "검역본부", "농가", "과수원", "재배지")),
         ) >= 1
         return bool(named_pest and direct_risk and authority_or_field and (score >= 25.0 or fit >= 3.6))
     return True
@@ -42521,7 +42769,7 @@ def _repair_publish_daily_editorial_floor(
                     and "간담회" in _publish_editorial_title(article)
                     and count_any(
                         _publish_editorial_title(article),
-                        [w.lower() for w in ("처리량", "계약", "수출", "공동선별", "물류", "자동화")],
+                        _lowered_terms(("처리량", "계약", "수출", "공동선별", "물류", "자동화")),
                     ) == 0
                 )
                 or (
@@ -42654,10 +42902,10 @@ def _repair_publish_daily_editorial_floor(
                 1 if _is_publish_high_confidence_core_candidate("pest", article) else 0,
                 count_any(
                     text,
-                    [w.lower() for w in (
+                    _lowered_terms((
                         "병징", "피해과율", "피해 과실", "예방용 살균제",
                         "치료용 살균제", "교호 살포", "7~10일",
-                    )],
+                    )),
                 ),
                 1 if "주의 당부" in title else 0,
                 press_priority(article.press, article.domain),
@@ -42963,10 +43211,10 @@ def is_generic_personnel_digest_context(title: str, desc: str) -> bool:
     )
     direct_agri_action = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "농식품부", "농림축산식품부", "농산물", "농업", "수급", "가격안정",
             "시행", "확정", "법안", "예산", "검역",
-        )],
+        )),
     ) >= 2
     return digest and not direct_agri_action
 
@@ -42979,24 +43227,24 @@ def is_non_agri_foodservice_cost_context(title: str, desc: str) -> bool:
         return False
     menu_hits = count_any(
         ttl,
-        [w.lower() for w in (
+        _lowered_terms((
             "치킨값", "치킨 가격", "튀김유", "올리브유", "삼계탕", "버거",
             "김밥", "편의점", "외식", "메뉴", "도시락",
-        )],
+        )),
     )
     foreign_or_foodservice = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "유럽 폭염", "수입물가", "식품업계", "프랜차이즈", "편의점업계",
             "메뉴 출시", "복날 특수", "외식 가격",
-        )],
+        )),
     )
     farm_market = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농가", "생산자", "산지", "도매시장", "출하량", "경락가", "수급 대책",
             "국내산 농산물", "원예농가",
-        )],
+        )),
     )
     return menu_hits >= 1 and foreign_or_foodservice >= 1 and farm_market == 0
 
@@ -43011,7 +43259,7 @@ def is_foodservice_product_launch_context(title: str, desc: str) -> bool:
     product = any(term in ttl for term in ("버거", "김밥", "도시락", "신메뉴", "메뉴 출시", "한국의 맛"))
     farm_market = count_any(
         text,
-        [w.lower() for w in ("산지 가격", "도매가격", "출하량", "계약재배 물량", "농가 수취가격")],
+        _lowered_terms(("산지 가격", "도매가격", "출하량", "계약재배 물량", "농가 수취가격")),
     )
     return brand and product and farm_market == 0
 
@@ -43038,32 +43286,32 @@ def _is_supply_reader_role_misfit(article: Article) -> bool:
         or any(term in title for term in ("공판사업소 개장", "공판장 개장", "산지공판장 초매식"))
     ) and count_any(
         title,
-        [w.lower() for w in ("가격 전망", "생산량", "재배면적", "수급 전망", "폭락", "급등")],
+        _lowered_terms(("가격 전망", "생산량", "재배면적", "수급 전망", "폭락", "급등")),
     ) == 0:
         return True
     # 제목에는 '가격 지지'가 있어도 본문이 초매식·공판장 행사/APC 운영에
     # 집중하고 실제 가격·생산량 수치가 없으면 공급 시황이 아니라 유통 운영이다.
     if (
         any(term in text for term in ("초매식", "공판장", "경매장", "산지유통센터", "apc"))
-        and count_any(text, [w.lower() for w in ("개최", "경매", "운영", "수매", "선별")]) >= 2
+        and count_any(text, _lowered_terms(("개최", "경매", "운영", "수매", "선별"))) >= 2
         and not re.search(
             r"\d[\d,]*(?:\.\d+)?\s*(?:원대?|원/kg|원/㎏|톤|t|kg|㎏|상자|박스|%)",
             title,
             flags=re.IGNORECASE,
         )
-        and count_any(title, [w.lower() for w in ("생산량", "재배면적", "출하량", "수급 전망", "가격 전망")]) == 0
+        and count_any(title, _lowered_terms(("생산량", "재배면적", "출하량", "수급 전망", "가격 전망"))) == 0
     ):
         return True
     if (
         _is_authority_crop_growth_warning(article)
-        and count_any(title, [w.lower() for w in ("가격", "시세", "수급", "출하량", "생산량", "재배면적", "관측")]) == 0
+        and count_any(title, _lowered_terms(("가격", "시세", "수급", "출하량", "생산량", "재배면적", "관측"))) == 0
     ):
         return True
     if (
         "삼계탕" in title
-        and count_any(text, [w.lower() for w in (
+        and count_any(text, _lowered_terms((
             "농가", "산지", "도매시장", "출하량", "농산물 수급", "원예농가",
-        )]) == 0
+        ))) == 0
     ):
         return True
     if _publish_editorial_event_signature(article) == ("national_agri_price_relief",):
@@ -43087,7 +43335,7 @@ def _is_supply_reader_role_misfit(article: Article) -> bool:
         re.search(r"^[가-힣]{2,8}(?:시|군)[,\s]", title)
         and any(term in title for term in ("기업 함께", "기업과 함께", "기업 협력"))
         and any(term in text for term in ("제값 받는 농업", "판로 지원", "상생"))
-        and count_any(title, [w.lower() for w in ("가격", "경락", "출하량", "생산량", "수급")]) == 0
+        and count_any(title, _lowered_terms(("가격", "경락", "출하량", "생산량", "수급"))) == 0
     ):
         return True
     if _is_policy_stakeholder_market_demand_story(article):
@@ -43100,7 +43348,7 @@ def _is_supply_reader_role_misfit(article: Article) -> bool:
     if (
         any(term in title for term in ("수출", "수출길", "대만 식탁", "해외시장"))
         and any(term in text for term in ("선적", "검역", "판로", "수출액", "시장 진출"))
-        and count_any(title, [w.lower() for w in ("가격", "시세", "수급", "생산량", "작황")]) == 0
+        and count_any(title, _lowered_terms(("가격", "시세", "수급", "생산량", "작황"))) == 0
     ):
         return True
     if (
@@ -43113,7 +43361,7 @@ def _is_supply_reader_role_misfit(article: Article) -> bool:
     if (
         any(term in title for term in ("회장", "장관"))
         and any(term in title for term in ("현장 점검", "수급 점검", "출하 점검", "출하 동향", "찾아"))
-        and count_any(title, [w.lower() for w in ("가격", "출하량", "생산량", "재배면적", "관측")]) == 0
+        and count_any(title, _lowered_terms(("가격", "출하량", "생산량", "재배면적", "관측"))) == 0
     ):
         return True
     if (
@@ -43125,13 +43373,13 @@ def _is_supply_reader_role_misfit(article: Article) -> bool:
     if (
         any(term in text for term in ("신선도유지제", "저장 신선도", "과수저장시설"))
         and any(term in text for term in ("예산군", "지원사업", "보조사업"))
-        and count_any(title, [w.lower() for w in ("가격", "시세", "수급", "출하량", "생산량")]) == 0
+        and count_any(title, _lowered_terms(("가격", "시세", "수급", "출하량", "생산량"))) == 0
     ):
         return True
     if (
-        count_any(title, [w.lower() for w in (
+        count_any(title, _lowered_terms((
             "유류비", "농자재 지원", "자재 지원", "농자재", "농가소득 안전망", "소득 안전망",
-        )]) >= 1
+        ))) >= 1
         and int(_managed_commodity_match_summary(article.title or "", "").get("count") or 0) == 0
     ):
         return True
@@ -43143,8 +43391,8 @@ def _supply_issue_family(article: Article) -> str:
     text = _publish_editorial_text(article)
     if (
         any(term in text for term in ("농업관측", "농업 관측", "농경연", "krei"))
-        and count_any(text, [w.lower() for w in ("여름배추", "배추", "무", "양배추")]) >= 2
-        and count_any(title, [w.lower() for w in ("가격", "값", "전망", "재배면적", "생산량")]) >= 1
+        and count_any(text, _lowered_terms(("여름배추", "배추", "무", "양배추"))) >= 2
+        and count_any(title, _lowered_terms(("가격", "값", "전망", "재배면적", "생산량"))) >= 1
     ):
         return "summer_leaf_root_outlook"
     if (
@@ -43153,15 +43401,15 @@ def _supply_issue_family(article: Article) -> str:
             any(term in title for term in ("과채", "과일류", "과일값"))
             or count_any(
                 text,
-                [w.lower() for w in ("사과", "배", "복숭아", "포도", "참외", "수박")],
+                _lowered_terms(("사과", "배", "복숭아", "포도", "참외", "수박")),
             ) >= 2
         )
-        and count_any(title, [w.lower() for w in ("가격", "값", "전망", "생산량", "출하량")]) >= 1
+        and count_any(title, _lowered_terms(("가격", "값", "전망", "생산량", "출하량"))) >= 1
     ):
         return "krei_fruit_outlook"
     if (
-        count_any(text, [w.lower() for w in ("농산물 가격 폭락", "농산물값 폭락", "농자재값 폭등", "생산비 폭등")]) >= 2
-        and count_any(text, [w.lower() for w in ("농민대회", "기자회견", "성명", "대책 마련", "촉구")]) >= 1
+        count_any(text, _lowered_terms(("농산물 가격 폭락", "농산물값 폭락", "농자재값 폭등", "생산비 폭등"))) >= 2
+        and count_any(text, _lowered_terms(("농민대회", "기자회견", "성명", "대책 마련", "촉구"))) >= 1
     ):
         return "producer_price_crisis_action"
     if (
@@ -43193,10 +43441,10 @@ def _is_cross_day_supply_candidate(article: Article) -> bool:
     broad_horti = any(term in title for term in ("농산물", "과일류", "과채류", "채소류", "월동채소", "여름배추"))
     market = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격", "값", "시세", "수급", "생산량", "재배면적", "출하량", "관측",
             "폭락", "하락", "급등", "약세", "산지폐기", "갈아엎",
-        )],
+        )),
     )
     quantified = bool(re.search(r"\d", text))
     quantified_crop_shipment = bool(
@@ -43207,7 +43455,7 @@ def _is_cross_day_supply_candidate(article: Article) -> bool:
             text,
             flags=re.IGNORECASE,
         )
-        and count_any(text, [w.lower() for w in ("출하", "생산", "농가", "판매", "도매시장", "공판장")]) >= 2
+        and count_any(text, _lowered_terms(("출하", "생산", "농가", "판매", "도매시장", "공판장"))) >= 2
     )
     return bool(
         direct_field_collapse
@@ -43225,7 +43473,7 @@ def _cross_day_supply_rank(article: Article) -> tuple[Any, ...]:
         4 if any(term in title for term in ("농업관측", "가격 전망", "하락 전망", "재배면적")) else 0,
         3 if any(term in title for term in ("폭락", "산지폐기", "갈아엎", "벼랑 끝")) else 0,
         1 if any(term in title for term in ("본격 출하", "첫 출하", "초출하")) and re.search(r"\d", _publish_editorial_text(article)) else 0,
-        count_any(title, [w.lower() for w in ("가격", "값", "수급", "생산량", "출하량", "관측")]),
+        count_any(title, _lowered_terms(("가격", "값", "수급", "생산량", "출하량", "관측"))),
         press_priority(article.press, article.domain),
         _publish_article_effective_fit("supply", article),
         float(getattr(article, "score", 0.0) or 0.0),
@@ -43252,17 +43500,17 @@ def _is_policy_reader_filler(article: Article) -> bool:
         and not (
             count_any(
                 text,
-                [w.lower() for w in (
+                _lowered_terms((
                     "국내 농가", "국내 농산물", "국내 수급", "국내 물가", "국내 가격",
-                )],
+                )),
             ) >= 1
             or (
                 any(term in text for term in ("농식품부", "농림축산식품부"))
                 and count_any(
                     text,
-                    [w.lower() for w in (
+                    _lowered_terms((
                         "국내 대응", "지원 대책", "수급 대책", "물가 대책", "시행", "지원한다",
-                    )],
+                    )),
                 ) >= 1
             )
         )
@@ -43276,25 +43524,25 @@ def _is_policy_reader_filler(article: Article) -> bool:
         return True
     if (
         any(term in title for term in ("거는 기대", "바라는 점", "제언"))
-        and count_any(title, [w.lower() for w in ("시행", "확정", "도입", "발표", "법안", "예산")]) == 0
+        and count_any(title, _lowered_terms(("시행", "확정", "도입", "발표", "법안", "예산"))) == 0
     ):
         return True
     if (
         any(term in title for term in ("케이크", "디저트", "생과일 한가득"))
-        and count_any(title, [w.lower() for w in ("농가", "산지", "도매", "출하", "수급", "정책")]) == 0
+        and count_any(title, _lowered_terms(("농가", "산지", "도매", "출하", "수급", "정책"))) == 0
     ):
         return True
     if (
         any(term in title for term in ("[창간특집]", "[사설]", "[기고]", "[칼럼]"))
         and any(term in text for term in ("내란농정", "국민주권정부", "정권", "정치적"))
-        and count_any(title, [w.lower() for w in ("시행", "확정", "법안", "예산", "도입", "발표")]) == 0
+        and count_any(title, _lowered_terms(("시행", "확정", "법안", "예산", "도입", "발표"))) == 0
     ):
         return True
     if (
         "소비자물가" in title
         and any(term in title for term in ("동향", "대책 없나", "다시 3%", "또 3%"))
         and "장바구니" not in title
-        and count_any(title, [w.lower() for w in ("정부", "농식품부", "물가정책", "현장점검")]) == 0
+        and count_any(title, _lowered_terms(("정부", "농식품부", "물가정책", "현장점검"))) == 0
     ):
         return True
     if (
@@ -43310,7 +43558,7 @@ def _is_policy_reader_filler(article: Article) -> bool:
         )
         and "스마트팜" in title
         and any(term in title for term in ("자율 안전망", "설계", "고도화", "육성"))
-        and count_any(title, [w.lower() for w in ("정부", "농식품부", "법안", "시행", "전국")]) == 0
+        and count_any(title, _lowered_terms(("정부", "농식품부", "법안", "시행", "전국"))) == 0
     ):
         return True
     if (
@@ -43322,25 +43570,25 @@ def _is_policy_reader_filler(article: Article) -> bool:
     if (
         "농협" in title
         and any(term in title for term in ("고강도 쇄신", "농협 대전환", "조직 쇄신"))
-        and count_any(title, [w.lower() for w in ("가격", "수급", "직불", "법안", "시행", "도입")]) == 0
+        and count_any(title, _lowered_terms(("가격", "수급", "직불", "법안", "시행", "도입"))) == 0
     ):
         return True
     if (
         any(term in title for term in ("mou", "업무협약", "전략적 협약"))
         and any(term in text for term in ("농자재 유통사", "민간기업", "대유", "수출계약"))
-        and count_any(title, [w.lower() for w in ("정부", "농식품부", "법안", "정책", "제도")]) == 0
+        and count_any(title, _lowered_terms(("정부", "농식품부", "법안", "정책", "제도"))) == 0
     ):
         return True
     if (
         re.search(r"^[가-힣]{2,8}(?:시|군|구)[,\s]", title)
         and any(term in title for term in ("신선도유지제", "저장시설", "구입비 지원", "지원사업"))
-        and count_any(title, [w.lower() for w in ("조례", "법안", "전국", "정부", "농식품부")]) == 0
+        and count_any(title, _lowered_terms(("조례", "법안", "전국", "정부", "농식품부"))) == 0
     ):
         return True
     if (
         any(term in text for term in ("신선도유지제", "과수저장시설", "저장 신선도"))
         and any(term in text for term in ("예산군", "지원사업", "보조사업"))
-        and count_any(title, [w.lower() for w in ("정부", "농식품부", "법안", "조례", "전국")]) == 0
+        and count_any(title, _lowered_terms(("정부", "농식품부", "법안", "조례", "전국"))) == 0
     ):
         return True
     if (
@@ -43365,24 +43613,24 @@ def _policy_issue_family(article: Article) -> str:
         and any(term in title for term in ("경영부담 완화", "경영 부담 완화", "경영 안정", "총력"))
         and count_any(
             text,
-            [w.lower() for w in (
+            _lowered_terms((
                 "농산물 가격 하락", "농산물 값 하락", "농산물값 하락", "가격 폭락",
                 "농자재값 상승", "농자재값 폭등", "생산비 폭등",
-            )],
+            )),
         ) >= 1
     ):
         return "producer_cost_government_response"
     if "가격안정제" in title or ("가격 하락분" in title and any(term in text for term in ("보전", "지원"))):
         return "price_stability_system"
     if (
-        count_any(text, [w.lower() for w in (
+        count_any(text, _lowered_terms((
             "농산물 가격 폭락", "농산물값 폭락", "농산물 가격 하락",
             "농자재값 폭등", "농자재 가격 폭등", "생산비 폭등", "cptpp",
             "소득안전망", "소득 안전망",
-        )]) >= 2
-        and count_any(text, [w.lower() for w in (
+        ))) >= 2
+        and count_any(text, _lowered_terms((
             "기자회견", "농민대회", "성명", "촉구", "반발", "대책", "안전망",
-        )]) >= 1
+        ))) >= 1
     ):
         if (
             any(term in text for term in ("정부", "농식품부", "농림축산식품부"))
@@ -43419,29 +43667,29 @@ def _is_cross_day_policy_candidate(article: Article) -> bool:
         return True
     agri = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "농업", "농가", "농민", "농식품", "원예", "채소", "과일",
             "농림위성", "직불금", "cptpp", "먹거리 물가",
-        )],
+        )),
     )
     issue = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "가격안정제", "직불금", "cptpp", "민관협의체", "민·관협의체", "수입농산물 관리",
             "물가정책", "물가 현장점검", "가격 폭락", "농산물값 폭락", "농자재", "생산비",
             "경영 안정", "소득 안전망", "농가소득 안전망", "농축산물 할인", "농림위성",
             "농업정책 변수", "세계식량가격", "세계 식량가격", "수급 안정", "수급 점검",
             "유류비", "자재 지원", "소비자물가 동향", "장바구니 물가", "농협개혁", "농협 개혁",
             "농식품 물가", "먹거리 물가", "취약계층",
-        )],
+        )),
     )
     action_or_analysis = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "정부", "농식품부", "농림축산식품부", "국회", "농경연", "krei", "시행",
             "도입", "보전", "지원", "정책", "대책", "분석", "점검", "구축 시급",
             "통계청", "소비자물가", "개혁안", "지배구조 개편",
-        )],
+        )),
     )
     return bool(
         is_national_agri_price_relief_package(article.title or "", article.description or "")
@@ -43462,7 +43710,7 @@ def _cross_day_policy_rank(article: Article) -> tuple[Any, ...]:
         5 if any(term in title for term in ("cptpp", "수입농산물 관리", "민관협의체", "민·관협의체")) else 0,
         4 if any(term in title for term in ("가격 폭락", "농산물값 폭락", "농자재", "생산비", "안전망")) else 0,
         3 if "농림위성" in title else 0,
-        count_any(text, [w.lower() for w in ("정부", "농식품부", "농경연", "krei", "시행", "도입", "지원")]),
+        count_any(text, _lowered_terms(("정부", "농식품부", "농경연", "krei", "시행", "도입", "지원"))),
         press_priority(article.press, article.domain),
         _publish_article_effective_fit("policy", article),
         float(getattr(article, "score", 0.0) or 0.0),
@@ -43488,10 +43736,10 @@ def _has_dist_market_operating_facts(article: Article) -> bool:
     )
     operating = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "경락가", "경매 물량", "출하 물량", "출하예약", "출하 예약", "예약제",
             "반입량", "수수료", "정산", "처리량", "공동선별", "분산출하", "수매가",
-        )],
+        )),
     )
     if metric and operating >= 1:
         return True
@@ -43501,10 +43749,10 @@ def _has_dist_market_operating_facts(article: Article) -> bool:
     operating_period = re.search(r"\d+(?:\.\d+)?\s*(?:개월|평)", text) is not None
     operating_facts = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "가동에 들어", "집중 운영", "첫 경매", "경매동", "창고동", "공판사업소",
             "취급 품목", "거래됐다", "판로 확보", "유통 거점",
-        )],
+        )),
     )
     return bool(operating_period and operating_facts >= 2)
 
@@ -43518,11 +43766,11 @@ def _is_replaceable_low_tier_dist_tail(article: Article) -> bool:
         return False
     direct_operations = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "온라인도매시장", "도매시장", "공판장", "경매", "경락", "반입",
             "거점물류센터", "apc", "공동선별", "공선출하", "선적", "수출길",
             "검역협상", "전자증명서", "휴장", "휴업",
-        )],
+        )),
     )
     generic_risk = any(term in title for term in (
         "라벨", "현지 검수", "통관대", "리스크", "우려", "주의 필요",
@@ -43535,15 +43783,15 @@ def _is_dist_logistics_disruption_story(article: Article) -> bool:
     text = _publish_editorial_text(article)
     transport = count_any(
         title,
-        [w.lower() for w in ("항공운송", "운송 차질", "물류 차질", "운임", "적재공간", "적재 공간")],
+        _lowered_terms(("항공운송", "운송 차질", "물류 차질", "운임", "적재공간", "적재 공간")),
     )
     impact = count_any(
         text,
-        [w.lower() for w in ("운임 상승", "운임 치솟", "적재공간", "적재 공간", "출하 차질", "운송비", "물류비")],
+        _lowered_terms(("운임 상승", "운임 치솟", "적재공간", "적재 공간", "출하 차질", "운송비", "물류비")),
     )
     farm_goods = count_any(
         text,
-        [w.lower() for w in ("농산물", "채소", "과일", "원예", "농협", "농가")],
+        _lowered_terms(("농산물", "채소", "과일", "원예", "농협", "농가")),
     )
     return bool(transport >= 1 and impact >= 1 and farm_goods >= 1)
 
@@ -43553,16 +43801,16 @@ def _is_dist_direct_joint_selection_ops(article: Article) -> bool:
     text = _publish_editorial_text(article)
     title_ops = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "공동선별", "공동 선별", "분산출하", "분산 출하", "공선출하", "공선 출하",
             "산지유통센터", "apc",
-        )],
+        )),
     )
     execution = count_any(
         text,
-        [w.lower() for w in (
+        _lowered_terms((
             "선별", "출하", "저장", "포장", "유통", "판매", "납품", "거래처", "처리",
-        )],
+        )),
     )
     return bool(title_ops >= 1 and execution >= 2)
 
@@ -43584,7 +43832,7 @@ def _is_dist_reader_filler(article: Article) -> bool:
         any(term in title for term in ("노하우 전수", "유통 교육", "현장 교육", "견학", "교육 프로그램"))
         and count_any(
             title,
-            [w.lower() for w in ("거래액", "물류비", "정산", "처리량", "경락가", "반입량", "출하량")],
+            _lowered_terms(("거래액", "물류비", "정산", "처리량", "경락가", "반입량", "출하량")),
         ) == 0
     ):
         return True
@@ -43593,7 +43841,7 @@ def _is_dist_reader_filler(article: Article) -> bool:
         and any(term in text for term in ("디지털 교육", "사업 지원", "경쟁력 강화"))
         and count_any(
             title,
-            [w.lower() for w in ("거래액", "판매액", "물류비", "처리량", "출하량", "수출액", "선적")],
+            _lowered_terms(("거래액", "판매액", "물류비", "처리량", "출하량", "수출액", "선적")),
         ) == 0
     ):
         return True
@@ -43601,10 +43849,10 @@ def _is_dist_reader_filler(article: Article) -> bool:
         any(term in title for term in ("안전기준 적합", "잔류농약 검사", "농산물 검사"))
         and count_any(
             title,
-            [w.lower() for w in (
+            _lowered_terms((
                 "경락가", "반입량", "거래액", "물류비", "정산", "공동선별",
                 "공선출하", "출하량", "온라인도매시장",
-            )],
+            )),
         ) == 0
     ):
         return True
@@ -43612,7 +43860,7 @@ def _is_dist_reader_filler(article: Article) -> bool:
         return True
     if (
         any(term in title for term in ("안전성 검증", "부적합 농산물", "잔류농약 검사"))
-        and count_any(title, [w.lower() for w in ("물류", "정산", "경매", "출하", "온라인도매시장")]) == 0
+        and count_any(title, _lowered_terms(("물류", "정산", "경매", "출하", "온라인도매시장"))) == 0
     ):
         return True
     if _is_dist_photo_filler_story(article):
@@ -43660,19 +43908,19 @@ def _is_dist_reader_filler(article: Article) -> bool:
     if (
         re.search(r"^[가-힣]{2,8}(?:시|군)[,\s]", title)
         and any(term in title for term in ("매출", "도약 원년", "AI 영농 확대", "명품화"))
-        and count_any(text, [w.lower() for w in ("선적", "검역", "수출 물량", "공동선별", "공선출하", "경매")]) < 2
+        and count_any(text, _lowered_terms(("선적", "검역", "수출 물량", "공동선별", "공선출하", "경매"))) < 2
     ):
         return True
     if (
         "명품화" in title
         and any(term in text for term in ("농협", "브랜드", "지원", "육성"))
-        and count_any(title, [w.lower() for w in ("출하량", "경락가", "수출 물량", "공동선별")]) == 0
+        and count_any(title, _lowered_terms(("출하량", "경락가", "수출 물량", "공동선별"))) == 0
     ):
         return True
     if (
         any(term in title for term in ("도약 원년", "매출 7000억", "매출 7천억"))
         and any(term in text for term in ("군", "명품", "브랜드", "AI 영농", "ai 영농"))
-        and count_any(title, [w.lower() for w in ("선적", "검역", "수출 물량", "공동선별", "경락가")]) == 0
+        and count_any(title, _lowered_terms(("선적", "검역", "수출 물량", "공동선별", "경락가"))) == 0
     ):
         return True
     if (
@@ -43707,7 +43955,7 @@ def _dist_issue_family(article: Article) -> str:
         return "online_wholesale_logistics"
     if (
         any(term in text for term in ("이집트", "호주", "검역협상", "검역 협상"))
-        and count_any(text, [w.lower() for w in ("배", "포도", "참외", "과일", "농산물")]) >= 1
+        and count_any(text, _lowered_terms(("배", "포도", "참외", "과일", "농산물"))) >= 1
         and any(term in text for term in ("수출길", "수출 길", "전 품종 수출", "시장 진출"))
     ):
         return "fresh_fruit_export_access"
@@ -43715,7 +43963,7 @@ def _dist_issue_family(article: Article) -> str:
         return "garlic_auction"
     if (
         any(term in text for term in ("공선출하회", "공선 출하회", "공동 출하 협약", "공동출하 협약"))
-        and count_any(text, [w.lower() for w in ("선별", "출하", "유통", "시장 경쟁력", "판매")]) >= 2
+        and count_any(text, _lowered_terms(("선별", "출하", "유통", "시장 경쟁력", "판매"))) >= 2
     ):
         return "joint_selection_shipping_agreement"
     if (
@@ -43749,7 +43997,7 @@ def _is_cross_day_dist_candidate(article: Article) -> bool:
         return True
     export_access = bool(
         any(term in title for term in ("수출길", "시장 진출", "전 품종 수출", "검역 장벽", "수출 확대"))
-        and count_any(text, [w.lower() for w in ("배", "포도", "참외", "토마토", "농산물", "과일")]) >= 1
+        and count_any(text, _lowered_terms(("배", "포도", "참외", "토마토", "농산물", "과일"))) >= 1
     )
     digital_quarantine_ops = bool(
         any(term in title for term in ("농산물 검역", "수출 검역", "전자증명서"))
@@ -43757,15 +44005,15 @@ def _is_cross_day_dist_candidate(article: Article) -> bool:
     )
     operations = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "경매", "온라인도매시장", "거점물류센터", "물류허브",
             "apc", "공동선별", "분산출하", "공선", "휴장", "휴업", "운임", "항공운송",
             "유통망", "판로 다변화", "검역", "전자증명서",
-        )],
+        )),
     )
     concrete = count_any(
         text,
-        [w.lower() for w in ("출하", "선별", "경매", "물류", "수출", "운송", "반입", "운영", "거래")],
+        _lowered_terms(("출하", "선별", "경매", "물류", "수출", "운송", "반입", "운영", "거래")),
     )
     return (
         is_dist_structural_market_analysis_context(article.title or "", article.description or "")
@@ -43789,7 +44037,7 @@ def _cross_day_dist_rank(article: Article) -> tuple[Any, ...]:
         ) else 0,
         4 if any(term in title for term in ("도매시장", "공판장", "경매", "휴장", "휴업")) else 0,
         0 if _is_dist_market_ceremony_story(article) else 1,
-        count_any(text, [w.lower() for w in ("출하", "선별", "물류", "수출", "경매", "운영", "거래")]),
+        count_any(text, _lowered_terms(("출하", "선별", "물류", "수출", "경매", "운영", "거래"))),
         press_priority(article.press, article.domain),
         _publish_article_effective_fit("dist", article),
         float(getattr(article, "score", 0.0) or 0.0),
@@ -43910,17 +44158,17 @@ def _is_cross_day_pest_candidate(article: Article) -> bool:
     text = _publish_editorial_text(article)
     if is_root_crop_disease_warning_context(article.title or "", article.description or ""):
         return True
-    named = _has_named_pest_signal(title) or count_any(title, [w.lower() for w in _PEST_NAMED_DISEASE_TERMS]) >= 1
+    named = _has_named_pest_signal(title) or count_any(title, _lowered_terms(_PEST_NAMED_DISEASE_TERMS)) >= 1
     crop = best_horti_score(article.title or "", article.description or "") >= 1.2 or count_any(
         text,
-        [w.lower() for w in ("과수", "사과", "배", "고추", "토마토", "오이", "멜론", "채소", "육묘장", "농작물")],
+        _lowered_terms(("과수", "사과", "배", "고추", "토마토", "오이", "멜론", "채소", "육묘장", "농작물")),
     ) >= 1
     action = count_any(
         title,
-        [w.lower() for w in (
+        _lowered_terms((
             "발생", "확산", "피해", "주의", "경보", "예찰", "방제", "예방", "관리",
             "대응", "도입", "제거", "매몰", "처리", "차단",
-        )],
+        )),
     ) >= 1
     authority_growth_advice = bool(
         _is_authority_crop_growth_warning(article)
@@ -43937,7 +44185,7 @@ def _cross_day_pest_rank(article: Article) -> tuple[Any, ...]:
     title = _publish_editorial_title(article)
     text = _publish_editorial_text(article)
     return (
-        5 if _has_named_pest_signal(title) or count_any(title, [w.lower() for w in _PEST_NAMED_DISEASE_TERMS]) >= 1 else 0,
+        5 if _has_named_pest_signal(title) or count_any(title, _lowered_terms(_PEST_NAMED_DISEASE_TERMS)) >= 1 else 0,
         4 if any(term in text for term in ("농촌진흥청", "농진청", "농업기술원", "검역본부")) else 0,
         3 if any(term in title for term in ("발생", "확산", "피해", "주의", "경보")) else 0,
         press_priority(article.press, article.domain),
@@ -44800,7 +45048,7 @@ def _repair_publish_editorial_selection(
             replacement = _mark_editorial_replacement(
                 candidates[0],
                 section_key,
-                next((section for section in SECTIONS if section.get("key") == section_key), {}),
+                SECTION_CONF_BY_KEY.get(section_key, {}),
                 f"{section_key}_publish_editorial_replacement",
                 "replace_visible_duplicate_or_weak_card",
             )
@@ -44860,7 +45108,7 @@ def _repair_publish_editorial_selection(
             replacement = _mark_editorial_replacement(
                 stronger_reports[0],
                 section_key,
-                next((section for section in SECTIONS if section.get("key") == section_key), {}),
+                SECTION_CONF_BY_KEY.get(section_key, {}),
                 f"{section_key}_publish_story_representative_upgrade",
                 "upgrade_duplicate_story_to_stronger_report",
             )
@@ -44887,10 +45135,10 @@ def _repair_publish_editorial_selection(
             key=lambda article: (
                 0 if count_any(
                     _publish_editorial_title(article),
-                    [w.lower() for w in (
+                    _lowered_terms((
                         "소비촉진", "공동 기부", "캠페인", "행사", "농자재 지원",
                         "자재 지원", "출하조직에 농자재", "포장용 랩",
-                    )],
+                    )),
                 ) >= 1 else 1,
                 float(getattr(article, "selection_fit_score", 0.0) or 0.0),
                 _publish_editorial_candidate_rank("supply", article),
@@ -44943,19 +45191,19 @@ def _repair_publish_editorial_selection(
                         "aT" in (article.title or "")
                         and count_any(
                             _publish_editorial_title(article),
-                            [w.lower() for w in ("ai 전환", "esg", "실행계획", "경영평가")],
+                            _lowered_terms(("ai 전환", "esg", "실행계획", "경영평가")),
                         ) >= 1
                     )
                     or count_any(
                         _publish_editorial_title(article),
-                        [w.lower() for w in ("수입농산물 관리", "수입 농산물 관리", "관리 개선방안")],
+                        _lowered_terms(("수입농산물 관리", "수입 농산물 관리", "관리 개선방안")),
                     ) >= 1
                     or count_any(
                         _publish_editorial_title(article),
-                        [w.lower() for w in (
+                        _lowered_terms((
                             "지원단 출범", "숏폼 영상", "토론회", "국민체감 정책",
                             "농촌일손", "보장하라", "위원장",
-                        )],
+                        )),
                     ) >= 1
                 ) else 1,
                 _publish_editorial_candidate_rank("policy", article),
@@ -45000,12 +45248,12 @@ def _dist_title_ops_hits(article: Article) -> int:
     title_l = _nfkc_lower(getattr(article, "title", "") or "")
     return count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "도매시장", "공판장", "물류", "저온유통", "산지 유통", "유통망", "유통 망",
             "농협몰", "디지털 전환", "수출", "수출길", "선적", "검역", "휴업", "시범휴업",
             "경매시간", "경매 시각", "qr코드", "수매", "순회수집", "매입", "선별",
             "처리량", "산지특송", "도달 시간", "당일 배송", "경매사", "유통 활성화",
-        )],
+        )),
     )
 
 
@@ -45014,10 +45262,10 @@ def _dist_title_agri_hits(article: Article) -> int:
     title_l = _nfkc_lower(title)
     return count_any(
         title_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "농산물", "양파", "매실", "수박", "복숭아", "블루베리", "청도", "제주", "산지", "과수", "원예", "고추", "마늘", "샤인머스캣",
             "농협", "청과", "출하조직",
-        )],
+        )),
     ) + int(_managed_commodity_match_summary(title, getattr(article, "description", "") or "").get("count") or 0)
 
 
@@ -45037,8 +45285,8 @@ def _dist_title_ops_replacement_rank(
             fit = 0.0
     novelty = 1
     title_l = _nfkc_lower(title)
-    ops_family_terms = [w.lower() for w in ("저온유통", "공판장", "도매시장", "농협몰", "수출길", "유통망", "유통 망")]
-    region_terms = [w.lower() for w in ("제주", "청도", "전남", "경남", "고창")]
+    ops_family_terms = _lowered_terms(("저온유통", "공판장", "도매시장", "농협몰", "수출길", "유통망", "유통 망"))
+    region_terms = _lowered_terms(("제주", "청도", "전남", "경남", "고창"))
     for idx, existing in enumerate(current_items):
         if idx == replace_idx or not isinstance(existing, Article):
             continue
@@ -45070,7 +45318,7 @@ def _replace_dist_promo_tail_with_title_ops_from_raw(
     victim_indexes = [idx for idx, article in enumerate(items) if _is_dist_editorial_promo_tail(article)]
     if not victim_indexes:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {_article_selection_identity(article) for article in items if _article_selection_identity(article)}
     ranked: list[tuple[tuple[Any, ...], Article]] = []
     for source_section in ("dist", "supply"):
@@ -45145,11 +45393,11 @@ def _is_clean_dist_shipment_replacement(article: Article) -> bool:
         return False
     title_l = _nfkc_lower(article.title or "")
     text_l = _nfkc_lower(f"{article.title or ''} {article.description or ''}")
-    if count_any(title_l, [w.lower() for w in ("본격 출하", "첫 출하")]) <= 0:
+    if count_any(title_l, _lowered_terms(("본격 출하", "첫 출하"))) <= 0:
         return False
-    if count_any(text_l, [w.lower() for w in ("입맛 공략", "브랜드 판촉", "출하식", "판촉 릴레이")]) >= 1:
+    if count_any(text_l, _lowered_terms(("입맛 공략", "브랜드 판촉", "출하식", "판촉 릴레이"))) >= 1:
         return False
-    return count_any(text_l, [w.lower() for w in ("수박", "블루베리", "농산물", "산지", "공급", "시장")]) >= 1
+    return count_any(text_l, _lowered_terms(("수박", "블루베리", "농산물", "산지", "공급", "시장"))) >= 1
 
 
 def _replace_dist_gocang_promo_with_clean_shipment_from_raw(
@@ -45165,7 +45413,7 @@ def _replace_dist_gocang_promo_with_clean_shipment_from_raw(
     ]
     if not victim_indexes:
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    conf = SECTION_CONF_BY_KEY.get("dist", {})
     existing_keys = {_article_selection_identity(article) for article in items if _article_selection_identity(article)}
     candidates: list[tuple[tuple[Any, ...], Article]] = []
     for article in raw_by_section.get("dist", []) or []:
@@ -45246,11 +45494,11 @@ def _is_policy_section_supply_support_tail(article: Article) -> bool:
         return True
     if count_any(
         text_l,
-        [w.lower() for w in (
+        _lowered_terms((
             "못난이 매실", "가공용 수매", "상생마케팅", "소비촉진", "제값받기",
             "직거래장터", "직거래 장터", "일손돕기", "일손 돕기", "첫 출하", "기능성",
             "시설하우스", "천장 환기창",
-        )],
+        )),
     ) >= 1:
         return True
     try:
@@ -45271,7 +45519,7 @@ def _refill_supply_market_gap_from_raw(
     if len(items) >= target:
         final_by_section["supply"] = items[:target]
         return 0
-    conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+    conf = SECTION_CONF_BY_KEY.get("supply", {})
     existing_keys = {
         _article_selection_identity(article)
         for section_items in (final_by_section or {}).values()
@@ -45381,7 +45629,7 @@ def _move_supply_structure_issue_to_policy_from_final(
         reverse=True,
     )[0]
     supply_items.pop(supply_idx)
-    conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    conf = SECTION_CONF_BY_KEY.get("policy", {})
     policy_items[victim_idx] = _mark_editorial_replacement(
         moved,
         "policy",
@@ -45458,7 +45706,7 @@ def _replace_final_item_with_editorial_candidate(
     if _postbuild_article_reject_reason(candidate, section_key, apply_selection_fit=False):
         return False
     ident = _article_selection_identity(candidate)
-    conf = next((s for s in SECTIONS if s.get("key") == section_key), {})
+    conf = SECTION_CONF_BY_KEY.get(section_key, {})
     marked = _mark_editorial_replacement(candidate, section_key, conf, stage, note)
     if as_core:
         marked.is_core = True
@@ -45759,11 +46007,11 @@ def _repair_editorial_shadow_issues_from_raw(
         idx for idx, article in enumerate(supply_items)
         if count_any(
             title_text(article),
-            [w.lower() for w in ("기계화", "기술 공개", "경영 효율화", "인력난 해법", "장비 보급")],
+            _lowered_terms(("기계화", "기술 공개", "경영 효율화", "인력난 해법", "장비 보급")),
         ) >= 1
         or (
             ("성주참외" in title_text(article) or "성주 참외" in title_text(article))
-            and count_any(title_text(article), [w.lower() for w in ("둔갑", "박스갈이")]) >= 1
+            and count_any(title_text(article), _lowered_terms(("둔갑", "박스갈이"))) >= 1
         )
         or ("대추형 방울" in title_text(article) and "경쟁력" in title_text(article))
         or ("신품종" in title_text(article) and "경쟁력" in title_text(article))
@@ -45812,7 +46060,7 @@ def _repair_editorial_shadow_issues_from_raw(
                 break
         if picked is None:
             break
-        conf = next((s for s in SECTIONS if s.get("key") == "supply"), {})
+        conf = SECTION_CONF_BY_KEY.get("supply", {})
         supply_items.append(_mark_editorial_replacement(
             picked,
             "supply",
@@ -45827,7 +46075,7 @@ def _repair_editorial_shadow_issues_from_raw(
     dist_victims = [
         idx for idx, article in enumerate(dist_items)
         if (
-            count_any(title_text(article), [w.lower() for w in ("농협몰", "설명회", "디지털 전환")]) >= 1
+            count_any(title_text(article), _lowered_terms(("농협몰", "설명회", "디지털 전환"))) >= 1
             or ("제주 블루베리" in title_text(article) and ("판매량" in title_text(article) or "껑충" in title_text(article)))
             or ("고창수박" in title_text(article) and "본격 출하" in title_text(article))
             or ("애플망고" in title_text(article) and "공선" in title_text(article))
@@ -46018,7 +46266,7 @@ def _repair_editorial_shadow_issues_from_raw(
         ):
             changed += 1
 
-    dist_conf = next((s for s in SECTIONS if s.get("key") == "dist"), {})
+    dist_conf = SECTION_CONF_BY_KEY.get("dist", {})
     dist_items_now = [article for article in (final_by_section.get("dist") or []) if isinstance(article, Article)]
     dist_core_changed = False
     for article in dist_items_now:
@@ -46046,7 +46294,7 @@ def _repair_editorial_shadow_issues_from_raw(
         )[:MAX_PER_SECTION]
         changed += 1
 
-    policy_conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    policy_conf = SECTION_CONF_BY_KEY.get("policy", {})
     policy_items_now = [article for article in (final_by_section.get("policy") or []) if isinstance(article, Article)]
     if not any(title_only_matches(article, "농민의길") and article_matches(article, "농특세", "가격 안정") for article in policy_items_now):
         ag_tax_candidates = _raw_editorial_candidates(
@@ -46558,7 +46806,7 @@ def _recover_priority_policy_from_raw(
 ) -> int:
     if not isinstance(final_by_section, dict) or not isinstance(raw_by_section, dict):
         return 0
-    policy_conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    policy_conf = SECTION_CONF_BY_KEY.get("policy", {})
     max_n = max(1, int(max_items or MAX_PER_SECTION))
     policy_items = [article for article in (final_by_section.get("policy") or []) if isinstance(article, Article)]
     if any(is_policy_price_stabilization_system_context(a.title or "", a.description or "", a.domain or "", a.press or "") for a in policy_items):
@@ -46661,15 +46909,15 @@ def _is_weaker_policy_macro_story(article: "Article") -> bool:
         return False
     text = _nfkc_lower(f"{title} {desc}")
     title_l = _nfkc_lower(title)
-    if count_any(title_l, [w.lower() for w in ("애그플레이션", "엘리뇨", "이란전쟁", "중동전쟁", "전쟁 장기화")]) >= 1:
+    if count_any(title_l, _lowered_terms(("애그플레이션", "엘리뇨", "이란전쟁", "중동전쟁", "전쟁 장기화"))) >= 1:
         if _is_policy_keepable_macro_issue(title, desc):
             return False
         return True
     return bool(
         is_policy_general_macro_tail_context(title, desc, dom, press)
         or (
-            count_any(text, [w.lower() for w in ("애그플레이션", "엘니뇨", "중동전쟁", "이란전쟁", "원자재", "생산자물가")]) >= 1
-            and count_any(text, [w.lower() for w in ("농협법", "농지법", "농안법", "가격안정제도", "농식품부", "국회")]) == 0
+            count_any(text, _lowered_terms(("애그플레이션", "엘니뇨", "중동전쟁", "이란전쟁", "원자재", "생산자물가"))) >= 1
+            and count_any(text, _lowered_terms(("농협법", "농지법", "농안법", "가격안정제도", "농식품부", "국회"))) == 0
         )
     )
 
@@ -46683,7 +46931,7 @@ def _recover_legislative_policy_from_raw(
 ) -> int:
     if not isinstance(final_by_section, dict) or not isinstance(raw_by_section, dict):
         return 0
-    policy_conf = next((s for s in SECTIONS if s.get("key") == "policy"), {})
+    policy_conf = SECTION_CONF_BY_KEY.get("policy", {})
     max_n = max(1, int(max_items or MAX_PER_SECTION))
     policy_items = [article for article in (final_by_section.get("policy") or []) if isinstance(article, Article)]
     existing_legislative = [
@@ -47571,6 +47819,14 @@ def render_managed_commodity_board_html(board_ctx: dict[str, Any], report_date:
     </section>
     """
 
+# 데일리/인덱스 페이지의 정적 CSS 스캐폴딩 — 호출마다 f-string으로 재조립하지 않도록
+# 모듈 로드 시 1회만 구성한다(pwa_install_css 삽입 지점 앞/뒤로 분리).
+_DAILY_PAGE_CSS_HEAD = '  <style>\n    :root {\n      --bg:#ffffff;\n      --text:#111827;\n      --muted:#6b7280;\n      --line:#e5e7eb;\n      --card:#ffffff;\n      --chip:#f8fafc;\n      --btn:#1d4ed8;\n      --btnHover:#1e40af;\n      --btnBg:#ffffff;\n      --shadow:0 4px 12px rgba(17,24,39,.08);\n      --page-max:1220px;\n      --topbar-height:172px;\n      --chipbar-height:58px;\n      --nav-chip-height:40px;\n      --sticky-nav-offset:188px;\n      --anchor-offset:248px;\n    }\n    *{box-sizing:border-box}\n    html {\n      scroll-behavior:smooth;\n      scroll-padding-top: var(--anchor-offset);\n      /* 가로 오버스크롤이 브라우저 히스토리 이동(뒤로가기 제스처)으로 번지지 않도록 차단\n         — 날짜 이동 스와이프는 페이지 자체 핸들러가 처리한다 */\n      overscroll-behavior-x:none;\n    }\n    body{margin:0;background:var(--bg); color:var(--text);\n         overscroll-behavior-x:none;\n         font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, "Noto Sans KR", Arial;}\n    .wrap{max-width:var(--page-max) !important;margin:0 auto !important;padding:18px 20px 80px !important;touch-action:pan-y;overscroll-behavior-x:contain;}\n    .topbar{position:sticky;top:0;background:rgba(255,255,255,0.94);backdrop-filter:saturate(180%) blur(10px);\n            border-bottom:1px solid var(--line); z-index:10;}\n    .topin{max-width:var(--page-max);margin:0 auto;padding:12px 20px;display:grid;grid-template-columns:1fr;gap:10px;align-items:start}\n    h1{margin:0;font-size:18px;letter-spacing:-0.2px}\n    .sub{color:var(--muted);font-size:12.5px;margin-top:4px}\n    .envBadge{display:inline-flex;align-items:center;justify-content:center;margin-left:8px;padding:2px 8px;border-radius:999px;background:#fff7ed;border:1px solid #fdba74;color:#9a3412;font-size:11px;font-weight:900;vertical-align:middle}\n    .navRow{display:flex;gap:8px;align-items:center;flex-wrap:wrap;width:100%}\n    .navRow > *{min-width:0}\n    .navBtn{white-space:nowrap}\n    .navBtn{display:inline-flex;align-items:center;justify-content:center;\n            height:36px;padding:0 12px;border:1px solid var(--line);border-radius:10px;\n            background:#fff;color:#111827;text-decoration:none;font-size:13px; cursor:pointer;}\n    .navBtn:hover{border-color:#cbd5e1}\n    .navBtn.navArchive{background:#eef5ff !important;border-color:#b7d4ff !important;color:#1d4ed8 !important;font-weight:800}\n    .navBtn.navArchive:hover{filter:brightness(0.98)}\n    /* fallback: first nav button */\n    .navRow > a.navBtn:first-child{background:#eef5ff !important;border-color:#b7d4ff !important;color:#1d4ed8 !important;font-weight:800}\n\n    .navBtn.disabled{opacity:.45;cursor:not-allowed}\n    .dateSelWrap{display:inline-flex;align-items:center;gap:6px}\n    select{height:36px;border:1px solid var(--line);border-radius:10px;padding:0 10px;background:#fff;font-size:13px;\n            width:165px; max-width:165px;}\n    @media (max-width: 520px) {\n      select{width:145px; max-width:145px;}\n    }\n\n    .viewTabs{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:14px;margin-top:18px;align-items:stretch}\n    .viewTab{display:flex;flex-direction:column;align-items:flex-start;justify-content:flex-start;gap:12px;min-height:132px;padding:18px 20px;border-radius:22px;border:1px solid #dbe4ee;background:linear-gradient(180deg,#ffffff 0%,#f8fafc 100%);color:#0f172a;cursor:pointer;text-align:left;box-shadow:0 12px 28px rgba(15,23,42,.08);transition:transform .18s ease, box-shadow .18s ease, border-color .18s ease}\n    .viewTab:hover{transform:translateY(-1px);border-color:#bfdbfe;box-shadow:0 18px 36px rgba(15,23,42,.12)}\n    .viewTab.isActive{background:linear-gradient(135deg,#0f172a 0%,#1d4ed8 100%);color:#fff;border-color:#0f172a;box-shadow:0 20px 40px rgba(29,78,216,.24)}\n    .viewTabEyebrow{display:inline-flex;align-items:center;min-height:24px;padding:0 9px;border-radius:999px;background:rgba(14,165,233,.1);color:#075985;font-size:11px;font-weight:900;letter-spacing:.02em}\n    .viewTab.isActive .viewTabEyebrow{background:rgba(255,255,255,.16);color:#e0f2fe}\n    .viewTabTitle{font-size:24px;font-weight:900;letter-spacing:-0.5px;line-height:1.1}\n    .viewTabDesc{max-width:420px;font-size:13px;line-height:1.55;color:#475569}\n    .viewTab.isActive .viewTabDesc{color:rgba(255,255,255,.88)}\n    .viewTabStats{display:flex;gap:8px;flex-wrap:wrap;align-items:center;margin-top:auto}\n    .viewTabStat{display:inline-flex;align-items:center;gap:6px;min-height:32px;padding:0 11px;border-radius:999px;background:#eef2ff;color:#1e293b;font-size:12px;font-weight:800}\n    .viewTabStat strong{font-size:13px}\n    .viewTab.isActive .viewTabStat{background:rgba(255,255,255,.16);color:#fff}\n\n    .briefingHero{display:grid;grid-template-columns:minmax(0,1fr) auto;gap:18px;align-items:flex-start;margin-top:14px;padding:22px;border:1px solid #dbe4ee;border-radius:22px;background:radial-gradient(circle at top left, rgba(191,219,254,.75), transparent 34%),linear-gradient(135deg,#eff6ff 0%,#ffffff 56%,#f8fafc 100%);box-shadow:0 14px 34px rgba(15,23,42,.08)}\n    .briefingHeroMain{min-width:0}\n    .briefingEyebrow{display:inline-flex;align-items:center;min-height:26px;padding:0 10px;border-radius:999px;background:#ecfeff;border:1px solid #99f6e4;color:#115e59;font-size:11px;font-weight:900;letter-spacing:.02em;vertical-align:middle;margin-left:10px;position:relative;top:-2px}\n    .briefingHero h2{margin:0;font-size:30px;line-height:1.05;letter-spacing:-0.8px}\n    .briefingLead{margin-top:10px;max-width:720px;color:#334155;font-size:14px;line-height:1.65}\n    .briefingHeroStats{display:flex;gap:10px;flex-wrap:wrap;justify-content:flex-end}\n    .briefingHeroStat{display:flex;flex-direction:column;justify-content:center;min-width:110px;min-height:82px;padding:14px 16px;border-radius:18px;border:1px solid rgba(148,163,184,.25);background:rgba(255,255,255,.92);box-shadow:0 10px 24px rgba(15,23,42,.06)}\n    .briefingHeroStatLabel{color:#64748b;font-size:11px;font-weight:900;letter-spacing:.04em}\n    .briefingHeroStat strong{margin-top:6px;color:#0f172a;font-size:22px;font-weight:900;letter-spacing:-0.4px}\n\n    /* briefing chip bar */\n    .chipbar{position:relative;z-index:2;border:1px solid var(--line);border-radius:16px;background:rgba(248,250,252,.96);box-shadow:0 14px 32px rgba(15,23,42,.10);backdrop-filter:saturate(180%) blur(10px);overflow:hidden;}\n    .briefingChipbar{margin:16px 0 0}\n    .commodityBoardNav{margin:18px 18px 20px}\n    .chipwrap{max-width:var(--page-max);margin:0 auto;padding:10px 18px;}\n    .chips,.commodityGroupNav{display:flex;gap:10px;align-items:center;justify-content:flex-start;width:100%;}\n    .chips{flex-wrap:wrap;overflow-x:auto; -webkit-overflow-scrolling:touch;}\n    .chips::-webkit-scrollbar{height:8px}\n    .commodityGroupNav{flex-wrap:wrap;}\n    .chip,.commodityGroupChip{text-decoration:none;border:1px solid var(--chip-border, var(--group-chip-border, var(--line)));border-radius:999px;\n          background:linear-gradient(180deg,var(--chip-soft, var(--group-chip-soft, var(--chip))) 0%, #ffffff 100%);font-size:13px;color:#111827;display:inline-flex;gap:8px;align-items:center;justify-content:center;min-width:0;min-height:var(--nav-chip-height);padding:0 16px;font-weight:900;box-shadow:inset 0 1px 0 rgba(255,255,255,.72);white-space:nowrap}\n    .chip:hover{border-color:var(--chip-color, #cbd5e1);transform:translateY(-1px)}\n    .chipTitle{font-weight:800;min-width:0;overflow:hidden;text-overflow:ellipsis;white-space:nowrap}\n    .chipN,.commodityGroupChip span{display:inline-flex;align-items:center;justify-content:center;min-width:26px;height:26px;text-align:center;color:#fff;padding:0 8px;border-radius:999px;font-size:11px}\n    .chipN{background:var(--chip-color, #111827)}\n    .chipDock{display:none}\n    .chipDock.isVisible{opacity:1;transform:translateY(0);pointer-events:auto}\n    .chipDockInner{max-width:var(--page-max);margin:0 auto;padding:0 20px}\n    .chipDock .chipbar{margin:0;box-shadow:0 18px 38px rgba(15,23,42,.14);background:rgba(248,250,252,.98)}\n    .chipDock .briefingChipbar,\n    .chipDock .commodityBoardNav{margin:0}\n    body.quickNavOpen{overflow:hidden}\n    .mobileQuickNav{display:block;position:fixed;right:18px;bottom:20px;z-index:13}\n    .mobileQuickNavToggle{display:inline-flex;align-items:center;justify-content:center;gap:8px;min-height:44px;max-width:calc(100vw - 32px);padding:0 14px;border:1px solid #0f172a;border-radius:999px;background:#0f172a;color:#fff;font-size:13px;font-weight:900;box-shadow:0 18px 38px rgba(15,23,42,.28);pointer-events:none;opacity:0;transform:translateY(8px);transition:opacity .18s ease, transform .18s ease}\n    .mobileQuickNav.isVisible .mobileQuickNavToggle{pointer-events:auto;opacity:1;transform:translateY(0)}\n    .mobileQuickNavSheet{position:fixed;inset:0;display:none;z-index:14}\n    .mobileQuickNavSheet.isOpen{display:block}\n    .mobileQuickNavBackdrop{position:absolute;inset:0;border:0;background:rgba(15,23,42,.42)}\n    .mobileQuickNavPanel{position:absolute;left:12px;right:12px;bottom:14px;max-height:min(72vh, 560px);overflow:auto;padding:16px;border:1px solid #dbe4ee;border-radius:24px;background:#ffffff;box-shadow:0 22px 56px rgba(15,23,42,.24)}\n    .mobileQuickNavHead{display:flex;align-items:center;justify-content:space-between;gap:12px;margin-bottom:12px}\n    .mobileQuickNavHead strong{font-size:15px;letter-spacing:-0.2px}\n    .mobileQuickNavClose{display:inline-flex;align-items:center;justify-content:center;min-height:34px;padding:0 12px;border:1px solid var(--line);border-radius:999px;background:#fff;color:#111827;font-size:12px;font-weight:800}\n    .mobileQuickNavBody .chipbar{border:none;background:transparent;box-shadow:none;overflow:visible}\n    .mobileQuickNavBody .chipwrap{padding:0;max-width:none}\n    .mobileQuickNavBody .chips,\n    .mobileQuickNavBody .commodityGroupNav{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;justify-content:stretch;overflow:visible}\n    .mobileQuickNavBody .chip,\n    .mobileQuickNavBody .commodityGroupChip{width:100%;justify-content:space-between;min-height:48px;padding:0 14px;border-radius:18px;font-size:13px;box-shadow:0 10px 24px rgba(15,23,42,.12)}\n    @media (min-width: 901px){\n      .mobileQuickNavPanel{left:auto;right:24px;bottom:82px;width:min(520px, calc(100vw - 48px));border-radius:20px}\n      .mobileQuickNavBackdrop{background:rgba(15,23,42,.10)}\n    }\n\n    .viewPane{display:none}\n    .viewPane.isActive{display:block}\n    .briefingPane{margin-top:14px}\n    .commodityPane{margin-top:14px}\n\n    .commodityBoard{margin-top:14px;border:1px solid #dbe4ee;border-radius:22px;background:linear-gradient(180deg,#fff 0%,#f8fafc 100%);box-shadow:0 16px 34px rgba(15,23,42,.08);overflow:visible}\n    .commodityHead{position:relative;display:grid;grid-template-columns:minmax(0,1fr) auto;align-items:flex-start;gap:18px;padding:22px 22px 16px;border-bottom:1px solid rgba(229,231,235,.9);background:linear-gradient(135deg,#ffffff 0%,#f8fafc 68%,#f0fdf4 100%);overflow:hidden;isolation:isolate}\n    .commodityHead::after{content:"";position:absolute;inset:-24% -6% -22% 48%;background:radial-gradient(circle at 50% 46%, rgba(110,231,183,.62) 0%, rgba(125,211,252,.26) 33%, rgba(255,255,255,0) 72%);pointer-events:none;z-index:0}\n    .commodityHeadMain{position:relative;z-index:1;min-width:0}\n    .commodityHead h2{margin:8px 0 0;font-size:30px;line-height:1.05;letter-spacing:-0.7px}\n    .commodityLead{margin-top:10px;max-width:720px;color:#334155;font-size:14px;line-height:1.65}\n    .commodityEyebrow{display:inline-flex;align-items:center;min-height:26px;padding:0 10px;border-radius:999px;background:#ecfeff;border:1px solid #99f6e4;color:#115e59;font-size:11px;font-weight:900;letter-spacing:.02em;vertical-align:middle;margin-left:10px;position:relative;top:-2px}\n    .commodityHeadStats{position:relative;z-index:1;display:flex;gap:10px;flex-wrap:wrap;justify-content:flex-end}\n    .commodityHeadStat{display:flex;flex-direction:column;justify-content:center;min-width:110px;min-height:82px;padding:14px 16px;border-radius:18px;border:1px solid rgba(148,163,184,.24);background:rgba(255,255,255,.95);box-shadow:0 10px 24px rgba(15,23,42,.06)}\n    .commodityHeadStatLabel{color:#64748b;font-size:11px;font-weight:900;letter-spacing:.04em}\n    .commodityHeadStat strong{margin-top:6px;color:#0f172a;font-size:22px;font-weight:900;letter-spacing:-0.4px}\n    .commodityBadge{display:inline-flex;align-items:center;justify-content:center;height:22px;padding:0 9px;border-radius:999px;font-size:11px;font-weight:900;white-space:nowrap}\n    .commodityBadge.core{background:#dbeafe;color:#1d4ed8;border:1px solid #93c5fd}\n    .commoditySignals{display:flex;flex-wrap:wrap;gap:6px;min-height:24px}\n    .commoditySig{display:inline-flex;align-items:center;justify-content:center;height:22px;padding:0 8px;border-radius:999px;background:#eef2ff;color:#3730a3;font-size:11px;font-weight:800}\n    .commoditySig[data-section="supply"]{background:#ccfbf1;color:#115e59}\n    .commoditySig[data-section="policy"]{background:#dbeafe;color:#1d4ed8}\n    .commoditySig[data-section="dist"]{background:#ede9fe;color:#6d28d9}\n    .commoditySig[data-section="pest"]{background:#ffedd5;color:#b45309}\n    .commoditySig.muted{background:#f8fafc;color:#94a3b8}\n    .commodityStoryCluster{display:flex;flex-direction:column;gap:10px;height:100%}\n    .commodityPrimaryCard{padding:12px;border:1px solid #dbe4ee;border-radius:16px;background:linear-gradient(180deg,#ffffff 0%,#f8fafc 100%);min-height:124px}\n    .commodityPrimaryHead{display:flex;align-items:center;justify-content:space-between;gap:8px;flex-wrap:wrap}\n    .commodityPrimaryKicker{display:inline-flex;align-items:center;justify-content:center;min-height:22px;padding:0 8px;border-radius:999px;background:#0f172a;color:#fff;font-size:10px;font-weight:900;letter-spacing:.02em}\n    .commodityPrimaryStory{display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient:vertical;overflow:hidden;margin-top:8px;color:#0f172a;font-size:14px;font-weight:900;line-height:1.52;text-decoration:none}\n    .commodityPrimaryStory:hover{text-decoration:underline}\n    .commodityPrimaryMeta{margin-top:7px;color:#64748b;font-size:11px;font-weight:700}\n    .commoditySupportList{display:flex;flex-direction:column;gap:8px}\n    .commoditySupportTitle{color:#64748b;font-size:11px;font-weight:900;letter-spacing:.02em}\n    .commoditySupportStory,.commodityMoreStory{display:flex;align-items:flex-start;gap:8px;padding:9px 10px;border-radius:14px;border:1px solid #dbe4ee;background:#fff;color:#0f172a;text-decoration:none;min-width:0}\n    .commoditySupportStory:hover,.commodityMoreStory:hover{border-color:#cbd5e1}\n    .commoditySupportLabel{display:inline-flex;align-items:center;justify-content:center;min-height:20px;padding:0 7px;border-radius:999px;background:#eef2ff;color:#3730a3;font-size:10px;font-weight:900;flex:0 0 auto}\n    .commoditySupportText{display:-webkit-box;min-width:0;font-size:12px;line-height:1.5;-webkit-line-clamp:3;-webkit-box-orient:vertical;overflow:hidden}\n    .commodityMoreWrap{border:1px dashed #cbd5e1;border-radius:14px;background:#f8fafc}\n    .commodityMoreSummary{list-style:none;cursor:pointer;padding:10px 12px;color:#334155;font-size:12px;font-weight:900}\n    .commodityMoreSummary::-webkit-details-marker{display:none}\n    .commodityMoreList{display:flex;flex-direction:column;gap:8px;padding:0 10px 10px}\n    .commodityStoryMuted{padding:11px 12px;border:1px dashed #dbe4ee;border-radius:14px;background:#f8fafc;color:#94a3b8;font-size:12px}\n    .commodityBoardNav{border-color:#cfe0f4;background:rgba(255,255,255,.98);box-shadow:0 18px 36px rgba(15,23,42,.12)}\n    .commodityGroupChip:hover{border-color:var(--group-chip-color, #334155);transform:translateY(-1px)}\n    .commodityGroupChip{border-color:var(--group-chip-border, var(--line));background:linear-gradient(180deg,var(--group-chip-soft, var(--chip)) 0%, #ffffff 100%);}\n    .commodityGroupChip span{background:var(--group-chip-color, #111827)}\n    .commodityGroupBlock{margin:0 18px 20px;padding:20px;border:1px solid var(--commodity-group-border, #dbe4ee);border-left:4px solid var(--commodity-group-color, #475569);border-radius:22px;background:linear-gradient(180deg,var(--commodity-group-soft, #f8fafc) 0%, #ffffff 100%);box-shadow:0 16px 34px rgba(15,23,42,.07), inset 0 1px 0 rgba(255,255,255,.8);scroll-margin-top:calc(var(--anchor-offset) + 28px)}\n    .commodityGroupHead{display:flex;align-items:flex-start;justify-content:space-between;gap:12px;padding:0 0 14px;border-bottom:1px solid var(--commodity-group-border, #dbe4ee);margin-bottom:16px;flex-wrap:wrap}\n    .commodityGroupTitleWrap{display:flex;align-items:center;gap:10px}\n    .commodityGroupTitleWrap h3{margin:0;font-size:16px}\n    .commodityGroupDot{width:12px;height:12px;border-radius:999px;box-shadow:0 0 0 8px var(--commodity-group-soft, rgba(15,23,42,.06))}\n    .commodityGroupMeta{margin-left:auto;color:#64748b;font-size:12px;font-weight:700}\n    .commodityGrid{display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:12px;align-items:start}\n    .commodityGrid.isSingle{grid-template-columns:minmax(280px,520px)}\n    .commodityGrid.isDuo{grid-template-columns:repeat(2,minmax(0,1fr))}\n    .commodityTile{display:flex;flex-direction:column;gap:9px;padding:13px;border:1px solid #dbe4ee;border-radius:16px;background:#fff;min-height:100%}\n    .commodityTile.isActive{border-color:#86efac;box-shadow:0 8px 24px rgba(15,118,110,.08)}\n    .commodityTile.isMuted{border-style:dashed;border-color:#dbe4ee;background:#fcfdfe;opacity:.86}\n    .commodityTile.isMuted .commodityTileName{color:#64748b}\n    .commodityTileTop{display:flex;align-items:flex-start;justify-content:space-between;gap:10px}\n    .commodityTileName{font-size:16px;font-weight:900;line-height:1.35}\n    .commodityTileMeta{display:flex;gap:10px;flex-wrap:wrap;color:#64748b;font-size:12px;font-weight:700}\n    .commodityInactive{margin-top:12px;padding:12px;border:1px dashed #dbe4ee;border-radius:14px;background:#f8fafc}\n    .commodityInactiveTitle{color:#64748b;font-size:12px;font-weight:800;margin-bottom:8px}\n    .commodityMiniGrid{display:flex;flex-wrap:wrap;gap:8px}\n    .commodityMiniChip{display:inline-flex;align-items:center;justify-content:center;min-height:30px;padding:0 10px;border-radius:999px;border:1px solid #dbe4ee;background:#fff;color:#475569;font-size:12px;font-weight:700;opacity:.7}\n    .commodityMiniChip.isCore{border-color:#93c5fd;background:#eff6ff;color:#1d4ed8;opacity:1;font-weight:900;border-width:2px}\n    .commodityEmpty{padding:20px 18px 22px}\n    .commodityGroupEmpty{margin-top:10px;padding:14px 12px;border:1px dashed #dbe4ee;border-radius:14px;background:#f8fafc;color:#64748b;font-size:13px}\n\n    .sec{margin-top:14px !important;border:1px solid var(--line);border-radius:14px !important;overflow:hidden;background:var(--card);\n          scroll-margin-top: calc(var(--anchor-offset) + 18px);\n    }\n    .secHead{display:flex;align-items:center;justify-content:space-between;padding:12px 14px;background:#fafafa;border-bottom:1px solid var(--line)}\n    .secTitle{font-size:15px;font-weight:900;display:flex;align-items:center;gap:10px}\n    .dotColor{width:10px;height:10px;border-radius:999px}\n    .secCount{font-size:12px;color:var(--muted);background:#fff;border:1px solid var(--line);padding:4px 10px;border-radius:999px}\n    .secBody{padding:12px 12px 14px}\n    .card{border:1px solid var(--line);border-left:5px solid #334155;border-radius:14px;padding:12px;margin:10px 0;background:#fff;cursor:pointer;transition:border-color .15s ease, box-shadow .15s ease}\n    .card:hover{border-color:#94a3b8;box-shadow:0 4px 12px rgba(15,23,42,.08)}\n    .cardTop{display:flex;align-items:center;justify-content:space-between;gap:10px;flex-wrap:nowrap}\n    .meta{color:var(--muted);font-size:12px;display:flex;align-items:center;gap:6px;flex-wrap:wrap;min-width:0;flex:1 1 0%}\n    .press{color:#111827;font-weight:900}\n    .dot{opacity:.5}\n    .topic{background:#f3f4f6;border:1px solid var(--line);padding:2px 8px;border-radius:999px;font-size:11.5px;color:#111827;cursor:pointer;transition:background .15s ease}\n    .topic:hover{background:#e0e7ff;border-color:#a5b4fc;color:#3730a3}\n    .ttl{margin-top:8px;font-size:15px;line-height:1.35;font-weight:900}\n    .sum{margin-top:8px;color:#374151;font-size:13px;line-height:1.55;display:-webkit-box;-webkit-line-clamp:3;-webkit-box-orient:vertical;overflow:hidden}\n\n    .badgeCore {\n      display:inline-flex; align-items:center; justify-content:center;\n      height:18px; padding:0 8px; border-radius:999px;\n      background:#111827; color:#fff; font-size:11px; font-weight:900;\n      margin-right:2px;\n    }\n    .hfDelta{display:inline-flex;align-items:center;justify-content:center;min-height:20px;padding:0 8px;border-radius:999px;border:1px solid #dbe4ee;background:#f8fafc;color:#334155;font-size:10.5px;font-weight:900;letter-spacing:.01em;white-space:nowrap}\n    .hfDelta.isPos{background:#ecfdf5;border-color:#86efac;color:#166534}\n    .hfDelta.isNeg{background:#fff7ed;border-color:#fdba74;color:#b45309}\n    .hfComparePanel{margin-top:16px;padding:18px;border:1px solid #bfdbfe;border-radius:22px;background:linear-gradient(135deg,#eff6ff 0%,#ffffff 54%,#f8fafc 100%);box-shadow:0 16px 36px rgba(29,78,216,.10)}\n    .hfCompareHead{display:grid;grid-template-columns:minmax(0,1fr) auto;gap:14px;align-items:flex-start}\n    .hfCompareEyebrow{display:inline-flex;align-items:center;min-height:24px;padding:0 9px;border-radius:999px;background:#dbeafe;color:#1d4ed8;font-size:11px;font-weight:900;letter-spacing:.02em}\n    .hfComparePanel h2{margin:10px 0 0;font-size:26px;line-height:1.1;letter-spacing:-0.6px}\n    .hfCompareLead{margin-top:8px;max-width:760px;color:#334155;font-size:13px;line-height:1.6}\n    .hfCompareStats{display:flex;gap:8px;flex-wrap:wrap;justify-content:flex-end}\n    .hfCompareStat{display:inline-flex;align-items:center;gap:6px;min-height:34px;padding:0 12px;border-radius:999px;border:1px solid #dbe4ee;background:rgba(255,255,255,.9);color:#1e293b;font-size:12px;font-weight:800}\n    .hfCompareStat strong{font-size:13px}\n    .hfCompareGrid{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:12px;margin-top:14px}\n    .hfCompareCard{padding:14px;border:1px solid #dbe4ee;border-radius:18px;background:rgba(255,255,255,.92);box-shadow:0 10px 24px rgba(15,23,42,.05)}\n    .hfCompareCardTitle{font-size:13px;font-weight:900;color:#0f172a}\n    .hfCompareGroups{display:flex;flex-direction:column;gap:10px;margin-top:10px}\n    .hfCompareDetails{border:1px solid #dbe4ee;border-radius:14px;background:#fff;overflow:hidden}\n    .hfCompareSummary{display:flex;align-items:center;justify-content:space-between;gap:10px;cursor:pointer;list-style:none;padding:10px 12px;font-size:12px;font-weight:900;color:#0f172a;background:#f8fafc}\n    .hfCompareSummary::-webkit-details-marker{display:none}\n    .hfCompareSummary span{display:inline-flex;align-items:center;justify-content:center;min-height:22px;padding:0 8px;border-radius:999px;background:#dbeafe;color:#1d4ed8;font-size:11px;font-weight:900}\n    .hfCompareList{margin:0;padding:12px 12px 12px 28px;display:flex;flex-direction:column;gap:12px;color:#0f172a;font-size:12.5px;line-height:1.6}\n    .hfCompareList li{margin:0}\n    .hfCompareItem{display:flex;flex-direction:column;gap:7px}\n    .hfCompareItemHead{display:flex;align-items:center;justify-content:space-between;gap:10px;flex-wrap:wrap}\n    .hfCompareSwap{display:flex;flex-direction:column;gap:8px}\n    .hfCompareLine{display:flex;gap:8px;align-items:flex-start;padding:8px 10px;border-radius:12px;border:1px solid #dbe4ee}\n    .hfCompareBefore{background:#fff7ed;border-color:#fdba74}\n    .hfCompareAfter{background:#ecfdf5;border-color:#86efac}\n    .hfCompareLabel{display:inline-flex;align-items:center;justify-content:center;flex:0 0 auto;min-width:38px;min-height:22px;padding:0 8px;border-radius:999px;font-size:10.5px;font-weight:900;letter-spacing:.01em}\n    .hfCompareBefore .hfCompareLabel{background:#ffedd5;color:#9a3412}\n    .hfCompareAfter .hfCompareLabel{background:#dcfce7;color:#166534}\n    .hfCompareChange{margin-top:2px;color:#334155;min-width:0}\n    .hfCompareMuted{display:inline-flex;margin-left:6px;color:#64748b;font-size:11px;font-weight:800}\n    .hfCompareEmpty{color:#64748b;list-style:disc}\n\n    .btnOpen{display:inline-flex;align-items:center;justify-content:center;flex-shrink:0;\n             height:38px;padding:0 16px;border-radius:12px;border:1px solid var(--btn);\n             background:var(--btn);color:#fff;text-decoration:none;font-size:13px;font-weight:900;white-space:nowrap}\n    .btnOpen:hover{background:var(--btnHover);border-color:var(--btnHover)}\n\n    .empty{color:var(--muted);font-size:13px;padding:10px 2px}\n    .footer{margin-top:18px;color:var(--muted);font-size:12px}\n    .footerMeta{margin-top:8px;font-family:ui-monospace, SFMono-Regular, Consolas, monospace}\n'
+_DAILY_PAGE_CSS_TAIL = '\n    .swipeHint{display:none;align-items:center;justify-content:center;gap:8px;margin:8px 0 2px;color:var(--muted);font-size:12px;user-select:none;opacity:.9;transition:opacity .25s ease, transform .25s ease}\n    .swipeHint.show{display:flex}\n    .swipeHint.hide{opacity:0;transform:translateY(-4px)}\n    .swipeHint .arrow{display:inline-flex;align-items:center;justify-content:center;width:20px;height:20px;border:1px solid var(--line);border-radius:999px;background:var(--btnBg, #fff);font-size:11px;line-height:1}\n    .swipeHint .txt{letter-spacing:-0.1px}\n    .swipeHint .pill{padding:2px 8px;border:1px dashed var(--line);border-radius:999px;background:rgba(255,255,255,.02)}\n    @media (hover:hover) and (pointer:fine){ .swipeHint{display:none !important;} }\n    @media (prefers-reduced-motion: reduce){ .swipeHint{transition:none} }\n    .navLoading{display:none;align-items:center;justify-content:center;margin:4px 0 0;color:var(--muted);font-size:12px}\n    .navLoading.show{display:flex}\n    .navLoading .badge{padding:3px 10px;border:1px solid var(--line);border-radius:999px;background:var(--btnBg, #fff);box-shadow:var(--shadow, 0 4px 12px rgba(17,24,39,.08))}\n    .navRow{transition:transform .18s ease, opacity .18s ease}\n    .navRow.swipeActive{transition:none}\n    .navRow.swipeSettling{transition:transform .18s ease, opacity .18s ease}\n    @media (max-width: 900px) and (hover: none), (max-width: 900px) and (pointer: coarse){\n      .chipDock{display:none}\n      .chips,.commodityGroupNav{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;justify-content:stretch;overflow:visible}\n      .chip,.commodityGroupChip{width:100%;justify-content:space-between;min-height:48px;padding:0 14px;border-radius:18px}\n      .chipN,.commodityGroupChip span{min-width:24px;height:24px;padding:0 7px}\n      .mobileQuickNav{display:block;position:fixed;right:14px;bottom:18px;z-index:13}\n      .mobileQuickNavToggle{display:inline-flex;align-items:center;justify-content:center;gap:8px;min-height:44px;padding:0 14px;border:1px solid #0f172a;border-radius:999px;background:#0f172a;color:#fff;font-size:13px;font-weight:900;box-shadow:0 18px 38px rgba(15,23,42,.28)}\n    }\n    @media (max-width: 840px){\n      .topbar{background:rgba(255,255,255,0.98);backdrop-filter:none}\n      .wrap{padding:16px 16px 72px !important}\n      .topin{padding:12px 16px}\n      .chipDockInner{padding:0 16px}\n      .commodityGrid{grid-template-columns:repeat(2,minmax(0,1fr))}\n    }\n    @media (max-width: 640px){\n      .wrap{padding:12px 12px 64px !important}\n      .topin{gap:8px}\n      .navRow{display:grid;grid-template-columns:minmax(0,1fr) auto;gap:8px}\n      .navRow > .navBtn:first-child{grid-column:1}\n      .navRow > .navBtn:nth-child(2){grid-column:2}\n      .navRow > .dateSelWrap{grid-column:1; width:100%}\n      .navRow > .navBtn:last-child{grid-column:2}\n      .dateSelWrap{width:100%}\n      .dateSelWrap select{width:100%;max-width:none}\n      .viewTabs{grid-template-columns:repeat(2,minmax(0,1fr));gap:4px;margin-top:12px;padding:4px;border:1px solid #dbe4ee;border-radius:18px;background:#f8fafc}\n      .viewTab{min-height:auto;padding:10px 12px;border:none;border-radius:14px;gap:4px;box-shadow:none;align-items:center;justify-content:center;background:transparent}\n      .viewTab:hover{transform:none;box-shadow:none;border-color:transparent}\n      .viewTab.isActive{box-shadow:0 10px 22px rgba(29,78,216,.22)}\n      .viewTabEyebrow{display:none}\n      .viewTabTitle{width:100%;font-size:17px;letter-spacing:-0.35px;text-align:center}\n      .viewTabDesc{display:none}\n      .viewTabStats{display:none}\n      .briefingPane,.commodityPane{margin-top:12px}\n      .briefingHero{grid-template-columns:1fr;padding:0;border:none;border-radius:0;gap:10px;background:transparent;box-shadow:none}\n      .briefingEyebrow,.commodityEyebrow{min-height:22px;padding:0 8px;font-size:10px}\n      .briefingEyebrow{margin-left:8px;top:-1px}\n      .briefingHero h2{font-size:26px;letter-spacing:-0.6px}\n      .briefingLead,.commodityLead{margin-top:8px;font-size:13px;line-height:1.5;display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient:vertical;overflow:hidden}\n      .briefingHeroStats{display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:8px;width:100%;justify-content:flex-start}\n      .briefingHeroStat{min-width:0;min-height:0;padding:10px 10px 11px;border-radius:14px;box-shadow:none;border:1px solid #e2e8f0;background:#f8fafc}\n      .briefingHeroStatLabel{font-size:10px}\n      .briefingHeroStat strong{margin-top:4px;font-size:18px}\n      .briefingChipbar{margin:12px 0 18px}\n      .hfComparePanel{margin-top:12px;padding:14px;border-radius:18px}\n      .hfCompareHead{grid-template-columns:1fr}\n      .hfComparePanel h2{font-size:22px;letter-spacing:-0.5px}\n      .hfCompareLead{margin-top:7px;font-size:12.5px;line-height:1.55}\n      .hfCompareStats{justify-content:flex-start}\n      .hfCompareGrid{grid-template-columns:1fr;gap:10px}\n      .hfCompareCard{padding:12px;border-radius:16px}\n      .hfCompareList{font-size:12px}\n      .hfCompareSummary{padding:10px 11px}\n      .hfCompareLine{padding:8px 9px}\n      .commodityBoardNav{margin:10px 0 16px}\n      .chipDock{display:none}\n      .chipbar{border:none;border-radius:0;background:transparent;box-shadow:none;overflow:visible}\n      .chipwrap{padding:0}\n      .chips,.commodityGroupNav{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;justify-content:stretch;overflow:visible}\n      .chip,.commodityGroupChip{width:100%;justify-content:space-between;min-height:48px;padding:0 14px;font-size:13px;border-radius:18px;box-shadow:0 10px 24px rgba(15,23,42,.10)}\n      .chipN,.commodityGroupChip span{min-width:24px;height:24px;padding:0 7px}\n      .mobileQuickNav{display:block;position:fixed;right:14px;bottom:18px;z-index:13}\n      .mobileQuickNavToggle{display:inline-flex;align-items:center;justify-content:center;gap:8px;min-height:44px;padding:0 14px;border:1px solid #0f172a;border-radius:999px;background:#0f172a;color:#fff;font-size:13px;font-weight:900;box-shadow:0 18px 38px rgba(15,23,42,.28)}\n      .commodityBoard{margin-top:8px;border:none;border-radius:0;background:transparent;box-shadow:none}\n      .commodityHead{grid-template-columns:1fr;padding:0;border-bottom:none;background:transparent;overflow:visible}\n      .commodityHead::after{display:none}\n      .commodityHead h2{font-size:26px;letter-spacing:-0.6px}\n      .commodityHeadStats{display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:8px;width:100%;justify-content:flex-start}\n      .commodityHeadStat{min-width:0;min-height:0;padding:10px 10px 11px;border-radius:14px;box-shadow:none;border:1px solid #e2e8f0;background:#f8fafc}\n      .commodityHeadStatLabel{font-size:10px}\n      .commodityHeadStat strong{margin-top:4px;font-size:18px}\n      .commodityGrid,.commodityGrid.isSingle,.commodityGrid.isDuo{grid-template-columns:1fr}\n      .commodityGroupBlock{margin:0 0 20px;padding:0;border:none;border-radius:0;background:transparent;box-shadow:none}\n      .commodityGroupHead{display:block;padding:0 0 10px;border-bottom:none;margin-bottom:12px}\n      .commodityGroupMeta{margin-top:6px}\n      .commodityTile{padding:14px;border-radius:18px;box-shadow:0 12px 26px rgba(15,23,42,.08)}\n      .commodityInactive{padding:0;border:none;background:transparent}\n      .commodityInactiveTitle{margin-bottom:10px}\n      .sec{margin-top:22px !important;border:none !important;border-left:none !important;border-radius:0 !important;overflow:visible;background:transparent;padding-left:0}\n      .secHead{padding:0 0 10px;background:transparent;border-bottom:1px solid var(--line);border-left:none !important}\n      .secBody{padding:4px 0 0}\n      .card{margin:0 0 12px;padding:14px;border-radius:18px;box-shadow:0 12px 26px rgba(15,23,42,.08);border-left:none !important}\n      .commoditySupportStory,.commodityMoreStory{width:100%}\n      .commoditySupportText{white-space:normal;display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient:vertical}\n      .commodityMiniGrid{gap:6px}\n    }\n    @media print {\n      .topbar,.chipDock,.mobileQuickNav,.mobileQuickNavSheet,.navLoading,.swipeHint,.btnOpen,.viewTabs{display:none !important}\n      body{background:#fff;color:#000}\n      .wrap{max-width:none;padding:10px !important}\n      .briefingHero{border:1px solid #ccc;box-shadow:none;background:#fff}\n      .chipbar{display:block;border:none;box-shadow:none;background:transparent}\n      .chips{flex-wrap:wrap}\n      .chip{border:1px solid #ccc;box-shadow:none;background:#f9f9f9;page-break-inside:avoid}\n      .sec{border:1px solid #ccc;page-break-inside:avoid}\n      .card{box-shadow:none;border:1px solid #ccc;page-break-inside:avoid;cursor:default}\n      .card:hover{border-color:#ccc;box-shadow:none}\n      .sum{display:block;-webkit-line-clamp:unset;overflow:visible}\n      .commodityBoard{box-shadow:none;border:1px solid #ccc}\n      .commodityTile{box-shadow:none;border:1px solid #ccc;page-break-inside:avoid}\n      .footer{page-break-before:always}\n      a{color:#000;text-decoration:none}\n      .press{color:#000} .ttl{color:#000}\n    }\n    @media (prefers-color-scheme: dark) {\n      :root {\n        --bg:#0f172a;--text:#e2e8f0;--muted:#94a3b8;--line:#334155;--card:#1e293b;\n        --chip:#1e293b;--btn:#3b82f6;--btnHover:#2563eb;--btnBg:#1e293b;\n        --shadow:0 4px 12px rgba(0,0,0,.3);\n      }\n      body{background:var(--bg);color:var(--text)}\n      .topbar{background:rgba(15,23,42,0.94);border-bottom-color:var(--line)}\n      .navBtn{background:#1e293b;color:#e2e8f0;border-color:var(--line)}\n      .navBtn:hover{border-color:#475569}\n      .navBtn.navArchive{background:#1e3a5f !important;border-color:#3b82f6 !important;color:#93c5fd !important}\n      .navRow > a.navBtn:first-child{background:#1e3a5f !important;border-color:#3b82f6 !important;color:#93c5fd !important}\n      select{background:#1e293b;color:#e2e8f0;border-color:var(--line)}\n      .viewTab{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);color:#e2e8f0;border-color:var(--line)}\n      .viewTab:hover{border-color:#475569}\n      .viewTab.isActive{background:linear-gradient(135deg,#0f172a 0%,#1d4ed8 100%);border-color:#1d4ed8}\n      .viewTabDesc{color:#94a3b8}\n      .viewTabStat{background:rgba(255,255,255,.08);color:#e2e8f0}\n      .hfDelta{background:#1e293b;border-color:#475569;color:#cbd5e1}\n      .hfDelta.isPos{background:rgba(20,83,45,.28);border-color:#22c55e;color:#bbf7d0}\n      .hfDelta.isNeg{background:rgba(124,45,18,.28);border-color:#fb923c;color:#fed7aa}\n      .hfComparePanel{background:linear-gradient(135deg,#1e293b 0%,#0f172a 54%,#1e293b 100%);border-color:#1d4ed8;box-shadow:0 16px 36px rgba(0,0,0,.24)}\n      .hfCompareEyebrow{background:#1e3a5f;color:#93c5fd}\n      .hfCompareLead{color:#cbd5e1}\n      .hfCompareStat{background:rgba(30,41,59,.9);border-color:var(--line);color:#e2e8f0}\n      .hfCompareCard{background:rgba(30,41,59,.92);border-color:var(--line)}\n      .hfCompareDetails{background:#0f172a;border-color:#475569}\n      .hfCompareSummary{background:#1e293b;color:#f8fafc}\n      .hfCompareSummary span{background:#1e3a5f;color:#93c5fd}\n      .hfCompareCardTitle{color:#f8fafc}\n      .hfCompareList{color:#e2e8f0}\n      .hfCompareLine{border-color:#475569}\n      .hfCompareBefore{background:rgba(124,45,18,.18);border-color:#ea580c}\n      .hfCompareAfter{background:rgba(20,83,45,.18);border-color:#22c55e}\n      .hfCompareBefore .hfCompareLabel{background:rgba(154,52,18,.32);color:#fed7aa}\n      .hfCompareAfter .hfCompareLabel{background:rgba(21,128,61,.32);color:#bbf7d0}\n      .hfCompareChange{color:#cbd5e1}\n      .hfCompareArrow{color:#60a5fa}\n      .hfCompareMuted,.hfCompareEmpty{color:#94a3b8}\n      .briefingHero{background:linear-gradient(135deg,#1e293b 0%,#0f172a 56%,#1e293b 100%);border-color:var(--line)}\n      .briefingHeroStat{background:rgba(30,41,59,.92);border-color:var(--line)}\n      .briefingHeroStat strong{color:#e2e8f0}\n      .briefingHeroStatLabel{color:#94a3b8}\n      .chipbar{background:rgba(30,41,59,.96);border-color:var(--line)}\n      .chip{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);color:#e2e8f0}\n      .sec{background:var(--card)}\n      .secHead{background:#1e293b;border-bottom-color:var(--line)}\n      .card{background:#1e293b;border-color:var(--line)}\n      .card:hover{border-color:#475569;box-shadow:0 4px 12px rgba(0,0,0,.2)}\n      .press{color:#e2e8f0}\n      .topic{background:#334155;border-color:#475569;color:#e2e8f0}\n      .ttl{color:#f1f5f9}\n      .sum{color:#94a3b8}\n      .badgeCore{background:#3b82f6;color:#fff}\n      .commodityBoard{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);border-color:var(--line)}\n      .commodityHead{background:linear-gradient(135deg,#1e293b 0%,#0f172a 68%,#1e293b 100%);border-bottom-color:var(--line)}\n      .commodityHead::after{display:none}\n      .commodityHeadStat{background:rgba(30,41,59,.95);border-color:var(--line)}\n      .commodityHeadStat strong{color:#e2e8f0}\n      .commodityTile{background:#1e293b;border-color:var(--line)}\n      .commodityTile.isActive{border-color:#34d399;box-shadow:0 8px 24px rgba(52,211,153,.1)}\n      .commodityTile.isMuted{background:#172033;border-color:#475569}\n      .commodityTile.isMuted .commodityTileName{color:#94a3b8}\n      .commodityPrimaryCard{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);border-color:var(--line)}\n      .commodityPrimaryStory{color:#f1f5f9}\n      .commoditySupportStory,.commodityMoreStory{background:#1e293b;border-color:var(--line);color:#e2e8f0}\n      .commodityMoreWrap{background:#0f172a;border-color:#475569}\n      .commodityMoreSummary{color:#94a3b8}\n      .commodityGroupBlock{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);border-color:var(--line)}\n      .commodityInactive{background:#0f172a;border-color:#475569}\n      .commodityMiniChip{background:#1e293b;border-color:#475569;color:#94a3b8}\n      .commodityMiniChip.isCore{background:#1e3a5f;border-color:#3b82f6;color:#93c5fd}\n      .commodityStoryMuted{background:#0f172a;border-color:#475569;color:#64748b}\n      .mobileQuickNavPanel{background:#1e293b;border-color:var(--line)}\n      .mobileQuickNavClose{background:#1e293b;color:#e2e8f0;border-color:var(--line)}\n      .chipDock .chipbar{background:rgba(30,41,59,.98)}\n      .empty{color:#64748b}\n    }\n  </style>\n'
+_INDEX_PAGE_CSS_HEAD = '  <style>\n    :root {\n      --bg:#ffffff;\n      --text:#111827;\n      --muted:#6b7280;\n      --line:#e5e7eb;\n      --btn:#1d4ed8;\n      --btnHover:#1e40af;\n      --chip:#f3f4f6;\n      --mark:#fef08a;\n    }\n    *{box-sizing:border-box}\n    body{margin:0;background:var(--bg);color:var(--text);\n      font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, "Noto Sans KR", Arial;}\n    .wrap{max-width:1040px;margin:0 auto;padding:26px 16px 70px}\n    h1{margin:0;font-size:22px;letter-spacing:-0.2px}\n    .sub{color:var(--muted);margin-top:8px;font-size:13px;line-height:1.5}\n    .btn{display:inline-flex;align-items:center;justify-content:center;margin-top:14px;text-decoration:none;color:#fff;\n         border:1px solid var(--btn);padding:10px 14px;border-radius:12px;background:var(--btn);font-weight:900; cursor:pointer; user-select:none}\n    .btn:hover{background:var(--btnHover);border-color:var(--btnHover)}\n    .btn.disabled{opacity:.5; cursor:not-allowed}\n    .btn.ghost{background:#fff;color:var(--btn);border-color:var(--line)}\n    .btn.ghost:hover{border-color:#cbd5e1;background:#f8fafc}\n\n    .panel{margin-top:18px;border:1px solid var(--line);border-radius:16px;background:#fff;padding:14px}\n    .panelTitle{font-weight:900;margin-bottom:10px;display:flex;gap:10px;align-items:center;justify-content:space-between}\n    .grid{display:grid;grid-template-columns:repeat(3,1fr);gap:10px}\n    @media (max-width: 820px) { .grid{grid-template-columns:repeat(2,1fr);} }\n    @media (max-width: 520px) { .grid{grid-template-columns:1fr;} }\n\n    .card{display:block;text-decoration:none;border:1px solid var(--line);border-radius:14px;padding:12px;\n          background:#ffffff;color:var(--text)}\n    .card:hover{border-color:#cbd5e1}\n    .dt{font-size:15px;font-weight:900}\n    .meta{margin-top:6px;color:var(--muted);font-size:12px}\n    .empty{color:var(--muted);font-size:13px}\n    .cardBadge{display:inline-flex;align-items:center;justify-content:center;margin-left:6px;padding:1px 7px;border-radius:999px;background:#eef2ff;color:#1d4ed8;font-size:11px;font-weight:800;border:1px solid #c7d2fe}\n\n    /* search */\n    .searchRow{display:flex;gap:10px;align-items:center}\n    .searchInput{flex:1;border:1px solid var(--line);border-radius:12px;padding:10px 12px;font-size:14px}\n    .searchInput:focus{outline:none;border-color:#93c5fd;box-shadow:0 0 0 3px rgba(59,130,246,.12)}\n\n    .filters{margin-top:10px;display:flex;flex-wrap:wrap;gap:8px;align-items:center}\n    .sel,.date{border:1px solid var(--line);border-radius:12px;padding:8px 10px;font-size:13px;background:#fff}\n    .sel:focus,.date:focus{outline:none;border-color:#93c5fd;box-shadow:0 0 0 3px rgba(59,130,246,.12)}\n    .chip{display:inline-flex;align-items:center;gap:6px;background:var(--chip);border:1px solid var(--line);\n          padding:3px 8px;border-radius:999px;font-size:11px;color:#374151}\n    .chip b{font-weight:900}\n    .hint{margin-top:8px;color:var(--muted);font-size:12px;line-height:1.4}\n    .metaLine{margin-top:10px;color:var(--muted);font-size:12px;display:flex;flex-wrap:wrap;gap:10px;align-items:center;justify-content:space-between}\n    .metaLeft{display:flex;gap:8px;flex-wrap:wrap;align-items:center}\n\n    mark{background:var(--mark);padding:0 2px;border-radius:4px}\n\n    .results{margin-top:10px;display:flex;flex-direction:column;gap:10px}\n    .result{border:1px solid var(--line);border-radius:14px;padding:12px;background:#fff}\n    .rTop{display:flex;flex-wrap:wrap;gap:6px;align-items:center}\n    .rTitle{margin-top:6px;font-weight:900;font-size:14px;line-height:1.35}\n    .rSum{margin-top:6px;color:#374151;font-size:13px;line-height:1.45}\n    .rLinks{margin-top:9px;display:flex;gap:12px;font-size:12px}\n    .rLinks a{color:var(--btn);text-decoration:none;font-weight:900}\n    .rLinks a:hover{text-decoration:underline}\n\n    .pager{margin-top:10px;display:flex;gap:8px;align-items:center;justify-content:flex-end;flex-wrap:wrap}\n    .pager .pbtn{padding:8px 10px;border-radius:12px;border:1px solid var(--line);background:#fff;cursor:pointer;font-weight:900;color:#111827}\n    .pager .pbtn:hover{border-color:#cbd5e1;background:#f8fafc}\n    .pager .pbtn[disabled]{opacity:.5;cursor:not-allowed}\n    .pager .pinfo{color:var(--muted);font-size:12px;margin-right:auto}\n\n    .groupHdr{margin-top:8px;font-weight:900;font-size:13px;color:#111827}\n    .groupWrap{display:flex;flex-direction:column;gap:10px}\n'
+_INDEX_PAGE_CSS_TAIL = '\n    @media (prefers-color-scheme: dark) {\n      :root {--bg:#0f172a;--text:#e2e8f0;--muted:#94a3b8;--line:#334155;--btn:#3b82f6;--btnHover:#2563eb;--chip:#334155;--mark:#854d0e}\n      body{background:var(--bg);color:var(--text)}\n      .btn{color:#fff} .btn.ghost{background:#1e293b;color:#93c5fd;border-color:var(--line)}\n      .btn.ghost:hover{background:#334155;border-color:#475569}\n      .btn.disabled{opacity:.5}\n      .panel{background:#1e293b;border-color:var(--line)}\n      .card{background:#1e293b;border-color:var(--line);color:var(--text)}\n      .card:hover{border-color:#475569}\n      .dt{color:#f1f5f9}\n      .searchInput{background:#1e293b;color:#e2e8f0;border-color:var(--line)}\n      .searchInput:focus{border-color:#3b82f6;box-shadow:0 0 0 3px rgba(59,130,246,.2)}\n      .sel,.date{background:#1e293b;color:#e2e8f0;border-color:var(--line)}\n      .sel:focus,.date:focus{border-color:#3b82f6;box-shadow:0 0 0 3px rgba(59,130,246,.2)}\n      .chip{background:#334155;border-color:#475569;color:#e2e8f0}\n      .result{background:#1e293b;border-color:var(--line)}\n      .rTitle{color:#f1f5f9}\n      .rSum{color:#94a3b8}\n      .rLinks a{color:#93c5fd}\n      .pager .pbtn{background:#1e293b;color:#e2e8f0;border-color:var(--line)}\n      .pager .pbtn:hover{background:#334155;border-color:#475569}\n      mark{background:#854d0e;color:#fde68a}\n      .groupHdr{color:#e2e8f0}\n      .cardBadge{background:#1e3a5f;color:#93c5fd;border-color:#3b82f6}\n    }\n  </style>\n'
+
+
 def render_daily_page(report_date: str, start_kst: datetime, end_kst: datetime, by_section: dict[str, list[Article]],
                       archive_dates_desc: list[str], site_path: str,
                       board_source_by_section: dict[str, list[Article]] | None = None) -> str:
@@ -47769,7 +48025,7 @@ def render_daily_page(report_date: str, start_kst: datetime, end_kst: datetime,
 
         def render_card(a: Article, is_core: bool) -> str:
             url = a.originallink or a.link
-            summary_html = "<br>".join(esc(a.summary).splitlines())
+            summary_html = esc(a.summary).replace("\r\n", "<br>").replace("\n", "<br>").replace("\r", "<br>")
             core_badge = '<span class="badgeCore">핵심</span>' if is_core else ""
             semantic_badge = ""
             if is_dev_preview and DEBUG_REPORT:
@@ -47921,466 +48177,7 @@ def render_daily_page(report_date: str, start_kst: datetime, end_kst: datetime,
 {ga4_head_html}
 {dev_meta_html}
   <title>{esc(page_title)}</title>
-  <style>
-    :root {{
-      --bg:#ffffff;
-      --text:#111827;
-      --muted:#6b7280;
-      --line:#e5e7eb;
-      --card:#ffffff;
-      --chip:#f8fafc;
-      --btn:#1d4ed8;
-      --btnHover:#1e40af;
-      --btnBg:#ffffff;
-      --shadow:0 4px 12px rgba(17,24,39,.08);
-      --page-max:1220px;
-      --topbar-height:172px;
-      --chipbar-height:58px;
-      --nav-chip-height:40px;
-      --sticky-nav-offset:188px;
-      --anchor-offset:248px;
-    }}
-    *{{box-sizing:border-box}}
-    html {{
-      scroll-behavior:smooth;
-      scroll-padding-top: var(--anchor-offset);
-      /* 가로 오버스크롤이 브라우저 히스토리 이동(뒤로가기 제스처)으로 번지지 않도록 차단
-         — 날짜 이동 스와이프는 페이지 자체 핸들러가 처리한다 */
-      overscroll-behavior-x:none;
-    }}
-    body{{margin:0;background:var(--bg); color:var(--text);
-         overscroll-behavior-x:none;
-         font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, \"Noto Sans KR\", Arial;}}
-    .wrap{{max-width:var(--page-max) !important;margin:0 auto !important;padding:18px 20px 80px !important;touch-action:pan-y;overscroll-behavior-x:contain;}}
-    .topbar{{position:sticky;top:0;background:rgba(255,255,255,0.94);backdrop-filter:saturate(180%) blur(10px);
-            border-bottom:1px solid var(--line); z-index:10;}}
-    .topin{{max-width:var(--page-max);margin:0 auto;padding:12px 20px;display:grid;grid-template-columns:1fr;gap:10px;align-items:start}}
-    h1{{margin:0;font-size:18px;letter-spacing:-0.2px}}
-    .sub{{color:var(--muted);font-size:12.5px;margin-top:4px}}
-    .envBadge{{display:inline-flex;align-items:center;justify-content:center;margin-left:8px;padding:2px 8px;border-radius:999px;background:#fff7ed;border:1px solid #fdba74;color:#9a3412;font-size:11px;font-weight:900;vertical-align:middle}}
-    .navRow{{display:flex;gap:8px;align-items:center;flex-wrap:wrap;width:100%}}
-    .navRow > *{{min-width:0}}
-    .navBtn{{white-space:nowrap}}
-    .navBtn{{display:inline-flex;align-items:center;justify-content:center;
-            height:36px;padding:0 12px;border:1px solid var(--line);border-radius:10px;
-            background:#fff;color:#111827;text-decoration:none;font-size:13px; cursor:pointer;}}
-    .navBtn:hover{{border-color:#cbd5e1}}
-    .navBtn.navArchive{{background:#eef5ff !important;border-color:#b7d4ff !important;color:#1d4ed8 !important;font-weight:800}}
-    .navBtn.navArchive:hover{{filter:brightness(0.98)}}
-    /* fallback: first nav button */
-    .navRow > a.navBtn:first-child{{background:#eef5ff !important;border-color:#b7d4ff !important;color:#1d4ed8 !important;font-weight:800}}
-
-    .navBtn.disabled{{opacity:.45;cursor:not-allowed}}
-    .dateSelWrap{{display:inline-flex;align-items:center;gap:6px}}
-    select{{height:36px;border:1px solid var(--line);border-radius:10px;padding:0 10px;background:#fff;font-size:13px;
-            width:165px; max-width:165px;}}
-    @media (max-width: 520px) {{
-      select{{width:145px; max-width:145px;}}
-    }}
-
-    .viewTabs{{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:14px;margin-top:18px;align-items:stretch}}
-    .viewTab{{display:flex;flex-direction:column;align-items:flex-start;justify-content:flex-start;gap:12px;min-height:132px;padding:18px 20px;border-radius:22px;border:1px solid #dbe4ee;background:linear-gradient(180deg,#ffffff 0%,#f8fafc 100%);color:#0f172a;cursor:pointer;text-align:left;box-shadow:0 12px 28px rgba(15,23,42,.08);transition:transform .18s ease, box-shadow .18s ease, border-color .18s ease}}
-    .viewTab:hover{{transform:translateY(-1px);border-color:#bfdbfe;box-shadow:0 18px 36px rgba(15,23,42,.12)}}
-    .viewTab.isActive{{background:linear-gradient(135deg,#0f172a 0%,#1d4ed8 100%);color:#fff;border-color:#0f172a;box-shadow:0 20px 40px rgba(29,78,216,.24)}}
-    .viewTabEyebrow{{display:inline-flex;align-items:center;min-height:24px;padding:0 9px;border-radius:999px;background:rgba(14,165,233,.1);color:#075985;font-size:11px;font-weight:900;letter-spacing:.02em}}
-    .viewTab.isActive .viewTabEyebrow{{background:rgba(255,255,255,.16);color:#e0f2fe}}
-    .viewTabTitle{{font-size:24px;font-weight:900;letter-spacing:-0.5px;line-height:1.1}}
-    .viewTabDesc{{max-width:420px;font-size:13px;line-height:1.55;color:#475569}}
-    .viewTab.isActive .viewTabDesc{{color:rgba(255,255,255,.88)}}
-    .viewTabStats{{display:flex;gap:8px;flex-wrap:wrap;align-items:center;margin-top:auto}}
-    .viewTabStat{{display:inline-flex;align-items:center;gap:6px;min-height:32px;padding:0 11px;border-radius:999px;background:#eef2ff;color:#1e293b;font-size:12px;font-weight:800}}
-    .viewTabStat strong{{font-size:13px}}
-    .viewTab.isActive .viewTabStat{{background:rgba(255,255,255,.16);color:#fff}}
-
-    .briefingHero{{display:grid;grid-template-columns:minmax(0,1fr) auto;gap:18px;align-items:flex-start;margin-top:14px;padding:22px;border:1px solid #dbe4ee;border-radius:22px;background:radial-gradient(circle at top left, rgba(191,219,254,.75), transparent 34%),linear-gradient(135deg,#eff6ff 0%,#ffffff 56%,#f8fafc 100%);box-shadow:0 14px 34px rgba(15,23,42,.08)}}
-    .briefingHeroMain{{min-width:0}}
-    .briefingEyebrow{{display:inline-flex;align-items:center;min-height:26px;padding:0 10px;border-radius:999px;background:#ecfeff;border:1px solid #99f6e4;color:#115e59;font-size:11px;font-weight:900;letter-spacing:.02em;vertical-align:middle;margin-left:10px;position:relative;top:-2px}}
-    .briefingHero h2{{margin:0;font-size:30px;line-height:1.05;letter-spacing:-0.8px}}
-    .briefingLead{{margin-top:10px;max-width:720px;color:#334155;font-size:14px;line-height:1.65}}
-    .briefingHeroStats{{display:flex;gap:10px;flex-wrap:wrap;justify-content:flex-end}}
-    .briefingHeroStat{{display:flex;flex-direction:column;justify-content:center;min-width:110px;min-height:82px;padding:14px 16px;border-radius:18px;border:1px solid rgba(148,163,184,.25);background:rgba(255,255,255,.92);box-shadow:0 10px 24px rgba(15,23,42,.06)}}
-    .briefingHeroStatLabel{{color:#64748b;font-size:11px;font-weight:900;letter-spacing:.04em}}
-    .briefingHeroStat strong{{margin-top:6px;color:#0f172a;font-size:22px;font-weight:900;letter-spacing:-0.4px}}
-
-    /* briefing chip bar */
-    .chipbar{{position:relative;z-index:2;border:1px solid var(--line);border-radius:16px;background:rgba(248,250,252,.96);box-shadow:0 14px 32px rgba(15,23,42,.10);backdrop-filter:saturate(180%) blur(10px);overflow:hidden;}}
-    .briefingChipbar{{margin:16px 0 0}}
-    .commodityBoardNav{{margin:18px 18px 20px}}
-    .chipwrap{{max-width:var(--page-max);margin:0 auto;padding:10px 18px;}}
-    .chips,.commodityGroupNav{{display:flex;gap:10px;align-items:center;justify-content:flex-start;width:100%;}}
-    .chips{{flex-wrap:wrap;overflow-x:auto; -webkit-overflow-scrolling:touch;}}
-    .chips::-webkit-scrollbar{{height:8px}}
-    .commodityGroupNav{{flex-wrap:wrap;}}
-    .chip,.commodityGroupChip{{text-decoration:none;border:1px solid var(--chip-border, var(--group-chip-border, var(--line)));border-radius:999px;
-          background:linear-gradient(180deg,var(--chip-soft, var(--group-chip-soft, var(--chip))) 0%, #ffffff 100%);font-size:13px;color:#111827;display:inline-flex;gap:8px;align-items:center;justify-content:center;min-width:0;min-height:var(--nav-chip-height);padding:0 16px;font-weight:900;box-shadow:inset 0 1px 0 rgba(255,255,255,.72);white-space:nowrap}}
-    .chip:hover{{border-color:var(--chip-color, #cbd5e1);transform:translateY(-1px)}}
-    .chipTitle{{font-weight:800;min-width:0;overflow:hidden;text-overflow:ellipsis;white-space:nowrap}}
-    .chipN,.commodityGroupChip span{{display:inline-flex;align-items:center;justify-content:center;min-width:26px;height:26px;text-align:center;color:#fff;padding:0 8px;border-radius:999px;font-size:11px}}
-    .chipN{{background:var(--chip-color, #111827)}}
-    .chipDock{{display:none}}
-    .chipDock.isVisible{{opacity:1;transform:translateY(0);pointer-events:auto}}
-    .chipDockInner{{max-width:var(--page-max);margin:0 auto;padding:0 20px}}
-    .chipDock .chipbar{{margin:0;box-shadow:0 18px 38px rgba(15,23,42,.14);background:rgba(248,250,252,.98)}}
-    .chipDock .briefingChipbar,
-    .chipDock .commodityBoardNav{{margin:0}}
-    body.quickNavOpen{{overflow:hidden}}
-    .mobileQuickNav{{display:block;position:fixed;right:18px;bottom:20px;z-index:13}}
-    .mobileQuickNavToggle{{display:inline-flex;align-items:center;justify-content:center;gap:8px;min-height:44px;max-width:calc(100vw - 32px);padding:0 14px;border:1px solid #0f172a;border-radius:999px;background:#0f172a;color:#fff;font-size:13px;font-weight:900;box-shadow:0 18px 38px rgba(15,23,42,.28);pointer-events:none;opacity:0;transform:translateY(8px);transition:opacity .18s ease, transform .18s ease}}
-    .mobileQuickNav.isVisible .mobileQuickNavToggle{{pointer-events:auto;opacity:1;transform:translateY(0)}}
-    .mobileQuickNavSheet{{position:fixed;inset:0;display:none;z-index:14}}
-    .mobileQuickNavSheet.isOpen{{display:block}}
-    .mobileQuickNavBackdrop{{position:absolute;inset:0;border:0;background:rgba(15,23,42,.42)}}
-    .mobileQuickNavPanel{{position:absolute;left:12px;right:12px;bottom:14px;max-height:min(72vh, 560px);overflow:auto;padding:16px;border:1px solid #dbe4ee;border-radius:24px;background:#ffffff;box-shadow:0 22px 56px rgba(15,23,42,.24)}}
-    .mobileQuickNavHead{{display:flex;align-items:center;justify-content:space-between;gap:12px;margin-bottom:12px}}
-    .mobileQuickNavHead strong{{font-size:15px;letter-spacing:-0.2px}}
-    .mobileQuickNavClose{{display:inline-flex;align-items:center;justify-content:center;min-height:34px;padding:0 12px;border:1px solid var(--line);border-radius:999px;background:#fff;color:#111827;font-size:12px;font-weight:800}}
-    .mobileQuickNavBody .chipbar{{border:none;background:transparent;box-shadow:none;overflow:visible}}
-    .mobileQuickNavBody .chipwrap{{padding:0;max-width:none}}
-    .mobileQuickNavBody .chips,
-    .mobileQuickNavBody .commodityGroupNav{{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;justify-content:stretch;overflow:visible}}
-    .mobileQuickNavBody .chip,
-    .mobileQuickNavBody .commodityGroupChip{{width:100%;justify-content:space-between;min-height:48px;padding:0 14px;border-radius:18px;font-size:13px;box-shadow:0 10px 24px rgba(15,23,42,.12)}}
-    @media (min-width: 901px){{
-      .mobileQuickNavPanel{{left:auto;right:24px;bottom:82px;width:min(520px, calc(100vw - 48px));border-radius:20px}}
-      .mobileQuickNavBackdrop{{background:rgba(15,23,42,.10)}}
-    }}
-
-    .viewPane{{display:none}}
-    .viewPane.isActive{{display:block}}
-    .briefingPane{{margin-top:14px}}
-    .commodityPane{{margin-top:14px}}
-
-    .commodityBoard{{margin-top:14px;border:1px solid #dbe4ee;border-radius:22px;background:linear-gradient(180deg,#fff 0%,#f8fafc 100%);box-shadow:0 16px 34px rgba(15,23,42,.08);overflow:visible}}
-    .commodityHead{{position:relative;display:grid;grid-template-columns:minmax(0,1fr) auto;align-items:flex-start;gap:18px;padding:22px 22px 16px;border-bottom:1px solid rgba(229,231,235,.9);background:linear-gradient(135deg,#ffffff 0%,#f8fafc 68%,#f0fdf4 100%);overflow:hidden;isolation:isolate}}
-    .commodityHead::after{{content:"";position:absolute;inset:-24% -6% -22% 48%;background:radial-gradient(circle at 50% 46%, rgba(110,231,183,.62) 0%, rgba(125,211,252,.26) 33%, rgba(255,255,255,0) 72%);pointer-events:none;z-index:0}}
-    .commodityHeadMain{{position:relative;z-index:1;min-width:0}}
-    .commodityHead h2{{margin:8px 0 0;font-size:30px;line-height:1.05;letter-spacing:-0.7px}}
-    .commodityLead{{margin-top:10px;max-width:720px;color:#334155;font-size:14px;line-height:1.65}}
-    .commodityEyebrow{{display:inline-flex;align-items:center;min-height:26px;padding:0 10px;border-radius:999px;background:#ecfeff;border:1px solid #99f6e4;color:#115e59;font-size:11px;font-weight:900;letter-spacing:.02em;vertical-align:middle;margin-left:10px;position:relative;top:-2px}}
-    .commodityHeadStats{{position:relative;z-index:1;display:flex;gap:10px;flex-wrap:wrap;justify-content:flex-end}}
-    .commodityHeadStat{{display:flex;flex-direction:column;justify-content:center;min-width:110px;min-height:82px;padding:14px 16px;border-radius:18px;border:1px solid rgba(148,163,184,.24);background:rgba(255,255,255,.95);box-shadow:0 10px 24px rgba(15,23,42,.06)}}
-    .commodityHeadStatLabel{{color:#64748b;font-size:11px;font-weight:900;letter-spacing:.04em}}
-    .commodityHeadStat strong{{margin-top:6px;color:#0f172a;font-size:22px;font-weight:900;letter-spacing:-0.4px}}
-    .commodityBadge{{display:inline-flex;align-items:center;justify-content:center;height:22px;padding:0 9px;border-radius:999px;font-size:11px;font-weight:900;white-space:nowrap}}
-    .commodityBadge.core{{background:#dbeafe;color:#1d4ed8;border:1px solid #93c5fd}}
-    .commoditySignals{{display:flex;flex-wrap:wrap;gap:6px;min-height:24px}}
-    .commoditySig{{display:inline-flex;align-items:center;justify-content:center;height:22px;padding:0 8px;border-radius:999px;background:#eef2ff;color:#3730a3;font-size:11px;font-weight:800}}
-    .commoditySig[data-section="supply"]{{background:#ccfbf1;color:#115e59}}
-    .commoditySig[data-section="policy"]{{background:#dbeafe;color:#1d4ed8}}
-    .commoditySig[data-section="dist"]{{background:#ede9fe;color:#6d28d9}}
-    .commoditySig[data-section="pest"]{{background:#ffedd5;color:#b45309}}
-    .commoditySig.muted{{background:#f8fafc;color:#94a3b8}}
-    .commodityStoryCluster{{display:flex;flex-direction:column;gap:10px;height:100%}}
-    .commodityPrimaryCard{{padding:12px;border:1px solid #dbe4ee;border-radius:16px;background:linear-gradient(180deg,#ffffff 0%,#f8fafc 100%);min-height:124px}}
-    .commodityPrimaryHead{{display:flex;align-items:center;justify-content:space-between;gap:8px;flex-wrap:wrap}}
-    .commodityPrimaryKicker{{display:inline-flex;align-items:center;justify-content:center;min-height:22px;padding:0 8px;border-radius:999px;background:#0f172a;color:#fff;font-size:10px;font-weight:900;letter-spacing:.02em}}
-    .commodityPrimaryStory{{display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient:vertical;overflow:hidden;margin-top:8px;color:#0f172a;font-size:14px;font-weight:900;line-height:1.52;text-decoration:none}}
-    .commodityPrimaryStory:hover{{text-decoration:underline}}
-    .commodityPrimaryMeta{{margin-top:7px;color:#64748b;font-size:11px;font-weight:700}}
-    .commoditySupportList{{display:flex;flex-direction:column;gap:8px}}
-    .commoditySupportTitle{{color:#64748b;font-size:11px;font-weight:900;letter-spacing:.02em}}
-    .commoditySupportStory,.commodityMoreStory{{display:flex;align-items:flex-start;gap:8px;padding:9px 10px;border-radius:14px;border:1px solid #dbe4ee;background:#fff;color:#0f172a;text-decoration:none;min-width:0}}
-    .commoditySupportStory:hover,.commodityMoreStory:hover{{border-color:#cbd5e1}}
-    .commoditySupportLabel{{display:inline-flex;align-items:center;justify-content:center;min-height:20px;padding:0 7px;border-radius:999px;background:#eef2ff;color:#3730a3;font-size:10px;font-weight:900;flex:0 0 auto}}
-    .commoditySupportText{{display:-webkit-box;min-width:0;font-size:12px;line-height:1.5;-webkit-line-clamp:3;-webkit-box-orient:vertical;overflow:hidden}}
-    .commodityMoreWrap{{border:1px dashed #cbd5e1;border-radius:14px;background:#f8fafc}}
-    .commodityMoreSummary{{list-style:none;cursor:pointer;padding:10px 12px;color:#334155;font-size:12px;font-weight:900}}
-    .commodityMoreSummary::-webkit-details-marker{{display:none}}
-    .commodityMoreList{{display:flex;flex-direction:column;gap:8px;padding:0 10px 10px}}
-    .commodityStoryMuted{{padding:11px 12px;border:1px dashed #dbe4ee;border-radius:14px;background:#f8fafc;color:#94a3b8;font-size:12px}}
-    .commodityBoardNav{{border-color:#cfe0f4;background:rgba(255,255,255,.98);box-shadow:0 18px 36px rgba(15,23,42,.12)}}
-    .commodityGroupChip:hover{{border-color:var(--group-chip-color, #334155);transform:translateY(-1px)}}
-    .commodityGroupChip{{border-color:var(--group-chip-border, var(--line));background:linear-gradient(180deg,var(--group-chip-soft, var(--chip)) 0%, #ffffff 100%);}}
-    .commodityGroupChip span{{background:var(--group-chip-color, #111827)}}
-    .commodityGroupBlock{{margin:0 18px 20px;padding:20px;border:1px solid var(--commodity-group-border, #dbe4ee);border-left:4px solid var(--commodity-group-color, #475569);border-radius:22px;background:linear-gradient(180deg,var(--commodity-group-soft, #f8fafc) 0%, #ffffff 100%);box-shadow:0 16px 34px rgba(15,23,42,.07), inset 0 1px 0 rgba(255,255,255,.8);scroll-margin-top:calc(var(--anchor-offset) + 28px)}}
-    .commodityGroupHead{{display:flex;align-items:flex-start;justify-content:space-between;gap:12px;padding:0 0 14px;border-bottom:1px solid var(--commodity-group-border, #dbe4ee);margin-bottom:16px;flex-wrap:wrap}}
-    .commodityGroupTitleWrap{{display:flex;align-items:center;gap:10px}}
-    .commodityGroupTitleWrap h3{{margin:0;font-size:16px}}
-    .commodityGroupDot{{width:12px;height:12px;border-radius:999px;box-shadow:0 0 0 8px var(--commodity-group-soft, rgba(15,23,42,.06))}}
-    .commodityGroupMeta{{margin-left:auto;color:#64748b;font-size:12px;font-weight:700}}
-    .commodityGrid{{display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:12px;align-items:start}}
-    .commodityGrid.isSingle{{grid-template-columns:minmax(280px,520px)}}
-    .commodityGrid.isDuo{{grid-template-columns:repeat(2,minmax(0,1fr))}}
-    .commodityTile{{display:flex;flex-direction:column;gap:9px;padding:13px;border:1px solid #dbe4ee;border-radius:16px;background:#fff;min-height:100%}}
-    .commodityTile.isActive{{border-color:#86efac;box-shadow:0 8px 24px rgba(15,118,110,.08)}}
-    .commodityTile.isMuted{{border-style:dashed;border-color:#dbe4ee;background:#fcfdfe;opacity:.86}}
-    .commodityTile.isMuted .commodityTileName{{color:#64748b}}
-    .commodityTileTop{{display:flex;align-items:flex-start;justify-content:space-between;gap:10px}}
-    .commodityTileName{{font-size:16px;font-weight:900;line-height:1.35}}
-    .commodityTileMeta{{display:flex;gap:10px;flex-wrap:wrap;color:#64748b;font-size:12px;font-weight:700}}
-    .commodityInactive{{margin-top:12px;padding:12px;border:1px dashed #dbe4ee;border-radius:14px;background:#f8fafc}}
-    .commodityInactiveTitle{{color:#64748b;font-size:12px;font-weight:800;margin-bottom:8px}}
-    .commodityMiniGrid{{display:flex;flex-wrap:wrap;gap:8px}}
-    .commodityMiniChip{{display:inline-flex;align-items:center;justify-content:center;min-height:30px;padding:0 10px;border-radius:999px;border:1px solid #dbe4ee;background:#fff;color:#475569;font-size:12px;font-weight:700;opacity:.7}}
-    .commodityMiniChip.isCore{{border-color:#93c5fd;background:#eff6ff;color:#1d4ed8;opacity:1;font-weight:900;border-width:2px}}
-    .commodityEmpty{{padding:20px 18px 22px}}
-    .commodityGroupEmpty{{margin-top:10px;padding:14px 12px;border:1px dashed #dbe4ee;border-radius:14px;background:#f8fafc;color:#64748b;font-size:13px}}
-
-    .sec{{margin-top:14px !important;border:1px solid var(--line);border-radius:14px !important;overflow:hidden;background:var(--card);
-          scroll-margin-top: calc(var(--anchor-offset) + 18px);
-    }}
-    .secHead{{display:flex;align-items:center;justify-content:space-between;padding:12px 14px;background:#fafafa;border-bottom:1px solid var(--line)}}
-    .secTitle{{font-size:15px;font-weight:900;display:flex;align-items:center;gap:10px}}
-    .dotColor{{width:10px;height:10px;border-radius:999px}}
-    .secCount{{font-size:12px;color:var(--muted);background:#fff;border:1px solid var(--line);padding:4px 10px;border-radius:999px}}
-    .secBody{{padding:12px 12px 14px}}
-    .card{{border:1px solid var(--line);border-left:5px solid #334155;border-radius:14px;padding:12px;margin:10px 0;background:#fff;cursor:pointer;transition:border-color .15s ease, box-shadow .15s ease}}
-    .card:hover{{border-color:#94a3b8;box-shadow:0 4px 12px rgba(15,23,42,.08)}}
-    .cardTop{{display:flex;align-items:center;justify-content:space-between;gap:10px;flex-wrap:nowrap}}
-    .meta{{color:var(--muted);font-size:12px;display:flex;align-items:center;gap:6px;flex-wrap:wrap;min-width:0;flex:1 1 0%}}
-    .press{{color:#111827;font-weight:900}}
-    .dot{{opacity:.5}}
-    .topic{{background:#f3f4f6;border:1px solid var(--line);padding:2px 8px;border-radius:999px;font-size:11.5px;color:#111827;cursor:pointer;transition:background .15s ease}}
-    .topic:hover{{background:#e0e7ff;border-color:#a5b4fc;color:#3730a3}}
-    .ttl{{margin-top:8px;font-size:15px;line-height:1.35;font-weight:900}}
-    .sum{{margin-top:8px;color:#374151;font-size:13px;line-height:1.55;display:-webkit-box;-webkit-line-clamp:3;-webkit-box-orient:vertical;overflow:hidden}}
-
-    .badgeCore {{
-      display:inline-flex; align-items:center; justify-content:center;
-      height:18px; padding:0 8px; border-radius:999px;
-      background:#111827; color:#fff; font-size:11px; font-weight:900;
-      margin-right:2px;
-    }}
-    .hfDelta{{display:inline-flex;align-items:center;justify-content:center;min-height:20px;padding:0 8px;border-radius:999px;border:1px solid #dbe4ee;background:#f8fafc;color:#334155;font-size:10.5px;font-weight:900;letter-spacing:.01em;white-space:nowrap}}
-    .hfDelta.isPos{{background:#ecfdf5;border-color:#86efac;color:#166534}}
-    .hfDelta.isNeg{{background:#fff7ed;border-color:#fdba74;color:#b45309}}
-    .hfComparePanel{{margin-top:16px;padding:18px;border:1px solid #bfdbfe;border-radius:22px;background:linear-gradient(135deg,#eff6ff 0%,#ffffff 54%,#f8fafc 100%);box-shadow:0 16px 36px rgba(29,78,216,.10)}}
-    .hfCompareHead{{display:grid;grid-template-columns:minmax(0,1fr) auto;gap:14px;align-items:flex-start}}
-    .hfCompareEyebrow{{display:inline-flex;align-items:center;min-height:24px;padding:0 9px;border-radius:999px;background:#dbeafe;color:#1d4ed8;font-size:11px;font-weight:900;letter-spacing:.02em}}
-    .hfComparePanel h2{{margin:10px 0 0;font-size:26px;line-height:1.1;letter-spacing:-0.6px}}
-    .hfCompareLead{{margin-top:8px;max-width:760px;color:#334155;font-size:13px;line-height:1.6}}
-    .hfCompareStats{{display:flex;gap:8px;flex-wrap:wrap;justify-content:flex-end}}
-    .hfCompareStat{{display:inline-flex;align-items:center;gap:6px;min-height:34px;padding:0 12px;border-radius:999px;border:1px solid #dbe4ee;background:rgba(255,255,255,.9);color:#1e293b;font-size:12px;font-weight:800}}
-    .hfCompareStat strong{{font-size:13px}}
-    .hfCompareGrid{{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:12px;margin-top:14px}}
-    .hfCompareCard{{padding:14px;border:1px solid #dbe4ee;border-radius:18px;background:rgba(255,255,255,.92);box-shadow:0 10px 24px rgba(15,23,42,.05)}}
-    .hfCompareCardTitle{{font-size:13px;font-weight:900;color:#0f172a}}
-    .hfCompareGroups{{display:flex;flex-direction:column;gap:10px;margin-top:10px}}
-    .hfCompareDetails{{border:1px solid #dbe4ee;border-radius:14px;background:#fff;overflow:hidden}}
-    .hfCompareSummary{{display:flex;align-items:center;justify-content:space-between;gap:10px;cursor:pointer;list-style:none;padding:10px 12px;font-size:12px;font-weight:900;color:#0f172a;background:#f8fafc}}
-    .hfCompareSummary::-webkit-details-marker{{display:none}}
-    .hfCompareSummary span{{display:inline-flex;align-items:center;justify-content:center;min-height:22px;padding:0 8px;border-radius:999px;background:#dbeafe;color:#1d4ed8;font-size:11px;font-weight:900}}
-    .hfCompareList{{margin:0;padding:12px 12px 12px 28px;display:flex;flex-direction:column;gap:12px;color:#0f172a;font-size:12.5px;line-height:1.6}}
-    .hfCompareList li{{margin:0}}
-    .hfCompareItem{{display:flex;flex-direction:column;gap:7px}}
-    .hfCompareItemHead{{display:flex;align-items:center;justify-content:space-between;gap:10px;flex-wrap:wrap}}
-    .hfCompareSwap{{display:flex;flex-direction:column;gap:8px}}
-    .hfCompareLine{{display:flex;gap:8px;align-items:flex-start;padding:8px 10px;border-radius:12px;border:1px solid #dbe4ee}}
-    .hfCompareBefore{{background:#fff7ed;border-color:#fdba74}}
-    .hfCompareAfter{{background:#ecfdf5;border-color:#86efac}}
-    .hfCompareLabel{{display:inline-flex;align-items:center;justify-content:center;flex:0 0 auto;min-width:38px;min-height:22px;padding:0 8px;border-radius:999px;font-size:10.5px;font-weight:900;letter-spacing:.01em}}
-    .hfCompareBefore .hfCompareLabel{{background:#ffedd5;color:#9a3412}}
-    .hfCompareAfter .hfCompareLabel{{background:#dcfce7;color:#166534}}
-    .hfCompareChange{{margin-top:2px;color:#334155;min-width:0}}
-    .hfCompareMuted{{display:inline-flex;margin-left:6px;color:#64748b;font-size:11px;font-weight:800}}
-    .hfCompareEmpty{{color:#64748b;list-style:disc}}
-
-    .btnOpen{{display:inline-flex;align-items:center;justify-content:center;flex-shrink:0;
-             height:38px;padding:0 16px;border-radius:12px;border:1px solid var(--btn);
-             background:var(--btn);color:#fff;text-decoration:none;font-size:13px;font-weight:900;white-space:nowrap}}
-    .btnOpen:hover{{background:var(--btnHover);border-color:var(--btnHover)}}
-
-    .empty{{color:var(--muted);font-size:13px;padding:10px 2px}}
-    .footer{{margin-top:18px;color:var(--muted);font-size:12px}}
-    .footerMeta{{margin-top:8px;font-family:ui-monospace, SFMono-Regular, Consolas, monospace}}
-{pwa_install_css}
-    .swipeHint{{display:none;align-items:center;justify-content:center;gap:8px;margin:8px 0 2px;color:var(--muted);font-size:12px;user-select:none;opacity:.9;transition:opacity .25s ease, transform .25s ease}}
-    .swipeHint.show{{display:flex}}
-    .swipeHint.hide{{opacity:0;transform:translateY(-4px)}}
-    .swipeHint .arrow{{display:inline-flex;align-items:center;justify-content:center;width:20px;height:20px;border:1px solid var(--line);border-radius:999px;background:var(--btnBg, #fff);font-size:11px;line-height:1}}
-    .swipeHint .txt{{letter-spacing:-0.1px}}
-    .swipeHint .pill{{padding:2px 8px;border:1px dashed var(--line);border-radius:999px;background:rgba(255,255,255,.02)}}
-    @media (hover:hover) and (pointer:fine){{ .swipeHint{{display:none !important;}} }}
-    @media (prefers-reduced-motion: reduce){{ .swipeHint{{transition:none}} }}
-    .navLoading{{display:none;align-items:center;justify-content:center;margin:4px 0 0;color:var(--muted);font-size:12px}}
-    .navLoading.show{{display:flex}}
-    .navLoading .badge{{padding:3px 10px;border:1px solid var(--line);border-radius:999px;background:var(--btnBg, #fff);box-shadow:var(--shadow, 0 4px 12px rgba(17,24,39,.08))}}
-    .navRow{{transition:transform .18s ease, opacity .18s ease}}
-    .navRow.swipeActive{{transition:none}}
-    .navRow.swipeSettling{{transition:transform .18s ease, opacity .18s ease}}
-    @media (max-width: 900px) and (hover: none), (max-width: 900px) and (pointer: coarse){{
-      .chipDock{{display:none}}
-      .chips,.commodityGroupNav{{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;justify-content:stretch;overflow:visible}}
-      .chip,.commodityGroupChip{{width:100%;justify-content:space-between;min-height:48px;padding:0 14px;border-radius:18px}}
-      .chipN,.commodityGroupChip span{{min-width:24px;height:24px;padding:0 7px}}
-      .mobileQuickNav{{display:block;position:fixed;right:14px;bottom:18px;z-index:13}}
-      .mobileQuickNavToggle{{display:inline-flex;align-items:center;justify-content:center;gap:8px;min-height:44px;padding:0 14px;border:1px solid #0f172a;border-radius:999px;background:#0f172a;color:#fff;font-size:13px;font-weight:900;box-shadow:0 18px 38px rgba(15,23,42,.28)}}
-    }}
-    @media (max-width: 840px){{
-      .topbar{{background:rgba(255,255,255,0.98);backdrop-filter:none}}
-      .wrap{{padding:16px 16px 72px !important}}
-      .topin{{padding:12px 16px}}
-      .chipDockInner{{padding:0 16px}}
-      .commodityGrid{{grid-template-columns:repeat(2,minmax(0,1fr))}}
-    }}
-    @media (max-width: 640px){{
-      .wrap{{padding:12px 12px 64px !important}}
-      .topin{{gap:8px}}
-      .navRow{{display:grid;grid-template-columns:minmax(0,1fr) auto;gap:8px}}
-      .navRow > .navBtn:first-child{{grid-column:1}}
-      .navRow > .navBtn:nth-child(2){{grid-column:2}}
-      .navRow > .dateSelWrap{{grid-column:1; width:100%}}
-      .navRow > .navBtn:last-child{{grid-column:2}}
-      .dateSelWrap{{width:100%}}
-      .dateSelWrap select{{width:100%;max-width:none}}
-      .viewTabs{{grid-template-columns:repeat(2,minmax(0,1fr));gap:4px;margin-top:12px;padding:4px;border:1px solid #dbe4ee;border-radius:18px;background:#f8fafc}}
-      .viewTab{{min-height:auto;padding:10px 12px;border:none;border-radius:14px;gap:4px;box-shadow:none;align-items:center;justify-content:center;background:transparent}}
-      .viewTab:hover{{transform:none;box-shadow:none;border-color:transparent}}
-      .viewTab.isActive{{box-shadow:0 10px 22px rgba(29,78,216,.22)}}
-      .viewTabEyebrow{{display:none}}
-      .viewTabTitle{{width:100%;font-size:17px;letter-spacing:-0.35px;text-align:center}}
-      .viewTabDesc{{display:none}}
-      .viewTabStats{{display:none}}
-      .briefingPane,.commodityPane{{margin-top:12px}}
-      .briefingHero{{grid-template-columns:1fr;padding:0;border:none;border-radius:0;gap:10px;background:transparent;box-shadow:none}}
-      .briefingEyebrow,.commodityEyebrow{{min-height:22px;padding:0 8px;font-size:10px}}
-      .briefingEyebrow{{margin-left:8px;top:-1px}}
-      .briefingHero h2{{font-size:26px;letter-spacing:-0.6px}}
-      .briefingLead,.commodityLead{{margin-top:8px;font-size:13px;line-height:1.5;display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient:vertical;overflow:hidden}}
-      .briefingHeroStats{{display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:8px;width:100%;justify-content:flex-start}}
-      .briefingHeroStat{{min-width:0;min-height:0;padding:10px 10px 11px;border-radius:14px;box-shadow:none;border:1px solid #e2e8f0;background:#f8fafc}}
-      .briefingHeroStatLabel{{font-size:10px}}
-      .briefingHeroStat strong{{margin-top:4px;font-size:18px}}
-      .briefingChipbar{{margin:12px 0 18px}}
-      .hfComparePanel{{margin-top:12px;padding:14px;border-radius:18px}}
-      .hfCompareHead{{grid-template-columns:1fr}}
-      .hfComparePanel h2{{font-size:22px;letter-spacing:-0.5px}}
-      .hfCompareLead{{margin-top:7px;font-size:12.5px;line-height:1.55}}
-      .hfCompareStats{{justify-content:flex-start}}
-      .hfCompareGrid{{grid-template-columns:1fr;gap:10px}}
-      .hfCompareCard{{padding:12px;border-radius:16px}}
-      .hfCompareList{{font-size:12px}}
-      .hfCompareSummary{{padding:10px 11px}}
-      .hfCompareLine{{padding:8px 9px}}
-      .commodityBoardNav{{margin:10px 0 16px}}
-      .chipDock{{display:none}}
-      .chipbar{{border:none;border-radius:0;background:transparent;box-shadow:none;overflow:visible}}
-      .chipwrap{{padding:0}}
-      .chips,.commodityGroupNav{{display:grid;grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;justify-content:stretch;overflow:visible}}
-      .chip,.commodityGroupChip{{width:100%;justify-content:space-between;min-height:48px;padding:0 14px;font-size:13px;border-radius:18px;box-shadow:0 10px 24px rgba(15,23,42,.10)}}
-      .chipN,.commodityGroupChip span{{min-width:24px;height:24px;padding:0 7px}}
-      .mobileQuickNav{{display:block;position:fixed;right:14px;bottom:18px;z-index:13}}
-      .mobileQuickNavToggle{{display:inline-flex;align-items:center;justify-content:center;gap:8px;min-height:44px;padding:0 14px;border:1px solid #0f172a;border-radius:999px;background:#0f172a;color:#fff;font-size:13px;font-weight:900;box-shadow:0 18px 38px rgba(15,23,42,.28)}}
-      .commodityBoard{{margin-top:8px;border:none;border-radius:0;background:transparent;box-shadow:none}}
-      .commodityHead{{grid-template-columns:1fr;padding:0;border-bottom:none;background:transparent;overflow:visible}}
-      .commodityHead::after{{display:none}}
-      .commodityHead h2{{font-size:26px;letter-spacing:-0.6px}}
-      .commodityHeadStats{{display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:8px;width:100%;justify-content:flex-start}}
-      .commodityHeadStat{{min-width:0;min-height:0;padding:10px 10px 11px;border-radius:14px;box-shadow:none;border:1px solid #e2e8f0;background:#f8fafc}}
-      .commodityHeadStatLabel{{font-size:10px}}
-      .commodityHeadStat strong{{margin-top:4px;font-size:18px}}
-      .commodityGrid,.commodityGrid.isSingle,.commodityGrid.isDuo{{grid-template-columns:1fr}}
-      .commodityGroupBlock{{margin:0 0 20px;padding:0;border:none;border-radius:0;background:transparent;box-shadow:none}}
-      .commodityGroupHead{{display:block;padding:0 0 10px;border-bottom:none;margin-bottom:12px}}
-      .commodityGroupMeta{{margin-top:6px}}
-      .commodityTile{{padding:14px;border-radius:18px;box-shadow:0 12px 26px rgba(15,23,42,.08)}}
-      .commodityInactive{{padding:0;border:none;background:transparent}}
-      .commodityInactiveTitle{{margin-bottom:10px}}
-      .sec{{margin-top:22px !important;border:none !important;border-left:none !important;border-radius:0 !important;overflow:visible;background:transparent;padding-left:0}}
-      .secHead{{padding:0 0 10px;background:transparent;border-bottom:1px solid var(--line);border-left:none !important}}
-      .secBody{{padding:4px 0 0}}
-      .card{{margin:0 0 12px;padding:14px;border-radius:18px;box-shadow:0 12px 26px rgba(15,23,42,.08);border-left:none !important}}
-      .commoditySupportStory,.commodityMoreStory{{width:100%}}
-      .commoditySupportText{{white-space:normal;display:-webkit-box;-webkit-line-clamp:2;-webkit-box-orient:vertical}}
-      .commodityMiniGrid{{gap:6px}}
-    }}
-    @media print {{
-      .topbar,.chipDock,.mobileQuickNav,.mobileQuickNavSheet,.navLoading,.swipeHint,.btnOpen,.viewTabs{{display:none !important}}
-      body{{background:#fff;color:#000}}
-      .wrap{{max-width:none;padding:10px !important}}
-      .briefingHero{{border:1px solid #ccc;box-shadow:none;background:#fff}}
-      .chipbar{{display:block;border:none;box-shadow:none;background:transparent}}
-      .chips{{flex-wrap:wrap}}
-      .chip{{border:1px solid #ccc;box-shadow:none;background:#f9f9f9;page-break-inside:avoid}}
-      .sec{{border:1px solid #ccc;page-break-inside:avoid}}
-      .card{{box-shadow:none;border:1px solid #ccc;page-break-inside:avoid;cursor:default}}
-      .card:hover{{border-color:#ccc;box-shadow:none}}
-      .sum{{display:block;-webkit-line-clamp:unset;overflow:visible}}
-      .commodityBoard{{box-shadow:none;border:1px solid #ccc}}
-      .commodityTile{{box-shadow:none;border:1px solid #ccc;page-break-inside:avoid}}
-      .footer{{page-break-before:always}}
-      a{{color:#000;text-decoration:none}}
-      .press{{color:#000}} .ttl{{color:#000}}
-    }}
-    @media (prefers-color-scheme: dark) {{
-      :root {{
-        --bg:#0f172a;--text:#e2e8f0;--muted:#94a3b8;--line:#334155;--card:#1e293b;
-        --chip:#1e293b;--btn:#3b82f6;--btnHover:#2563eb;--btnBg:#1e293b;
-        --shadow:0 4px 12px rgba(0,0,0,.3);
-      }}
-      body{{background:var(--bg);color:var(--text)}}
-      .topbar{{background:rgba(15,23,42,0.94);border-bottom-color:var(--line)}}
-      .navBtn{{background:#1e293b;color:#e2e8f0;border-color:var(--line)}}
-      .navBtn:hover{{border-color:#475569}}
-      .navBtn.navArchive{{background:#1e3a5f !important;border-color:#3b82f6 !important;color:#93c5fd !important}}
-      .navRow > a.navBtn:first-child{{background:#1e3a5f !important;border-color:#3b82f6 !important;color:#93c5fd !important}}
-      select{{background:#1e293b;color:#e2e8f0;border-color:var(--line)}}
-      .viewTab{{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);color:#e2e8f0;border-color:var(--line)}}
-      .viewTab:hover{{border-color:#475569}}
-      .viewTab.isActive{{background:linear-gradient(135deg,#0f172a 0%,#1d4ed8 100%);border-color:#1d4ed8}}
-      .viewTabDesc{{color:#94a3b8}}
-      .viewTabStat{{background:rgba(255,255,255,.08);color:#e2e8f0}}
-      .hfDelta{{background:#1e293b;border-color:#475569;color:#cbd5e1}}
-      .hfDelta.isPos{{background:rgba(20,83,45,.28);border-color:#22c55e;color:#bbf7d0}}
-      .hfDelta.isNeg{{background:rgba(124,45,18,.28);border-color:#fb923c;color:#fed7aa}}
-      .hfComparePanel{{background:linear-gradient(135deg,#1e293b 0%,#0f172a 54%,#1e293b 100%);border-color:#1d4ed8;box-shadow:0 16px 36px rgba(0,0,0,.24)}}
-      .hfCompareEyebrow{{background:#1e3a5f;color:#93c5fd}}
-      .hfCompareLead{{color:#cbd5e1}}
-      .hfCompareStat{{background:rgba(30,41,59,.9);border-color:var(--line);color:#e2e8f0}}
-      .hfCompareCard{{background:rgba(30,41,59,.92);border-color:var(--line)}}
-      .hfCompareDetails{{background:#0f172a;border-color:#475569}}
-      .hfCompareSummary{{background:#1e293b;color:#f8fafc}}
-      .hfCompareSummary span{{background:#1e3a5f;color:#93c5fd}}
-      .hfCompareCardTitle{{color:#f8fafc}}
-      .hfCompareList{{color:#e2e8f0}}
-      .hfCompareLine{{border-color:#475569}}
-      .hfCompareBefore{{background:rgba(124,45,18,.18);border-color:#ea580c}}
-      .hfCompareAfter{{background:rgba(20,83,45,.18);border-color:#22c55e}}
-      .hfCompareBefore .hfCompareLabel{{background:rgba(154,52,18,.32);color:#fed7aa}}
-      .hfCompareAfter .hfCompareLabel{{background:rgba(21,128,61,.32);color:#bbf7d0}}
-      .hfCompareChange{{color:#cbd5e1}}
-      .hfCompareArrow{{color:#60a5fa}}
-      .hfCompareMuted,.hfCompareEmpty{{color:#94a3b8}}
-      .briefingHero{{background:linear-gradient(135deg,#1e293b 0%,#0f172a 56%,#1e293b 100%);border-color:var(--line)}}
-      .briefingHeroStat{{background:rgba(30,41,59,.92);border-color:var(--line)}}
-      .briefingHeroStat strong{{color:#e2e8f0}}
-      .briefingHeroStatLabel{{color:#94a3b8}}
-      .chipbar{{background:rgba(30,41,59,.96);border-color:var(--line)}}
-      .chip{{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);color:#e2e8f0}}
-      .sec{{background:var(--card)}}
-      .secHead{{background:#1e293b;border-bottom-color:var(--line)}}
-      .card{{background:#1e293b;border-color:var(--line)}}
-      .card:hover{{border-color:#475569;box-shadow:0 4px 12px rgba(0,0,0,.2)}}
-      .press{{color:#e2e8f0}}
-      .topic{{background:#334155;border-color:#475569;color:#e2e8f0}}
-      .ttl{{color:#f1f5f9}}
-      .sum{{color:#94a3b8}}
-      .badgeCore{{background:#3b82f6;color:#fff}}
-      .commodityBoard{{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);border-color:var(--line)}}
-      .commodityHead{{background:linear-gradient(135deg,#1e293b 0%,#0f172a 68%,#1e293b 100%);border-bottom-color:var(--line)}}
-      .commodityHead::after{{display:none}}
-      .commodityHeadStat{{background:rgba(30,41,59,.95);border-color:var(--line)}}
-      .commodityHeadStat strong{{color:#e2e8f0}}
-      .commodityTile{{background:#1e293b;border-color:var(--line)}}
-      .commodityTile.isActive{{border-color:#34d399;box-shadow:0 8px 24px rgba(52,211,153,.1)}}
-      .commodityTile.isMuted{{background:#172033;border-color:#475569}}
-      .commodityTile.isMuted .commodityTileName{{color:#94a3b8}}
-      .commodityPrimaryCard{{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);border-color:var(--line)}}
-      .commodityPrimaryStory{{color:#f1f5f9}}
-      .commoditySupportStory,.commodityMoreStory{{background:#1e293b;border-color:var(--line);color:#e2e8f0}}
-      .commodityMoreWrap{{background:#0f172a;border-color:#475569}}
-      .commodityMoreSummary{{color:#94a3b8}}
-      .commodityGroupBlock{{background:linear-gradient(180deg,#1e293b 0%,#0f172a 100%);border-color:var(--line)}}
-      .commodityInactive{{background:#0f172a;border-color:#475569}}
-      .commodityMiniChip{{background:#1e293b;border-color:#475569;color:#94a3b8}}
-      .commodityMiniChip.isCore{{background:#1e3a5f;border-color:#3b82f6;color:#93c5fd}}
-      .commodityStoryMuted{{background:#0f172a;border-color:#475569;color:#64748b}}
-      .mobileQuickNavPanel{{background:#1e293b;border-color:var(--line)}}
-      .mobileQuickNavClose{{background:#1e293b;color:#e2e8f0;border-color:var(--line)}}
-      .chipDock .chipbar{{background:rgba(30,41,59,.98)}}
-      .empty{{color:#64748b}}
-    }}
-  </style>
+{_DAILY_PAGE_CSS_HEAD}{pwa_install_css}{_DAILY_PAGE_CSS_TAIL}
 </head>
 <body class=\"pageArchive\">
   <div class=\"topbar\">
@@ -49441,8 +49238,7 @@ try {{ _ensureDates(); }} catch (e) {{}}
 
 
 def render_index_page(manifest: JsonDict, site_path: str) -> str:
-    manifest = _normalize_manifest(manifest)
-
+    # _normalize_manifest를 다시 돌릴 필요 없음: 아래에서 날짜를 직접(더 엄격하게) 검증한다.
     def is_valid_iso_date(s: str) -> bool:
         s = (s or "").strip()
         if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
@@ -49460,25 +49256,24 @@ def render_index_page(manifest: JsonDict, site_path: str) -> str:
         except Exception:
             return iso_date
 
-    raw_dates = manifest.get("dates", [])
+    raw_dates = manifest.get("dates", []) if isinstance(manifest, dict) else []
+    if not isinstance(raw_dates, list):
+        raw_dates = []
     dates = [d for d in raw_dates if isinstance(d, str) and is_valid_iso_date(d)]
     dates = sorted(set(dates), reverse=True)
 
     latest = dates[0] if dates else None
     latest_link = build_site_url(site_path, f"archive/{latest}.html") if latest else None
 
-    cards = []
-    for d in dates[:90]:
-        href = build_site_url(site_path, f"archive/{d}.html")
-        wd = weekday_label(d)
-        cards.append(f"""
-          <a class="card" href="{esc(href)}" data-nav-type="archive_card" data-from-date="{esc(latest or '')}" data-to-date="{esc(d)}">
+    cards_html = "\n".join(
+        f"""
+          <a class="card" href="{esc(build_site_url(site_path, f"archive/{d}.html"))}" data-nav-type="archive_card" data-from-date="{esc(latest or '')}" data-to-date="{esc(d)}">
             <div class="dt">{esc(pretty_date_kr(d))}</div>
-            <div class="meta">{esc(d)} · {esc(wd)}요일</div>
+            <div class="meta">{esc(d)} · {esc(weekday_label(d))}요일</div>
           </a>
-        """)
-
-    cards_html = "\n".join(cards) if cards else '<div class="empty">아카이브가 아직 없습니다.</div>'
+        """
+        for d in dates[:90]
+    ) or '<div class="empty">아카이브가 아직 없습니다.</div>'
 
     latest_btn_html = (
         f'<a class="btn" href="{esc(latest_link)}" data-nav-type="latest_brief" data-from-date="" data-to-date="{esc(latest or "")}">최신 브리핑 열기</a>'
@@ -49510,105 +49305,7 @@ def render_index_page(manifest: JsonDict, site_path: str) -> str:
   {pwa_head_html}
   {ga4_head_html}
   <title>농산물 뉴스 브리핑</title>
-  <style>
-    :root {{
-      --bg:#ffffff;
-      --text:#111827;
-      --muted:#6b7280;
-      --line:#e5e7eb;
-      --btn:#1d4ed8;
-      --btnHover:#1e40af;
-      --chip:#f3f4f6;
-      --mark:#fef08a;
-    }}
-    *{{box-sizing:border-box}}
-    body{{margin:0;background:var(--bg);color:var(--text);
-      font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, "Noto Sans KR", Arial;}}
-    .wrap{{max-width:1040px;margin:0 auto;padding:26px 16px 70px}}
-    h1{{margin:0;font-size:22px;letter-spacing:-0.2px}}
-    .sub{{color:var(--muted);margin-top:8px;font-size:13px;line-height:1.5}}
-    .btn{{display:inline-flex;align-items:center;justify-content:center;margin-top:14px;text-decoration:none;color:#fff;
-         border:1px solid var(--btn);padding:10px 14px;border-radius:12px;background:var(--btn);font-weight:900; cursor:pointer; user-select:none}}
-    .btn:hover{{background:var(--btnHover);border-color:var(--btnHover)}}
-    .btn.disabled{{opacity:.5; cursor:not-allowed}}
-    .btn.ghost{{background:#fff;color:var(--btn);border-color:var(--line)}}
-    .btn.ghost:hover{{border-color:#cbd5e1;background:#f8fafc}}
-
-    .panel{{margin-top:18px;border:1px solid var(--line);border-radius:16px;background:#fff;padding:14px}}
-    .panelTitle{{font-weight:900;margin-bottom:10px;display:flex;gap:10px;align-items:center;justify-content:space-between}}
-    .grid{{display:grid;grid-template-columns:repeat(3,1fr);gap:10px}}
-    @media (max-width: 820px) {{ .grid{{grid-template-columns:repeat(2,1fr);}} }}
-    @media (max-width: 520px) {{ .grid{{grid-template-columns:1fr;}} }}
-
-    .card{{display:block;text-decoration:none;border:1px solid var(--line);border-radius:14px;padding:12px;
-          background:#ffffff;color:var(--text)}}
-    .card:hover{{border-color:#cbd5e1}}
-    .dt{{font-size:15px;font-weight:900}}
-    .meta{{margin-top:6px;color:var(--muted);font-size:12px}}
-    .empty{{color:var(--muted);font-size:13px}}
-    .cardBadge{{display:inline-flex;align-items:center;justify-content:center;margin-left:6px;padding:1px 7px;border-radius:999px;background:#eef2ff;color:#1d4ed8;font-size:11px;font-weight:800;border:1px solid #c7d2fe}}
-
-    /* search */
-    .searchRow{{display:flex;gap:10px;align-items:center}}
-    .searchInput{{flex:1;border:1px solid var(--line);border-radius:12px;padding:10px 12px;font-size:14px}}
-    .searchInput:focus{{outline:none;border-color:#93c5fd;box-shadow:0 0 0 3px rgba(59,130,246,.12)}}
-
-    .filters{{margin-top:10px;display:flex;flex-wrap:wrap;gap:8px;align-items:center}}
-    .sel,.date{{border:1px solid var(--line);border-radius:12px;padding:8px 10px;font-size:13px;background:#fff}}
-    .sel:focus,.date:focus{{outline:none;border-color:#93c5fd;box-shadow:0 0 0 3px rgba(59,130,246,.12)}}
-    .chip{{display:inline-flex;align-items:center;gap:6px;background:var(--chip);border:1px solid var(--line);
-          padding:3px 8px;border-radius:999px;font-size:11px;color:#374151}}
-    .chip b{{font-weight:900}}
-    .hint{{margin-top:8px;color:var(--muted);font-size:12px;line-height:1.4}}
-    .metaLine{{margin-top:10px;color:var(--muted);font-size:12px;display:flex;flex-wrap:wrap;gap:10px;align-items:center;justify-content:space-between}}
-    .metaLeft{{display:flex;gap:8px;flex-wrap:wrap;align-items:center}}
-
-    mark{{background:var(--mark);padding:0 2px;border-radius:4px}}
-
-    .results{{margin-top:10px;display:flex;flex-direction:column;gap:10px}}
-    .result{{border:1px solid var(--line);border-radius:14px;padding:12px;background:#fff}}
-    .rTop{{display:flex;flex-wrap:wrap;gap:6px;align-items:center}}
-    .rTitle{{margin-top:6px;font-weight:900;font-size:14px;line-height:1.35}}
-    .rSum{{margin-top:6px;color:#374151;font-size:13px;line-height:1.45}}
-    .rLinks{{margin-top:9px;display:flex;gap:12px;font-size:12px}}
-    .rLinks a{{color:var(--btn);text-decoration:none;font-weight:900}}
-    .rLinks a:hover{{text-decoration:underline}}
-
-    .pager{{margin-top:10px;display:flex;gap:8px;align-items:center;justify-content:flex-end;flex-wrap:wrap}}
-    .pager .pbtn{{padding:8px 10px;border-radius:12px;border:1px solid var(--line);background:#fff;cursor:pointer;font-weight:900;color:#111827}}
-    .pager .pbtn:hover{{border-color:#cbd5e1;background:#f8fafc}}
-    .pager .pbtn[disabled]{{opacity:.5;cursor:not-allowed}}
-    .pager .pinfo{{color:var(--muted);font-size:12px;margin-right:auto}}
-
-    .groupHdr{{margin-top:8px;font-weight:900;font-size:13px;color:#111827}}
-    .groupWrap{{display:flex;flex-direction:column;gap:10px}}
-{pwa_install_css}
-    @media (prefers-color-scheme: dark) {{
-      :root {{--bg:#0f172a;--text:#e2e8f0;--muted:#94a3b8;--line:#334155;--btn:#3b82f6;--btnHover:#2563eb;--chip:#334155;--mark:#854d0e}}
-      body{{background:var(--bg);color:var(--text)}}
-      .btn{{color:#fff}} .btn.ghost{{background:#1e293b;color:#93c5fd;border-color:var(--line)}}
-      .btn.ghost:hover{{background:#334155;border-color:#475569}}
-      .btn.disabled{{opacity:.5}}
-      .panel{{background:#1e293b;border-color:var(--line)}}
-      .card{{background:#1e293b;border-color:var(--line);color:var(--text)}}
-      .card:hover{{border-color:#475569}}
-      .dt{{color:#f1f5f9}}
-      .searchInput{{background:#1e293b;color:#e2e8f0;border-color:var(--line)}}
-      .searchInput:focus{{border-color:#3b82f6;box-shadow:0 0 0 3px rgba(59,130,246,.2)}}
-      .sel,.date{{background:#1e293b;color:#e2e8f0;border-color:var(--line)}}
-      .sel:focus,.date:focus{{border-color:#3b82f6;box-shadow:0 0 0 3px rgba(59,130,246,.2)}}
-      .chip{{background:#334155;border-color:#475569;color:#e2e8f0}}
-      .result{{background:#1e293b;border-color:var(--line)}}
-      .rTitle{{color:#f1f5f9}}
-      .rSum{{color:#94a3b8}}
-      .rLinks a{{color:#93c5fd}}
-      .pager .pbtn{{background:#1e293b;color:#e2e8f0;border-color:var(--line)}}
-      .pager .pbtn:hover{{background:#334155;border-color:#475569}}
-      mark{{background:#854d0e;color:#fde68a}}
-      .groupHdr{{color:#e2e8f0}}
-      .cardBadge{{background:#1e3a5f;color:#93c5fd;border-color:#3b82f6}}
-    }}
-  </style>
+{_INDEX_PAGE_CSS_HEAD}{pwa_install_css}{_INDEX_PAGE_CSS_TAIL}
 </head>
 <body class="pageHome">
   <div class="wrap">
@@ -50250,6 +49947,10 @@ def render_index_page(manifest: JsonDict, site_path: str) -> str:
 
 
 
+# gist/raw 호스트는 Kakao 링크/Pages base URL로 쓸 수 없다(두 검사 지점에서 공유)
+_GIST_RAW_HOST_RE = re.compile(r"gist\.github\.com|raw\.githubusercontent\.com")
+
+
 def get_pages_base_url(repo: str) -> str:
     owner, name = repo.split("/", 1)
 
@@ -50263,8 +49964,7 @@ def get_pages_base_url(repo: str) -> str:
     if not env_url:
         return default_url
 
-    bad = ("gist.github.com", "raw.githubusercontent.com")
-    if any(b in env_url for b in bad):
+    if _GIST_RAW_HOST_RE.search(env_url):
         log.warning("[WARN] PAGES_BASE_URL/BRIEF_VIEW_URL points to gist/raw. Ignoring and using default: %s", default_url)
         return default_url
 
@@ -50275,7 +49975,7 @@ def get_pages_base_url(repo: str) -> str:
     return env_url
 
 def ensure_not_gist(url: str, label: str) -> None:
-    if "gist.github.com" in url or "raw.githubusercontent.com" in url:
+    if _GIST_RAW_HOST_RE.search(url):
         raise RuntimeError(f"[FATAL] {label} points to gist/raw: {url}")
 
 def ensure_absolute_http_url(u: str) -> str:
@@ -50303,10 +50003,7 @@ def log_kakao_link(url: str) -> None:
 KAKAO_MESSAGE_SECTION_ORDER = ["supply", "policy", "dist", "pest"]
 
 def _get_section_conf(key: str) -> SectionConfig | None:
-    for s in SECTIONS:
-        if s["key"] == key:
-            return s
-    return None
+    return SECTION_CONF_BY_KEY.get(key)
 
 
 def _kakao_pick_core2(lst: list[Article]) -> list[Article]:
@@ -50676,7 +50373,7 @@ def kakao_send_to_me(text: str, web_url: str) -> None:
             r = http_session().post(
                 url,
                 headers=headers,
-                data={"template_object": json.dumps(template, ensure_ascii=False)},
+                data={"template_object": _json_dumps_compact(template)},
                 timeout=35,
             )
         except Exception as exc:
@@ -53217,8 +52914,10 @@ def main() -> None:
                     while cur >= s:
                         dset.add(cur.isoformat())
                         cur -= timedelta(days=1)
-            archive_dates_desc = sorted(dset, reverse=True)
-            manifest["dates"] = sorted(set(sanitize_dates(list(dset))))
+            # 한 번만 정렬하고 내림차순 뷰는 슬라이스로 파생(동일 데이터 이중 정렬 방지)
+            dates_asc = sorted(set(sanitize_dates(list(dset))))
+            archive_dates_desc = dates_asc[::-1]
+            manifest["dates"] = dates_asc
             # 오늘 페이지도 최신 날짜목록으로 다시 렌더(◀ 이전 링크/스와이프/드롭다운 통일)
             daily_html = render_daily_page(report_date, start_kst, end_kst, by_section, archive_dates_desc, site_path)
         except Exception as e2:
@@ -53237,14 +52936,17 @@ def main() -> None:
         log.warning("[WARN] save_search_index failed (non-fatal): %s", e)
 
 
-    # write daily
+    # write daily + index
+    # sha 조회는 서로 독립적인 파일이라 동시에 돌려 RTT를 숨긴다.
+    # (Contents API의 sha는 파일 blob 기준이므로 다른 파일 put에 영향받지 않음)
     daily_path = f"{DOCS_ARCHIVE_DIR}/{report_date}.html"
-    _raw_old, sha_old = github_get_file(repo, daily_path, GH_TOKEN, ref="main")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_daily = ex.submit(github_get_file, repo, daily_path, GH_TOKEN, ref="main")
+        f_index = ex.submit(github_get_file, repo, DOCS_INDEX_PATH, GH_TOKEN, ref="main")
+        _raw_old, sha_old = f_daily.result()
+        _raw_old2, sha_old2 = f_index.result()
+    # put은 같은 ref(main)를 움직이므로 기존대로 순차 수행
     github_put_file(repo, daily_path, daily_html, GH_TOKEN, f"Add daily brief {report_date}", sha=sha_old, branch="main")
-
-    # write index
-    _raw_old2, sha_old2 = github_get_file(repo, DOCS_INDEX_PATH, GH_TOKEN, ref="main")
-
     github_put_file(repo, DOCS_INDEX_PATH, index_html, GH_TOKEN, f"Update index {report_date}", sha=sha_old2, branch="main")
 
 
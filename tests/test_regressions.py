@@ -140,12 +140,13 @@ class TestRegressions(unittest.TestCase):
         self.assertIn("--nav-chip-height", self.text)
         self.assertIn("--chip-color", self.text)
         self.assertIn("--group-chip-color", self.text)
-        self.assertIn(".chipDock{{display:none}}", self.text)
-        self.assertIn(".chip,.commodityGroupChip{{", self.text)
-        self.assertIn(".chips,.commodityGroupNav{{display:flex;gap:10px;align-items:center;justify-content:flex-start;width:100%;}}", self.text)
-        self.assertIn("@media (max-width: 900px) and (hover: none), (max-width: 900px) and (pointer: coarse){{", self.text)
-        self.assertIn(".viewTabEyebrow{{display:none}}", self.text)
-        self.assertIn("body.quickNavOpen{{overflow:hidden}}", self.text)
+        # 정적 CSS는 모듈 상수(_DAILY_PAGE_CSS_*)로 분리되어 f-string 이스케이프({{}}) 없이 존재한다
+        self.assertIn(".chipDock{display:none}", self.text)
+        self.assertIn(".chip,.commodityGroupChip{", self.text)
+        self.assertIn(".chips,.commodityGroupNav{display:flex;gap:10px;align-items:center;justify-content:flex-start;width:100%;}", self.text)
+        self.assertIn("@media (max-width: 900px) and (hover: none), (max-width: 900px) and (pointer: coarse){", self.text)
+        self.assertIn(".viewTabEyebrow{display:none}", self.text)
+        self.assertIn("body.quickNavOpen{overflow:hidden}", self.text)
         self.assertIn(".mobileQuickNavBody .chips,", self.text)
         self.assertIn("viewTabTitle", self.text)
         self.assertIn("function activateView(viewKey, opts)", self.text)